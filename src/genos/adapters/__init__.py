@@ -1 +1,4 @@
 """MUD source adapters for parsing various MUD formats."""
+
+# Default directory of the per-file parse cache (``migrate --cache``).
+DEFAULT_CACHE_DIR = ".genos-cache"
@@ -5,9 +5,24 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 from genos.uir.schema import UIR
 
+from .fingerprint import DetectionContext, Marker
+
+if TYPE_CHECKING:
+    from genos.adapters.cache import ParseCache
+
+# UIR list sections that parse_stream() delivers as per-file chunks.
+# Everything else (classes, skills, configs, tables...) is small and stays
+# on the UIR returned alongside the chunks.
+STREAM_SECTIONS = (
+    "rooms", "items", "monsters", "zones", "triggers", "shops", "quests",
+)
+
+UIRChunks = Iterator[tuple[str, list]]
+
 
 @dataclass
 class AnalysisReport:
@@ -54,13 +69,30 @@ class AnalysisReport:
 class BaseAdapter(ABC):
     """Abstract base class for MUD source adapters."""
 
+    # Paths that identify the source layout, checked by detect().
+    markers: tuple[Marker, ...] = ()
+
     def __init__(self, source_path: str | Path) -> None:
         self.source_path = Path(source_path)
+        # Worker processes for per-file parsing (1 = serial, 0 = all CPUs).
+        # Adapters without a per-file parse loop ignore this.
+        self.jobs: int = 1
+        # Per-file parse result cache; None disables caching.
+        self.cache: ParseCache | None = None
 
-    @abstractmethod
-    def detect(self) -> bool:
-        """Return True if this adapter can handle the source."""
-        ...
+    def detect(self, context: DetectionContext | None = None) -> bool:
+        """Return True if this adapter can handle the source.
+
+        Checks :attr:`markers` against *context*, the listings shared by
+        every adapter during auto-detection (a fresh one when omitted).
+        Adapters without markers override this; auto-detection calls
+        such overrides as ``detect()``, without a context.
+        """
+        if not self.markers:
+            return False
+        if context is None:
+            context = DetectionContext(self.source_path)
+        return context.matches_all(self.markers)
 
     @abstractmethod
     def analyze(self) -> AnalysisReport:
@@ -71,3 +103,24 @@ class BaseAdapter(ABC):
     def parse(self) -> UIR:
         """Parse the entire source into a UIR object."""
         ...
+
+    def parse_stream(self) -> tuple[UIR, UIRChunks]:
+        """Parse the source as a stream of ``(section, entities)`` chunks.
+
+        Returns a UIR holding every section except :data:`STREAM_SECTIONS`
+        plus an iterator over chunks of those sections, each naming the
+        UIR field the entities belong to.  The UIR (including its
+        migration stats) is only complete once the iterator is exhausted.
+
+        The default implementation parses everything up front and hands
+        the world sections out whole, so memory is not bounded; adapters
+        that parse file by file override this to yield per file.
+        """
+        uir = self.parse()
+        chunks = []
+        for section in STREAM_SECTIONS:
+            entities = getattr(uir, section)
+            if entities:
+                chunks.append((section, entities))
+            setattr(uir, section, [])
+        return uir, iter(chunks)
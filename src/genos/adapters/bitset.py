@@ -0,0 +1,92 @@
+"""Table-driven bitvector decoding shared by the adapters.
+
+Flags are decoded for every room, monster and item: CircleMUD/Simoon
+store them as ascii bitvectors (``"abdq"``) or plain integers, 3eyes as
+``char flags[n]`` arrays tested with ``F_ISSET``.  Instead of testing
+each bit, set bytes are looked up in :data:`BYTE_BITS`, a 256-entry
+table of the bit positions set in each byte value.  Flag strings repeat
+heavily within a world, so :func:`asciiflag_to_int` is memoized.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+# BYTE_BITS[b]: positions of the bits set in byte value b, ascending
+BYTE_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if value & (1 << bit)) for value in range(256)
+)
+
+# The same positions shifted to byte k of a bitvector, for k < 8
+_SHIFTED_BITS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(8 * k + bit for bit in bits) for bits in BYTE_BITS)
+    for k in range(8)
+)
+
+
+def bytes_to_flag_list(flag_bytes: bytes) -> list[int]:
+    """Positions of the bits set in a little-endian ``char flags[n]`` array.
+
+    Bit *f* is byte ``f // 8``, mask ``1 << (f % 8)``, as in the C
+    ``F_ISSET`` macro.
+    """
+    positions: list[int] = []
+    for k, byte in enumerate(flag_bytes):
+        if byte:
+            if k < 8:
+                positions.extend(_SHIFTED_BITS[k][byte])
+            else:
+                positions.extend(8 * k + bit for bit in BYTE_BITS[byte])
+    return positions
+
+
+def int_to_flag_list(value: int) -> list[int]:
+    """Convert an integer bitvector to a list of set bit positions.
+
+    Non-positive values have no flags set.
+    """
+    if value <= 0:
+        return []
+    return bytes_to_flag_list(value.to_bytes((value.bit_length() + 7) // 8, "little"))
+
+
+@lru_cache(maxsize=4096)
+def asciiflag_to_int(flag_str: str) -> int:
+    """Convert a CircleMUD ascii bitvector string to an integer.
+
+    Lowercase letters are bit positions (a=bit0, ..., z=bit25) and
+    uppercase continue (A=bit26, B=bit27, ...); several letters set
+    several bits.  A plain number is returned as-is.
+    """
+    if not flag_str or flag_str == "0":
+        return 0
+
+    # If it's a plain number, return it
+    try:
+        return int(flag_str)
+    except ValueError:
+        pass
+
+    result = 0
+    for ch in flag_str:
+        if ch.islower():
+            result |= 1 << (ord(ch) - ord('a'))
+        elif ch.isupper():
+            result |= 1 << (26 + ord(ch) - ord('A'))
+    return result
+
+
+def asciiflag_to_list(flag_str: str) -> list[int]:
+    """Bit positions of an ascii bitvector or plain-number flag field."""
+    return list(_asciiflag_positions(flag_str))
+
+
+@lru_cache(maxsize=4096)
+def _asciiflag_positions(flag_str: str) -> tuple[int, ...]:
+    return tuple(int_to_flag_list(asciiflag_to_int(flag_str)))
+
+
+def clear_caches() -> None:
+    """Forget the memoized flag strings."""
+    asciiflag_to_int.cache_clear()
+    _asciiflag_positions.cache_clear()
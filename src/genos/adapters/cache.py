@@ -0,0 +1,254 @@
+"""On-disk cache of per-file parse results.
+
+Re-running a migration re-parses every world file even when only one
+zone changed.  :class:`ParseCache` stores the parsed entities of each
+source file under ``<cache_dir>/`` so unchanged files are loaded from
+disk instead of parsed again.
+
+Each entry is keyed by a *namespace* (which parser produced it) and the
+file's absolute path, and records the file's mtime, size and SHA-256
+content hash.  An entry is reused when mtime and size still match, or
+when they changed but the content hash did not (e.g. after a ``touch``
+or a fresh checkout).  All entries are invalidated whenever the parser
+sources change: the cache version is a hash over the ``genos.adapters``
+package and the UIR schema.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import genos
+from genos.profiling import parse_file
+
+from . import DEFAULT_CACHE_DIR
+from .parallel import _call_safely, iter_files
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Per-file parse result cache rooted at *cache_dir*."""
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    # ── Lookup / store ──────────────────────────────────────────────
+
+    def lookup(self, namespace: str, fpath: Path) -> tuple[bool, Any]:
+        """Return ``(True, value)`` for a fresh entry, else ``(False, None)``."""
+        entry = self._entry_path(namespace, fpath)
+        try:
+            st = fpath.stat()
+            with open(entry, "rb") as f:
+                header = pickle.load(f)
+                if self._is_fresh(header, fpath, st):
+                    value = pickle.load(f)
+                else:
+                    self.misses += 1
+                    return False, None
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", entry, e)
+            self.misses += 1
+            return False, None
+
+        self._hit(namespace, fpath, header, st, value)
+        return True, value
+
+    def store(
+        self, namespace: str, fpath: Path, value: Any, digest: str | None = None,
+    ) -> None:
+        """Record *value* as the parse result of *fpath*."""
+        try:
+            st = fpath.stat()
+            if digest is None:
+                digest = _file_digest(fpath)
+            header = {
+                "version": cache_version(),
+                "path": str(fpath.resolve()),
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "digest": digest,
+            }
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see a
+            # partially written entry.
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._entry_path(namespace, fpath))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except Exception as e:
+            logger.debug("Could not cache %s: %s", fpath, e)
+
+    # ── Parser wrappers ─────────────────────────────────────────────
+
+    def call(self, func: Callable[..., Any], fpath: Path, *args: Any) -> Any:
+        """Return ``func(fpath, *args)``, served from the cache when fresh.
+
+        *args* must be derived from *fpath* (e.g. a file index parsed from
+        its name), since they are not part of the cache key.  Exceptions
+        propagate and are not cached.
+        """
+        namespace = func_namespace(func)
+        hit, value = self.lookup(namespace, fpath)
+        if hit:
+            return value
+        value = parse_file(func, fpath, *args)
+        self.store(namespace, fpath, value)
+        return value
+
+    def iter_files(
+        self,
+        func: Callable[[Path], Any],
+        files: Iterable[Path],
+        jobs: int = 1,
+    ) -> Iterator[tuple[Path, Any, str | None]]:
+        """Cached form of :func:`genos.adapters.parallel.iter_files`.
+
+        Only files without a fresh entry are handed to *func* (in a
+        process pool when ``jobs > 1``); outcomes are still yielded in
+        input order, one file at a time.
+        """
+        namespace = func_namespace(func)
+        files = list(files)
+        fresh = {}
+        for fpath in files:
+            entry = self._fresh_entry(namespace, fpath)
+            if entry is not None:
+                fresh[fpath] = entry
+        parsed = iter_files(func, [f for f in files if f not in fresh], jobs)
+
+        for fpath in files:
+            if fpath in fresh:
+                hit, value = self._load_fresh(namespace, fpath, *fresh.pop(fpath))
+                if hit:
+                    yield fpath, value, None
+                    continue
+                # Entry vanished or was replaced since the freshness check
+                self.misses += 1
+                outcome = _call_safely(func, fpath)
+            else:
+                self.misses += 1
+                _, *outcome = next(parsed)
+            value, error = outcome
+            if error is None:
+                self.store(namespace, fpath, value)
+            yield fpath, value, error
+
+    # ── Internals ───────────────────────────────────────────────────
+
+    def _entry_path(self, namespace: str, fpath: Path) -> Path:
+        key = f"{namespace}\0{fpath.resolve()}".encode("utf-8")
+        return self.cache_dir / f"{hashlib.sha256(key).hexdigest()[:40]}.pkl"
+
+    def _fresh_entry(
+        self, namespace: str, fpath: Path,
+    ) -> tuple[dict, os.stat_result, os.stat_result, int] | None:
+        """Check an entry's header without loading its payload.
+
+        Returns the header, the stats of the source file and of the entry
+        and the payload's offset in the entry, or None when not fresh.
+        """
+        try:
+            with open(self._entry_path(namespace, fpath), "rb") as f:
+                header = pickle.load(f)
+                st = fpath.stat()
+                if self._is_fresh(header, fpath, st):
+                    return header, st, os.fstat(f.fileno()), f.tell()
+        except Exception:
+            pass
+        return None
+
+    def _load_fresh(
+        self, namespace: str, fpath: Path, header: dict,
+        st: os.stat_result, entry_st: os.stat_result, offset: int,
+    ) -> tuple[bool, Any]:
+        """Load the payload of an entry found by :meth:`_fresh_entry`."""
+        entry = self._entry_path(namespace, fpath)
+        try:
+            with open(entry, "rb") as f:
+                now = os.fstat(f.fileno())
+                if (now.st_ino, now.st_mtime_ns) != (entry_st.st_ino, entry_st.st_mtime_ns):
+                    return False, None
+                f.seek(offset)
+                value = pickle.load(f)
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", entry, e)
+            return False, None
+        self._hit(namespace, fpath, header, st, value)
+        return True, value
+
+    def _hit(
+        self, namespace: str, fpath: Path, header: dict,
+        st: os.stat_result, value: Any,
+    ) -> None:
+        if (header["mtime_ns"], header["size"]) != (st.st_mtime_ns, st.st_size):
+            # Same content under a new mtime: refresh so the next run
+            # can skip hashing.
+            self.store(namespace, fpath, value, digest=header["digest"])
+        self.hits += 1
+
+    @staticmethod
+    def _is_fresh(header: dict, fpath: Path, st: os.stat_result) -> bool:
+        if header.get("version") != cache_version():
+            return False
+        if header.get("path") != str(fpath.resolve()):
+            return False
+        if header["size"] != st.st_size:
+            return False
+        if header["mtime_ns"] == st.st_mtime_ns:
+            return True
+        return header["digest"] == _file_digest(fpath)
+
+
+def func_namespace(func: Callable[..., Any]) -> str:
+    """Cache namespace of a module-level parser function.
+
+    A :func:`functools.partial` of one is namespaced by the function and
+    its bound arguments, which must have a stable ``str()``.
+    """
+    if isinstance(func, functools.partial):
+        bound = [func_namespace(a) if callable(a) else str(a) for a in func.args]
+        bound += [f"{k}={v}" for k, v in sorted(func.keywords.items())]
+        return ":".join([func_namespace(func.func), *bound])
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+@functools.lru_cache(maxsize=None)
+def cache_version() -> str:
+    """Hash of the parser sources; changes invalidate every entry."""
+    h = hashlib.sha256()
+    h.update(f"{genos.__version__}\0{sys.version_info[:2]}\0".encode())
+    adapters_dir = Path(__file__).resolve().parent
+    sources = sorted(adapters_dir.rglob("*.py"))
+    sources.append(adapters_dir.parent / "uir" / "schema.py")
+    for src in sources:
+        h.update(src.name.encode("utf-8"))
+        h.update(src.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _file_digest(fpath: Path) -> str:
+    h = hashlib.sha256()
+    with open(fpath, "rb") as f:
+        for block in iter(functools.partial(f.read, 1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
@@ -1,3 +1,20 @@
-"""CircleMUD/tbaMUD adapter for parsing CircleMUD-derived MUD data."""
+"""CircleMUD/tbaMUD adapter for parsing CircleMUD-derived MUD data.
 
-from .adapter import CircleMudAdapter  # noqa: F401 — triggers register_adapter
+Importing the package is cheap: it only declares the detection
+:data:`MARKERS`.  ``CircleMudAdapter`` (and with it every parser module)
+is imported on first access.
+"""
+
+from __future__ import annotations
+
+from genos.adapters.fingerprint import dir_marker
+
+# lib/world/ with at least wld and mob directories
+MARKERS = (dir_marker("lib/world/wld"), dir_marker("lib/world/mob"))
+
+
+def __getattr__(name: str):
+    if name == "CircleMudAdapter":
+        from .adapter import CircleMudAdapter
+        return CircleMudAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,13 @@
 """CircleMUD/tbaMUD constant mappings."""
 
+# Ascii bitvectors ('a' = bit 0, ..., see asciiflag_conv in utils.c) are
+# decoded by the helpers shared with the other adapters.
+from genos.adapters.bitset import (  # noqa: F401
+    asciiflag_to_int,
+    asciiflag_to_list,
+    int_to_flag_list,
+)
+
 # ── Directions ──────────────────────────────────────────────────────────
 
 DIRECTIONS = {
@@ -153,42 +161,3 @@ ATTACK_TYPES = {
 # ── Trigger Types ───────────────────────────────────────────────────────
 
 TRIG_ATTACH_TYPES = {0: "mob", 1: "obj", 2: "wld"}
-
-# Bitvector letter-to-number mapping (CircleMUD uses 'a'=1, 'b'=2, ... for bitvectors)
-# The asciiflag_conv function in utils.c handles this
-def asciiflag_to_int(flag_str: str) -> int:
-    """Convert CircleMUD ascii bitvector string to integer.
-
-    CircleMUD uses a custom encoding where lowercase letters represent
-    bit positions (a=bit0, b=bit1, ..., z=bit25) and uppercase continue
-    (A=bit26, B=bit27, ...). Multiple letters set multiple bits.
-    A plain number is returned as-is.
-    """
-    if not flag_str or flag_str == "0":
-        return 0
-
-    # If it's a plain number, return it
-    try:
-        return int(flag_str)
-    except ValueError:
-        pass
-
-    result = 0
-    for ch in flag_str:
-        if ch.islower():
-            result |= 1 << (ord(ch) - ord('a'))
-        elif ch.isupper():
-            result |= 1 << (26 + ord(ch) - ord('A'))
-    return result
-
-
-def int_to_flag_list(value: int) -> list[int]:
-    """Convert an integer bitvector to a list of set bit positions."""
-    flags = []
-    bit = 0
-    while value > 0:
-        if value & 1:
-            flags.append(bit)
-        value >>= 1
-        bit += 1
-    return flags
@@ -0,0 +1,301 @@
+"""Shared reader for the CircleMUD tilde-record file formats.
+
+.wld, .obj, .mob, .zon, .trg, .shp and .qst files (and their Simoon
+variants) are sequences of ``#<vnum>`` records made of ``~``-terminated
+strings and whitespace-separated numeric lines.  :class:`RecordReader`
+walks the file text once with a single offset: lines and tilde strings
+are sliced straight out of the buffer, so no per-line list is built and
+every line is stripped at most once.
+
+Line semantics match ``text.split("\\n")``: a text ending in a newline
+has a final empty line, and the reader is exhausted once it has moved
+past the last line (:attr:`RecordReader.eof`).
+
+:func:`open_records` opens a world file for reading.  Files of at least
+:data:`MMAP_MIN_SIZE` bytes are memory-mapped and read by
+:class:`BufferRecordReader`, which scans the raw bytes for ``#``, ``~``
+and newlines and decodes only the lines and strings the parser asks
+for, so the decoded text of the whole file never exists.  Decoding
+slices that start and end at ASCII bytes gives exactly the text a full
+``read_text(errors="replace")`` would for UTF-8 and EUC-KR, whose
+multibyte sequences never contain ASCII bytes.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# A "~" ending its line, i.e. followed by nothing but whitespace.  Group
+# 1 is the end of that line.
+_TILDE_END = re.compile(r"~[^\S\n]*(\n|\Z)")
+
+# The last "~" of a line in a byte buffer.  Group 1 is the rest of the
+# line, which must still be checked for (possibly non-ASCII) whitespace;
+# group 2 is the end of the line.
+_TILDE_LAST = re.compile(rb"~([^~\n]*)(\n|\Z)")
+
+# A carriage return that is not part of a CRLF pair.
+_LONE_CR = re.compile(rb"\r(?!\n)")
+
+# Files at least this large are memory-mapped by open_records().
+MMAP_MIN_SIZE = 1 << 20
+
+
+class RecordReader:
+    """Cursor over the lines and tilde strings of a record file."""
+
+    __slots__ = ("text", "pos", "end")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # Offset of the start of the current line; end + 1 once every
+        # line has been consumed.
+        self.pos = 0
+        self.end = len(text)
+
+    @property
+    def eof(self) -> bool:
+        return self.pos > self.end
+
+    # ── Lines ───────────────────────────────────────────────────────────
+
+    def line(self) -> str | None:
+        """Consume the current line and return it right-stripped.
+
+        Returns None once the reader is exhausted.
+        """
+        pos = self.pos
+        if pos > self.end:
+            return None
+        eol = self.text.find("\n", pos)
+        if eol < 0:
+            eol = self.end
+        self.pos = eol + 1
+        return self.text[pos:eol].rstrip()
+
+    def peek(self) -> str:
+        """Return the current line right-stripped, without consuming it."""
+        eol = self.text.find("\n", self.pos)
+        if eol < 0:
+            eol = self.end
+        return self.text[self.pos:eol].rstrip()
+
+    def skip(self) -> None:
+        """Consume the current line."""
+        eol = self.text.find("\n", self.pos)
+        self.pos = (self.end if eol < 0 else eol) + 1
+
+    def fields(self) -> list[str]:
+        """Consume the current line and return its whitespace-split fields.
+
+        Returns an empty list once the reader is exhausted.
+        """
+        pos = self.pos
+        eol = self.text.find("\n", pos)
+        if eol < 0:
+            eol = self.end
+        self.pos = eol + 1
+        return self.text[pos:eol].split()
+
+    # ── Tilde strings ───────────────────────────────────────────────────
+
+    def tilde(self) -> str:
+        """Consume lines up to one ending in ``~``; return the stripped text.
+
+        The terminating ``~`` (and any whitespace after it) is dropped.
+        Without a terminator the rest of the file is consumed.
+        """
+        text, start = self.text, self.pos
+        # Fast path: the first "~" of the string is directly followed by
+        # the newline.
+        k = text.find("~\n", start)
+        if k >= 0 and text.find("~", start, k) < 0:
+            self.pos = k + 2
+            return text[start:k].strip()
+        m = _TILDE_END.search(text, start)
+        if m is not None:
+            self.pos = m.start(1) + 1
+            return text[start:m.start()].strip()
+        if start <= self.end:
+            self.pos = self.end + 1
+        return text[start:].strip()
+
+    # ── Records ─────────────────────────────────────────────────────────
+
+    def records(self, tilde_header: bool = False) -> Iterator[int]:
+        """Yield the vnum of each ``#<vnum>`` record, positioned after its header.
+
+        Lines up to the next header are skipped, a ``#$`` header ends the
+        scan, and headers without a numeric vnum are ignored.  With
+        *tilde_header*, headers are written ``#<vnum>~`` (shop files).
+        The caller parses the record body before asking for the next one.
+        """
+        text = self.text
+        while self.pos <= self.end:
+            pos = self.pos
+            if not text.startswith("#", pos):
+                k = text.find("\n#", pos)
+                if k < 0:
+                    self.pos = self.end + 1
+                    return
+                pos = k + 1
+            eol = text.find("\n", pos)
+            if eol < 0:
+                eol = self.end
+            self.pos = eol + 1
+            header = text[pos + 1:eol].rstrip()
+            if tilde_header:
+                header = header.rstrip("~")
+            header = header.strip()
+            if header.startswith("$"):
+                return
+            try:
+                vnum = int(header)
+            except ValueError:
+                continue
+            yield vnum
+
+
+class BufferRecordReader(RecordReader):
+    """:class:`RecordReader` over the raw bytes of a file (e.g. an mmap).
+
+    Boundaries are found on bytes; lines and strings are decoded from
+    *encoding* (with ``errors="replace"``) when they are returned.  ASCII
+    lines such as the numeric ones skip the codec entirely.  CRLF line
+    ends read as ``\\n``; buffers with lone carriage returns must be read
+    as text instead (:func:`open_records` does so).
+    """
+
+    __slots__ = ("encoding", "crlf")
+
+    def __init__(self, buf: bytes | mmap.mmap, encoding: str = "utf-8") -> None:
+        self.text = buf  # type: ignore[assignment]
+        self.pos = 0
+        self.end = len(buf)
+        self.encoding = encoding
+        self.crlf = buf.find(b"\r") >= 0
+
+    def _decode(self, raw: bytes) -> str:
+        if raw.isascii():
+            return raw.decode("ascii")
+        return raw.decode(self.encoding, "replace")
+
+    def _string(self, raw: bytes) -> str:
+        s = raw.decode("ascii") if raw.isascii() else raw.decode(self.encoding, "replace")
+        if self.crlf:
+            s = s.replace("\r\n", "\n")
+        return s.strip()
+
+    # ── Lines ───────────────────────────────────────────────────────────
+
+    def line(self) -> str | None:
+        pos = self.pos
+        if pos > self.end:
+            return None
+        eol = self.text.find(b"\n", pos)
+        if eol < 0:
+            eol = self.end
+        self.pos = eol + 1
+        raw = self.text[pos:eol]
+        if raw.isascii():
+            return raw.decode("ascii").rstrip()
+        return raw.decode(self.encoding, "replace").rstrip()
+
+    def peek(self) -> str:
+        eol = self.text.find(b"\n", self.pos)
+        if eol < 0:
+            eol = self.end
+        return self._decode(self.text[self.pos:eol]).rstrip()
+
+    def skip(self) -> None:
+        eol = self.text.find(b"\n", self.pos)
+        self.pos = (self.end if eol < 0 else eol) + 1
+
+    def fields(self) -> list[str]:
+        pos = self.pos
+        eol = self.text.find(b"\n", pos)
+        if eol < 0:
+            eol = self.end
+        self.pos = eol + 1
+        raw = self.text[pos:eol]
+        if raw.isascii():
+            return raw.decode("ascii").split()
+        return raw.decode(self.encoding, "replace").split()
+
+    # ── Tilde strings ───────────────────────────────────────────────────
+
+    def tilde(self) -> str:
+        buf, start = self.text, self.pos
+        k = buf.find(b"~\n", start)
+        if k >= 0 and buf.find(b"~", start, k) < 0:
+            self.pos = k + 2
+            raw = buf[start:k]
+            if raw.isascii() and not self.crlf:
+                return raw.decode("ascii").strip()
+            return self._string(raw)
+        for m in _TILDE_LAST.finditer(buf, start):
+            rest = m.group(1)
+            if not rest or rest.isspace() or self._decode(rest).isspace():
+                self.pos = m.start(2) + 1
+                return self._string(buf[start:m.start()])
+        if start <= self.end:
+            self.pos = self.end + 1
+        return self._string(buf[start:])
+
+    # ── Records ─────────────────────────────────────────────────────────
+
+    def records(self, tilde_header: bool = False) -> Iterator[int]:
+        buf = self.text
+        while self.pos <= self.end:
+            pos = self.pos
+            if buf[pos:pos + 1] != b"#":
+                k = buf.find(b"\n#", pos)
+                if k < 0:
+                    self.pos = self.end + 1
+                    return
+                pos = k + 1
+            eol = buf.find(b"\n", pos)
+            if eol < 0:
+                eol = self.end
+            self.pos = eol + 1
+            header = self._decode(buf[pos + 1:eol]).rstrip()
+            if tilde_header:
+                header = header.rstrip("~")
+            header = header.strip()
+            if header.startswith("$"):
+                return
+            try:
+                vnum = int(header)
+            except ValueError:
+                continue
+            yield vnum
+
+
+@contextmanager
+def open_records(
+    filepath: str | Path, encoding: str = "utf-8",
+) -> Iterator[RecordReader]:
+    """Open a record file for the duration of a ``with`` block.
+
+    Small files, and files with lone carriage returns (which text mode
+    reads as line breaks), are read and decoded whole; larger ones are
+    memory-mapped and decoded lazily.  Both give identical results.
+    """
+    filepath = Path(filepath)
+    if os.path.getsize(filepath) < MMAP_MIN_SIZE:
+        yield RecordReader(filepath.read_text(encoding=encoding, errors="replace"))
+        return
+    with open(filepath, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        if buf.find(b"\r") >= 0 and _LONE_CR.search(buf):
+            reader: RecordReader = RecordReader(
+                filepath.read_text(encoding=encoding, errors="replace"),
+            )
+        else:
+            reader = BufferRecordReader(buf, encoding)
+        yield reader
@@ -31,62 +31,49 @@ from pathlib import Path
 
 from genos.uir.schema import Shop
 
+from .records import RecordReader, open_records
+
 logger = logging.getLogger(__name__)
 
 
 def parse_shp_file(filepath: str | Path) -> list[Shop]:
     """Parse a single .shp file and return a list of Shop objects."""
     filepath = Path(filepath)
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    return parse_shp_text(text, str(filepath))
+    with open_records(filepath) as reader:
+        return parse_shp_records(reader, str(filepath))
 
 
 def parse_shp_text(text: str, source: str = "<string>") -> list[Shop]:
     """Parse .shp format text into Shop objects."""
-    shops: list[Shop] = []
-    lines = text.split("\n")
-    i = 0
-
-    # Skip file header line
-    if lines and lines[0].rstrip().startswith("CircleMUD"):
-        i += 1
+    return parse_shp_records(RecordReader(text), source)
 
-    while i < len(lines):
-        line = lines[i].rstrip()
 
-        if not line.startswith("#"):
-            i += 1
-            continue
-
-        # Shop vnum: #<num>~
-        vnum_str = line[1:].rstrip("~").strip()
-        if vnum_str.startswith("$"):
-            break
+def parse_shp_records(
+    reader: RecordReader, source: str = "<string>"
+) -> list[Shop]:
+    """Parse the records of a .shp file from *reader*."""
+    shops: list[Shop] = []
 
-        try:
-            vnum = int(vnum_str)
-        except ValueError:
-            i += 1
-            continue
+    # Skip file header line
+    if reader.peek().startswith("CircleMUD"):
+        reader.skip()
 
-        i += 1
-        shop, i = _parse_single_shop(vnum, lines, i, source)
+    # Shop vnum: #<num>~
+    for vnum in reader.records(tilde_header=True):
+        shop = _parse_single_shop(vnum, reader, source)
         if shop:
             shops.append(shop)
-
     return shops
 
 
 def _parse_single_shop(
-    vnum: int, lines: list[str], i: int, source: str
-) -> tuple[Shop | None, int]:
+    vnum: int, reader: RecordReader, source: str
+) -> Shop | None:
     """Parse a single shop block."""
     shop = Shop(vnum=vnum)
 
     # Item vnums (until -1)
-    while i < len(lines):
-        line = lines[i].rstrip()
-        i += 1
+    while (line := reader.line()) is not None:
         try:
             val = int(line)
         except ValueError:
@@ -96,25 +83,21 @@ def _parse_single_shop(
         shop.selling_items.append(val)
 
     # Profit buy
-    if i < len(lines):
+    if not reader.eof:
         try:
-            shop.profit_buy = float(lines[i].rstrip())
+            shop.profit_buy = float(reader.line())
         except ValueError:
             pass
-        i += 1
 
     # Profit sell
-    if i < len(lines):
+    if not reader.eof:
         try:
-            shop.profit_sell = float(lines[i].rstrip())
+            shop.profit_sell = float(reader.line())
         except ValueError:
             pass
-        i += 1
 
     # Accepting types (until -1)
-    while i < len(lines):
-        line = lines[i].rstrip()
-        i += 1
+    while (line := reader.line()) is not None:
         try:
             val = int(line)
         except ValueError:
@@ -124,10 +107,7 @@ def _parse_single_shop(
         shop.accepting_types.append(val)
 
     # 7 message strings (each ends with ~)
-    messages = []
-    for _ in range(7):
-        msg, i = _read_tilde_string(lines, i)
-        messages.append(msg)
+    messages = [reader.tilde() for _ in range(7)]
 
     if len(messages) >= 7:
         shop.no_such_item1 = messages[0]
@@ -139,42 +119,36 @@ def _parse_single_shop(
         shop.message_sell = messages[6]
 
     # temper
-    if i < len(lines):
+    if not reader.eof:
         try:
-            shop.temper = int(lines[i].rstrip())
+            shop.temper = int(reader.line())
         except ValueError:
             pass
-        i += 1
 
     # bitvector
-    if i < len(lines):
+    if not reader.eof:
         try:
-            shop.bitvector = int(lines[i].rstrip())
+            shop.bitvector = int(reader.line())
         except ValueError:
             pass
-        i += 1
 
     # keeper vnum
-    if i < len(lines):
+    if not reader.eof:
         try:
-            shop.keeper_vnum = int(lines[i].rstrip())
+            shop.keeper_vnum = int(reader.line())
         except ValueError:
             pass
-        i += 1
 
     # with_who
-    if i < len(lines):
+    if not reader.eof:
         try:
-            shop.with_who = int(lines[i].rstrip())
+            shop.with_who = int(reader.line())
         except ValueError:
             pass
-        i += 1
 
     # Shop rooms (until -1)
     first_room = True
-    while i < len(lines):
-        line = lines[i].rstrip()
-        i += 1
+    while (line := reader.line()) is not None:
         try:
             val = int(line)
         except ValueError:
@@ -187,25 +161,10 @@ def _parse_single_shop(
 
     # open1, close1, open2, close2
     for attr in ("open1", "close1", "open2", "close2"):
-        if i < len(lines):
+        if not reader.eof:
             try:
-                setattr(shop, attr, int(lines[i].rstrip()))
+                setattr(shop, attr, int(reader.line()))
             except ValueError:
                 pass
-            i += 1
-
-    return shop, i
 
-
-def _read_tilde_string(lines: list[str], i: int) -> tuple[str, int]:
-    """Read lines until a line ending with ~ is found."""
-    parts: list[str] = []
-    while i < len(lines):
-        line = lines[i]
-        i += 1
-        if line.rstrip().endswith("~"):
-            content = line.rstrip()[:-1]
-            parts.append(content)
-            break
-        parts.append(line.rstrip("\n"))
-    return "\n".join(parts).strip(), i
+    return shop
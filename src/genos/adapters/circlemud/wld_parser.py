@@ -26,7 +26,8 @@ from pathlib import Path
 
 from genos.uir.schema import Exit, ExtraDescription, Room
 
-from .constants import asciiflag_to_int, int_to_flag_list
+from .constants import asciiflag_to_list
+from .records import RecordReader, open_records
 
 logger = logging.getLogger(__name__)
 
@@ -34,102 +35,78 @@ logger = logging.getLogger(__name__)
 def parse_wld_file(filepath: str | Path) -> list[Room]:
     """Parse a single .wld file and return a list of Room objects."""
     filepath = Path(filepath)
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    return parse_wld_text(text, str(filepath))
+    with open_records(filepath) as reader:
+        return parse_wld_records(reader, str(filepath))
 
 
 def parse_wld_text(text: str, source: str = "<string>") -> list[Room]:
     """Parse .wld format text into Room objects."""
-    rooms: list[Room] = []
-    lines = text.split("\n")
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].rstrip()
-
-        # Skip empty lines and look for #vnum
-        if not line.startswith("#"):
-            i += 1
-            continue
+    return parse_wld_records(RecordReader(text), source)
 
-        vnum_str = line[1:].strip()
-        if vnum_str == "$" or vnum_str.startswith("$"):
-            break  # End of file marker
 
-        try:
-            vnum = int(vnum_str)
-        except ValueError:
-            i += 1
-            continue
-
-        i += 1
-        room, i = _parse_single_room(vnum, lines, i, source)
+def parse_wld_records(
+    reader: RecordReader, source: str = "<string>"
+) -> list[Room]:
+    """Parse the records of a .wld file from *reader*."""
+    rooms: list[Room] = []
+    for vnum in reader.records():
+        room = _parse_single_room(vnum, reader, source)
         if room:
             rooms.append(room)
-
     return rooms
 
 
 def _parse_single_room(
-    vnum: int, lines: list[str], i: int, source: str
-) -> tuple[Room | None, int]:
+    vnum: int, reader: RecordReader, source: str
+) -> Room | None:
     """Parse a single room block starting after the #vnum line."""
     room = Room(vnum=vnum)
 
     # Name (until ~)
-    room.name, i = _read_tilde_string(lines, i)
+    room.name = reader.tilde()
 
     # Description (until ~)
-    room.description, i = _read_tilde_string(lines, i)
+    room.description = reader.tilde()
 
     # Room stats line: zone_num flags sector [unlinked previous map_x [map_y]]
-    if i < len(lines):
-        parts = lines[i].rstrip().split()
-        i += 1
-        if len(parts) >= 3:
-            room.zone_number = int(parts[0])
-            flags_int = asciiflag_to_int(parts[1])
-            room.room_flags = int_to_flag_list(flags_int)
-            room.sector_type = int(parts[2])
-        if len(parts) >= 4:
-            room.extensions["tba_unlinked"] = int(parts[3])
-        if len(parts) >= 5:
-            room.extensions["tba_previous"] = int(parts[4])
-        if len(parts) >= 6:
-            room.extensions["tba_map_x"] = int(parts[5])
-        if len(parts) >= 7:
-            room.extensions["tba_map_y"] = int(parts[6])
+    parts = reader.fields()
+    if len(parts) >= 3:
+        room.zone_number = int(parts[0])
+        room.room_flags = asciiflag_to_list(parts[1])
+        room.sector_type = int(parts[2])
+    if len(parts) >= 4:
+        room.extensions["tba_unlinked"] = int(parts[3])
+    if len(parts) >= 5:
+        room.extensions["tba_previous"] = int(parts[4])
+    if len(parts) >= 6:
+        room.extensions["tba_map_x"] = int(parts[5])
+    if len(parts) >= 7:
+        room.extensions["tba_map_y"] = int(parts[6])
 
     # Parse optional sections: D (exits), E (extra descs), T (triggers), S (end)
-    while i < len(lines):
-        line = lines[i].rstrip()
-
+    while (line := reader.line()) is not None:
         if line == "S":
-            i += 1
             # In CircleMUD, T (trigger) lines come AFTER the S marker
-            while i < len(lines):
-                tline = lines[i].rstrip()
-                if tline.startswith("T "):
-                    try:
-                        trg_vnum = int(tline.split()[1])
-                        room.trigger_vnums.append(trg_vnum)
-                    except (IndexError, ValueError):
-                        pass
-                    i += 1
-                else:
+            while not reader.eof:
+                tline = reader.peek()
+                if not tline.startswith("T "):
                     break
+                try:
+                    trg_vnum = int(tline.split()[1])
+                    room.trigger_vnums.append(trg_vnum)
+                except (IndexError, ValueError):
+                    pass
+                reader.skip()
             break
 
         if line.startswith("D"):
             direction = int(line[1:].strip())
-            i += 1
-            exit_obj, i = _parse_exit(direction, lines, i)
+            exit_obj = _parse_exit(direction, reader)
             if exit_obj:
                 room.exits.append(exit_obj)
 
         elif line == "E":
-            i += 1
-            ed, i = _parse_extra_desc(lines, i)
+            ed = _parse_extra_desc(reader)
             if ed:
                 room.extra_descriptions.append(ed)
 
@@ -139,62 +116,33 @@ def _parse_single_room(
                 room.trigger_vnums.append(trg_vnum)
             except (IndexError, ValueError):
                 pass
-            i += 1
-
-        else:
-            i += 1
 
-    return room, i
+    return room
 
 
-def _parse_exit(
-    direction: int, lines: list[str], i: int
-) -> tuple[Exit | None, int]:
+def _parse_exit(direction: int, reader: RecordReader) -> Exit | None:
     """Parse an exit block (after D<dir> line)."""
     exit_obj = Exit(direction=direction, destination=-1)
 
     # Exit description (until ~)
-    exit_obj.description, i = _read_tilde_string(lines, i)
+    exit_obj.description = reader.tilde()
 
     # Keywords (until ~)
-    exit_obj.keyword, i = _read_tilde_string(lines, i)
+    exit_obj.keyword = reader.tilde()
 
     # door_flags key_vnum destination
-    if i < len(lines):
-        parts = lines[i].rstrip().split()
-        i += 1
-        if len(parts) >= 3:
-            exit_obj.door_flags = int(parts[0])
-            exit_obj.key_vnum = int(parts[1])
-            exit_obj.destination = int(parts[2])
+    parts = reader.fields()
+    if len(parts) >= 3:
+        exit_obj.door_flags = int(parts[0])
+        exit_obj.key_vnum = int(parts[1])
+        exit_obj.destination = int(parts[2])
 
-    return exit_obj, i
+    return exit_obj
 
 
-def _parse_extra_desc(
-    lines: list[str], i: int
-) -> tuple[ExtraDescription | None, int]:
+def _parse_extra_desc(reader: RecordReader) -> ExtraDescription | None:
     """Parse an extra description block (after E line)."""
     ed = ExtraDescription()
-    ed.keywords, i = _read_tilde_string(lines, i)
-    ed.description, i = _read_tilde_string(lines, i)
-    return ed, i
-
-
-def _read_tilde_string(lines: list[str], i: int) -> tuple[str, int]:
-    """Read lines until a line ending with ~ is found.
-
-    Returns the concatenated text (without the trailing ~) and the new index.
-    """
-    parts: list[str] = []
-    while i < len(lines):
-        line = lines[i]
-        i += 1
-        if line.rstrip().endswith("~"):
-            # Remove the trailing ~
-            content = line.rstrip()[:-1]
-            parts.append(content)
-            break
-        parts.append(line.rstrip("\n"))
-
-    return "\n".join(parts).strip(), i
+    ed.keywords = reader.tilde()
+    ed.description = reader.tilde()
+    return ed
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import importlib
+import json
+import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-from .base import BaseAdapter
+from .fingerprint import DetectionContext, Marker
+
+if TYPE_CHECKING:
+    from .base import BaseAdapter
+
+logger = logging.getLogger(__name__)
 
 
 _ADAPTER_REGISTRY: list[type[BaseAdapter]] = []
-_adapters_loaded: bool = False
 
 # Adapters listed earlier have higher priority (checked first).
 # More specific adapters should come before generic fallbacks.
@@ -19,45 +28,150 @@ _ADAPTER_ORDER: list[str] = [
     "CircleMudAdapter",  # CircleMUD/tbaMUD: generic fallback
 ]
 
+# Packages of the built-in adapters.  Each declares its MARKERS and only
+# imports the adapter module (and its parsers) when the class is used,
+# so detection loads the parsers of the matching adapter alone.
+_ADAPTER_PACKAGES: dict[str, str] = {
+    "LPMudAdapter": "genos.adapters.lpmud",
+    "ThreeEyesAdapter": "genos.adapters.threeeyes",
+    "SimoonAdapter": "genos.adapters.simoon",
+    "CircleMudAdapter": "genos.adapters.circlemud",
+}
+
+# File under the parse cache directory remembering detected adapters.
+DETECTION_CACHE_NAME = "detected.json"
+
 
 def register_adapter(cls: type[BaseAdapter]) -> type[BaseAdapter]:
-    """Decorator to register an adapter class for auto-detection."""
+    """Decorator to register an adapter class for auto-detection.
+
+    The adapter must declare :attr:`~BaseAdapter.markers` or override
+    :meth:`~BaseAdapter.detect`.
+    """
+    from .base import BaseAdapter
+
+    if not cls.markers and cls.detect is BaseAdapter.detect:
+        raise TypeError(
+            f"{cls.__name__} must declare markers or override detect()"
+        )
     if cls not in _ADAPTER_REGISTRY:
         _ADAPTER_REGISTRY.append(cls)
     return cls
 
 
-def detect_mud_type(source_path: str | Path) -> BaseAdapter | None:
+def detect_mud_type(
+    source_path: str | Path, cache_dir: str | Path | None = None,
+) -> BaseAdapter | None:
     """Try each registered adapter's detect() and return the first match.
 
     Adapters are checked in priority order defined by _ADAPTER_ORDER,
-    so more specific adapters are tried before generic ones.
+    so more specific adapters are tried before generic ones.  They all
+    check their markers against one shared :class:`DetectionContext`.
+
+    With *cache_dir*, the detected adapter is remembered per source path
+    in ``<cache_dir>/detected.json`` and reused while the source root's
+    mtime is unchanged and that adapter's markers still match.
     """
-    _ensure_adapters_loaded()
     source_path = Path(source_path)
+    context = DetectionContext(source_path)
+
+    cache_path = key = None
+    if cache_dir is not None:
+        cache_path = Path(cache_dir) / DETECTION_CACHE_NAME
+        key = _cache_key(source_path)
+        cached = _load_detected(cache_path).get(key)
+        if isinstance(cached, list) and len(cached) == 2:
+            name, mtime = cached
+            if mtime is not None and mtime == _root_mtime(source_path):
+                for candidate, markers in _candidates():
+                    if candidate == name and context.matches_all(markers):
+                        adapter = _adapter_class(name)(source_path)
+                        if _detects(adapter, context):
+                            return adapter
 
-    # Sort registry by priority order
-    def _sort_key(cls: type[BaseAdapter]) -> int:
-        name = cls.__name__
-        try:
-            return _ADAPTER_ORDER.index(name)
-        except ValueError:
-            return len(_ADAPTER_ORDER)
-
-    ordered = sorted(_ADAPTER_REGISTRY, key=_sort_key)
-    for cls in ordered:
-        adapter = cls(source_path)
-        if adapter.detect():
+    for name, markers in _candidates():
+        # Markers are checked before the adapter module is imported
+        if not context.matches_all(markers):
+            continue
+        adapter = _adapter_class(name)(source_path)
+        if _detects(adapter, context):
+            if cache_path is not None:
+                _store_detected(
+                    cache_path, key, [name, _root_mtime(source_path)],
+                )
             return adapter
     return None
 
 
-def _ensure_adapters_loaded() -> None:
-    """Import adapter modules on first use so they self-register."""
-    global _adapters_loaded
-    if not _adapters_loaded:
-        _adapters_loaded = True
-        import genos.adapters.lpmud      # noqa: F401
-        import genos.adapters.threeeyes  # noqa: F401
-        import genos.adapters.simoon     # noqa: F401
-        import genos.adapters.circlemud  # noqa: F401
+def _candidates() -> Iterator[tuple[str, tuple[Marker, ...]]]:
+    """``(class name, markers)`` of every adapter, by priority.
+
+    Built-in adapters come first, in _ADAPTER_ORDER; adapters registered
+    with :func:`register_adapter` from elsewhere follow.
+    """
+    for name in _ADAPTER_ORDER:
+        yield name, importlib.import_module(_ADAPTER_PACKAGES[name]).MARKERS
+    for cls in list(_ADAPTER_REGISTRY):
+        if cls.__name__ not in _ADAPTER_PACKAGES:
+            yield cls.__name__, cls.markers
+
+
+def _adapter_class(name: str) -> type[BaseAdapter]:
+    package = _ADAPTER_PACKAGES.get(name)
+    if package is not None:
+        return getattr(importlib.import_module(package), name)
+    return next(cls for cls in _ADAPTER_REGISTRY if cls.__name__ == name)
+
+
+def _detects(adapter: BaseAdapter, context: DetectionContext) -> bool:
+    """Whether *adapter* accepts the source, sharing *context* if it can.
+
+    Built-in adapters and the inherited marker check take the shared
+    context; other overrides keep the ``detect(self)`` signature adapters
+    have always implemented and are called without it.
+    """
+    from .base import BaseAdapter
+
+    cls = type(adapter)
+    if cls.__name__ in _ADAPTER_PACKAGES or cls.detect is BaseAdapter.detect:
+        return adapter.detect(context)
+    return adapter.detect()
+
+
+# ── Detection cache ─────────────────────────────────────────────────
+
+
+def _cache_key(source_path: Path) -> str:
+    try:
+        return str(source_path.resolve())
+    except OSError:
+        return str(source_path.absolute())
+
+
+def _root_mtime(source_path: Path) -> int | None:
+    try:
+        return source_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_detected(cache_path: Path) -> dict[str, list]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_detected(cache_path: Path, key: str, value: list) -> None:
+    data = _load_detected(cache_path)
+    data[key] = value
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        logger.debug("Could not cache detected MUD type: %s", e)
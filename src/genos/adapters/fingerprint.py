@@ -0,0 +1,111 @@
+"""Cheap source-tree fingerprints for adapter detection.
+
+Detection used to have every adapter probe the tree on its own (globs,
+``rglob`` over the whole lib, a stat per candidate file), which takes
+seconds on network-mounted sources.  Instead, adapters declare the
+:class:`Marker` paths that identify their layout and
+:func:`~genos.adapters.detector.detect_mud_type` checks them all against
+one :class:`DetectionContext`.  The context lists each directory it is
+asked about once, with ``os.scandir``, so the adapters share a handful
+of listings near the top of the tree.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class Marker:
+    """A path that must exist under the source root.
+
+    *paths* are alternatives relative to the root, ``/``-separated, with
+    glob patterns allowed in any component; the marker holds when one of
+    them matches.  *is_dir* restricts the match to directories (True) or
+    files (False).  With *record_size*, a matching file must also be a
+    non-empty multiple of that many bytes.
+    """
+
+    paths: tuple[str, ...]
+    is_dir: bool | None = None
+    record_size: int = 0
+
+
+def dir_marker(*paths: str) -> Marker:
+    return Marker(paths, is_dir=True)
+
+
+def file_marker(*paths: str, record_size: int = 0) -> Marker:
+    return Marker(paths, is_dir=False if record_size else None,
+                  record_size=record_size)
+
+
+class DetectionContext:
+    """Memoized directory listings of one source tree."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._listings: dict[str, dict[str, os.DirEntry]] = {}
+
+    def listing(self, rel: str = "") -> dict[str, os.DirEntry]:
+        """Entries of directory *rel* by name (empty if it is not a directory)."""
+        entries = self._listings.get(rel)
+        if entries is None:
+            try:
+                with os.scandir(self.root / rel) as it:
+                    entries = {e.name: e for e in it}
+            except OSError:
+                entries = {}
+            self._listings[rel] = entries
+        return entries
+
+    def find(self, path: str) -> list[os.DirEntry]:
+        """Entries matching *path* (glob components allowed), sorted by path."""
+        found = [("", None)]
+        for part in path.split("/"):
+            nxt = []
+            for rel, entry in found:
+                if entry is not None and not _is_dir(entry):
+                    continue
+                entries = self.listing(rel)
+                if _GLOB_CHARS.isdisjoint(part):
+                    names = [part] if part in entries else []
+                else:
+                    names = sorted(n for n in entries if fnmatchcase(n, part))
+                nxt.extend((f"{rel}/{n}" if rel else n, entries[n]) for n in names)
+            found = nxt
+        return [entry for _, entry in found]
+
+    def matches(self, marker: Marker) -> bool:
+        for path in marker.paths:
+            for entry in self.find(path):
+                if marker.is_dir is not None and _is_dir(entry) != marker.is_dir:
+                    continue
+                if marker.record_size and not _is_record_file(entry, marker.record_size):
+                    continue
+                return True
+        return False
+
+    def matches_all(self, markers: Iterable[Marker]) -> bool:
+        return all(self.matches(m) for m in markers)
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_record_file(entry: os.DirEntry, record_size: int) -> bool:
+    try:
+        size = entry.stat().st_size
+    except OSError:
+        return False
+    return size > 0 and size % record_size == 0
@@ -1,3 +1,24 @@
-"""LP-MUD/FluffOS adapter for LPC source file parsing."""
+"""LP-MUD/FluffOS adapter for LPC source file parsing.
 
-from .adapter import LPMudAdapter  # noqa: F401
+Importing the package is cheap: it only declares the detection
+:data:`MARKERS`.  ``LPMudAdapter`` (and with it every parser module) is
+imported on first access.
+"""
+
+from __future__ import annotations
+
+from genos.adapters.fingerprint import dir_marker, file_marker
+
+# FluffOS driver binary plus the LPC library structure directories
+MARKERS = (
+    dir_marker("lib"),
+    file_marker("bin/driver", "bin/fluffos*"),
+    dir_marker("lib/구조", "lib/삽입파일"),
+)
+
+
+def __getattr__(name: str):
+    if name == "LPMudAdapter":
+        from .adapter import LPMudAdapter
+        return LPMudAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,8 +17,9 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Any, Iterator, NamedTuple
 
-from genos.adapters.base import AnalysisReport, BaseAdapter
+from genos.adapters.base import AnalysisReport, BaseAdapter, UIRChunks
 from genos.adapters.detector import register_adapter
 from genos.uir.schema import (
     CombatSystem,
@@ -30,6 +31,7 @@ from genos.uir.schema import (
     ZoneResetCommand,
 )
 
+from . import MARKERS
 from .class_parser import parse_classes
 from .command_parser import parse_all_commands
 from .config_parser import (
@@ -39,11 +41,10 @@ from .config_parser import (
     parse_stat_formulas,
 )
 from .help_parser import parse_all_help
-from .mob_parser import parse_all_monsters
-from .obj_parser import parse_all_items
-from .room_parser import parse_all_rooms, resolve_exits
+from .room_parser import resolve_exits
 from .skill_parser import parse_skills
 from .vnum_generator import VnumGenerator
+from .world_parser import iter_world
 
 logger = logging.getLogger(__name__)
 
@@ -52,58 +53,27 @@ logger = logging.getLogger(__name__)
 ROOM_DIRS = ["방"]
 
 
+class _RoomRef(NamedTuple):
+    """What zone inference and reset commands need of a parsed room."""
+
+    vnum: int
+    name: str
+    zone_number: int
+    room_inventory: dict[str, int]
+    limit_mob: dict[str, int]
+
+
 @register_adapter
 class LPMudAdapter(BaseAdapter):
     """Adapter for LP-MUD/FluffOS (LPC source code format)."""
 
+    markers = MARKERS
+
     def __init__(self, source_path: str | Path) -> None:
         super().__init__(source_path)
         self._lib_dir = self.source_path / "lib"
         self._bin_dir = self.source_path / "bin"
 
-    def detect(self) -> bool:
-        """Detect LP-MUD by checking for FluffOS driver and LPC structure.
-
-        Requires:
-        1. bin/driver OR bin/fluffos* exists
-        2. lib/구조/ OR lib/삽입파일/ directory exists
-        3. At least one .c file with 'inherit LIB_' pattern in lib/
-        """
-        if not self._lib_dir.is_dir():
-            return False
-
-        # Check for driver binary
-        has_driver = False
-        if self._bin_dir.is_dir():
-            has_driver = (
-                (self._bin_dir / "driver").exists()
-                or any(self._bin_dir.glob("fluffos*"))
-            )
-
-        if not has_driver:
-            return False
-
-        # Check for LPC structure directories
-        has_structure = (
-            (self._lib_dir / "구조").is_dir()
-            or (self._lib_dir / "삽입파일").is_dir()
-        )
-        if not has_structure:
-            return False
-
-        # Check for LPC inherit pattern in at least one .c file
-        for c_file in self._lib_dir.rglob("*.c"):
-            try:
-                raw = c_file.read_bytes()
-                if b"inherit LIB_" in raw:
-                    return True
-            except Exception:
-                continue
-            # Only check first 20 files for speed
-            break
-
-        return True
-
     def analyze(self) -> AnalysisReport:
         """Quick analysis without full parsing."""
         report = AnalysisReport(
@@ -174,6 +144,16 @@ class LPMudAdapter(BaseAdapter):
 
     def parse(self) -> UIR:
         """Parse all LP-MUD data into a UIR."""
+        uir, chunks = self.parse_stream()
+        for section, entities in chunks:
+            getattr(uir, section).extend(entities)
+        return uir
+
+    def parse_stream(self) -> tuple[UIR, UIRChunks]:
+        """Parse world files one at a time, yielding each file's entity.
+
+        Zones are inferred from every room, so they come last.
+        """
         uir = UIR()
         uir.source_mud = SourceMudInfo(
             name="10woongi",
@@ -181,45 +161,64 @@ class LPMudAdapter(BaseAdapter):
             codebase="LP-MUD (FluffOS/MudOS)",
             source_path=str(self.source_path),
         )
+        uir.migration_stats = MigrationStats()
+        return uir, self._stream(uir)
 
-        stats = MigrationStats()
+    def _stream(self, uir: UIR) -> UIRChunks:
+        """Yield world chunks, then fill in the remaining sections."""
+        stats = uir.migration_stats
         vnum_gen = VnumGenerator()
 
         # Phase 1: Header files (classes, skills)
         uir.character_classes = self._parse_classes(stats)
         uir.skills = self._parse_skills(stats)
 
-        # Phase 2: Rooms (2-pass for exit resolution)
-        uir.rooms, pending_exits = self._parse_rooms(stats, vnum_gen)
-        resolve_exits(uir.rooms, pending_exits, vnum_gen)
-
-        # Phase 3: Monsters and Items
-        uir.monsters = self._parse_monsters(stats, vnum_gen)
-        uir.items = self._parse_items(stats, vnum_gen)
+        # Phase 2: Rooms, monsters and items (one walk, parsed per file)
+        # Phase 3: Exits (destination paths -> VNUMs)
+        # Zones and reset commands only need these fields of each room
+        rooms: list[_RoomRef] = []
+        vnums: dict[str, set[int]] = {"monsters": set(), "items": set()}
+        counts = {"monsters": 0, "items": 0}
+        for kind, entity, exits in self._parse_world(stats, vnum_gen):
+            if kind == "rooms":
+                if exits:
+                    resolve_exits([entity], {entity.vnum: exits}, vnum_gen)
+                rooms.append(_RoomRef(
+                    entity.vnum, entity.name, entity.zone_number,
+                    entity.extensions.get("room_inventory", {}),
+                    entity.extensions.get("limit_mob", {}),
+                ))
+            else:
+                vnums[kind].add(entity.vnum)
+                counts[kind] += 1
+            yield kind, [entity]
 
         # Phase 4: Help and Commands
         uir.help_entries = self._parse_help(stats)
         uir.commands = self._parse_commands(stats)
 
         # Phase 5: Infer zones from room directories
-        uir.zones = self._infer_zones(uir.rooms, vnum_gen)
+        zones = self._infer_zones(rooms, vnum_gen)
 
         # Phase 5b: Generate zone reset commands from room inventories
-        self._build_reset_commands(uir, vnum_gen)
+        self._build_reset_commands(
+            zones, rooms, vnums["monsters"], vnums["items"], vnum_gen,
+        )
+        if zones:
+            yield "zones", zones
 
         # Phase 6: Game configuration (settings, driver config, combat, formulas)
         uir.game_configs = self._parse_configs(stats)
 
         # Stats
-        stats.total_rooms = len(uir.rooms)
-        stats.total_items = len(uir.items)
-        stats.total_monsters = len(uir.monsters)
-        stats.total_zones = len(uir.zones)
+        stats.total_rooms = len(rooms)
+        stats.total_items = counts["items"]
+        stats.total_monsters = counts["monsters"]
+        stats.total_zones = len(zones)
         stats.total_help_entries = len(uir.help_entries)
         stats.total_skills = len(uir.skills)
         stats.total_commands = len(uir.commands)
         stats.total_game_configs = len(uir.game_configs)
-        uir.migration_stats = stats
 
         uir.combat_system = CombatSystem(
             type="stat_based",
@@ -242,8 +241,6 @@ class LPMudAdapter(BaseAdapter):
         # Store vnum path map in extensions for debugging
         uir.extensions["vnum_path_map_size"] = len(vnum_gen.get_path_map())
 
-        return uir
-
     # ── Parse helpers ──────────────────────────────────────────────
 
     def _parse_classes(self, stats: MigrationStats) -> list:
@@ -266,26 +263,16 @@ class LPMudAdapter(BaseAdapter):
             stats.warnings.append(f"Error parsing skills: {e}")
             return []
 
-    def _parse_rooms(self, stats: MigrationStats, vnum_gen: VnumGenerator) -> tuple:
+    def _parse_world(
+        self, stats: MigrationStats, vnum_gen: VnumGenerator,
+    ) -> Iterator[tuple[str, Any, dict[str, str] | None]]:
         try:
-            return parse_all_rooms(self._lib_dir, ROOM_DIRS, vnum_gen)
-        except Exception as e:
-            stats.warnings.append(f"Error parsing rooms: {e}")
-            return [], {}
-
-    def _parse_monsters(self, stats: MigrationStats, vnum_gen: VnumGenerator) -> list:
-        try:
-            return parse_all_monsters(self._lib_dir, ROOM_DIRS, vnum_gen)
-        except Exception as e:
-            stats.warnings.append(f"Error parsing monsters: {e}")
-            return []
-
-    def _parse_items(self, stats: MigrationStats, vnum_gen: VnumGenerator) -> list:
-        try:
-            return parse_all_items(self._lib_dir, ROOM_DIRS, vnum_gen)
+            yield from iter_world(
+                self._lib_dir, ROOM_DIRS, vnum_gen,
+                jobs=self.jobs, cache=self.cache, warnings=stats.warnings,
+            )
         except Exception as e:
-            stats.warnings.append(f"Error parsing items: {e}")
-            return []
+            stats.warnings.append(f"Error parsing world files: {e}")
 
     def _parse_help(self, stats: MigrationStats) -> list:
         help_dir = self._lib_dir / "도움말"
@@ -352,7 +339,7 @@ class LPMudAdapter(BaseAdapter):
             unique.append(gc)
         return unique
 
-    def _infer_zones(self, rooms: list, vnum_gen: VnumGenerator) -> list[Zone]:
+    def _infer_zones(self, rooms: list[_RoomRef], vnum_gen: VnumGenerator) -> list[Zone]:
         """Infer zones from room directory structure."""
         zone_rooms: dict[int, list] = {}
         zone_names: dict[int, str] = {}
@@ -386,15 +373,20 @@ class LPMudAdapter(BaseAdapter):
 
         return zones
 
-    def _build_reset_commands(self, uir: UIR, vnum_gen: VnumGenerator) -> None:
+    def _build_reset_commands(
+        self,
+        zones: list[Zone],
+        rooms: list[_RoomRef],
+        mob_vnums: set[int],
+        item_vnums: set[int],
+        vnum_gen: VnumGenerator,
+    ) -> None:
         """Generate zone reset commands from room_inventory/limit_mob extensions."""
-        mob_vnums = {m.vnum for m in uir.monsters}
-        item_vnums = {i.vnum for i in uir.items}
-        zone_map = {z.vnum: z for z in uir.zones}
+        zone_map = {z.vnum: z for z in zones}
 
-        for room in uir.rooms:
-            room_inv = room.extensions.get("room_inventory", {})
-            limit_mob = room.extensions.get("limit_mob", {})
+        for room in rooms:
+            room_inv = room.room_inventory
+            limit_mob = room.limit_mob
 
             for path, count in room_inv.items():
                 entity_vnum = vnum_gen.path_to_vnum(path)
@@ -7,7 +7,9 @@ from FluffOS/LP-MUD .c source files encoded in EUC-KR.
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterator, Union
 
 
 def read_lpc_file(filepath: Path, encoding: str = "euc-kr") -> str:
@@ -39,64 +41,22 @@ def extract_string_call(text: str, method: str) -> str | None:
         setLong("line1 "
                 "line2");
     """
-    # Match method call with opening paren
-    pattern = re.compile(
-        rf"{re.escape(method)}\s*\(", re.DOTALL,
-    )
-    m = pattern.search(text)
-    if not m:
-        return None
-
-    start = m.end()
-    # Collect all consecutive string fragments
-    result_parts: list[str] = []
-    pos = start
-    rest = text[pos:]
-
-    while True:
-        rest = rest.lstrip()
-        if not rest or rest[0] == ")":
-            break
-        if rest[0] == '"':
-            s, consumed = _parse_string_literal(rest)
-            if s is not None:
-                result_parts.append(s)
-                rest = rest[consumed:]
-                continue
-            break
-        # Skip non-string chars (like + or whitespace)
-        if rest[0] in ("+", "\n", "\r", "\t", " "):
-            rest = rest[1:]
-            continue
-        break
-
-    if result_parts:
-        return "".join(result_parts)
-    return None
+    return LpcCalls(text).string_call(method)
 
 
 def extract_int_call(text: str, method: str) -> int | None:
     """Extract integer argument from setXxx(N) call."""
-    pattern = re.compile(
-        rf"{re.escape(method)}\s*\(\s*(-?\d+)\s*\)",
-    )
-    m = pattern.search(text)
-    return int(m.group(1)) if m else None
+    return LpcCalls(text).int_call(method)
 
 
 def extract_float_call(text: str, method: str) -> float | None:
     """Extract float argument from setXxx(N.N) call."""
-    pattern = re.compile(
-        rf"{re.escape(method)}\s*\(\s*(-?\d+\.?\d*)\s*\)",
-    )
-    m = pattern.search(text)
-    return float(m.group(1)) if m else None
+    return LpcCalls(text).float_call(method)
 
 
 def extract_void_call(text: str, method: str) -> bool:
     """Check if setXxx() (no args or with args) is called."""
-    pattern = re.compile(rf"{re.escape(method)}\s*\(")
-    return bool(pattern.search(text))
+    return LpcCalls(text).void_call(method)
 
 
 def extract_mapping(text: str, method: str) -> dict | None:
@@ -104,20 +64,7 @@ def extract_mapping(text: str, method: str) -> dict | None:
 
     Returns dict of string->string or string->int.
     """
-    pattern = re.compile(
-        rf"{re.escape(method)}\s*\(\s*\(\[", re.DOTALL,
-    )
-    m = pattern.search(text)
-    if not m:
-        return None
-
-    # Find matching ]))
-    start = m.end()
-    content = _extract_balanced(text, start - 2, "([", "])")
-    if content is None:
-        return None
-
-    return _parse_mapping_content(content)
+    return LpcCalls(text).mapping(method)
 
 
 def extract_array(text: str, method: str) -> list | None:
@@ -125,56 +72,27 @@ def extract_array(text: str, method: str) -> list | None:
 
     Returns list of strings.
     """
-    pattern = re.compile(
-        rf"{re.escape(method)}\s*\(\s*\(\{{", re.DOTALL,
-    )
-    m = pattern.search(text)
-    if not m:
-        return None
-
-    start = m.end()
-    content = _extract_balanced(text, start - 2, "({", "})")
-    if content is None:
-        return None
-
-    return _parse_array_content(content)
+    return LpcCalls(text).array(method)
 
 
 def extract_string_pair_call(text: str, method: str) -> tuple[str, int] | None:
     """Extract (string, int) pair from setXxx("str", N) call."""
-    pattern = re.compile(
-        rf'{re.escape(method)}\s*\(\s*"([^"]*?)"\s*,\s*(-?\d+)\s*\)',
-    )
-    m = pattern.search(text)
-    if m:
-        return (m.group(1), int(m.group(2)))
-    return None
+    return LpcCalls(text).string_pair_call(method)
 
 
 def extract_all_string_pair_calls(text: str, method: str) -> list[tuple[str, int]]:
     """Extract all (string, int) pairs from repeated setXxx("str", N) calls."""
-    pattern = re.compile(
-        rf'{re.escape(method)}\s*\(\s*"([^"]*?)"\s*,\s*(-?\d+)\s*\)',
-    )
-    return [(m.group(1), int(m.group(2))) for m in pattern.finditer(text)]
+    return LpcCalls(text).all_string_pair_calls(method)
 
 
 def extract_clone_items(text: str) -> list[str]:
     """Extract all cloneItem("path") calls."""
-    pattern = re.compile(r'cloneItem\s*\(\s*"([^"]+)"\s*\)')
-    return [m.group(1) for m in pattern.finditer(text)]
+    return LpcCalls(text).clone_items()
 
 
 def extract_prop_calls(text: str) -> dict[str, str | int]:
     """Extract all setProp("key", value) calls."""
-    result: dict[str, str | int] = {}
-    # String value
-    for m in re.finditer(r'setProp\s*\(\s*"([^"]+)"\s*,\s*"([^"]*?)"\s*\)', text):
-        result[m.group(1)] = m.group(2)
-    # Int value
-    for m in re.finditer(r'setProp\s*\(\s*"([^"]+)"\s*,\s*(-?\d+)\s*\)', text):
-        result[m.group(1)] = int(m.group(2))
-    return result
+    return LpcCalls(text).prop_calls()
 
 
 def strip_color_codes(text: str) -> str:
@@ -189,9 +107,290 @@ def strip_help_color_codes(text: str) -> str:
     return text
 
 
+# ── Call table ──────────────────────────────────────────────────────
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_CHAR = r"'(?:[^'\\]|\\.)'"
+_CALL = r"([^\W\d]\w*)\s*\((?![\[{])"
+
+# Call sites; literals are matched whole so calls inside them are skipped
+_SITE_RE = re.compile(rf"{_STRING}|{_CHAR}|{_CALL}", re.DOTALL)
+
+# Tokens delimiting an argument list.  Anything else is read back from
+# the source span of the argument it belongs to.
+_TOKEN_RE = re.compile(
+    rf"""
+    (?P<str>{_STRING})
+  | (?P<chr>{_CHAR})
+  | (?P<call>{_CALL})
+  | (?P<open>\(\[|\(\{{|\()
+  | (?P<close>\]\)|\}}\)|\))
+  | (?P<sep>[,:;])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.?\d*")
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t"}
+
+
+@dataclass(frozen=True)
+class LpcExpr:
+    """A call argument that is not a literal, kept as its source text."""
+
+    source: str
+
+
+LpcValue = Union[str, int, float, dict, list, LpcExpr]
+
+
+class LpcCalls:
+    """Table of the ``name(...)`` calls in an LPC source.
+
+    One regex walk over the text records where every call starts, calls
+    nested in arguments included.  :meth:`args` parses the arguments of
+    a method's calls into values on first use: a ``str`` (adjacent or
+    ``+``-joined literals concatenated), ``int``, ``float``, ``dict`` for
+    a ``([ ])`` mapping, ``list`` for a ``({ })`` array, or an
+    :class:`LpcExpr`.  Mapping and array elements are literals or their
+    stripped source text.
+
+    The query methods mirror the ``extract_*`` functions; a parser that
+    asks for dozens of setters scans the file once and reads each
+    queried call once.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # method -> offsets just past the "(" of each call, in order
+        self._sites: dict[str, list[int]] = {}
+        self._args: dict[str, list[list[LpcValue]]] = {}
+        for m in _SITE_RE.finditer(text):
+            name = m.group(1)
+            if name is not None:
+                self._sites.setdefault(name, []).append(m.end())
+
+    def args(self, method: str) -> list[list[LpcValue]]:
+        """Arguments of each *method* call, in source order."""
+        found = self._args.get(method)
+        if found is None:
+            found = self._args[method] = [
+                self._call_args(pos) for pos in self._sites.get(method, ())
+            ]
+        return found
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    def string_call(self, method: str) -> str | None:
+        if method not in self._sites:
+            return None
+        args = self.args(method)[0]
+        if not args:
+            return None
+        arg = args[0]
+        if isinstance(arg, str):
+            return arg
+        if isinstance(arg, LpcExpr):
+            return _leading_string(arg.source)
+        return None
+
+    def int_call(self, method: str) -> int | None:
+        for args in self.args(method):
+            if len(args) == 1 and type(args[0]) is int:
+                return args[0]
+        return None
+
+    def float_call(self, method: str) -> float | None:
+        for args in self.args(method):
+            if len(args) == 1 and type(args[0]) in (int, float):
+                return float(args[0])
+        return None
+
+    def void_call(self, method: str) -> bool:
+        return method in self._sites
+
+    def mapping(self, method: str) -> dict | None:
+        for args in self.args(method):
+            if args and isinstance(args[0], dict):
+                return dict(args[0])
+        return None
+
+    def array(self, method: str) -> list | None:
+        for args in self.args(method):
+            if args and isinstance(args[0], list):
+                return list(args[0])
+        return None
+
+    def string_pair_call(self, method: str) -> tuple[str, int] | None:
+        pairs = self.all_string_pair_calls(method)
+        return pairs[0] if pairs else None
+
+    def all_string_pair_calls(self, method: str) -> list[tuple[str, int]]:
+        return [
+            (args[0], args[1])
+            for args in self.args(method)
+            if len(args) == 2 and isinstance(args[0], str)
+            and type(args[1]) is int
+        ]
+
+    def clone_items(self) -> list[str]:
+        return [
+            args[0] for args in self.args("cloneItem")
+            if len(args) == 1 and isinstance(args[0], str) and args[0]
+        ]
+
+    def prop_calls(self) -> dict[str, str | int]:
+        result: dict[str, str | int] = {}
+        props = [
+            args for args in self.args("setProp")
+            if len(args) == 2 and isinstance(args[0], str) and args[0]
+        ]
+        # String values first, so an int value of the same key wins
+        for key, value in props:
+            if isinstance(value, str):
+                result[key] = value
+        for key, value in props:
+            if type(value) is int:
+                result[key] = value
+        return result
+
+    # ── Argument parsing ────────────────────────────────────────────────
+
+    def _call_args(self, pos: int) -> list[LpcValue]:
+        tokens = _TOKEN_RE.finditer(self.text, pos)
+        elements, _ = self._group(tokens, pos)
+        return [self._value(*e) for e in elements if e[2] or self._span(e)]
+
+    def _group(self, tokens: Iterator[re.Match], start: int) -> tuple[list[list], int]:
+        """Parse elements up to the next close token, consuming it.
+
+        Returns the ``,``/``;``-separated elements, each ``[start, end,
+        parts]`` with *parts* the ``(kind, value, start, end)`` literals
+        and nested groups in it, and the offset where the group ends.
+        """
+        end_of_text = len(self.text)
+        element: list = [start, end_of_text, []]
+        elements = [element]
+        for m in tokens:
+            kind = m.lastgroup
+            if kind == "str" or kind == "chr":
+                element[2].append((kind, m.group(), m.start(), m.end()))
+            elif kind == "sep":
+                if m.group() == ":":
+                    element[2].append(("sep", ":", m.start(), m.end()))
+                else:
+                    element[1] = m.start()
+                    element = [m.end(), end_of_text, []]
+                    elements.append(element)
+            elif kind == "close":
+                element[1] = m.start()
+                return elements, m.end()
+            else:
+                opener = "(" if kind == "call" else m.group()
+                inner, end = self._group(tokens, m.end())
+                if opener == "([":
+                    value: Any = self._mapping(inner)
+                elif opener == "({":
+                    value = self._array(inner)
+                else:
+                    value = None
+                element[2].append((opener, value, m.start(), end))
+        return elements, end_of_text
+
+    def _span(self, element: list) -> str:
+        return self.text[element[0]:element[1]].strip()
+
+    def _value(self, start: int, end: int, parts: list) -> LpcValue:
+        """Value of a call argument."""
+        text = self.text
+        if not parts:
+            source = text[start:end].strip()
+            if _INT_RE.fullmatch(source):
+                return int(source)
+            if _FLOAT_RE.fullmatch(source):
+                return float(source)
+            return LpcExpr(source)
+        lead = text[start:parts[0][2]].strip()
+        trail = text[parts[-1][3]:end].strip()
+        if not lead and not trail:
+            if len(parts) == 1 and parts[0][0] in ("([", "({"):
+                return parts[0][1]
+            # Adjacent or +-joined literals
+            if all(p[0] == "str" for p in parts) and all(
+                not text[a[3]:b[2]].strip(" \t\r\n+")
+                for a, b in zip(parts, parts[1:])
+            ):
+                return "".join(_unquote(p[1]) for p in parts)
+        return LpcExpr(text[start:end].strip())
+
+    def _literal(self, start: int, end: int, parts: list) -> str | int | None:
+        """Value of a mapping or array element: literal or source text."""
+        source = self.text[start:end].strip()
+        if parts and parts[0][0] == "str" and source.startswith('"'):
+            return _unquote(parts[0][1])
+        if _INT_RE.fullmatch(source):
+            return int(source)
+        return source or None
+
+    def _mapping(self, elements: list[list]) -> dict:
+        result: dict[str, str | int | None] = {}
+        for start, end, parts in elements:
+            colon = next((p for p in parts if p[0] == "sep"), None)
+            if colon is None:
+                continue
+            key = self._literal(
+                start, colon[2], [p for p in parts if p[3] <= colon[2]],
+            )
+            if key is not None:
+                result[str(key)] = self._literal(
+                    colon[3], end, [p for p in parts if p[2] >= colon[3]],
+                )
+        return result
+
+    def _array(self, elements: list[list]) -> list:
+        values = (self._literal(*e) for e in elements)
+        return [v for v in values if v is not None]
+
+
 # ── Internal helpers ────────────────────────────────────────────────
 
 
+def _leading_string(text: str) -> str | None:
+    """Concatenate the string literals at the start of an expression."""
+    result_parts: list[str] = []
+    rest = text
+
+    while True:
+        rest = rest.lstrip()
+        if not rest or rest[0] == ")":
+            break
+        if rest[0] == '"':
+            s, consumed = _parse_string_literal(rest)
+            if s is not None:
+                result_parts.append(s)
+                rest = rest[consumed:]
+                continue
+            break
+        # Skip non-string chars (like + or whitespace)
+        if rest[0] in ("+", "\n", "\r", "\t", " "):
+            rest = rest[1:]
+            continue
+        break
+
+    if result_parts:
+        return "".join(result_parts)
+    return None
+
+
+def _unquote(literal: str) -> str:
+    """Value of a complete ``"..."`` literal token."""
+    body = literal[1:-1]
+    if "\\" not in body:
+        return body
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), body)
+
+
 def _parse_string_literal(text: str) -> tuple[str | None, int]:
     """Parse a quoted string literal starting at text[0]=='"'.
 
@@ -225,149 +424,3 @@ def _parse_string_literal(text: str) -> tuple[str | None, int]:
         pos += 1
 
     return None, 0
-
-
-def _extract_balanced(text: str, start: int, open_tok: str, close_tok: str) -> str | None:
-    """Extract content between balanced LPC delimiters like ([ ... ]).
-
-    start should point to the opening delimiter.
-    """
-    depth = 0
-    pos = start
-    content_start = start + len(open_tok)
-
-    while pos < len(text):
-        if text[pos:pos + len(open_tok)] == open_tok:
-            depth += 1
-            pos += len(open_tok)
-        elif text[pos:pos + len(close_tok)] == close_tok:
-            depth -= 1
-            if depth == 0:
-                return text[content_start:pos]
-            pos += len(close_tok)
-        else:
-            pos += 1
-
-    return None
-
-
-def _parse_mapping_content(content: str) -> dict:
-    """Parse the inside of an LPC mapping ([ k:v, k:v ])."""
-    result: dict[str, str | int] = {}
-
-    # Split by comma, then parse key:value pairs
-    # Handle nested structures by tracking brackets
-    entries = _split_lpc_entries(content, ",")
-
-    for entry in entries:
-        entry = entry.strip()
-        if not entry:
-            continue
-        # Split on first ':'
-        colon_pos = entry.find(":")
-        if colon_pos == -1:
-            continue
-
-        key_part = entry[:colon_pos].strip()
-        val_part = entry[colon_pos + 1:].strip()
-
-        key = _parse_lpc_value(key_part)
-        val = _parse_lpc_value(val_part)
-
-        if key is not None:
-            result[str(key)] = val
-
-    return result
-
-
-def _parse_array_content(content: str) -> list:
-    """Parse the inside of an LPC array ({ elem, elem })."""
-    entries = _split_lpc_entries(content, ",")
-    result: list = []
-    for entry in entries:
-        entry = entry.strip()
-        if not entry:
-            continue
-        val = _parse_lpc_value(entry)
-        if val is not None:
-            result.append(val)
-    return result
-
-
-def _split_lpc_entries(text: str, sep: str) -> list[str]:
-    """Split LPC entries respecting nested brackets and strings."""
-    entries: list[str] = []
-    depth = 0
-    current: list[str] = []
-    in_string = False
-    i = 0
-
-    while i < len(text):
-        ch = text[i]
-
-        if in_string:
-            current.append(ch)
-            if ch == "\\" and i + 1 < len(text):
-                current.append(text[i + 1])
-                i += 2
-                continue
-            if ch == '"':
-                in_string = False
-            i += 1
-            continue
-
-        if ch == '"':
-            in_string = True
-            current.append(ch)
-            i += 1
-            continue
-
-        if ch == "(" and i + 1 < len(text) and text[i + 1] in ("[", "{"):
-            depth += 1
-            current.append(ch)
-            i += 1
-            continue
-
-        if ch in ("]", "}") and i + 1 < len(text) and text[i + 1] == ")":
-            depth -= 1
-            current.append(ch)
-            i += 1
-            continue
-
-        if ch == sep and depth == 0:
-            entries.append("".join(current))
-            current = []
-            i += 1
-            continue
-
-        current.append(ch)
-        i += 1
-
-    if current:
-        entries.append("".join(current))
-
-    return entries
-
-
-def _parse_lpc_value(text: str) -> str | int | None:
-    """Parse a single LPC literal value (string or int)."""
-    text = text.strip()
-    if not text:
-        return None
-
-    # String literal
-    if text.startswith('"'):
-        val, _ = _parse_string_literal(text)
-        return val
-
-    # Integer literal
-    m = re.match(r"^-?\d+$", text)
-    if m:
-        return int(text)
-
-    # Path reference (unquoted, starts with /)
-    if text.startswith("/"):
-        return text.strip()
-
-    # Variable or expression - return as string
-    return text
@@ -8,15 +8,8 @@ from pathlib import Path
 from genos.uir.schema import DiceRoll, Monster
 
 from .lpc_parser import (
-    extract_all_string_pair_calls,
-    extract_array,
-    extract_clone_items,
-    extract_float_call,
+    LpcCalls,
     extract_inherit,
-    extract_int_call,
-    extract_prop_calls,
-    extract_string_call,
-    extract_void_call,
     read_lpc_file,
     strip_color_codes,
 )
@@ -27,48 +20,6 @@ logger = logging.getLogger(__name__)
 GENDER_MAP = {"남자": 1, "여자": 2, "동물": 0, "장": 0}
 
 
-def parse_all_monsters(
-    lib_dir: Path,
-    room_dirs: list[str],
-    vnum_gen: VnumGenerator,
-    encoding: str = "euc-kr",
-) -> list[Monster]:
-    """Parse all monster .c files from room mob/ dirs and 물체/ dir."""
-    monsters: list[Monster] = []
-    seen_paths: set[str] = set()
-
-    # 1. Room mob/ subdirectories
-    for room_dir_name in room_dirs:
-        room_base = lib_dir / room_dir_name
-        if not room_base.is_dir():
-            continue
-        for mob_dir in room_base.rglob("mob"):
-            if not mob_dir.is_dir():
-                continue
-            for c_file in sorted(mob_dir.glob("*.c")):
-                rel = str(c_file.relative_to(lib_dir))
-                if rel in seen_paths:
-                    continue
-                seen_paths.add(rel)
-                mob = _parse_mob_file(c_file, lib_dir, vnum_gen, encoding)
-                if mob:
-                    monsters.append(mob)
-
-    # 2. 물체/ directory (top-level monster files)
-    obj_dir = lib_dir / "물체"
-    if obj_dir.is_dir():
-        for c_file in sorted(obj_dir.rglob("*.c")):
-            rel = str(c_file.relative_to(lib_dir))
-            if rel in seen_paths:
-                continue
-            seen_paths.add(rel)
-            mob = _parse_mob_file(c_file, lib_dir, vnum_gen, encoding)
-            if mob:
-                monsters.append(mob)
-
-    return monsters
-
-
 def _parse_mob_file(
     filepath: Path,
     lib_dir: Path,
@@ -84,6 +35,7 @@ def _parse_mob_file(
     inherit = extract_inherit(text)
     if inherit != "LIB_MONSTER":
         return None
+    calls = LpcCalls(text)
 
     rel_path = "/" + str(filepath.relative_to(lib_dir))
     if rel_path.endswith(".c"):
@@ -91,49 +43,49 @@ def _parse_mob_file(
     vnum = vnum_gen.path_to_vnum(rel_path)
 
     # Basic fields
-    name = extract_string_call(text, "setName") or ""
-    keywords_arr = extract_array(text, "setID") or []
+    name = calls.string_call("setName") or ""
+    keywords_arr = calls.array("setID") or []
     keywords = " ".join(keywords_arr) if keywords_arr else name
 
-    short_desc = extract_string_call(text, "setShort") or ""
-    long_desc = extract_string_call(text, "setLong") or ""
+    short_desc = calls.string_call("setShort") or ""
+    long_desc = calls.string_call("setLong") or ""
     short_desc = strip_color_codes(short_desc)
     long_desc = strip_color_codes(long_desc)
 
     # Gender
-    gender_str = extract_string_call(text, "setGender") or ""
+    gender_str = calls.string_call("setGender") or ""
     sex = GENDER_MAP.get(gender_str, 0)
 
     # Level from randomStat(N)
-    level = extract_int_call(text, "randomStat") or 1
+    level = calls.int_call("randomStat") or 1
 
     # Stats
-    stats = extract_all_string_pair_calls(text, "setStat")
+    stats = calls.all_string_pair_calls("setStat")
     stat_dict = {s: v for s, v in stats}
 
     # Experience
-    exp = extract_int_call(text, "setExp") or 0
-    adj_exp = extract_float_call(text, "setAdjExp")
+    exp = calls.int_call("setExp") or 0
+    adj_exp = calls.float_call("setAdjExp")
 
     # Gold
-    gold = extract_int_call(text, "setGold") or 0
+    gold = calls.int_call("setGold") or 0
 
     # HP/SP/MP overrides
-    max_hp = extract_int_call(text, "setMaxHp")
-    max_sp = extract_int_call(text, "setMaxSp")
+    max_hp = calls.int_call("setMaxHp")
+    max_sp = calls.int_call("setMaxSp")
 
     # Armor/Weapon class
-    armor_class = extract_int_call(text, "setArmorClass") or 0
+    armor_class = calls.int_call("setArmorClass") or 0
 
     # Action flags
     action_flags: list[int] = []
-    if extract_void_call(text, "setAggresive"):
+    if calls.void_call("setAggresive"):
         action_flags.append(1)  # AGGRESSIVE
-    if extract_void_call(text, "setAggresiveMunpa"):
+    if calls.void_call("setAggresiveMunpa"):
         action_flags.append(2)  # AGGRESSIVE_MUNPA
-    if extract_void_call(text, "setUnconditionalAttack"):
+    if calls.void_call("setUnconditionalAttack"):
         action_flags.append(3)  # UNCONDITIONAL_ATTACK
-    if extract_void_call(text, "setNoAttack"):
+    if calls.void_call("setNoAttack"):
         action_flags.append(4)  # NO_ATTACK
 
     # HP dice approximation from level
@@ -144,33 +96,33 @@ def _parse_mob_file(
     if stat_dict:
         extensions["stats"] = stat_dict
 
-    race = extract_string_call(text, "setRace")
+    race = calls.string_call("setRace")
     if race:
         extensions["race"] = race
 
-    munpa = extract_string_call(text, "setMunpa")
+    munpa = calls.string_call("setMunpa")
     if munpa:
         extensions["faction"] = munpa
 
-    wander = extract_int_call(text, "setWander")
+    wander = calls.int_call("setWander")
     if wander:
         extensions["wander_prob"] = wander
 
     # Chat
-    chat_arr = extract_array(text, "setChat")
+    chat_arr = calls.array("setChat")
     if chat_arr:
         extensions["chat"] = chat_arr
-    chat_chance = extract_int_call(text, "setChatChance")
+    chat_chance = calls.int_call("setChatChance")
     if chat_chance:
         extensions["chat_chance"] = chat_chance
 
     # Cloned items (inventory)
-    cloned = extract_clone_items(text)
+    cloned = calls.clone_items()
     if cloned:
         extensions["inventory"] = cloned
 
     # Props
-    props = extract_prop_calls(text)
+    props = calls.prop_calls()
     if props:
         extensions["props"] = props
 
@@ -180,7 +132,7 @@ def _parse_mob_file(
         extensions["max_sp"] = max_sp
 
     # Attack messages
-    attack_msgs = extract_array(text, "setBasicAttackMessage")
+    attack_msgs = calls.array("setBasicAttackMessage")
     if attack_msgs:
         extensions["attack_messages"] = attack_msgs
 
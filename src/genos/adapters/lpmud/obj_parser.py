@@ -8,12 +8,8 @@ from pathlib import Path
 from genos.uir.schema import Item, ItemAffect
 
 from .lpc_parser import (
-    extract_array,
+    LpcCalls,
     extract_inherit,
-    extract_int_call,
-    extract_prop_calls,
-    extract_string_call,
-    extract_void_call,
     read_lpc_file,
     strip_color_codes,
 )
@@ -43,48 +39,6 @@ WEAR_TYPE_MAP = {
 }
 
 
-def parse_all_items(
-    lib_dir: Path,
-    room_dirs: list[str],
-    vnum_gen: VnumGenerator,
-    encoding: str = "euc-kr",
-) -> list[Item]:
-    """Parse all item .c files from 물체/ dir and room obj/ dirs."""
-    items: list[Item] = []
-    seen_paths: set[str] = set()
-
-    # 1. 물체/ directory
-    obj_dir = lib_dir / "물체"
-    if obj_dir.is_dir():
-        for c_file in sorted(obj_dir.rglob("*.c")):
-            rel = str(c_file.relative_to(lib_dir))
-            if rel in seen_paths:
-                continue
-            seen_paths.add(rel)
-            item = _parse_item_file(c_file, lib_dir, vnum_gen, encoding)
-            if item:
-                items.append(item)
-
-    # 2. Room obj/ subdirectories
-    for room_dir_name in room_dirs:
-        room_base = lib_dir / room_dir_name
-        if not room_base.is_dir():
-            continue
-        for obj_subdir in room_base.rglob("obj"):
-            if not obj_subdir.is_dir():
-                continue
-            for c_file in sorted(obj_subdir.glob("*.c")):
-                rel = str(c_file.relative_to(lib_dir))
-                if rel in seen_paths:
-                    continue
-                seen_paths.add(rel)
-                item = _parse_item_file(c_file, lib_dir, vnum_gen, encoding)
-                if item:
-                    items.append(item)
-
-    return items
-
-
 def _parse_item_file(
     filepath: Path,
     lib_dir: Path,
@@ -100,6 +54,7 @@ def _parse_item_file(
     inherit = extract_inherit(text)
     if inherit not in ITEM_INHERITS:
         return None
+    calls = LpcCalls(text)
 
     item_type = INHERIT_TO_ITEM_TYPE[inherit]
 
@@ -109,25 +64,25 @@ def _parse_item_file(
     vnum = vnum_gen.path_to_vnum(rel_path)
 
     # Basic fields
-    name = extract_string_call(text, "setName") or ""
-    keywords_arr = extract_array(text, "setID") or []
+    name = calls.string_call("setName") or ""
+    keywords_arr = calls.array("setID") or []
     keywords = " ".join(keywords_arr) if keywords_arr else name
 
-    short_desc = extract_string_call(text, "setShort") or ""
-    long_desc = extract_string_call(text, "setLong") or ""
+    short_desc = calls.string_call("setShort") or ""
+    long_desc = calls.string_call("setLong") or ""
     short_desc = strip_color_codes(short_desc)
     long_desc = strip_color_codes(long_desc)
 
     # Weight / cost
-    weight = extract_int_call(text, "setMass") or 0
-    cost = extract_int_call(text, "setValue") or 0
+    weight = calls.int_call("setMass") or 0
+    cost = calls.int_call("setValue") or 0
 
     # Min level
-    min_level = extract_int_call(text, "setLimitLevel") or 0
+    min_level = calls.int_call("setLimitLevel") or 0
 
     # Wear flags from setType
     wear_flags: list[int] = []
-    wear_type = extract_string_call(text, "setType")
+    wear_type = calls.string_call("setType")
     if wear_type and wear_type in WEAR_TYPE_MAP:
         wear_flags.append(WEAR_TYPE_MAP[wear_type])
 
@@ -136,16 +91,16 @@ def _parse_item_file(
 
     if inherit == "LIB_WEAPON" or inherit == "LIB_AMGI":
         # Weapon values
-        weapon_dmg = extract_int_call(text, "setWeapon") or 0
-        sp_weapon = extract_int_call(text, "setSpWeapon") or 0
+        weapon_dmg = calls.int_call("setWeapon") or 0
+        sp_weapon = calls.int_call("setSpWeapon") or 0
         values[0] = weapon_dmg
         values[1] = sp_weapon
-        two_hand = extract_int_call(text, "setTwoHand")
+        two_hand = calls.int_call("setTwoHand")
         if two_hand:
             values[2] = 1
     elif inherit == "LIB_ARMOR":
-        armor_val = extract_int_call(text, "setArmor") or 0
-        sp_armor = extract_int_call(text, "setSpArmor") or 0
+        armor_val = calls.int_call("setArmor") or 0
+        sp_armor = calls.int_call("setSpArmor") or 0
         values[0] = armor_val
         values[1] = sp_armor
 
@@ -154,8 +109,7 @@ def _parse_item_file(
     stat_up_map = {
         "힘": 1, "민첩": 2, "지혜": 3, "기골": 4, "내공": 5, "투지": 6,
     }
-    from .lpc_parser import extract_all_string_pair_calls
-    stat_ups = extract_all_string_pair_calls(text, "setStatUp")
+    stat_ups = calls.all_string_pair_calls("setStatUp")
     for stat_name, modifier in stat_ups:
         loc = stat_up_map.get(stat_name, 0)
         if loc:
@@ -163,11 +117,11 @@ def _parse_item_file(
 
     # Extra flags
     extra_flags: list[int] = []
-    if extract_void_call(text, "setInvis"):
+    if calls.void_call("setInvis"):
         extra_flags.append(1)  # INVISIBLE
 
     # Timer (durability)
-    max_life = extract_int_call(text, "setMaxLifeCircle") or 0
+    max_life = calls.int_call("setMaxLifeCircle") or 0
 
     return Item(
         vnum=vnum,
@@ -8,12 +8,8 @@ from pathlib import Path
 from genos.uir.schema import Exit, ExtraDescription, Room
 
 from .lpc_parser import (
+    LpcCalls,
     extract_inherit,
-    extract_int_call,
-    extract_mapping,
-    extract_prop_calls,
-    extract_string_call,
-    extract_void_call,
     read_lpc_file,
     strip_color_codes,
 )
@@ -28,39 +24,6 @@ DIR_MAP = {
 }
 
 
-def parse_all_rooms(
-    lib_dir: Path,
-    room_dirs: list[str],
-    vnum_gen: VnumGenerator,
-    encoding: str = "euc-kr",
-) -> tuple[list[Room], dict[int, dict[str, str]]]:
-    """Parse all room .c files from room directories.
-
-    Returns:
-        (rooms, pending_exits) where pending_exits maps
-        room_vnum -> {direction_str: destination_path} for 2-pass resolution.
-    """
-    rooms: list[Room] = []
-    pending_exits: dict[int, dict[str, str]] = {}
-
-    for room_dir_name in room_dirs:
-        room_base = lib_dir / room_dir_name
-        if not room_base.is_dir():
-            continue
-
-        for c_file in _find_room_files(room_base):
-            try:
-                room, exits = parse_room_file(c_file, lib_dir, vnum_gen, encoding)
-                if room:
-                    rooms.append(room)
-                    if exits:
-                        pending_exits[room.vnum] = exits
-            except Exception as e:
-                logger.debug("Error parsing room %s: %s", c_file, e)
-
-    return rooms, pending_exits
-
-
 def parse_room_file(
     filepath: Path,
     lib_dir: Path,
@@ -79,6 +42,7 @@ def parse_room_file(
     inherit = extract_inherit(text)
     if inherit != "LIB_ROOM":
         return None, {}
+    calls = LpcCalls(text)
 
     # Compute relative path for vnum
     rel_path = _relative_lpc_path(filepath, lib_dir)
@@ -89,77 +53,77 @@ def parse_room_file(
     zone_vnum = vnum_gen.zone_id(str(zone_dir))
 
     # Basic fields
-    name = extract_string_call(text, "setShort") or ""
-    description = extract_string_call(text, "setLong") or ""
+    name = calls.string_call("setShort") or ""
+    description = calls.string_call("setLong") or ""
 
     # Clean color codes
     name = strip_color_codes(name)
     description = strip_color_codes(description)
 
     # Room attributes
-    room_attr = extract_int_call(text, "setRoomAttr") or 0
+    room_attr = calls.int_call("setRoomAttr") or 0
     room_flags: list[int] = []
     if room_attr:
         room_flags.append(room_attr)
 
     # Sector type
     sector_type = 1  # indoor by default
-    if extract_void_call(text, "setOutSide"):
+    if calls.void_call("setOutSide"):
         sector_type = 0  # outdoor
 
     # Special flags
-    if extract_void_call(text, "setLight"):
+    if calls.void_call("setLight"):
         room_flags.append(100)  # LIGHT flag
-    if extract_void_call(text, "setHoly"):
+    if calls.void_call("setHoly"):
         room_flags.append(101)  # HOLY flag
 
     # Extensions
     extensions: dict = {}
-    mp = extract_int_call(text, "setMp")
+    mp = calls.int_call("setMp")
     if mp is not None:
         extensions["movement_cost"] = mp
 
-    long_type = extract_int_call(text, "setLongType")
+    long_type = calls.int_call("setLongType")
     if long_type is not None:
         extensions["long_type"] = long_type
 
-    fast_heal = extract_int_call(text, "setFastHeal")
+    fast_heal = calls.int_call("setFastHeal")
     if fast_heal:
         extensions["fast_heal"] = fast_heal
 
-    no_sky = extract_int_call(text, "setNoSky")
+    no_sky = calls.int_call("setNoSky")
     if no_sky:
         extensions["no_sky"] = no_sky
 
-    no_under = extract_int_call(text, "setNoUnder")
+    no_under = calls.int_call("setNoUnder")
     if no_under:
         extensions["no_under"] = no_under
 
-    no_hourse = extract_int_call(text, "setNoHourse")
+    no_hourse = calls.int_call("setNoHourse")
     if no_hourse:
         extensions["no_hourse"] = no_hourse
 
-    no_drop = extract_int_call(text, "setNoDrop")
+    no_drop = calls.int_call("setNoDrop")
     if no_drop:
         extensions["no_drop"] = no_drop
 
     # Props
-    props = extract_prop_calls(text)
+    props = calls.prop_calls()
     if props:
         extensions["props"] = props
 
     # Room inventory (mob spawns)
-    room_inv = extract_mapping(text, "setRoomInventory")
+    room_inv = calls.mapping("setRoomInventory")
     if room_inv:
         extensions["room_inventory"] = room_inv
 
     # LimitMob
-    limit_mob = extract_mapping(text, "setLimitMob")
+    limit_mob = calls.mapping("setLimitMob")
     if limit_mob:
         extensions["limit_mob"] = limit_mob
 
     # Room items (examinable)
-    room_items = extract_mapping(text, "setRoomItems")
+    room_items = calls.mapping("setRoomItems")
     if room_items:
         extra_descs = [
             ExtraDescription(keywords=k, description=str(v))
@@ -169,8 +133,8 @@ def parse_room_file(
         extra_descs = []
 
     # Exits: collect paths for 2-pass resolution
-    exit_mapping = extract_mapping(text, "setExits") or {}
-    enter_mapping = extract_mapping(text, "setEnters") or {}
+    exit_mapping = calls.mapping("setExits") or {}
+    enter_mapping = calls.mapping("setEnters") or {}
     # Merge enters into exits
     exit_mapping.update(enter_mapping)
 
@@ -222,18 +186,6 @@ def resolve_exits(
             ))
 
 
-def _find_room_files(room_base: Path) -> list[Path]:
-    """Find all .c files that are rooms (not mob/ or obj/ subdirs)."""
-    results: list[Path] = []
-    for c_file in room_base.rglob("*.c"):
-        # Skip mob and obj subdirectories
-        parts = c_file.relative_to(room_base).parts
-        if any(p in ("mob", "obj") for p in parts):
-            continue
-        results.append(c_file)
-    return results
-
-
 def _relative_lpc_path(filepath: Path, lib_dir: Path) -> str:
     """Convert absolute path to LPC-style relative path."""
     rel = filepath.relative_to(lib_dir)
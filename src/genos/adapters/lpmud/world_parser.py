@@ -0,0 +1,197 @@
+"""One-walk, process-parallel parsing of LP-MUD room, monster and item files.
+
+:func:`scan_lib` walks the room directories and ``물체/`` once and sorts
+the ``.c`` files into room, monster and item candidates.
+:func:`parse_world` then parses each list with
+:func:`genos.adapters.parallel.iter_files` (a process pool with
+``jobs > 1``, the parse cache when given); :func:`iter_world` hands the
+same entities out one at a time for streaming.
+
+Per-file parsers register their path with a :class:`VnumGenerator`, and
+its collision probing makes VNUMs depend on registration order.  Files
+are therefore parsed with a private generator, and the merge step
+replays the path → VNUM assignment over every parsed entity in sorted
+path order, so the result does not depend on the walk order, the number
+of workers or which files came from the cache.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from genos.adapters.cache import ParseCache
+from genos.adapters.parallel import iter_files
+from genos.uir.schema import Item, Monster, Room
+
+from .mob_parser import _parse_mob_file
+from .obj_parser import _parse_item_file
+from .room_parser import _relative_lpc_path, parse_room_file
+from .vnum_generator import VnumGenerator
+
+logger = logging.getLogger(__name__)
+
+# Directory of top-level monster and item files
+OBJECT_DIR = "물체"
+
+
+@dataclass
+class LibFiles:
+    """Candidate ``.c`` files of each entity kind, sorted by path.
+
+    ``물체/`` files are both monster and item candidates; the parsers
+    keep the ones whose ``inherit`` matches.
+    """
+
+    rooms: list[Path] = field(default_factory=list)
+    monsters: list[Path] = field(default_factory=list)
+    items: list[Path] = field(default_factory=list)
+
+
+@dataclass
+class LibEntities:
+    rooms: list[Room] = field(default_factory=list)
+    # room vnum -> {direction: destination path}, resolved by resolve_exits
+    pending_exits: dict[int, dict[str, str]] = field(default_factory=dict)
+    monsters: list[Monster] = field(default_factory=list)
+    items: list[Item] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+def scan_lib(lib_dir: Path, room_dirs: list[str]) -> LibFiles:
+    """Classify the entity files of *lib_dir* in one directory walk.
+
+    Under a room directory, ``.c`` files directly in a ``mob/`` or
+    ``obj/`` directory are monster or item candidates and every file
+    outside such directories is a room candidate.  All ``.c`` files
+    under ``물체/`` are monster and item candidates.
+    """
+    rooms: set[Path] = set()
+    monsters: set[Path] = set()
+    items: set[Path] = set()
+
+    for room_dir_name in room_dirs:
+        room_base = lib_dir / room_dir_name
+        for dirpath, _, filenames in os.walk(room_base):
+            parts = Path(dirpath).relative_to(room_base).parts
+            c_files = [Path(dirpath, f) for f in filenames if f.endswith(".c")]
+            if not parts or ("mob" not in parts and "obj" not in parts):
+                rooms.update(c_files)
+            elif parts[-1] == "mob":
+                monsters.update(c_files)
+            elif parts[-1] == "obj":
+                items.update(c_files)
+
+    for dirpath, _, filenames in os.walk(lib_dir / OBJECT_DIR):
+        c_files = [Path(dirpath, f) for f in filenames if f.endswith(".c")]
+        monsters.update(c_files)
+        items.update(c_files)
+
+    return LibFiles(sorted(rooms), sorted(monsters), sorted(items))
+
+
+def parse_detached(
+    parse_func: Callable[..., Any], filepath: Path, lib_dir: Path, encoding: str,
+) -> Any:
+    """Run a per-file parser with a private :class:`VnumGenerator`.
+
+    The entity's VNUM is provisional; :func:`parse_world` assigns the
+    final one.  Used through :func:`functools.partial`, which pickles,
+    so files can be parsed in worker processes.
+    """
+    return parse_func(filepath, lib_dir, VnumGenerator(), encoding)
+
+
+def parse_world(
+    lib_dir: Path,
+    room_dirs: list[str],
+    vnum_gen: VnumGenerator,
+    encoding: str = "euc-kr",
+    jobs: int = 1,
+    cache: ParseCache | None = None,
+) -> LibEntities:
+    """Parse every room, monster and item file of *lib_dir*.
+
+    Entities come out in sorted path order within each kind, with VNUMs
+    registered in *vnum_gen* in sorted path order across all kinds.
+    """
+    result = LibEntities()
+    for kind, entity, exits in iter_world(
+        lib_dir, room_dirs, vnum_gen, encoding, jobs, cache, result.warnings,
+    ):
+        getattr(result, kind).append(entity)
+        if exits:
+            result.pending_exits[entity.vnum] = exits
+    return result
+
+
+def iter_world(
+    lib_dir: Path,
+    room_dirs: list[str],
+    vnum_gen: VnumGenerator,
+    encoding: str = "euc-kr",
+    jobs: int = 1,
+    cache: ParseCache | None = None,
+    warnings: list[str] | None = None,
+) -> Iterator[tuple[str, Any, dict[str, str] | None]]:
+    """Yield ``(kind, entity, exits)`` for every file of :func:`parse_world`.
+
+    *exits* (direction -> destination path) is given for rooms with
+    exits, to be resolved with :func:`~.room_parser.resolve_exits`.
+    Parsed entities are spooled to a temporary file until every VNUM is
+    registered, then read back one at a time, so only the VNUM map and
+    the exit paths are held in memory.  Exit destinations are registered
+    right after the entities, in room path order, as resolving every
+    exit after :func:`parse_world` would.  Parse errors are appended to
+    *warnings*.
+    """
+    files = scan_lib(lib_dir, room_dirs)
+    iter_parsed = cache.iter_files if cache is not None else iter_files
+    paths: list[str] = []
+    room_exits: list[tuple[str, dict[str, str]]] = []
+
+    with tempfile.TemporaryFile() as spool:
+        for kind, parse_func in (
+            ("rooms", parse_room_file),
+            ("monsters", _parse_mob_file),
+            ("items", _parse_item_file),
+        ):
+            parser = functools.partial(
+                parse_detached, parse_func, lib_dir=lib_dir, encoding=encoding,
+            )
+            for fpath, value, error in iter_parsed(parser, getattr(files, kind), jobs):
+                if error is not None:
+                    msg = f"Error parsing {fpath}: {error}"
+                    logger.debug(msg)
+                    if warnings is not None:
+                        warnings.append(msg)
+                    continue
+                entity = value[0] if kind == "rooms" else value
+                if entity is None:
+                    continue
+                rel_path = _relative_lpc_path(fpath, lib_dir)
+                if kind == "rooms" and value[1]:
+                    room_exits.append((rel_path, value[1]))
+                pickle.dump((kind, rel_path, entity), spool, pickle.HIGHEST_PROTOCOL)
+                paths.append(rel_path)
+
+        # Replay the VNUM registration in one deterministic order
+        for rel_path in sorted(paths):
+            vnum_gen.path_to_vnum(rel_path)
+        room_exits.sort(key=lambda re: re[0])
+        exits_by_path = dict(room_exits)
+        for _, exits in room_exits:
+            for dest_path in exits.values():
+                vnum_gen.path_to_vnum(dest_path)
+
+        spool.seek(0)
+        for _ in paths:
+            kind, rel_path, entity = pickle.load(spool)
+            entity.vnum = vnum_gen.path_to_vnum(rel_path)
+            yield kind, entity, exits_by_path.get(rel_path) if kind == "rooms" else None
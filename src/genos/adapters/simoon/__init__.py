@@ -1 +1,24 @@
-from .adapter import SimoonAdapter  # noqa: F401
+"""Simoon (CircleMUD 3.0 Korean) adapter.
+
+Importing the package is cheap: it only declares the detection
+:data:`MARKERS`.  ``SimoonAdapter`` (and with it every parser module) is
+imported on first access.
+"""
+
+from __future__ import annotations
+
+from genos.adapters.fingerprint import dir_marker, file_marker
+
+# CircleMUD world structure plus the Simoon-specific HANGUL.TXT
+MARKERS = (
+    dir_marker("lib/world/wld"),
+    dir_marker("lib/world/mob"),
+    file_marker("HANGUL.TXT"),
+)
+
+
+def __getattr__(name: str):
+    if name == "SimoonAdapter":
+        from .adapter import SimoonAdapter
+        return SimoonAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,8 +5,9 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from genos.adapters.base import AnalysisReport, BaseAdapter
+from genos.adapters.base import AnalysisReport, BaseAdapter, UIRChunks
 from genos.adapters.detector import register_adapter
+from genos.adapters.parallel import iter_files, map_files
 from genos.adapters.circlemud.skill_parser import parse_skills
 from genos.adapters.circlemud.social_parser import parse_social_file
 from genos.uir.schema import (
@@ -19,6 +20,7 @@ from genos.uir.schema import (
     UIR,
 )
 
+from . import MARKERS
 from .cmd_parser import parse_cmd_file
 from .config_parser import (
     parse_attribute_modifiers,
@@ -39,6 +41,16 @@ logger = logging.getLogger(__name__)
 
 _ENCODING = "euc-kr"
 
+# (world sub-directory, UIR section, MigrationStats total, parser)
+_WORLD_FILES = (
+    ("wld", "rooms", "total_rooms", parse_wld_file),
+    ("obj", "items", "total_items", parse_obj_file),
+    ("mob", "monsters", "total_monsters", parse_mob_file),
+    ("zon", "zones", "total_zones", parse_zon_file),
+    ("shp", "shops", "total_shops", parse_shp_file),
+    ("qst", "quests", "total_quests", parse_qst_file),
+)
+
 
 def _read_euckr(filepath: Path) -> str:
     """Read a file with EUC-KR encoding."""
@@ -49,23 +61,12 @@ def _read_euckr(filepath: Path) -> str:
 class SimoonAdapter(BaseAdapter):
     """Adapter for Simoon (CircleMUD 3.0 Korean custom) codebases."""
 
+    markers = MARKERS
+
     def __init__(self, source_path: str | Path) -> None:
         super().__init__(source_path)
         self._world_dir = self.source_path / "lib" / "world"
 
-    def detect(self) -> bool:
-        """Detect Simoon by checking for HANGUL.TXT + CircleMUD world structure."""
-        if not self._world_dir.is_dir():
-            return False
-        has_dirs = (
-            (self._world_dir / "wld").is_dir()
-            and (self._world_dir / "mob").is_dir()
-        )
-        if not has_dirs:
-            return False
-        # Simoon-specific: HANGUL.TXT in the root
-        return (self.source_path / "HANGUL.TXT").exists()
-
     def analyze(self) -> AnalysisReport:
         """Quick scan to count entities without full parsing."""
         report = AnalysisReport(
@@ -97,6 +98,13 @@ class SimoonAdapter(BaseAdapter):
 
     def parse(self) -> UIR:
         """Parse all Simoon data files into a UIR."""
+        uir, chunks = self.parse_stream()
+        for section, entities in chunks:
+            getattr(uir, section).extend(entities)
+        return uir
+
+    def parse_stream(self) -> tuple[UIR, UIRChunks]:
+        """Parse world files one at a time, yielding each file's entities."""
         uir = UIR()
         uir.source_mud = SourceMudInfo(
             name="Simoon",
@@ -104,15 +112,17 @@ class SimoonAdapter(BaseAdapter):
             codebase="CircleMUD 3.0",
             source_path=str(self.source_path),
         )
+        uir.migration_stats = MigrationStats()
+        return uir, self._stream(uir)
 
-        stats = MigrationStats()
+    def _stream(self, uir: UIR) -> UIRChunks:
+        """Yield world file chunks, then fill in the remaining sections."""
+        stats = uir.migration_stats
 
-        uir.rooms = self._parse_all("wld", parse_wld_file, stats)
-        uir.items = self._parse_all("obj", parse_obj_file, stats)
-        uir.monsters = self._parse_all("mob", parse_mob_file, stats)
-        uir.zones = self._parse_all("zon", parse_zon_file, stats)
-        uir.shops = self._parse_all("shp", parse_shp_file, stats)
-        uir.quests = self._parse_all("qst", parse_qst_file, stats)
+        for subdir, section, total, parser_func in _WORLD_FILES:
+            for entities in self._iter_parsed(subdir, parser_func, stats):
+                setattr(stats, total, getattr(stats, total) + len(entities))
+                yield section, entities
 
         # Phase 2: extended data
         uir.socials = self._parse_socials(stats)
@@ -136,13 +146,6 @@ class SimoonAdapter(BaseAdapter):
                     pp.extensions.update(tp.extensions)
                     break
 
-        stats.total_rooms = len(uir.rooms)
-        stats.total_items = len(uir.items)
-        stats.total_monsters = len(uir.monsters)
-        stats.total_zones = len(uir.zones)
-        stats.total_shops = len(uir.shops)
-        stats.total_triggers = 0
-        stats.total_quests = len(uir.quests)
         stats.total_socials = len(uir.socials)
         stats.total_help_entries = len(uir.help_entries)
         stats.total_commands = len(uir.commands)
@@ -152,7 +155,6 @@ class SimoonAdapter(BaseAdapter):
         stats.total_exp_entries = len(uir.experience_table)
         stats.total_level_titles = len(uir.level_titles)
         stats.total_attribute_modifiers = len(uir.attribute_modifiers)
-        uir.migration_stats = stats
 
         uir.character_classes = _simoon_classes()
 
@@ -174,8 +176,6 @@ class SimoonAdapter(BaseAdapter):
             num_equip_slots=18,
         )
 
-        return uir
-
     # ── Internals ───────────────────────────────────────────────────────
 
     def _get_data_files(self, subdir: str) -> list[Path]:
@@ -207,58 +207,37 @@ class SimoonAdapter(BaseAdapter):
         ext = f".{subdir}"
         return sorted(data_dir.glob(f"*{ext}"))
 
-    def _parse_all(self, subdir, parser_func, stats):
-        """Parse all files in a sub-directory using the given parser."""
-        results = []
-        for fpath in self._get_data_files(subdir):
-            try:
-                items = parser_func(fpath)
-                results.extend(items)
-            except Exception as e:
-                msg = f"Error parsing {fpath}: {e}"
+    def _iter_parsed(self, subdir, parser_func, stats):
+        """Yield the entities of each file in a sub-directory, file by file.
+
+        With ``self.jobs > 1`` the files are parsed in a process pool;
+        results and warnings are still produced in index order.  Files
+        with a fresh entry in ``self.cache`` are not parsed at all.
+        """
+        files = self._get_data_files(subdir)
+        iter_parsed = self.cache.iter_files if self.cache else iter_files
+        for fpath, items, error in iter_parsed(parser_func, files, self.jobs):
+            if error is not None:
+                msg = f"Error parsing {fpath}: {error}"
                 logger.warning(msg)
                 stats.warnings.append(msg)
-        return results
+                continue
+            if items:
+                yield items
 
     def _count_entries(self, subdir: str) -> int:
         """Count #vnum entries across all files in a sub-directory."""
-        count = 0
-        for fpath in self._get_data_files(subdir):
-            try:
-                text = _read_euckr(fpath)
-                for line in text.split("\n"):
-                    stripped = line.strip()
-                    if stripped.startswith("#") and not stripped.startswith("#$"):
-                        vnum_part = stripped[1:]
-                        if vnum_part and not vnum_part.startswith("$"):
-                            try:
-                                int(vnum_part.rstrip("~").strip())
-                                count += 1
-                            except ValueError:
-                                pass
-            except Exception:
-                pass
-        return count
+        files = self._get_data_files(subdir)
+        return sum(
+            n or 0 for _, n, _ in map_files(_count_vnum_entries, files, self.jobs)
+        )
 
     def _count_shop_entries(self) -> int:
         """Count shop entries (format: #<vnum>~)."""
-        count = 0
-        for fpath in self._get_data_files("shp"):
-            try:
-                text = _read_euckr(fpath)
-                for line in text.split("\n"):
-                    stripped = line.strip()
-                    if stripped.startswith("#") and stripped.endswith("~"):
-                        vnum_str = stripped[1:-1].strip()
-                        if vnum_str and not vnum_str.startswith("$"):
-                            try:
-                                int(vnum_str)
-                                count += 1
-                            except ValueError:
-                                pass
-            except Exception:
-                pass
-        return count
+        files = self._get_data_files("shp")
+        return sum(
+            n or 0 for _, n, _ in map_files(_count_shop_vnums, files, self.jobs)
+        )
 
     # ── Phase 2 parsing ──────────────────────────────────────────────
 
@@ -438,6 +417,38 @@ class SimoonAdapter(BaseAdapter):
             return 0
 
 
+def _count_vnum_entries(fpath: Path) -> int:
+    """Count #vnum entries in a single data file (EUC-KR)."""
+    count = 0
+    for line in _read_euckr(fpath).split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("#") and not stripped.startswith("#$"):
+            vnum_part = stripped[1:]
+            if vnum_part and not vnum_part.startswith("$"):
+                try:
+                    int(vnum_part.rstrip("~").strip())
+                    count += 1
+                except ValueError:
+                    pass
+    return count
+
+
+def _count_shop_vnums(fpath: Path) -> int:
+    """Count #<vnum>~ shop entries in a single .shp file (EUC-KR)."""
+    count = 0
+    for line in _read_euckr(fpath).split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("#") and stripped.endswith("~"):
+            vnum_str = stripped[1:-1].strip()
+            if vnum_str and not vnum_str.startswith("$"):
+                try:
+                    int(vnum_str)
+                    count += 1
+                except ValueError:
+                    pass
+    return count
+
+
 def _simoon_classes() -> list[CharacterClass]:
     """Return the 7 Simoon character classes (4 base + 3 extended)."""
     return [
@@ -37,6 +37,8 @@ import logging
 import re
 from pathlib import Path
 
+from genos.adapters.bitset import asciiflag_to_list
+from genos.adapters.circlemud.records import RecordReader, open_records
 from genos.uir.schema import DiceRoll, Monster
 
 logger = logging.getLogger(__name__)
@@ -53,104 +55,81 @@ _NAMED_ATTRS = frozenset({
 def parse_mob_file(filepath: str | Path) -> list[Monster]:
     """Parse a single .mob file and return a list of Monster objects."""
     filepath = Path(filepath)
-    text = filepath.read_text(encoding=_ENCODING, errors="replace")
-    return parse_mob_text(text, str(filepath))
+    with open_records(filepath, _ENCODING) as reader:
+        return parse_mob_records(reader, str(filepath))
 
 
 def parse_mob_text(text: str, source: str = "<string>") -> list[Monster]:
     """Parse .mob format text into Monster objects."""
-    monsters: list[Monster] = []
-    lines = text.split("\n")
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].rstrip()
-
-        if not line.startswith("#"):
-            i += 1
-            continue
+    return parse_mob_records(RecordReader(text), source)
 
-        vnum_str = line[1:].strip()
-        if vnum_str.startswith("$"):
-            break
-
-        try:
-            vnum = int(vnum_str)
-        except ValueError:
-            i += 1
-            continue
 
-        i += 1
-        mob, i = _parse_single_mob(vnum, lines, i, source)
+def parse_mob_records(
+    reader: RecordReader, source: str = "<string>"
+) -> list[Monster]:
+    """Parse the records of a .mob file from *reader*."""
+    monsters: list[Monster] = []
+    for vnum in reader.records():
+        mob = _parse_single_mob(vnum, reader, source)
         if mob:
             monsters.append(mob)
-
     return monsters
 
 
 def _parse_single_mob(
-    vnum: int, lines: list[str], i: int, source: str
-) -> tuple[Monster | None, int]:
+    vnum: int, reader: RecordReader, source: str
+) -> Monster | None:
     """Parse a single mob block starting after #vnum."""
     mob = Monster(vnum=vnum)
 
     # keywords~
-    mob.keywords, i = _read_tilde_string(lines, i)
+    mob.keywords = reader.tilde()
     # short_desc~
-    mob.short_description, i = _read_tilde_string(lines, i)
+    mob.short_description = reader.tilde()
     # long_desc~
-    mob.long_description, i = _read_tilde_string(lines, i)
+    mob.long_description = reader.tilde()
     # detailed_desc~
-    mob.detailed_description, i = _read_tilde_string(lines, i)
+    mob.detailed_description = reader.tilde()
 
     # Flags line: action_flags affect_flags alignment E|S
-    if i < len(lines):
-        parts = lines[i].rstrip().split()
-        i += 1
-        if len(parts) >= 3:
-            mob.action_flags = _parse_flags(parts[0])
-            mob.affect_flags = _parse_flags(parts[1])
-            mob.alignment = int(parts[2])
-        mob.mob_type = parts[-1] if parts else "E"
+    parts = reader.fields()
+    if len(parts) >= 3:
+        mob.action_flags = asciiflag_to_list(parts[0])
+        mob.affect_flags = asciiflag_to_list(parts[1])
+        mob.alignment = int(parts[2])
+    mob.mob_type = parts[-1] if parts else "E"
 
     if mob.mob_type == "E":
         # Line: level hitroll ac hp_dice damage_dice
-        if i < len(lines):
-            parts = lines[i].rstrip().split()
-            i += 1
-            if len(parts) >= 5:
-                mob.level = int(parts[0])
-                mob.hitroll = int(parts[1])
-                mob.armor_class = int(parts[2])
-                mob.hp_dice = _parse_dice(parts[3])
-                mob.damage_dice = _parse_dice(parts[4])
+        parts = reader.fields()
+        if len(parts) >= 5:
+            mob.level = int(parts[0])
+            mob.hitroll = int(parts[1])
+            mob.armor_class = int(parts[2])
+            mob.hp_dice = _parse_dice(parts[3])
+            mob.damage_dice = _parse_dice(parts[4])
 
         # Line: gold exp
-        if i < len(lines):
-            parts = lines[i].rstrip().split()
-            i += 1
-            if len(parts) >= 2:
-                mob.gold = int(parts[0])
-                mob.experience = int(parts[1])
+        parts = reader.fields()
+        if len(parts) >= 2:
+            mob.gold = int(parts[0])
+            mob.experience = int(parts[1])
 
         # Line: load_pos default_pos sex
-        if i < len(lines):
-            parts = lines[i].rstrip().split()
-            i += 1
-            if len(parts) >= 3:
-                mob.load_position = int(parts[0])
-                mob.default_position = int(parts[1])
-                mob.sex = int(parts[2])
+        parts = reader.fields()
+        if len(parts) >= 3:
+            mob.load_position = int(parts[0])
+            mob.default_position = int(parts[1])
+            mob.sex = int(parts[2])
 
     # Optional trailing lines: BareHandAttack, named attrs, E (end marker)
-    while i < len(lines):
-        line = lines[i].rstrip()
-
-        if line == "E":
-            i += 1
+    while not reader.eof:
+        line = reader.peek()
+        if line.startswith("#") or line.startswith("$"):
             break
+        reader.skip()
 
-        if line.startswith("#") or line.startswith("$"):
+        if line == "E":
             break
 
         # Check for named attribute lines like "Str: 18", "BareHandAttack: 1"
@@ -167,12 +146,8 @@ def _parse_single_mob(
                     mob.bare_hand_attack = int(val)
                 else:
                     mob.extensions[attr_name] = val
-                i += 1
-                continue
 
-        i += 1
-
-    return mob, i
+    return mob
 
 
 def _parse_dice(dice_str: str) -> DiceRoll:
@@ -188,51 +163,3 @@ def _parse_dice(dice_str: str) -> DiceRoll:
         return DiceRoll(num=0, size=0, bonus=int(dice_str))
     except ValueError:
         return DiceRoll()
-
-
-def _parse_flags(flag_str: str) -> list[int]:
-    """Parse a flag field (plain integer or asciiflag) into bit position list."""
-    return _int_to_flag_list(_flag_to_int(flag_str))
-
-
-def _flag_to_int(flag_str: str) -> int:
-    """Convert a flag string to int. Supports plain integers and asciiflag."""
-    if not flag_str or flag_str == "0":
-        return 0
-    try:
-        return int(flag_str)
-    except ValueError:
-        pass
-    result = 0
-    for ch in flag_str:
-        if ch.islower():
-            result |= 1 << (ord(ch) - ord('a'))
-        elif ch.isupper():
-            result |= 1 << (26 + ord(ch) - ord('A'))
-    return result
-
-
-def _int_to_flag_list(value: int) -> list[int]:
-    """Convert an integer bitvector to a list of set bit positions."""
-    flags = []
-    bit = 0
-    while value > 0:
-        if value & 1:
-            flags.append(bit)
-        value >>= 1
-        bit += 1
-    return flags
-
-
-def _read_tilde_string(lines: list[str], i: int) -> tuple[str, int]:
-    """Read lines until a line ending with ~ is found."""
-    parts: list[str] = []
-    while i < len(lines):
-        line = lines[i]
-        i += 1
-        if line.rstrip().endswith("~"):
-            content = line.rstrip()[:-1]
-            parts.append(content)
-            break
-        parts.append(line.rstrip("\n"))
-    return "\n".join(parts).strip(), i
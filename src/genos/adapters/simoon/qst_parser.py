@@ -23,6 +23,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from genos.adapters.circlemud.records import RecordReader, open_records
 from genos.uir.schema import Quest
 
 logger = logging.getLogger(__name__)
@@ -33,111 +34,79 @@ _ENCODING = "euc-kr"
 def parse_qst_file(filepath: str | Path) -> list[Quest]:
     """Parse a single .qst file and return a list of Quest objects."""
     filepath = Path(filepath)
-    text = filepath.read_text(encoding=_ENCODING, errors="replace")
-    return parse_qst_text(text, str(filepath))
+    with open_records(filepath, _ENCODING) as reader:
+        return parse_qst_records(reader, str(filepath))
 
 
 def parse_qst_text(text: str, source: str = "<string>") -> list[Quest]:
     """Parse .qst format text into Quest objects."""
-    quests: list[Quest] = []
-    lines = text.split("\n")
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].rstrip()
+    return parse_qst_records(RecordReader(text), source)
 
-        if not line.startswith("#"):
-            i += 1
-            continue
-
-        vnum_str = line[1:].strip()
-        if vnum_str.startswith("$"):
-            break
 
-        try:
-            vnum = int(vnum_str)
-        except ValueError:
-            i += 1
-            continue
-
-        i += 1
-        quest, i = _parse_single_quest(vnum, lines, i, source)
+def parse_qst_records(
+    reader: RecordReader, source: str = "<string>"
+) -> list[Quest]:
+    """Parse the records of a .qst file from *reader*."""
+    quests: list[Quest] = []
+    for vnum in reader.records():
+        quest = _parse_single_quest(vnum, reader, source)
         if quest:
             quests.append(quest)
-
     return quests
 
 
 def _parse_single_quest(
-    vnum: int, lines: list[str], i: int, source: str
-) -> tuple[Quest | None, int]:
+    vnum: int, reader: RecordReader, source: str
+) -> Quest | None:
     """Parse a single quest block."""
     quest = Quest(vnum=vnum)
 
     # Name~
-    quest.name, i = _read_tilde_string(lines, i)
+    quest.name = reader.tilde()
     # Keywords~
-    quest.keywords, i = _read_tilde_string(lines, i)
+    quest.keywords = reader.tilde()
     # Description~
-    quest.description, i = _read_tilde_string(lines, i)
+    quest.description = reader.tilde()
     # Completion message~
-    quest.completion_message, i = _read_tilde_string(lines, i)
+    quest.completion_message = reader.tilde()
     # No quit_message in Simoon format
 
     # Params line 1: quest_type mob_vnum obj_vnum target_vnum reward_exp next_quest min_level
-    if i < len(lines):
-        parts = lines[i].rstrip().split()
-        i += 1
-        if len(parts) >= 1:
-            quest.quest_type = int(parts[0])
-        if len(parts) >= 2:
-            quest.mob_vnum = int(parts[1])
-        if len(parts) >= 3:
-            quest.quest_flags = int(parts[2])  # obj_vnum reused as flags
-        if len(parts) >= 4:
-            quest.target_vnum = int(parts[3])
-        if len(parts) >= 5:
-            quest.reward_exp = int(parts[4])
-        if len(parts) >= 6:
-            quest.next_quest = int(parts[5])
-        if len(parts) >= 7:
-            quest.min_level = int(parts[6])
+    parts = reader.fields()
+    if len(parts) >= 1:
+        quest.quest_type = int(parts[0])
+    if len(parts) >= 2:
+        quest.mob_vnum = int(parts[1])
+    if len(parts) >= 3:
+        quest.quest_flags = int(parts[2])  # obj_vnum reused as flags
+    if len(parts) >= 4:
+        quest.target_vnum = int(parts[3])
+    if len(parts) >= 5:
+        quest.reward_exp = int(parts[4])
+    if len(parts) >= 6:
+        quest.next_quest = int(parts[5])
+    if len(parts) >= 7:
+        quest.min_level = int(parts[6])
 
     # Params line 2: value0 value1 value2 value3
-    if i < len(lines):
-        parts = lines[i].rstrip().split()
-        i += 1
-        if len(parts) >= 1:
-            quest.value0 = int(parts[0])
-        if len(parts) >= 2:
-            quest.value1 = int(parts[1])
-        if len(parts) >= 3:
-            quest.value2 = int(parts[2])
-        if len(parts) >= 4:
-            quest.value3 = int(parts[3])
+    parts = reader.fields()
+    if len(parts) >= 1:
+        quest.value0 = int(parts[0])
+    if len(parts) >= 2:
+        quest.value1 = int(parts[1])
+    if len(parts) >= 3:
+        quest.value2 = int(parts[2])
+    if len(parts) >= 4:
+        quest.value3 = int(parts[3])
 
     # Skip until 'S' or next entry
-    while i < len(lines):
-        line = lines[i].rstrip()
-        if line == "S":
-            i += 1
-            break
+    while not reader.eof:
+        line = reader.peek()
         if line.startswith("#") or line.startswith("$"):
             break
-        i += 1
-
-    return quest, i
+        reader.skip()
+        if line == "S":
+            break
 
+    return quest
 
-def _read_tilde_string(lines: list[str], i: int) -> tuple[str, int]:
-    """Read lines until a line ending with ~ is found."""
-    parts: list[str] = []
-    while i < len(lines):
-        line = lines[i]
-        i += 1
-        if line.rstrip().endswith("~"):
-            content = line.rstrip()[:-1]
-            parts.append(content)
-            break
-        parts.append(line.rstrip("\n"))
-    return "\n".join(parts).strip(), i
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from genos.adapters.circlemud.shp_parser import parse_shp_text
+from genos.adapters.circlemud.records import open_records
+from genos.adapters.circlemud.shp_parser import parse_shp_records
 from genos.uir.schema import Shop
 
 _ENCODING = "euc-kr"
@@ -17,5 +18,5 @@ _ENCODING = "euc-kr"
 def parse_shp_file(filepath: str | Path) -> list[Shop]:
     """Parse a single .shp file (EUC-KR) and return a list of Shop objects."""
     filepath = Path(filepath)
-    text = filepath.read_text(encoding=_ENCODING, errors="replace")
-    return parse_shp_text(text, str(filepath))
+    with open_records(filepath, _ENCODING) as reader:
+        return parse_shp_records(reader, str(filepath))
@@ -20,6 +20,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from genos.adapters.circlemud.records import RecordReader, open_records
 from genos.uir.schema import Zone, ZoneResetCommand
 
 logger = logging.getLogger(__name__)
@@ -30,82 +31,61 @@ _ENCODING = "euc-kr"
 def parse_zon_file(filepath: str | Path) -> list[Zone]:
     """Parse a single .zon file and return a list of Zone objects."""
     filepath = Path(filepath)
-    text = filepath.read_text(encoding=_ENCODING, errors="replace")
-    return parse_zon_text(text, str(filepath))
+    with open_records(filepath, _ENCODING) as reader:
+        return parse_zon_records(reader, str(filepath))
 
 
 def parse_zon_text(text: str, source: str = "<string>") -> list[Zone]:
     """Parse .zon format text into Zone objects."""
-    zones: list[Zone] = []
-    lines = text.split("\n")
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].rstrip()
-
-        if not line.startswith("#"):
-            i += 1
-            continue
+    return parse_zon_records(RecordReader(text), source)
 
-        vnum_str = line[1:].strip()
-        if vnum_str.startswith("$"):
-            break
-
-        try:
-            vnum = int(vnum_str)
-        except ValueError:
-            i += 1
-            continue
 
-        i += 1
-        zone, i = _parse_single_zone(vnum, lines, i, source)
+def parse_zon_records(
+    reader: RecordReader, source: str = "<string>"
+) -> list[Zone]:
+    """Parse the records of a .zon file from *reader*."""
+    zones: list[Zone] = []
+    for vnum in reader.records():
+        zone = _parse_single_zone(vnum, reader, source)
         if zone:
             zones.append(zone)
-
     return zones
 
 
 def _parse_single_zone(
-    vnum: int, lines: list[str], i: int, source: str
-) -> tuple[Zone | None, int]:
+    vnum: int, reader: RecordReader, source: str
+) -> Zone | None:
     """Parse a single zone block."""
     zone = Zone(vnum=vnum)
 
     # Zone name~
-    zone.name, i = _read_tilde_string(lines, i)
+    zone.name = reader.tilde()
 
     # Builders~ (often <NONE!>~)
-    zone.builders, i = _read_tilde_string(lines, i)
+    zone.builders = reader.tilde()
 
     # Zone params line: top lifespan reset_mode (3 fields)
-    if i < len(lines):
-        parts = lines[i].rstrip().split()
-        i += 1
-        if len(parts) >= 3:
-            zone.top = int(parts[0])
-            zone.lifespan = int(parts[1])
-            zone.reset_mode = int(parts[2])
-            # bot is inferred from zone vnum
-            zone.bot = vnum * 100
+    parts = reader.fields()
+    if len(parts) >= 3:
+        zone.top = int(parts[0])
+        zone.lifespan = int(parts[1])
+        zone.reset_mode = int(parts[2])
+        # bot is inferred from zone vnum
+        zone.bot = vnum * 100
 
     # Reset commands until 'S'
-    while i < len(lines):
-        line = lines[i].rstrip()
-
+    while (line := reader.line()) is not None:
         if line == "S" or line.startswith("$"):
-            i += 1
             break
 
         if not line or line.startswith("*"):
-            i += 1
             continue
 
         cmd = _parse_reset_command(line)
         if cmd:
             zone.reset_commands.append(cmd)
-        i += 1
 
-    return zone, i
+    return zone
 
 
 def _parse_reset_command(line: str) -> ZoneResetCommand | None:
@@ -142,16 +122,3 @@ def _parse_reset_command(line: str) -> ZoneResetCommand | None:
 
     return cmd
 
-
-def _read_tilde_string(lines: list[str], i: int) -> tuple[str, int]:
-    """Read lines until a line ending with ~ is found."""
-    parts: list[str] = []
-    while i < len(lines):
-        line = lines[i]
-        i += 1
-        if line.rstrip().endswith("~"):
-            content = line.rstrip()[:-1]
-            parts.append(content)
-            break
-        parts.append(line.rstrip("\n"))
-    return "\n".join(parts).strip(), i
@@ -1,5 +1,32 @@
-"""3eyes MUD adapter — binary C struct format parser."""
+"""3eyes MUD adapter — binary C struct format parser.
 
-from .adapter import ThreeEyesAdapter
+Importing the package is cheap: it only declares the detection
+:data:`MARKERS`.  ``ThreeEyesAdapter`` (and with it every parser module)
+is imported on first access.
+"""
+
+from __future__ import annotations
+
+from genos.adapters.fingerprint import file_marker
+
+# sizeof(struct creature), as constants.SIZEOF_CREATURE; repeated here so
+# detection does not load the struct tables.
+_CREATURE_SIZE = 1184
+
+# rooms/r{nn}/ + objmon/o{nn} + objmon/m{nn}, with at least one
+# monster file holding whole records.  No other MUD uses numbered
+# binary room files.
+MARKERS = (
+    file_marker("rooms/r[0-9][0-9]"),
+    file_marker("objmon/o[0-9][0-9]"),
+    file_marker("objmon/m[0-9][0-9]", record_size=_CREATURE_SIZE),
+)
 
 __all__ = ["ThreeEyesAdapter"]
+
+
+def __getattr__(name: str):
+    if name == "ThreeEyesAdapter":
+        from .adapter import ThreeEyesAdapter
+        return ThreeEyesAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,9 +16,12 @@ Directory structure:
 from __future__ import annotations
 
 import logging
+import pickle
+import tempfile
 from pathlib import Path
+from typing import Any, Callable, Container, Iterator
 
-from genos.adapters.base import AnalysisReport, BaseAdapter
+from genos.adapters.base import AnalysisReport, BaseAdapter, UIRChunks
 from genos.adapters.detector import register_adapter
 from genos.uir.schema import (
     CharacterClass,
@@ -33,6 +36,7 @@ from genos.uir.schema import (
     UIR,
 )
 
+from . import MARKERS
 from .config_parser import (
     parse_bonus_table,
     parse_class_stats,
@@ -42,14 +46,14 @@ from .config_parser import (
 )
 from .constants import CLASSES, RACES, SIZEOF_CREATURE, SIZEOF_OBJECT, RECORDS_PER_FILE, SPELL_NAMES
 from .help_parser import parse_all_help
-from .mob_parser import parse_all_monsters
-from .obj_parser import parse_all_objects
-from .room_parser import parse_all_rooms
+from .mob_parser import iter_monsters
+from .obj_parser import iter_objects
+from .room_parser import iter_rooms
 from .talk_parser import (
-    load_all_ddescs,
-    load_all_talks,
-    parse_ddesc_filename,
-    parse_talk_filename,
+    index_ddesc_files,
+    index_talk_files,
+    parse_ddesc_file,
+    parse_talk_file,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,42 +63,14 @@ logger = logging.getLogger(__name__)
 class ThreeEyesAdapter(BaseAdapter):
     """Adapter for 3eyes MUD (binary C struct format)."""
 
+    markers = MARKERS
+
     def __init__(self, source_path: str | Path) -> None:
         super().__init__(source_path)
         self._rooms_dir = self.source_path / "rooms"
         self._objmon_dir = self.source_path / "objmon"
         self._help_dir = self.source_path / "help"
 
-    def detect(self) -> bool:
-        """Detect 3eyes by checking for its unique directory structure.
-
-        3eyes has: rooms/r{nn}/r{nnnnn} + objmon/m{nn} + objmon/o{nn}.
-        This pattern is unique — no other MUD uses numbered binary room files.
-        """
-        if not self._rooms_dir.is_dir():
-            return False
-        if not self._objmon_dir.is_dir():
-            return False
-
-        # Check for room subdirectories
-        has_room_dirs = any(self._rooms_dir.glob("r[0-9][0-9]"))
-        if not has_room_dirs:
-            return False
-
-        # Check for monster/object binary files with correct size
-        has_monsters = any(self._objmon_dir.glob("m[0-9][0-9]"))
-        has_objects = any(self._objmon_dir.glob("o[0-9][0-9]"))
-        if not (has_monsters and has_objects):
-            return False
-
-        # Verify at least one file's size is a multiple of the record size
-        for mfile in sorted(self._objmon_dir.glob("m[0-9][0-9]")):
-            size = mfile.stat().st_size
-            if size > 0 and size % SIZEOF_CREATURE == 0:
-                return True
-
-        return False
-
     def analyze(self) -> AnalysisReport:
         """Quick analysis without full parsing."""
         report = AnalysisReport(
@@ -143,6 +119,17 @@ class ThreeEyesAdapter(BaseAdapter):
 
     def parse(self) -> UIR:
         """Parse all 3eyes data into a UIR."""
+        uir, chunks = self.parse_stream()
+        for section, entities in chunks:
+            getattr(uir, section).extend(entities)
+        return uir
+
+    def parse_stream(self) -> tuple[UIR, UIRChunks]:
+        """Parse world files one at a time, yielding each file's entities.
+
+        Room files hold one room each and come one ``r{nn}`` directory
+        per chunk.
+        """
         uir = UIR()
         uir.source_mud = SourceMudInfo(
             name="3eyes",
@@ -150,16 +137,26 @@ class ThreeEyesAdapter(BaseAdapter):
             codebase="Mordor (CircleMUD variant)",
             source_path=str(self.source_path),
         )
+        uir.migration_stats = MigrationStats()
+        return uir, self._stream(uir)
 
-        stats = MigrationStats()
+    def _stream(self, uir: UIR) -> UIRChunks:
+        """Yield world chunks, then fill in the remaining sections."""
+        stats = uir.migration_stats
 
         # Core data
-        uir.rooms = self._parse_rooms(stats)
-        uir.items = self._parse_objects(stats)
-        uir.monsters = self._parse_monsters(stats)
-
-        # Merge talk/ddesc files into monsters
-        self._merge_talk_files(uir.monsters)
+        zones: set[int] = set()
+        for rooms in self._parse_rooms(stats):
+            stats.total_rooms += len(rooms)
+            zones.update(r.zone_number for r in rooms)
+            yield "rooms", rooms
+        for items in self._parse_objects(stats):
+            stats.total_items += len(items)
+            yield "items", items
+        # Talk/ddesc files are merged in as monsters stream by
+        for monsters in self._parse_monsters(stats):
+            stats.total_monsters += len(monsters)
+            yield "monsters", monsters
 
         # Help entries
         uir.help_entries = self._parse_help(stats)
@@ -185,18 +182,14 @@ class ThreeEyesAdapter(BaseAdapter):
         if level_cycle:
             uir.extensions["level_cycle"] = level_cycle
 
-        # Stats
-        stats.total_rooms = len(uir.rooms)
-        stats.total_items = len(uir.items)
-        stats.total_monsters = len(uir.monsters)
-        stats.total_zones = len({r.zone_number for r in uir.rooms})
+        # Stats (world section totals are counted while streaming)
+        stats.total_zones = len(zones)
         stats.total_help_entries = len(uir.help_entries)
         stats.total_skills = len(uir.skills)
         stats.total_races = len(uir.races)
         stats.total_thac0_entries = len(uir.thac0_table)
         stats.total_exp_entries = len(uir.experience_table)
         stats.total_attribute_modifiers = len(uir.attribute_modifiers)
-        uir.migration_stats = stats
 
         uir.combat_system = CombatSystem(
             type="thac0",
@@ -215,36 +208,47 @@ class ThreeEyesAdapter(BaseAdapter):
             num_equip_slots=20,
         )
 
-        return uir
-
     # ── Parse helpers ──────────────────────────────────────────────
 
-    def _parse_rooms(self, stats: MigrationStats) -> list:
-        try:
-            return parse_all_rooms(self._rooms_dir)
-        except Exception as e:
-            msg = f"Error parsing rooms: {e}"
-            logger.warning(msg)
-            stats.warnings.append(msg)
-            return []
+    def _parse_rooms(self, stats: MigrationStats) -> Iterator[list]:
+        yield from _warn_on_error(
+            "rooms", iter_rooms(self._rooms_dir, self.cache, self.jobs), stats,
+        )
 
-    def _parse_objects(self, stats: MigrationStats) -> list:
-        try:
-            return parse_all_objects(self._objmon_dir)
-        except Exception as e:
-            msg = f"Error parsing objects: {e}"
-            logger.warning(msg)
-            stats.warnings.append(msg)
-            return []
+    def _parse_objects(self, stats: MigrationStats) -> Iterator[list]:
+        yield from _warn_on_error(
+            "objects", iter_objects(self._objmon_dir, self.cache), stats,
+        )
 
-    def _parse_monsters(self, stats: MigrationStats) -> list:
-        try:
-            return parse_all_monsters(self._objmon_dir)
-        except Exception as e:
-            msg = f"Error parsing monsters: {e}"
-            logger.warning(msg)
-            stats.warnings.append(msg)
-            return []
+    def _parse_monsters(self, stats: MigrationStats) -> Iterator[list[Monster]]:
+        """Yield each monster file's monsters with talk/ddesc merged in.
+
+        Which monster a talk file belongs to depends on every monster
+        (the last one with its name and level), so the monsters are
+        spooled to a temporary file while their keys are collected, then
+        read back one file at a time.
+        """
+        with tempfile.TemporaryFile() as spool:
+            # (name, level) -> vnum of the last monster with that key
+            owners: dict[tuple[str, int], int] = {}
+            files = 0
+            for monsters in _warn_on_error(
+                "monsters", iter_monsters(self._objmon_dir, self.cache), stats,
+            ):
+                for m in monsters:
+                    owners[(m.short_description, m.level)] = m.vnum
+                pickle.dump(monsters, spool, pickle.HIGHEST_PROTOCOL)
+                files += 1
+
+            matches = self._match_talk_files(owners)
+            spool.seek(0)
+            for _ in range(files):
+                monsters = pickle.load(spool)
+                for m in monsters:
+                    key = (m.short_description, m.level)
+                    if owners[key] == m.vnum and key in matches:
+                        _apply_talk_files(m, *matches[key])
+                yield monsters
 
     def _parse_help(self, stats: MigrationStats) -> list[HelpEntry]:
         try:
@@ -316,40 +320,45 @@ class ThreeEyesAdapter(BaseAdapter):
             return {}
 
     def _merge_talk_files(self, monsters: list[Monster]) -> None:
-        """Merge talk and ddesc files into parsed monsters."""
-        talk_dir = self._objmon_dir / "talk"
-        ddesc_dir = self._objmon_dir / "ddesc"
-
-        talks = load_all_talks(talk_dir)
-        ddescs = load_all_ddescs(ddesc_dir)
+        """Merge talk and ddesc files into parsed monsters.
 
+        Files are matched to monsters by the name and level in their file
+        names, and only the files of a matching monster are read.
+        """
         # Build lookup: (name, level) → monster
         mob_lookup: dict[tuple[str, int], Monster] = {}
         for m in monsters:
             mob_lookup[(m.short_description, m.level)] = m
 
-        # Merge talk files
-        for filename, talk_dict in talks.items():
-            name, level = parse_talk_filename(filename)
-            mob = mob_lookup.get((name, level))
-            if mob is not None:
-                mob.extensions["talk_responses"] = talk_dict
-            else:
-                logger.debug("No monster match for talk file: %s", filename)
-
-        # Merge ddesc files
-        for filename, desc in ddescs.items():
-            name, level = parse_ddesc_filename(filename)
-            # ddesc uses underscore separators in name
-            name_display = name.replace("_", " ")
-            mob = mob_lookup.get((name_display, level))
-            if mob is None:
-                # Try with original name (underscores kept)
-                mob = mob_lookup.get((name, level))
-            if mob is not None:
-                mob.detailed_description = desc
-            else:
-                logger.debug("No monster match for ddesc file: %s", filename)
+        for key, paths in self._match_talk_files(mob_lookup).items():
+            _apply_talk_files(mob_lookup[key], *paths)
+
+    def _match_talk_files(
+        self, keys: Container[tuple[str, int]],
+    ) -> dict[tuple[str, int], tuple[list[Path] | None, list[Path] | None]]:
+        """``(talk files, ddesc files)`` of each monster key in *keys*."""
+        talk_index = index_talk_files(self._objmon_dir / "talk")
+        ddesc_by_name = index_ddesc_files(self._objmon_dir / "ddesc")
+
+        # ddesc uses underscore separators in name; fall back to the
+        # original name (underscores kept) when no monster has the spaced one
+        ddesc_index: dict[tuple[str, int], list[Path]] = {}
+        for (name, level), paths in ddesc_by_name.items():
+            key = (name.replace("_", " "), level)
+            if key not in keys:
+                key = (name, level)
+            ddesc_index.setdefault(key, []).extend(paths)
+
+        matches = {
+            key: (talk_index.get(key), ddesc_index.get(key))
+            for key in talk_index.keys() | ddesc_index.keys() if key in keys
+        }
+
+        for kind, index in (("talk", talk_index), ("ddesc", ddesc_index)):
+            for key in index.keys() - matches.keys():
+                for path in index[key]:
+                    logger.debug("No monster match for %s file: %s", kind, path.name)
+        return matches
 
     def _count_binary_records(
         self, prefix: str, record_size: int,
@@ -440,3 +449,35 @@ def _threeeyes_spells() -> list[Skill]:
         )
         for spell_id, name in sorted(SPELL_NAMES.items())
     ]
+
+
+def _apply_talk_files(
+    mob: Monster, talk_paths: list[Path] | None, ddesc_paths: list[Path] | None,
+) -> None:
+    talk_dict = _read_matched(parse_talk_file, talk_paths)
+    if talk_dict:
+        mob.extensions["talk_responses"] = talk_dict
+    desc = _read_matched(parse_ddesc_file, ddesc_paths)
+    if desc:
+        mob.detailed_description = desc
+
+
+def _warn_on_error(
+    label: str, chunks: Iterator[list], stats: MigrationStats,
+) -> Iterator[list]:
+    """Yield from *chunks*, recording an exception as a parse warning."""
+    try:
+        yield from chunks
+    except Exception as e:
+        msg = f"Error parsing {label}: {e}"
+        logger.warning(msg)
+        stats.warnings.append(msg)
+
+
+def _read_matched(parse: Callable[[Path], Any], paths: list[Path] | None) -> Any:
+    """Parse the last of *paths* (in name order) with non-empty content."""
+    for path in reversed(paths or ()):
+        value = parse(path)
+        if value:
+            return value
+    return None
@@ -9,31 +9,52 @@ Strings are EUC-KR encoded, null-terminated C strings.
 from __future__ import annotations
 
 import struct
+from collections import namedtuple
+from typing import Any, Sequence
+
+from genos.adapters.bitset import bytes_to_flag_list
+
+from .constants import (
+    CREATURE_LAYOUT,
+    EXIT_LAYOUT,
+    OBJECT_LAYOUT,
+    ROOM_LAYOUT,
+    SIZEOF_CREATURE,
+    SIZEOF_EXIT,
+    SIZEOF_OBJECT,
+    SIZEOF_ROOM,
+)
+
+_BYTE = struct.Struct("<b")
+_UBYTE = struct.Struct("<B")
+_SHORT = struct.Struct("<h")
+_USHORT = struct.Struct("<H")
+_INT = struct.Struct("<i")
 
 
 def read_byte(data: bytes, offset: int) -> int:
     """Read a signed byte (char)."""
-    return struct.unpack_from("<b", data, offset)[0]
+    return _BYTE.unpack_from(data, offset)[0]
 
 
 def read_ubyte(data: bytes, offset: int) -> int:
     """Read an unsigned byte (unsigned char)."""
-    return struct.unpack_from("<B", data, offset)[0]
+    return _UBYTE.unpack_from(data, offset)[0]
 
 
 def read_short(data: bytes, offset: int) -> int:
     """Read a signed 16-bit short."""
-    return struct.unpack_from("<h", data, offset)[0]
+    return _SHORT.unpack_from(data, offset)[0]
 
 
 def read_ushort(data: bytes, offset: int) -> int:
     """Read an unsigned 16-bit short."""
-    return struct.unpack_from("<H", data, offset)[0]
+    return _USHORT.unpack_from(data, offset)[0]
 
 
 def read_int(data: bytes, offset: int) -> int:
     """Read a signed 32-bit int/long."""
-    return struct.unpack_from("<i", data, offset)[0]
+    return _INT.unpack_from(data, offset)[0]
 
 
 def read_cstring(data: bytes, offset: int, max_len: int) -> str:
@@ -43,7 +64,11 @@ def read_cstring(data: bytes, offset: int, max_len: int) -> str:
     first null byte, and decodes as EUC-KR (with replacement for
     unmappable bytes).
     """
-    raw = data[offset : offset + max_len]
+    return cstring(data[offset : offset + max_len])
+
+
+def cstring(raw: bytes) -> str:
+    """Decode a fixed-size ``char[]`` field up to its first null byte."""
     null_pos = raw.find(b"\x00")
     if null_pos >= 0:
         raw = raw[:null_pos]
@@ -60,14 +85,69 @@ def read_cstring_array(
     ]
 
 
-def flags_to_bit_positions(flag_bytes: bytes) -> list[int]:
-    """Convert a flags byte-array to a list of set bit positions.
+# Convert a flags byte-array to a list of set bit positions, mirroring
+# the C macro ``F_ISSET(p, f) => p->flags[f/8] & (1<<(f%8))``.
+flags_to_bit_positions = bytes_to_flag_list
 
-    Mirrors the C macro ``F_ISSET(p, f) => p->flags[f/8] & (1<<(f%8))``.
+
+# ── Record layouts ──────────────────────────────────────────────────
+
+
+class RecordLayout:
+    """Precompiled decoder of one fixed-size C struct.
+
+    Built from a ``(field, format)`` table of :mod:`.constants`: the
+    formats are joined into a single :class:`struct.Struct`, so a record
+    is decoded with one ``unpack_from`` call straight from the file
+    buffer (``bytes`` or a ``memoryview``), without slicing it out first.
+    Records come back as named tuples; array fields are tuples.
     """
-    positions: list[int] = []
-    for byte_idx, byte_val in enumerate(flag_bytes):
-        for bit in range(8):
-            if byte_val & (1 << bit):
-                positions.append(byte_idx * 8 + bit)
-    return positions
+
+    def __init__(
+        self, name: str, fields: Sequence[tuple[str, str]], size: int,
+    ) -> None:
+        self.struct = struct.Struct("<" + "".join(fmt for _, fmt in fields))
+        if self.struct.size != size:
+            raise ValueError(
+                f"{name} layout is {self.struct.size} bytes, expected {size}"
+            )
+        self.name = name
+        self.fields = tuple(fields)
+        self.size = size
+        names: list[str] = []
+        # Per field: value index, or (start, stop) of an array's values
+        plan: list[int | tuple[int, int]] = []
+        index = 0
+        for field, fmt in fields:
+            count = _value_count(fmt)
+            if not field:
+                if count:
+                    raise ValueError(f"{name}: unnamed field {fmt!r} holds values")
+                continue
+            names.append(field)
+            plan.append(index if count == 1 else (index, index + count))
+            index += count
+        self.record_type = namedtuple(name, names)
+        self._plan = plan
+        self._flat = all(isinstance(p, int) for p in plan)
+
+    def decode(self, buffer: Any, offset: int = 0) -> Any:
+        """Decode the record at *offset* of *buffer*."""
+        values = self.struct.unpack_from(buffer, offset)
+        if self._flat:
+            return self.record_type._make(values)
+        return self.record_type._make([
+            values[p] if p.__class__ is int else values[p[0]:p[1]]
+            for p in self._plan
+        ])
+
+
+def _value_count(fmt: str) -> int:
+    part = struct.Struct("<" + fmt)
+    return len(part.unpack(bytes(part.size)))
+
+
+CREATURE = RecordLayout("CreatureRecord", CREATURE_LAYOUT, SIZEOF_CREATURE)
+OBJECT = RecordLayout("ObjectRecord", OBJECT_LAYOUT, SIZEOF_OBJECT)
+ROOM = RecordLayout("RoomRecord", ROOM_LAYOUT, SIZEOF_ROOM)
+EXIT = RecordLayout("ExitRecord", EXIT_LAYOUT, SIZEOF_EXIT)
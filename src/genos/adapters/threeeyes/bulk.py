@@ -0,0 +1,94 @@
+"""Vectorized decoding of objmon files with numpy (optional).
+
+An ``objmon/m{nn}`` or ``o{nn}`` file is an array of fixed-size C
+structs, i.e. a numpy structured array.  When numpy is importable,
+:func:`decode_records` maps a whole file with ``np.frombuffer`` using a
+dtype built from the same :mod:`.constants` layout table as the
+``struct`` decoder, selects the wanted records with boolean masks and
+converts every column to Python values in one call per field.  The
+records it returns are the :class:`~.binary_utils.RecordLayout` named
+tuples, so the parsers build entities from them unchanged; only the
+EUC-KR strings are still decoded per record, by the parsers.
+
+Without numpy, :data:`HAVE_NUMPY` is False and the parsers fall back to
+one ``unpack_from`` per record.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from typing import Any
+
+from .binary_utils import RecordLayout
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install genos[fast]
+    np = None  # type: ignore[assignment]
+
+HAVE_NUMPY = np is not None
+
+# struct format code -> numpy scalar type (little-endian)
+_NUMPY_TYPES = {"b": "i1", "B": "u1", "h": "<i2", "H": "<u2", "i": "<i4"}
+
+_FMT_RE = re.compile(r"(\d*)([xbBhHis])")
+
+_dtypes: dict[str, Any] = {}
+
+
+def dtype_fields(layout: RecordLayout) -> dict[str, Any]:
+    """numpy dtype spec (names/formats/offsets/itemsize) of *layout*.
+
+    ``char[n]`` fields become ``S{n}`` and arrays get a shape; padding
+    is left out and covered by the explicit offsets.
+    """
+    names: list[str] = []
+    formats: list[Any] = []
+    offsets: list[int] = []
+    offset = 0
+    for field, fmt in layout.fields:
+        if field:
+            codes = _FMT_RE.findall(fmt)
+            count, code = codes[0]
+            if len(set(codes)) != 1 or (code != "s" and len(codes) > 1):
+                raise ValueError(f"{layout.name}.{field}: mixed format {fmt!r}")
+            if code == "s":
+                base, shape = f"S{count}", len(codes)
+            else:
+                base, shape = _NUMPY_TYPES[code], int(count or 1)
+            names.append(field)
+            formats.append(base if shape == 1 else (base, (shape,)))
+            offsets.append(offset)
+        offset += struct.calcsize("<" + fmt)
+    return {
+        "names": names, "formats": formats, "offsets": offsets,
+        "itemsize": layout.size,
+    }
+
+
+def record_dtype(layout: RecordLayout) -> Any:
+    """Structured numpy dtype of *layout* (requires numpy)."""
+    dtype = _dtypes.get(layout.name)
+    if dtype is None:
+        dtype = _dtypes[layout.name] = np.dtype(dtype_fields(layout))
+    return dtype
+
+
+def decode_records(
+    data: bytes, layout: RecordLayout, count: int, **where: int,
+) -> list[tuple[int, Any]]:
+    """``(record index, record)`` of the used records among the first *count*.
+
+    A record is used when its ``name`` is not all null and every field
+    named in *where* equals the given value.
+    """
+    arr = np.frombuffer(data, dtype=record_dtype(layout), count=count)
+    # S fields drop trailing nulls, so an all-null name is empty
+    mask = arr["name"] != b""
+    for field, value in where.items():
+        mask &= arr[field] == value
+    rows = arr[mask]
+    columns = [rows[field].tolist() for field in layout.record_type._fields]
+    make = layout.record_type._make
+    return list(zip(np.flatnonzero(mask).tolist(), map(make, zip(*columns))))
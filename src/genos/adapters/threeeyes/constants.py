@@ -13,6 +13,117 @@ SIZEOF_LASTTIME = 12
 
 RECORDS_PER_FILE = 100  # MFILESIZE / OFILESIZE
 
+# ── Record layouts (mstruct.h) ──────────────────────────────────────────
+#
+# (field, struct format) in declaration order, little-endian with the
+# compiler's padding spelled out as "x" entries (field "").  Pointer and
+# runtime-only members are padding too.  A format yielding several
+# values (``5i``, ``20s20s20s``) is an array field.
+
+CREATURE_LAYOUT: tuple[tuple[str, str], ...] = (
+    ("fd", "h"),
+    ("level", "B"),
+    ("type", "b"),
+    ("crt_class", "b"),
+    ("race", "b"),
+    ("numwander", "b"),
+    ("", "x"),
+    ("alignment", "h"),
+    ("strength", "b"),
+    ("dexterity", "b"),
+    ("constitution", "b"),
+    ("intelligence", "b"),
+    ("piety", "b"),
+    ("", "x"),
+    ("hpmax", "h"),
+    ("hpcur", "h"),
+    ("mpmax", "h"),
+    ("mpcur", "h"),
+    ("armor", "b"),
+    ("thaco", "b"),
+    ("", "2x"),
+    ("experience", "i"),
+    ("gold", "i"),
+    ("ndice", "h"),
+    ("sdice", "h"),
+    ("pdice", "h"),
+    ("special", "h"),
+    ("name", "80s"),
+    ("description", "80s"),
+    ("talk", "80s"),
+    ("etc", "15s"),
+    ("key", "20s20s20s"),
+    ("", "x"),
+    ("proficiency", "5i"),
+    ("realm", "4i"),
+    ("spells", "16s"),
+    ("flags", "8s"),
+    ("quests", "16s"),
+    ("questnum", "b"),
+    ("", "x"),
+    ("carry", "10h"),
+    ("rom_num", "h"),
+    ("", "724x"),  # ready[20], daily[10], lasttime[45], 6 pointers
+)
+
+OBJECT_LAYOUT: tuple[tuple[str, str], ...] = (
+    ("name", "70s"),
+    ("etc", "10s"),
+    ("description", "80s"),
+    ("key", "20s20s20s"),
+    ("use_output", "80s"),
+    ("value", "i"),
+    ("weight", "h"),
+    ("type", "b"),
+    ("adjustment", "b"),
+    ("shotsmax", "h"),
+    ("shotscur", "h"),
+    ("ndice", "h"),
+    ("sdice", "h"),
+    ("pdice", "h"),
+    ("armor", "b"),
+    ("wearflag", "B"),
+    ("magicpower", "b"),
+    ("magicrealm", "b"),
+    ("special", "h"),
+    ("flags", "8s"),
+    ("questnum", "b"),
+    ("", "19x"),  # 3 pad, 4 pointers
+)
+
+ROOM_LAYOUT: tuple[tuple[str, str], ...] = (
+    ("name", "80s"),
+    ("rom_num", "h"),
+    ("", "2x"),
+    ("", "12x"),  # long_desc, short_desc, obj_desc pointers
+    ("special", "h"),
+    ("trap", "b"),
+    ("", "x"),
+    ("trapexit", "h"),
+    ("track", "80s"),
+    ("flags", "8s"),
+    ("random", "10h"),
+    ("traffic", "B"),
+    ("", "x"),
+    ("", "240x"),  # perm_mon[10], perm_obj[10]
+    ("visited_time", "i"),
+    ("established", "i"),
+    ("lolevel", "B"),
+    ("hilevel", "B"),
+    ("", "2x"),
+    ("", "16x"),  # 4 pointers
+)
+
+EXIT_LAYOUT: tuple[tuple[str, str], ...] = (
+    ("name", "20s"),
+    ("room", "h"),
+    ("flags", "4s"),
+    ("", "2x"),
+    ("", "12x"),  # lasttime ltime
+    ("key", "b"),
+    ("", "3x"),
+)
+
 # ── Creature types ──────────────────────────────────────────────────────
 
 CREATURE_PLAYER = 0
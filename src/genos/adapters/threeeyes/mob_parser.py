@@ -57,18 +57,14 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Any, Iterator
 
+from genos.adapters.cache import ParseCache
+from genos.profiling import parse_file
 from genos.uir.schema import DiceRoll, Monster
 
-from .binary_utils import (
-    flags_to_bit_positions,
-    read_byte,
-    read_cstring,
-    read_cstring_array,
-    read_int,
-    read_short,
-    read_ubyte,
-)
+from . import bulk
+from .binary_utils import CREATURE, cstring, flags_to_bit_positions
 from .constants import (
     CREATURE_MONSTER,
     PROFICIENCIES,
@@ -90,100 +86,64 @@ def parse_mob_file(filepath: Path, file_index: int) -> list[Monster]:
             filepath, len(data), expected,
         )
 
-    monsters: list[Monster] = []
     record_count = min(len(data) // SIZEOF_CREATURE, RECORDS_PER_FILE)
+    # Only MONSTER (1) records with a name; PLAYER (0) records are skipped
+    if bulk.HAVE_NUMPY:
+        records = bulk.decode_records(
+            data, CREATURE, record_count, type=CREATURE_MONSTER,
+        )
+    else:
+        records = _decode_records(data, record_count)
+    return [
+        _parse_creature_record(rec, file_index * 100 + i) for i, rec in records
+    ]
+
+
+def _decode_records(data: bytes, record_count: int) -> list[tuple[int, Any]]:
+    """``(record index, record)`` of the named MONSTER records, one at a time."""
+    records: list[tuple[int, Any]] = []
+    view = memoryview(data)
 
     for i in range(record_count):
         offset = i * SIZEOF_CREATURE
-        record = data[offset : offset + SIZEOF_CREATURE]
 
         # Skip PLAYER type (0) and empty records
-        crt_type = read_byte(record, 3)
-        if crt_type != CREATURE_MONSTER:
+        if data[offset + 3] != CREATURE_MONSTER:
             continue
+        rec = CREATURE.decode(view, offset)
 
         # Skip empty records (name all null)
-        if record[44:124].rstrip(b"\x00") == b"":
+        if not rec.name.rstrip(b"\x00"):
             continue
 
-        vnum = file_index * 100 + i
-        monsters.append(_parse_creature_record(record, vnum))
-
-    return monsters
-
-
-def _parse_creature_record(rec: bytes, vnum: int) -> Monster:
-    """Parse a single 1184-byte creature record into a Monster."""
-    level = read_ubyte(rec, 2)
-    crt_class = read_byte(rec, 4)
-    crt_race = read_byte(rec, 5)
-    numwander = read_byte(rec, 6)
-    alignment = read_short(rec, 8)
-
-    strength = read_byte(rec, 10)
-    dexterity = read_byte(rec, 11)
-    constitution = read_byte(rec, 12)
-    intelligence = read_byte(rec, 13)
-    piety = read_byte(rec, 14)
-
-    hpmax = read_short(rec, 16)
-    hpcur = read_short(rec, 18)
-    mpmax = read_short(rec, 20)
-    mpcur = read_short(rec, 22)
-    armor = read_byte(rec, 24)
-    thaco = read_byte(rec, 25)
-
-    experience = read_int(rec, 28)
-    gold = read_int(rec, 32)
-    ndice = read_short(rec, 36)
-    sdice = read_short(rec, 38)
-    pdice = read_short(rec, 40)
-    special = read_short(rec, 42)
-
-    name = read_cstring(rec, 44, 80)
-    description = read_cstring(rec, 124, 80)
-    talk = read_cstring(rec, 204, 80)
-    etc = read_cstring(rec, 284, 15)
-    keys = read_cstring_array(rec, 299, 3, 20)
+        records.append((i, rec))
+
+    return records
+
+
+def _parse_creature_record(rec: Any, vnum: int) -> Monster:
+    """Build a Monster from a decoded creature record."""
+    name = cstring(rec.name)
+    keys = [cstring(k) for k in rec.key]
 
     # Proficiencies
     profs: dict[str, int] = {}
-    for idx in range(5):
-        val = read_int(rec, 360 + idx * 4)
+    for idx, val in enumerate(rec.proficiency):
         if val > 0:
             prof_name = PROFICIENCIES.get(idx, f"prof_{idx}")
             profs[prof_name] = val
 
     # Magic realms
     realms: dict[str, int] = {}
-    for idx in range(4):
-        val = read_int(rec, 380 + idx * 4)
+    for idx, val in enumerate(rec.realm):
         if val > 0:
             realm_name = MAGIC_REALMS.get(idx + 1, f"realm_{idx}")
             realms[realm_name] = val
 
-    # Spells
-    spells_raw = rec[396:412]
-    known_spells = flags_to_bit_positions(spells_raw)
-
-    # Flags
-    flags_raw = rec[412:420]
-    action_flags = flags_to_bit_positions(flags_raw)
-
-    # Quests
-    quests_raw = rec[420:436]
-    quest_flags = flags_to_bit_positions(quests_raw)
-
-    questnum = read_byte(rec, 436)
+    action_flags = flags_to_bit_positions(rec.flags)
 
     # Carry items
-    carry: list[int] = []
-    for idx in range(10):
-        c = read_short(rec, 438 + idx * 2)
-        if c > 0:
-            carry.append(c)
-
-    rom_num = read_short(rec, 458)
+    carry = [c for c in rec.carry if c > 0]
 
     # Build keywords
     keyword_parts = [name] + [k for k in keys if k]
@@ -193,52 +153,63 @@ def _parse_creature_record(rec: bytes, vnum: int) -> Monster:
         vnum=vnum,
         keywords=keywords,
         short_description=name,
-        long_description=description,
+        long_description=cstring(rec.description),
         detailed_description="",
         action_flags=action_flags,
         affect_flags=[],
-        alignment=alignment,
-        level=level,
+        alignment=rec.alignment,
+        level=rec.level,
         hitroll=0,
-        armor_class=armor,
-        hp_dice=DiceRoll(num=hpmax, size=1, bonus=0),
-        damage_dice=DiceRoll(num=ndice, size=sdice, bonus=pdice),
-        gold=gold,
-        experience=experience,
+        armor_class=rec.armor,
+        hp_dice=DiceRoll(num=rec.hpmax, size=1, bonus=0),
+        damage_dice=DiceRoll(num=rec.ndice, size=rec.sdice, bonus=rec.pdice),
+        gold=rec.gold,
+        experience=rec.experience,
         load_position=8,
         default_position=8,
         sex=1 if 12 in action_flags else 0,
         bare_hand_attack=0,
         mob_type="E",
         extensions={
-            "class": crt_class,
-            "race": crt_race,
-            "thaco": thaco,
-            "strength": strength,
-            "dexterity": dexterity,
-            "constitution": constitution,
-            "intelligence": intelligence,
-            "piety": piety,
-            "hpmax": hpmax,
-            "mpmax": mpmax,
-            "numwander": numwander,
-            "special": special,
+            "class": rec.crt_class,
+            "race": rec.race,
+            "thaco": rec.thaco,
+            "strength": rec.strength,
+            "dexterity": rec.dexterity,
+            "constitution": rec.constitution,
+            "intelligence": rec.intelligence,
+            "piety": rec.piety,
+            "hpmax": rec.hpmax,
+            "mpmax": rec.mpmax,
+            "numwander": rec.numwander,
+            "special": rec.special,
             "proficiencies": profs,
             "realms": realms,
-            "known_spells": known_spells,
-            "quest_flags": quest_flags,
-            "questnum": questnum,
+            "known_spells": flags_to_bit_positions(rec.spells),
+            "quest_flags": flags_to_bit_positions(rec.quests),
+            "questnum": rec.questnum,
             "carry_items": carry,
-            "rom_num": rom_num,
-            "talk": talk,
-            "etc": etc,
+            "rom_num": rec.rom_num,
+            "talk": cstring(rec.talk),
+            "etc": cstring(rec.etc),
         },
     )
 
 
-def parse_all_monsters(objmon_dir: Path) -> list[Monster]:
-    """Parse all monster files in the objmon directory."""
-    monsters: list[Monster] = []
+def parse_all_monsters(
+    objmon_dir: Path, cache: ParseCache | None = None,
+) -> list[Monster]:
+    """Parse all monster files in the objmon directory.
+
+    Unchanged files are served from *cache* when one is given.
+    """
+    return [entity for monsters in iter_monsters(objmon_dir, cache) for entity in monsters]
+
+
+def iter_monsters(
+    objmon_dir: Path, cache: ParseCache | None = None,
+) -> Iterator[list[Monster]]:
+    """Yield the monsters of each monster file, in file name order."""
     for fpath in sorted(objmon_dir.glob("m[0-9][0-9]")):
         fname = fpath.name
         try:
@@ -246,7 +217,12 @@ def parse_all_monsters(objmon_dir: Path) -> list[Monster]:
         except ValueError:
             continue
         try:
-            monsters.extend(parse_mob_file(fpath, file_index))
+            if cache is not None:
+                monsters = cache.call(parse_mob_file, fpath, file_index)
+            else:
+                monsters = parse_file(parse_mob_file, fpath, file_index)
         except Exception as e:
             logger.warning("Error parsing %s: %s", fpath, e)
-    return monsters
+            continue
+        if monsters:
+            yield monsters
@@ -33,18 +33,14 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Any, Iterator
 
+from genos.adapters.cache import ParseCache
+from genos.profiling import parse_file
 from genos.uir.schema import DiceRoll, Item, ItemAffect
 
-from .binary_utils import (
-    flags_to_bit_positions,
-    read_byte,
-    read_cstring,
-    read_cstring_array,
-    read_int,
-    read_short,
-    read_ubyte,
-)
+from . import bulk
+from .binary_utils import OBJECT, cstring, flags_to_bit_positions
 from .constants import SIZEOF_OBJECT, RECORDS_PER_FILE
 
 logger = logging.getLogger(__name__)
@@ -60,47 +56,38 @@ def parse_obj_file(filepath: Path, file_index: int) -> list[Item]:
             filepath, len(data), expected,
         )
 
-    items: list[Item] = []
     record_count = min(len(data) // SIZEOF_OBJECT, RECORDS_PER_FILE)
+    if bulk.HAVE_NUMPY:
+        records = bulk.decode_records(data, OBJECT, record_count)
+    else:
+        records = _decode_records(data, record_count)
+    return [_parse_object_record(rec, file_index * 100 + i) for i, rec in records]
+
+
+def _decode_records(data: bytes, record_count: int) -> list[tuple[int, Any]]:
+    """``(record index, record)`` of the named records, one at a time."""
+    records: list[tuple[int, Any]] = []
+    view = memoryview(data)
 
     for i in range(record_count):
-        offset = i * SIZEOF_OBJECT
-        record = data[offset : offset + SIZEOF_OBJECT]
+        rec = OBJECT.decode(view, i * SIZEOF_OBJECT)
 
         # Skip empty records (name is all null)
-        if record[:70].rstrip(b"\x00") == b"":
+        if not rec.name.rstrip(b"\x00"):
             continue
 
-        vnum = file_index * 100 + i
-        items.append(_parse_object_record(record, vnum))
-
-    return items
-
-
-def _parse_object_record(rec: bytes, vnum: int) -> Item:
-    """Parse a single 352-byte object record into an Item."""
-    name = read_cstring(rec, 0, 70)
-    etc = read_cstring(rec, 70, 10)
-    description = read_cstring(rec, 80, 80)
-    keys = read_cstring_array(rec, 160, 3, 20)
-    use_output = read_cstring(rec, 220, 80)
-
-    value = read_int(rec, 300)
-    weight = read_short(rec, 304)
-    obj_type = read_byte(rec, 306)
-    adjustment = read_byte(rec, 307)
-    shotsmax = read_short(rec, 308)
-    shotscur = read_short(rec, 310)
-    ndice = read_short(rec, 312)
-    sdice = read_short(rec, 314)
-    pdice = read_short(rec, 316)
-    armor = read_byte(rec, 318)
-    wearflag = read_ubyte(rec, 319)
-    magicpower = read_byte(rec, 320)
-    magicrealm = read_byte(rec, 321)
-    special = read_short(rec, 322)
-    flags_raw = rec[324:332]
-    questnum = read_byte(rec, 332)
+        records.append((i, rec))
+
+    return records
+
+
+def _parse_object_record(rec: Any, vnum: int) -> Item:
+    """Build an Item from a decoded object record."""
+    name = cstring(rec.name)
+    keys = [cstring(k) for k in rec.key]
+    adjustment = rec.adjustment
+    armor = rec.armor
+    wearflag = rec.wearflag
 
     # Build keywords from name + keys
     keyword_parts = [name] + [k for k in keys if k]
@@ -112,7 +99,7 @@ def _parse_object_record(rec: bytes, vnum: int) -> Item:
         wear_flags.append(wearflag)
 
     # Object flags → extra_flags
-    extra_flags = flags_to_bit_positions(flags_raw)
+    extra_flags = flags_to_bit_positions(rec.flags)
 
     # Affects from adjustment/armor
     affects: list[ItemAffect] = []
@@ -125,14 +112,14 @@ def _parse_object_record(rec: bytes, vnum: int) -> Item:
         vnum=vnum,
         keywords=keywords,
         short_description=name,
-        long_description=description,
-        action_description=use_output,
-        item_type=obj_type,
+        long_description=cstring(rec.description),
+        action_description=cstring(rec.use_output),
+        item_type=rec.type,
         extra_flags=extra_flags,
         wear_flags=wear_flags,
-        values=[value, ndice, sdice, pdice],
-        weight=weight,
-        cost=value,
+        values=[rec.value, rec.ndice, rec.sdice, rec.pdice],
+        weight=rec.weight,
+        cost=rec.value,
         rent=0,
         timer=0,
         min_level=0,
@@ -144,9 +131,20 @@ def _parse_object_record(rec: bytes, vnum: int) -> Item:
     return item
 
 
-def parse_all_objects(objmon_dir: Path) -> list[Item]:
-    """Parse all object files in the objmon directory."""
-    items: list[Item] = []
+def parse_all_objects(
+    objmon_dir: Path, cache: ParseCache | None = None,
+) -> list[Item]:
+    """Parse all object files in the objmon directory.
+
+    Unchanged files are served from *cache* when one is given.
+    """
+    return [entity for items in iter_objects(objmon_dir, cache) for entity in items]
+
+
+def iter_objects(
+    objmon_dir: Path, cache: ParseCache | None = None,
+) -> Iterator[list[Item]]:
+    """Yield the items of each object file, in file name order."""
     for fpath in sorted(objmon_dir.glob("o[0-9][0-9]")):
         fname = fpath.name
         try:
@@ -154,7 +152,12 @@ def parse_all_objects(objmon_dir: Path) -> list[Item]:
         except ValueError:
             continue
         try:
-            items.extend(parse_obj_file(fpath, file_index))
+            if cache is not None:
+                items = cache.call(parse_obj_file, fpath, file_index)
+            else:
+                items = parse_file(parse_obj_file, fpath, file_index)
         except Exception as e:
             logger.warning("Error parsing %s: %s", fpath, e)
-    return items
+            continue
+        if items:
+            yield items
@@ -38,48 +38,64 @@ Room struct layout (480 bytes):
 from __future__ import annotations
 
 import logging
+import os
+import re
 from pathlib import Path
+from typing import Iterator
 
+from genos.adapters.cache import ParseCache
+from genos.adapters.parallel import iter_files, resolve_jobs
+from genos.profiling import parse_file
 from genos.uir.schema import Exit, Room
 
-from .binary_utils import (
-    flags_to_bit_positions,
-    read_byte,
-    read_cstring,
-    read_int,
-    read_short,
-    read_ubyte,
-)
+from .binary_utils import EXIT, ROOM, cstring, flags_to_bit_positions, read_int
 from .constants import SIZEOF_ROOM, SIZEOF_EXIT, SIZEOF_OBJECT, SIZEOF_CREATURE
 
 logger = logging.getLogger(__name__)
 
+# Room file names under rooms/r{nn}/
+_ROOM_FILE_RE = re.compile(r"r[0-9]{5}")
+
 
 def parse_room_file(filepath: Path) -> Room | None:
     """Parse a single room binary file."""
-    data = filepath.read_bytes()
+    return parse_room_data(filepath.read_bytes())
+
+
+def parse_room_dir(zone_dir: Path) -> list[tuple[str, Room | None, str | None]]:
+    """Parse every room file of one ``rooms/r{nn}`` directory.
+
+    The unit of work of :func:`parse_all_rooms`: one directory listing
+    and a run of reads per call instead of one task per tiny file.
+    Returns ``(file name, room, error)`` in file name order; a file that
+    fails has ``room`` None and the error message.
+    """
+    names = sorted(
+        entry.name for entry in os.scandir(zone_dir)
+        if _ROOM_FILE_RE.fullmatch(entry.name)
+    )
+    results: list[tuple[str, Room | None, str | None]] = []
+    for name in names:
+        try:
+            # Timed per room file when profiling
+            room = parse_file(parse_room_file, Path(zone_dir, name))
+            results.append((name, room, None))
+        except Exception as e:
+            results.append((name, None, str(e)))
+    return results
+
+
+def parse_room_data(data: bytes) -> Room | None:
+    """Parse the contents of one room file."""
     if len(data) < SIZEOF_ROOM:
         return None
 
     # ── Fixed room struct ──
-    name = read_cstring(data, 0, 80)
-    rom_num = read_short(data, 80)
-    special = read_short(data, 96)
-    trap = read_byte(data, 98)
-    trapexit = read_short(data, 100)
-    track = read_cstring(data, 102, 80)
-    flags_raw = data[182:190]
-    room_flags = flags_to_bit_positions(flags_raw)
-
-    random_mobs: list[int] = []
-    for i in range(10):
-        rm = read_short(data, 190 + i * 2)
-        if rm > 0:
-            random_mobs.append(rm)
-
-    traffic = read_ubyte(data, 210)
-    lolevel = read_ubyte(data, 460)
-    hilevel = read_ubyte(data, 461)
+    view = memoryview(data)
+    rec = ROOM.decode(view)
+    rom_num = rec.rom_num
+    room_flags = flags_to_bit_positions(rec.flags)
+    random_mobs = [rm for rm in rec.random if rm > 0]
 
     pos = SIZEOF_ROOM
 
@@ -92,30 +108,18 @@ def parse_room_file(filepath: Path) -> Room | None:
     for i in range(exit_count):
         if pos + SIZEOF_EXIT > len(data):
             break
-        exits.append(_parse_exit(data, pos, direction=i))
+        exits.append(_parse_exit(view, pos, direction=i))
         pos += SIZEOF_EXIT
 
-    # ── Monsters (skip) ──
-    if pos + 4 <= len(data):
-        mon_count = read_int(data, pos)
-        pos += 4
-        for _ in range(mon_count):
-            pos = _skip_creature_with_inventory(data, pos)
-            if pos < 0:
-                break
-    if pos < 0:
-        pos = len(data)
-
-    # ── Objects (skip) ──
-    if pos + 4 <= len(data):
-        obj_count = read_int(data, pos)
-        pos += 4
-        for _ in range(obj_count):
-            pos = _skip_object_with_contents(data, pos)
-            if pos < 0:
-                break
-    if pos < 0:
-        pos = len(data)
+    # ── Monsters, then objects (skipped, see _skip_contents) ──
+    for section in ("creatures", "objects"):
+        if pos + 4 > len(data):
+            break
+        count = read_int(data, pos)
+        pos = _skip_contents(data, pos + 4, **{section: count})
+        if pos < 0:
+            pos = len(data)
+            break
 
     # ── Descriptions (order: short, long, obj — matching write_rom) ──
     short_desc, pos = _read_length_prefixed_string(data, pos)
@@ -124,90 +128,75 @@ def parse_room_file(filepath: Path) -> Room | None:
 
     return Room(
         vnum=rom_num,
-        name=name,
+        name=cstring(rec.name),
         description=long_desc if long_desc else short_desc,
         zone_number=rom_num // 100,
         room_flags=room_flags,
         sector_type=0,
         exits=exits,
         extensions={
-            "special": special,
-            "trap": trap,
-            "trapexit": trapexit,
-            "track": track,
+            "special": rec.special,
+            "trap": rec.trap,
+            "trapexit": rec.trapexit,
+            "track": cstring(rec.track),
             "random_mobs": random_mobs,
-            "traffic": traffic,
-            "lolevel": lolevel,
-            "hilevel": hilevel,
+            "traffic": rec.traffic,
+            "lolevel": rec.lolevel,
+            "hilevel": rec.hilevel,
             "short_desc": short_desc,
             "obj_desc": obj_desc,
         },
     )
 
 
-def _parse_exit(data: bytes, offset: int, direction: int) -> Exit:
-    """Parse a 44-byte exit_ struct.
-
-    exit_ layout:
-      offset 0:  char name[20]
-      offset 20: short room       (2)
-      offset 22: char flags[4]    (4)
-      offset 26: 2 pad
-      offset 28: lasttime ltime   (12)
-      offset 40: char key         (1)
-      offset 41: 3 pad
-    """
-    name = read_cstring(data, offset, 20)
-    dest_room = read_short(data, offset + 20)
-    exit_flags_raw = data[offset + 22 : offset + 26]
-    door_flags = 0
-    flag_positions = flags_to_bit_positions(exit_flags_raw)
-    for fp in flag_positions:
-        door_flags |= 1 << fp
-    key_num = read_byte(data, offset + 40)
+def _parse_exit(view: memoryview, offset: int, direction: int) -> Exit:
+    """Decode a 44-byte exit_ struct (see ``EXIT_LAYOUT``)."""
+    rec = EXIT.decode(view, offset)
+    # Bit f of the flags array is bit f of the door flags
+    door_flags = int.from_bytes(rec.flags, "little")
+    key_num = rec.key
 
     return Exit(
         direction=direction,
-        destination=dest_room,
+        destination=rec.room,
         description="",
-        keyword=name,
+        keyword=cstring(rec.name),
         door_flags=door_flags,
         key_vnum=key_num if key_num > 0 else -1,
     )
 
 
-def _skip_object_with_contents(data: bytes, pos: int) -> int:
-    """Skip an object struct + its contained objects (recursive).
+def _skip_contents(
+    data: bytes, pos: int, creatures: int = 0, objects: int = 0,
+) -> int:
+    """Jump over embedded creatures and objects without decoding them.
 
-    Format: object(352) + int(contained_count) + contained objects...
+    Skips *creatures* creature structs, each followed by
+    ``int inv_count`` and its inventory, then *objects* object structs,
+    each followed by ``int contained_count`` and its contents.  Every
+    object is ``SIZEOF_OBJECT + 4`` bytes whatever its depth, so the
+    nested contents are skipped with a running count instead of
+    recursion.  Returns the position after them, or -1 if the data ends
+    first.
     """
-    if pos + SIZEOF_OBJECT + 4 > len(data):
-        return -1
-    pos += SIZEOF_OBJECT
-    cnt = read_int(data, pos)
-    pos += 4
-    for _ in range(cnt):
-        pos = _skip_object_with_contents(data, pos)
-        if pos < 0:
-            return -1
-    return pos
-
-
-def _skip_creature_with_inventory(data: bytes, pos: int) -> int:
-    """Skip a creature struct + its inventory objects.
-
-    Format: creature(1184) + int(inv_count) + objects...
-    """
-    if pos + SIZEOF_CREATURE + 4 > len(data):
-        return -1
-    pos += SIZEOF_CREATURE
-    cnt = read_int(data, pos)
-    pos += 4
-    for _ in range(cnt):
-        pos = _skip_object_with_contents(data, pos)
-        if pos < 0:
-            return -1
-    return pos
+    end = len(data)
+    while True:
+        if objects > 0:
+            if pos + SIZEOF_OBJECT + 4 > end:
+                return -1
+            pos += SIZEOF_OBJECT
+        elif creatures > 0:
+            if pos + SIZEOF_CREATURE + 4 > end:
+                return -1
+            pos += SIZEOF_CREATURE
+            creatures -= 1
+            objects += 1  # consumed by the inventory count below
+        else:
+            return pos
+        # Count of the objects inside the one just skipped
+        count = read_int(data, pos)
+        pos += 4
+        objects += (count if count > 0 else 0) - 1
 
 
 def _read_length_prefixed_string(data: bytes, pos: int) -> tuple[str, int]:
@@ -228,24 +217,81 @@ def _read_length_prefixed_string(data: bytes, pos: int) -> tuple[str, int]:
     return text, pos + length
 
 
-def parse_all_rooms(rooms_dir: Path) -> list[Room]:
+def parse_all_rooms(
+    rooms_dir: Path, cache: ParseCache | None = None, jobs: int = 1,
+) -> list[Room]:
     """Parse all room files in the rooms directory.
 
     Room files are organized as rooms/r{nn}/r{nnnnn}.
     Rooms with vnum=0 are filtered out (invalid/placeholder entries).
     Duplicates by vnum are deduplicated, keeping the first occurrence.
     """
+    return [room for rooms in iter_rooms(rooms_dir, cache, jobs) for room in rooms]
+
+
+def iter_rooms(
+    rooms_dir: Path, cache: ParseCache | None = None, jobs: int = 1,
+) -> Iterator[list[Room]]:
+    """Yield the rooms of each ``r{nn}`` directory, filtered as by
+    :func:`parse_all_rooms`.
+
+    Each ``r{nn}`` directory is parsed by :func:`parse_room_dir`, in a
+    process pool with ``jobs > 1``.  With a *cache*, which keys entries
+    by file, room files are parsed (and served when unchanged) one by
+    one instead.  Either way rooms come back in path order.
+    """
+    zone_dirs = sorted(d for d in rooms_dir.glob("r[0-9][0-9]") if d.is_dir())
+    if cache is not None:
+        room_files = [
+            f for zone_dir in zone_dirs
+            for f in sorted(zone_dir.glob("r[0-9][0-9][0-9][0-9][0-9]"))
+        ]
+        parsed = cache.iter_files(parse_room_file, room_files, jobs)
+    else:
+        parsed = _iter_room_dirs(zone_dirs, jobs)
+
     rooms: list[Room] = []
+    zone_dir = None
     seen_vnums: set[int] = set()
-    for zone_dir in sorted(rooms_dir.glob("r[0-9][0-9]")):
-        if not zone_dir.is_dir():
+    for room_file, room, error in parsed:
+        if room_file.parent != zone_dir:
+            if rooms:
+                yield rooms
+            rooms = []
+            zone_dir = room_file.parent
+        if error is not None:
+            logger.warning("Error parsing %s: %s", room_file, error)
+        elif room is not None and room.vnum != 0 and room.vnum not in seen_vnums:
+            seen_vnums.add(room.vnum)
+            rooms.append(room)
+    if rooms:
+        yield rooms
+
+
+def _iter_room_dirs(
+    zone_dirs: list[Path], jobs: int,
+) -> Iterator[tuple[Path, Room | None, str | None]]:
+    """``(room file, room, error)`` of every file of *zone_dirs*."""
+    if min(resolve_jobs(jobs), len(zone_dirs)) > 1:
+        outcomes = iter_files(parse_room_dir, zone_dirs, jobs)
+    else:
+        # Called directly, not through iter_files, so that the profiler
+        # records the room files parse_room_dir times rather than whole
+        # directories.
+        outcomes = _parse_room_dirs(zone_dirs)
+    for zone_dir, results, error in outcomes:
+        if error is not None:
+            yield zone_dir, None, error
             continue
-        for room_file in sorted(zone_dir.glob("r[0-9][0-9][0-9][0-9][0-9]")):
-            try:
-                room = parse_room_file(room_file)
-                if room is not None and room.vnum != 0 and room.vnum not in seen_vnums:
-                    seen_vnums.add(room.vnum)
-                    rooms.append(room)
-            except Exception as e:
-                logger.warning("Error parsing %s: %s", room_file, e)
-    return rooms
+        for name, room, room_error in results:
+            yield zone_dir / name, room, room_error
+
+
+def _parse_room_dirs(
+    zone_dirs: list[Path],
+) -> Iterator[tuple[Path, list | None, str | None]]:
+    for zone_dir in zone_dirs:
+        try:
+            yield zone_dir, parse_room_dir(zone_dir), None
+        except Exception as e:
+            yield zone_dir, None, str(e)
@@ -12,13 +12,17 @@ Ddesc files (objmon/ddesc/{name}_{level}):
   Entire file content is the detailed description.
 
 File names encode the monster name and level, allowing merge
-with parsed monster data by matching name + level.
+with parsed monster data by matching name + level.  The adapter indexes
+both directories by file name and reads only the files of monsters it
+parsed.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -86,27 +90,32 @@ def parse_ddesc_filename(filename: str) -> tuple[str, int]:
     return filename, 0
 
 
-def load_all_talks(talk_dir: Path) -> dict[str, dict[str, str]]:
-    """Load all talk files. Returns {filename_key: {keyword: response}}."""
-    result: dict[str, dict[str, str]] = {}
-    if not talk_dir.is_dir():
-        return result
-    for fpath in talk_dir.iterdir():
-        if fpath.is_file():
-            talks = parse_talk_file(fpath)
-            if talks:
-                result[fpath.name] = talks
-    return result
-
-
-def load_all_ddescs(ddesc_dir: Path) -> dict[str, str]:
-    """Load all ddesc files. Returns {filename_key: description}."""
-    result: dict[str, str] = {}
-    if not ddesc_dir.is_dir():
-        return result
-    for fpath in ddesc_dir.iterdir():
-        if fpath.is_file():
-            desc = parse_ddesc_file(fpath)
-            if desc:
-                result[fpath.name] = desc
-    return result
+def index_talk_files(talk_dir: Path) -> dict[tuple[str, int], list[Path]]:
+    """Talk files by the ``(name, level)`` in their names.
+
+    Built from the directory listing alone; no file is read.
+    """
+    return _index_files(talk_dir, parse_talk_filename)
+
+
+def index_ddesc_files(ddesc_dir: Path) -> dict[tuple[str, int], list[Path]]:
+    """Ddesc files by the ``(name, level)`` in their names (underscores kept).
+
+    Built from the directory listing alone; no file is read.
+    """
+    return _index_files(ddesc_dir, parse_ddesc_filename)
+
+
+def _index_files(
+    directory: Path, parse_filename: Callable[[str], tuple[str, int]],
+) -> dict[tuple[str, int], list[Path]]:
+    # Paths sharing a key are kept in name order
+    index: dict[tuple[str, int], list[Path]] = {}
+    try:
+        with os.scandir(directory) as it:
+            names = sorted(entry.name for entry in it if entry.is_file())
+    except OSError:
+        return index
+    for name in names:
+        index.setdefault(parse_filename(name), []).append(directory / name)
+    return index
@@ -0,0 +1,19 @@
+"""Throughput benchmarks: synthetic worlds and per-stage migration timings."""
+
+# Formats generate_world() can write.  Kept here, free of imports, so the
+# CLI can offer them without loading the generator.
+WORLD_KINDS: tuple[str, ...] = ("circlemud", "simoon", "threeeyes", "lpmud")
+
+__all__ = ["STAGES", "WORLD_KINDS", "SyntheticWorld", "generate_world", "run_bench"]
+
+
+def __getattr__(name: str):
+    # The generator imports the adapters' constants and the runner the
+    # whole migration pipeline; load them on use.
+    if name in ("SyntheticWorld", "generate_world"):
+        from . import synthetic
+        return getattr(synthetic, name)
+    if name in ("STAGES", "run_bench"):
+        from . import runner
+        return getattr(runner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
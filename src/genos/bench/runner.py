@@ -0,0 +1,157 @@
+"""Stage-by-stage timing of a migration.
+
+:func:`run_bench` runs the stages of ``genos migrate`` on a source tree
+(detect, analyze, parse, validate, serialize, compile) and times each
+one.  Every stage reports wall and CPU time, the entities it handled
+per second and the process's peak RSS once it finished.  Peak RSS is a
+high-water mark for the whole process, so a stage's figure also covers
+the stages before it.
+"""
+
+from __future__ import annotations
+
+import gc
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import genos
+from genos.adapters.detector import detect_mud_type
+from genos.compiler.compiler import GenosCompiler
+from genos.uir.columnar import ColumnarWorld
+from genos.uir.compact import compact_uir
+from genos.uir.validator import validate_uir
+from genos.uir.writer import write_uir
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+STAGES = ("detect", "analyze", "parse", "validate", "serialize", "compile")
+
+# UIR sections counted as the entities a stage handled.
+_ENTITY_SECTIONS = (
+    "rooms", "items", "monsters", "zones", "triggers", "shops", "quests",
+)
+
+
+@dataclass
+class StageTiming:
+    name: str
+    seconds: float
+    cpu_seconds: float
+    entities: int
+    peak_rss_kb: int | None
+
+    @property
+    def entities_per_sec(self) -> float | None:
+        if not self.entities or self.seconds <= 0:
+            return None
+        return self.entities / self.seconds
+
+    def as_dict(self) -> dict:
+        eps = self.entities_per_sec
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "entities": self.entities,
+            "entities_per_sec": round(eps, 1) if eps is not None else None,
+            "peak_rss_kb": self.peak_rss_kb,
+        }
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def environment() -> dict:
+    """Interpreter and machine details recorded with every report."""
+    return {
+        "genos_version": genos.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_bench(
+    source: str | Path, output_dir: str | Path, jobs: int = 1,
+) -> dict:
+    """Run every stage on *source*, writing artifacts to *output_dir*.
+
+    Returns the detected adapter, entity counts and one entry per stage
+    of :data:`STAGES`.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stages: list[StageTiming] = []
+
+    def timed(name: str, func: Callable[[], Any], entities: int = 0) -> Any:
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        value = func()
+        stages.append(StageTiming(
+            name,
+            time.perf_counter() - wall,
+            time.process_time() - cpu,
+            entities,
+            peak_rss_kb(),
+        ))
+        return value
+
+    adapter = timed("detect", lambda: detect_mud_type(source))
+    if adapter is None:
+        raise ValueError(f"Could not detect MUD type at {source}")
+    adapter.jobs = jobs
+
+    report = timed("analyze", adapter.analyze)
+    stages[-1].entities = (
+        report.room_count + report.item_count + report.mob_count
+        + report.zone_count + report.shop_count + report.trigger_count
+        + report.quest_count
+    )
+
+    uir = timed("parse", lambda: compact_uir(adapter.parse()))
+    counts = {section: len(getattr(uir, section)) for section in _ENTITY_SECTIONS}
+    entities = sum(counts.values())
+    stages[-1].entities = entities
+
+    def validate():
+        # As in migrate, the columnar view is built for validation and
+        # reused by the compiler.
+        columns = ColumnarWorld.from_uir(uir)
+        return columns, validate_uir(uir, columns=columns, max_per_code=1)
+
+    columns, validation = timed("validate", validate, entities)
+    timed(
+        "serialize",
+        lambda: write_uir(uir, output_dir / "uir.json", "json"),
+        entities,
+    )
+    timed(
+        "compile",
+        GenosCompiler(
+            uir, output_dir, incremental=False, columns=columns,
+        ).compile,
+        entities,
+    )
+
+    return {
+        "adapter": adapter.__class__.__name__,
+        "entities": counts,
+        "validation_warnings": validation.warning_count,
+        "parse_warnings": len(uir.migration_stats.warnings),
+        "stages": [stage.as_dict() for stage in stages],
+        "peak_rss_kb": peak_rss_kb(),
+    }
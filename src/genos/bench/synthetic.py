@@ -0,0 +1,410 @@
+"""Deterministic synthetic MUD worlds for benchmarking.
+
+:func:`generate_world` writes a source tree in one of the formats the
+adapters read, sized by its room count: 100 rooms per zone, and half as
+many items and mobs as rooms.  Rooms are chained within their zone and
+one in ten gets a portal to a random room elsewhere; each zone loads
+every one of its mobs into a random room of the zone, giving it one of
+the zone's items and equipping another.
+
+Names, descriptions and portals are drawn from a ``random.Random``
+seeded with *seed*, so the same arguments always produce byte-identical
+trees and benchmark runs can be compared across commits.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from genos.adapters.threeeyes.constants import (
+    RECORDS_PER_FILE,
+    SIZEOF_CREATURE,
+    SIZEOF_EXIT,
+    SIZEOF_OBJECT,
+    SIZEOF_ROOM,
+)
+from genos.bench import WORLD_KINDS
+
+logger = logging.getLogger(__name__)
+
+ROOMS_PER_ZONE = 100
+
+# 3eyes stores room numbers as shorts and has two-digit objmon files.
+THREEEYES_MAX_ROOMS = 0x7FFF
+THREEEYES_MAX_RECORDS = 100 * RECORDS_PER_FILE
+
+# Portal exits per room
+_PORTAL_RATE = 0.1
+
+
+@dataclass
+class SyntheticWorld:
+    """What :func:`generate_world` wrote."""
+
+    kind: str
+    root: Path
+    seed: int
+    rooms: int = 0
+    items: int = 0
+    mobs: int = 0
+    zones: int = 0
+    files: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind, "seed": self.seed, "rooms": self.rooms,
+            "items": self.items, "mobs": self.mobs, "zones": self.zones,
+            "files": self.files, "bytes": self.bytes,
+        }
+
+
+def generate_world(
+    kind: str, root: str | Path, rooms: int = 1000, seed: int = 0,
+) -> SyntheticWorld:
+    """Write a synthetic *kind* world of *rooms* rooms under *root*.
+
+    *kind* is one of :data:`WORLD_KINDS`.  3eyes worlds are capped at
+    :data:`THREEEYES_MAX_ROOMS` rooms.  *root* must be empty or missing,
+    so that no leftover files are parsed along with the world.
+    """
+    try:
+        writer = _WRITERS[kind]
+    except KeyError:
+        raise ValueError(
+            f"Unknown world kind {kind!r} (expected one of {', '.join(WORLD_KINDS)})"
+        ) from None
+    if rooms < 1:
+        raise ValueError("A synthetic world needs at least one room")
+    if Path(root).is_dir() and any(Path(root).iterdir()):
+        raise ValueError(f"Synthetic world directory is not empty: {root}")
+    world = SyntheticWorld(kind=kind, root=Path(root), seed=seed)
+    writer(world, rooms, random.Random(seed))
+    return world
+
+
+def _write(world: SyntheticWorld, rel: str, data: bytes) -> None:
+    path = world.root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    world.files += 1
+    world.bytes += len(data)
+
+
+# ── World layout ─────────────────────────────────────────────────────────
+
+@dataclass
+class _Zone:
+    number: int
+    rooms: int
+
+    @property
+    def objects(self) -> int:
+        """Items (and mobs) in the zone."""
+        return (self.rooms + 1) // 2
+
+
+def _zones(rooms: int) -> list[_Zone]:
+    return [
+        _Zone(z, min(ROOMS_PER_ZONE, rooms - z * ROOMS_PER_ZONE))
+        for z in range((rooms + ROOMS_PER_ZONE - 1) // ROOMS_PER_ZONE)
+    ]
+
+
+def _exits(
+    zone: _Zone, i: int, total: int, rng: random.Random,
+) -> list[tuple[int, int]]:
+    """``(direction, room index)`` exits of room *i* of *zone*.
+
+    Rooms are chained east/west within the zone; a portal (up) leads to
+    a random room index in ``range(total)``.
+    """
+    base = zone.number * ROOMS_PER_ZONE
+    exits = []
+    if i + 1 < zone.rooms:
+        exits.append((1, base + i + 1))
+    if i > 0:
+        exits.append((3, base + i - 1))
+    if rng.random() < _PORTAL_RATE:
+        exits.append((4, rng.randrange(total)))
+    return exits
+
+
+def _sentences(rng: random.Random, pool: tuple[str, ...], n: int) -> str:
+    return " ".join(rng.choice(pool) for _ in range(n))
+
+
+_EN_ROOMS = (
+    "The Stone Corridor", "A Narrow Alley", "The Market Square",
+    "A Dusty Road", "The Old Well", "A Quiet Glade", "The Guard Post",
+    "A Damp Cellar",
+)
+_EN_TEXT = (
+    "Torches flicker in iron brackets along the damp walls.",
+    "A cold wind whistles through the cracks in the stones.",
+    "Footprints in the dust lead off in several directions.",
+    "The distant sound of running water echoes softly.",
+    "Moss covers the lower half of the ancient walls.",
+    "A faded banner hangs limply from a rusted pole.",
+)
+_EN_MOBS = ("goblin", "wolf", "bandit", "guard", "merchant", "rat")
+_EN_ITEMS = ("dagger", "sword", "shield", "helmet", "ring", "lantern")
+
+_KO_ROOMS = (
+    "작은 방", "어두운 동굴", "넓은 광장", "좁은 골목", "산기슭", "강가",
+    "숲속 오솔길", "성문 앞",
+)
+_KO_TEXT = (
+    "벽을 따라 횃불이 흔들리고 있다.",
+    "돌 틈 사이로 차가운 바람이 불어온다.",
+    "먼지 위에 여러 방향으로 발자국이 나 있다.",
+    "멀리서 물 흐르는 소리가 희미하게 들린다.",
+    "오래된 벽의 아랫부분이 이끼로 덮여 있다.",
+    "녹슨 깃대에 빛바랜 깃발이 걸려 있다.",
+)
+_KO_MOBS = ("고블린", "늑대", "산적", "경비병", "상인", "쥐")
+_KO_ITEMS = ("단검", "장검", "방패", "투구", "반지", "등불")
+
+# Direction keywords of the 3eyes and LP-MUD exits, by direction.
+_KO_DIRS = ("북", "동", "남", "서", "위", "아래")
+
+
+# ── CircleMUD / Simoon (tilde-record text) ───────────────────────────────
+
+def _write_circle_tree(
+    world: SyntheticWorld, rooms: int, rng: random.Random, simoon: bool,
+) -> None:
+    encoding = "euc-kr" if simoon else "utf-8"
+    room_names, text, mob_names, item_names = (
+        (_KO_ROOMS, _KO_TEXT, _KO_MOBS, _KO_ITEMS) if simoon
+        else (_EN_ROOMS, _EN_TEXT, _EN_MOBS, _EN_ITEMS)
+    )
+    zones = _zones(rooms)
+    files: dict[str, list[str]] = {"wld": [], "obj": [], "mob": [], "zon": []}
+
+    def emit(ext: str, zone: _Zone, body: str) -> None:
+        name = f"{zone.number}.{ext}"
+        files[ext].append(name)
+        _write(world, f"lib/world/{ext}/{name}", (body + "$~\n").encode(encoding))
+
+    for zone in zones:
+        base = zone.number * ROOMS_PER_ZONE
+        zone_line = f"{zone.number} 0 0" if simoon else f"{zone.number} d 0 0 0 0"
+
+        out = []
+        for i in range(zone.rooms):
+            out.append(
+                f"#{base + i}\n{rng.choice(room_names)}~\n"
+                f"   {_sentences(rng, text, rng.randint(1, 4))}\n~\n"
+                f"{zone_line}\n"
+            )
+            for direction, dest in _exits(zone, i, rooms, rng):
+                out.append(f"D{direction}\n~\n~\n0 -1 {dest}\n")
+            out.append("S\n")
+        emit("wld", zone, "".join(out))
+
+        out = []
+        for i in range(zone.objects):
+            name = rng.choice(item_names)
+            type_line = (
+                "5 0 8193" if simoon else "5 0 0 0 8193 0 0 0 0 0 0 0 0"
+            )
+            out.append(
+                f"#{base + i}\n{name}~\n{name}~\n{name} {text[0]}~\n~\n"
+                f"{type_line}\n0 2 6 3\n{rng.randint(1, 20)} "
+                f"{rng.randint(10, 1000)} 10 0 0\n"
+            )
+        emit("obj", zone, "".join(out))
+
+        out = []
+        for i in range(zone.objects):
+            name = rng.choice(mob_names)
+            level = rng.randint(1, 30)
+            out.append(
+                f"#{base + i}\n{name}~\n{name}~\n{name} {text[1]}\n~\n"
+                f"{_sentences(rng, text, 2)}\n~\n0 0 0 E\n"
+                f"{level} 0 5 {level}d8+10 1d6+{level // 5}\n"
+                f"{level * 10} {level * 100}\n8 8 {i % 3}\nE\n"
+            )
+        emit("mob", zone, "".join(out))
+
+        top = base + ROOMS_PER_ZONE - 1
+        header = (
+            f"{top} 30 2" if simoon else f"{base} {top} 30 2 0 0 0 0 1 30"
+        )
+        out = [f"#{zone.number}\n{rng.choice(room_names)}~\n<NONE!>~\n{header}\n"]
+        for i in range(zone.objects):
+            room = base + rng.randrange(zone.rooms)
+            out.append(
+                f"M 0 {base + i} 1 {room}\n"
+                f"G 1 {base + i} 1\n"
+                f"E 1 {base + zone.objects - 1 - i} 1 16\n"
+            )
+        out.append("S\n")
+        emit("zon", zone, "".join(out))
+
+    for ext, names in files.items():
+        _write(world, f"lib/world/{ext}/index",
+               ("\n".join(names) + "\n$\n").encode(encoding))
+    if simoon:
+        _write(world, "HANGUL.TXT", "한글\n".encode(encoding))
+
+    world.rooms = rooms
+    world.zones = len(zones)
+    world.items = world.mobs = sum(z.objects for z in zones)
+
+
+def _write_circlemud(world: SyntheticWorld, rooms: int, rng: random.Random) -> None:
+    _write_circle_tree(world, rooms, rng, simoon=False)
+
+
+def _write_simoon(world: SyntheticWorld, rooms: int, rng: random.Random) -> None:
+    _write_circle_tree(world, rooms, rng, simoon=True)
+
+
+# ── 3eyes (binary C structs) ─────────────────────────────────────────────
+
+def _cstring(buf: bytearray, offset: int, size: int, s: str) -> None:
+    raw = s.encode("euc-kr")[:size - 1]
+    buf[offset:offset + len(raw)] = raw
+
+
+def _write_threeeyes(world: SyntheticWorld, rooms: int, rng: random.Random) -> None:
+    if rooms > THREEEYES_MAX_ROOMS:
+        logger.warning(
+            "3eyes room numbers are 16-bit; generating %d of %d rooms",
+            THREEEYES_MAX_ROOMS, rooms,
+        )
+        rooms = THREEEYES_MAX_ROOMS
+    zones = _zones(rooms)
+
+    # Room vnums start at 1 (vnum 0 is a placeholder in 3eyes).
+    for zone in zones:
+        base = zone.number * ROOMS_PER_ZONE
+        for i in range(zone.rooms):
+            vnum = base + i + 1
+            room = bytearray(SIZEOF_ROOM)
+            _cstring(room, 0, 80, rng.choice(_KO_ROOMS))
+            struct.pack_into("<h", room, 80, vnum)
+            exits = _exits(zone, i, rooms, rng)
+            out = [bytes(room), struct.pack("<i", len(exits))]
+            for direction, dest in exits:
+                ext = bytearray(SIZEOF_EXIT)
+                _cstring(ext, 0, 20, _KO_DIRS[direction])
+                struct.pack_into("<h", ext, 20, dest + 1)
+                out.append(bytes(ext))
+            out.append(struct.pack("<ii", 0, 0))  # monsters, objects
+            for desc in ("", _sentences(rng, _KO_TEXT, rng.randint(1, 4)), ""):
+                raw = desc.encode("euc-kr") + b"\x00" if desc else b""
+                out.append(struct.pack("<i", len(raw)) + raw)
+            _write(world, f"rooms/r{vnum // 1000:02d}/r{vnum:05d}", b"".join(out))
+
+    objects = min(sum(z.objects for z in zones), THREEEYES_MAX_RECORDS)
+    for prefix, size, fill in (
+        ("o", SIZEOF_OBJECT, _threeeyes_object),
+        ("m", SIZEOF_CREATURE, _threeeyes_creature),
+    ):
+        for n in range((objects + RECORDS_PER_FILE - 1) // RECORDS_PER_FILE):
+            data = bytearray(size * RECORDS_PER_FILE)
+            for r in range(min(RECORDS_PER_FILE, objects - n * RECORDS_PER_FILE)):
+                fill(data, r * size, rng)
+            _write(world, f"objmon/{prefix}{n:02d}", bytes(data))
+
+    world.rooms = rooms
+    world.zones = len(zones)
+    world.items = world.mobs = objects
+
+
+def _threeeyes_object(data: bytearray, offset: int, rng: random.Random) -> None:
+    _cstring(data, offset, 80, rng.choice(_KO_ITEMS))
+    struct.pack_into("<i", data, offset + 300, rng.randint(10, 1000))
+    struct.pack_into("<h", data, offset + 304, rng.randint(1, 20))
+    data[offset + 306] = 5
+
+
+def _threeeyes_creature(data: bytearray, offset: int, rng: random.Random) -> None:
+    level = rng.randint(1, 30)
+    data[offset + 2] = level
+    data[offset + 3] = 1  # MONSTER
+    _cstring(data, offset + 44, 80, rng.choice(_KO_MOBS))
+    struct.pack_into("<ii", data, offset + 28, level * 100, level * 10)
+    struct.pack_into("<hhh", data, offset + 36, 1, 6, level // 5)
+
+
+# ── LP-MUD (LPC source) ──────────────────────────────────────────────────
+
+def _write_lpmud(world: SyntheticWorld, rooms: int, rng: random.Random) -> None:
+    zones = _zones(rooms)
+
+    def room_path(index: int) -> str:
+        return f"/방/z{index // ROOMS_PER_ZONE:03d}/r{index % ROOMS_PER_ZONE:02d}"
+
+    def lpc(rel: str, inherit: str, body: list[str]) -> None:
+        text = (
+            f"#include <구조.h>\ninherit {inherit};\n\nvoid create()\n{{\n"
+            "    ::create();\n" + "".join(f"    {line}\n" for line in body) + "}\n"
+        )
+        _write(world, f"lib{rel}.c", text.encode("euc-kr"))
+
+    _write(world, "bin/driver", b"")
+    _write(world, "lib/구조/room.c", b"// base room\n")
+    (world.root / "lib" / "삽입파일").mkdir(parents=True, exist_ok=True)
+
+    for zone in zones:
+        zdir = f"/방/z{zone.number:03d}"
+        for i in range(zone.objects):
+            name = rng.choice(_KO_ITEMS)
+            lpc(f"{zdir}/obj/o{i:02d}", "LIB_WEAPON", [
+                f'setName("{name}");',
+                f'setID(({{ "{name}" }}));',
+                f'setShort("{name}이 놓여 있다.");',
+                f'setLong("{rng.choice(_KO_TEXT)}");',
+                f"setMass({rng.randint(1, 20)});",
+                f"setValue({rng.randint(10, 1000)});",
+                'setType("오른손");',
+            ])
+            name = rng.choice(_KO_MOBS)
+            lpc(f"{zdir}/mob/m{i:02d}", "LIB_MONSTER", [
+                f'setName("{name}");',
+                f'setID(({{ "{name}" }}));',
+                f'setShort("{name}이 서 있다.");',
+                f'setLong("{rng.choice(_KO_TEXT)}");',
+                'setGender("남자");',
+                'setRace("인간");',
+                f"randomStat({rng.randint(1, 30)});",
+                f'cloneItem("{zdir}/obj/o{i:02d}");',
+                f"setExp({rng.randint(10, 1000)});",
+            ])
+        for i in range(zone.rooms):
+            exits = "".join(
+                f'        "{_KO_DIRS[d]}" : "{room_path(dest)}",\n'
+                for d, dest in _exits(zone, i, rooms, rng)
+            )
+            body = [
+                f'setShort("{rng.choice(_KO_ROOMS)}");',
+                f'setLong("{_sentences(rng, _KO_TEXT, rng.randint(1, 4))}");',
+                f"setExits(([\n{exits}    ]));",
+            ]
+            if i < zone.objects:
+                body.append(
+                    f'setRoomInventory(([ "{zdir}/mob/m{i:02d}" : 1 ]));'
+                )
+            body += ["setRoomAttr(0);", "reset();"]
+            lpc(f"{zdir}/r{i:02d}", "LIB_ROOM", body)
+
+    world.rooms = rooms
+    world.zones = len(zones)
+    world.items = world.mobs = sum(z.objects for z in zones)
+
+
+_WRITERS: dict[str, Callable[[SyntheticWorld, int, random.Random], None]] = {
+    "circlemud": _write_circlemud,
+    "simoon": _write_simoon,
+    "threeeyes": _write_threeeyes,
+    "lpmud": _write_lpmud,
+}
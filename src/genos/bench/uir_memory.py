@@ -0,0 +1,80 @@
+"""Memory footprint of UIR entities (slots and empty-collection sharing).
+
+:func:`uir_memory` builds the same small world three times and traces
+the bytes per room (with one exit) and per zone reset command: with the
+pre-slots dataclass layout (a ``__dict__`` per instance), with the
+slotted :mod:`genos.uir.schema` classes, and with the slotted classes
+after :func:`~genos.uir.compact.compact_uir`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import tracemalloc
+from typing import Callable
+
+from genos.uir.compact import compact_uir
+from genos.uir.schema import UIR, Exit, Room, Zone, ZoneResetCommand
+
+
+def _unslotted(cls: type) -> type:
+    """The same dataclass without __slots__ (the pre-slots layout)."""
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(f.name, f.type, dataclasses.field(
+            default=f.default, default_factory=f.default_factory,
+        )) for f in dataclasses.fields(cls)],
+    )
+
+
+def _build_world(count: int, room_cls, exit_cls, cmd_cls, zone_cls) -> UIR:
+    name, desc = "A room", "A plain room.\n"
+    rooms = [
+        room_cls(vnum=v, name=name, description=desc, zone_number=v // 100,
+                 exits=[exit_cls(direction=0, destination=v + 1)])
+        for v in range(count)
+    ]
+    zone = zone_cls(vnum=0, reset_commands=[
+        cmd_cls(command="M", arg1=v, arg2=1, arg3=v) for v in range(count)
+    ])
+    return UIR(rooms=rooms, zones=[zone])
+
+
+def _measure(build: Callable[[], UIR], count: int, compact: bool) -> tuple[float, float]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    uir = build()
+    zone = uir.zones[0]
+    uir.zones = []
+    if compact:
+        compact_uir(uir)
+    rooms_bytes = tracemalloc.get_traced_memory()[0] - before
+    del uir
+    after_rooms = tracemalloc.get_traced_memory()[0]
+    del zone
+    cmd_bytes = after_rooms - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return rooms_bytes / count, cmd_bytes / count
+
+
+def uir_memory(count: int = 2000) -> list[dict]:
+    """Bytes per room and per reset command of each entity layout."""
+    plain = tuple(_unslotted(c) for c in (Room, Exit, ZoneResetCommand, Zone))
+    slotted = (Room, Exit, ZoneResetCommand, Zone)
+    layouts = (
+        ("dict-based", plain, False),
+        ("slotted", slotted, False),
+        ("slotted+compact", slotted, True),
+    )
+    results = []
+    for name, classes, compact in layouts:
+        per_room, per_cmd = _measure(
+            lambda: _build_world(count, *classes), count, compact,
+        )
+        results.append({
+            "layout": name,
+            "entities": count,
+            "bytes_per_room": round(per_room, 1),
+            "bytes_per_reset_command": round(per_cmd, 1),
+        })
+    return results
@@ -0,0 +1,73 @@
+"""Parse throughput and transient memory of CircleMUD-style .wld files.
+
+:func:`wld_parsing` reads every ``lib/world/wld/*.wld`` file of a
+CircleMUD or Simoon tree into memory and times parsing them with the
+shared record reader (:mod:`genos.adapters.circlemud.records`), without
+file I/O.  It also traces the memory each file allocates beyond the
+rooms it returns and reports, for comparison, what the list of lines
+the parsers used to build before scanning would have taken.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from genos.adapters.circlemud import wld_parser as circlemud_wld
+from genos.adapters.simoon import wld_parser as simoon_wld
+
+# adapter class name -> (text parser, file encoding)
+_DIALECTS: dict[str, tuple[Callable, str]] = {
+    "CircleMudAdapter": (circlemud_wld.parse_wld_text, "utf-8"),
+    "SimoonAdapter": (simoon_wld.parse_wld_text, "euc-kr"),
+}
+
+
+def wld_parsing(
+    source: str | Path, adapter: str = "CircleMudAdapter", repeat: int = 3,
+) -> dict | None:
+    """Parse rate and transient memory of the .wld files under *source*.
+
+    The fastest of *repeat* passes is reported.  Memory figures are the
+    largest over the files.  Returns None when *adapter* does not read
+    .wld files.
+    """
+    if adapter not in _DIALECTS:
+        return None
+    parse, encoding = _DIALECTS[adapter]
+    files = sorted((Path(source) / "lib" / "world" / "wld").glob("*.wld"))
+    texts = [fpath.read_text(encoding=encoding, errors="replace") for fpath in files]
+
+    rooms = 0
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        rooms = sum(len(parse(text)) for text in texts)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    transient = line_list = 0
+    for text in texts:
+        tracemalloc.start()
+        parsed = parse(text)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del parsed
+        tracemalloc.start()
+        lines = text.split("\n")
+        line_list = max(line_list, tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del lines
+        transient = max(transient, peak - current)
+
+    return {
+        "files": len(texts),
+        "rooms": rooms,
+        "bytes": sum(fpath.stat().st_size for fpath in files),
+        "seconds": round(best, 6),
+        "rooms_per_sec": round(rooms / best, 1) if rooms and best else None,
+        "transient_bytes": transient,
+        "line_list_bytes": line_list,
+    }
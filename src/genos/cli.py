@@ -1,18 +1,35 @@
-"""GenOS CLI - Migration tool entry point."""
+"""GenOS CLI - Migration tool entry point.
+
+The CLI is run many times from batch scripts, so module import only
+loads what the command line definition needs.  Each command imports
+the modules it uses (compiler, validator, writers...) when it runs, and
+detection imports the parsers of the detected adapter alone.
+"""
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager
 
 import click
-import yaml
 
-from genos.adapters.detector import detect_mud_type
-from genos.compiler.compiler import GenosCompiler
-from genos.uir.validator import validate_uir
+from genos.adapters import DEFAULT_CACHE_DIR
+from genos.bench import WORLD_KINDS
+from genos.compiler import SQL_FORMATS
+
+if TYPE_CHECKING:
+    from genos.compiler.compiler import GenosCompiler
+    from genos.profiling import Profiler
+
+
+# File name of the binary UIR snapshot written by ``migrate --snapshot``.
+SNAPSHOT_NAME = "uir.snap"
+
+# Files written by ``migrate --profile`` / ``--cprofile``.
+PROFILE_NAME = "profile.json"
+CPROFILE_NAME = "profile.pstats"
 
 
 @click.group()
@@ -28,12 +45,22 @@ def main(verbose: bool) -> None:
 
 @main.command()
 @click.argument("source", type=click.Path(exists=True))
-def analyze(source: str) -> None:
+@click.option(
+    "--jobs", "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for per-file parsing (0 = all CPUs).",
+)
+def analyze(source: str, jobs: int) -> None:
     """Analyze a MUD source directory and report migration feasibility."""
+    from genos.adapters.detector import detect_mud_type
+
     adapter = detect_mud_type(source)
     if not adapter:
         click.echo(f"Error: Could not detect MUD type at {source}", err=True)
         sys.exit(1)
+    adapter.jobs = jobs
 
     click.echo(f"Detected: {adapter.__class__.__name__}")
     click.echo()
@@ -62,26 +89,218 @@ def analyze(source: str) -> None:
     default="yaml",
     help="UIR output format.",
 )
-def migrate(source: str, output: str | None, output_format: str) -> None:
+@click.option(
+    "--jobs", "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for per-file parsing (0 = all CPUs).",
+)
+@click.option(
+    "--validate-jobs",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for zone-sharded cross-reference validation "
+         "(0 = all CPUs).",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Write UIR, SQL and Lua file by file instead of building the "
+         "whole UIR in memory (skips cross-reference validation).",
+)
+@click.option(
+    "--sql-format",
+    type=click.Choice(SQL_FORMATS),
+    default="insert",
+    show_default=True,
+    help="Seed data format: INSERT statements or PostgreSQL COPY blocks "
+         "(indexes are then created after the load).",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Rows per INSERT statement in the insert SQL format.",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Reuse parse results of unchanged source files from earlier runs.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=DEFAULT_CACHE_DIR,
+    show_default=True,
+    help="Directory holding the parse cache (used with --cache).",
+)
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Regenerate every artifact, even those whose UIR inputs are unchanged.",
+)
+@click.option(
+    "--snapshot",
+    is_flag=True,
+    help="Also write a binary UIR snapshot (uir.snap) for 'genos compile'.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Record per-stage time, memory and bytes read, and the slowest "
+         f"source files, in {PROFILE_NAME} in the output directory.",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(min=0),
+    default=20,
+    show_default=True,
+    help="Slowest source files listed in the profile.",
+)
+@click.option(
+    "--cprofile",
+    is_flag=True,
+    help=f"Also dump cProfile statistics to {CPROFILE_NAME} (implies --profile).",
+)
+def migrate(
+    source: str, output: str | None, output_format: str, jobs: int,
+    validate_jobs: int, stream: bool, sql_format: str, batch_size: int, cache: bool,
+    cache_dir: str, rebuild: bool, snapshot: bool, profile: bool,
+    profile_top: int, cprofile: bool,
+) -> None:
     """Parse a MUD source and generate GenOS project artifacts."""
-    adapter = detect_mud_type(source)
+    if stream and snapshot:
+        raise click.UsageError("--snapshot cannot be combined with --stream.")
+    if output is None:
+        output = str(Path(source).name + "-genos-output")
+    output_dir = Path(output)
+    options = dict(
+        source=source, output_dir=output_dir, output_format=output_format,
+        jobs=jobs, validate_jobs=validate_jobs, stream=stream,
+        sql_format=sql_format, batch_size=batch_size, cache=cache,
+        cache_dir=cache_dir, rebuild=rebuild, snapshot=snapshot,
+    )
+    if not (profile or cprofile):
+        _migrate(**options)
+        return
+
+    import cProfile
+
+    from genos.profiling import Profiler
+
+    profiler = Profiler()
+    profile_path = output_dir / PROFILE_NAME
+    cprof = cProfile.Profile() if cprofile else None
+    with profiler.activate():
+        if cprof is not None:
+            cprof.enable()
+        try:
+            _migrate(profiler=profiler, **options)
+        finally:
+            if cprof is not None:
+                cprof.disable()
+    profiler.write(
+        profile_path, profile_top,
+        command="migrate", source=str(source), jobs=jobs, stream=stream,
+    )
+    click.echo(f"Profile written to: {profile_path}")
+    if cprof is not None:
+        cprof.dump_stats(output_dir / CPROFILE_NAME)
+        click.echo(f"cProfile stats written to: {output_dir / CPROFILE_NAME}")
+
+
+def _migrate(
+    source: str, output_dir: Path, output_format: str, jobs: int,
+    validate_jobs: int, stream: bool, sql_format: str, batch_size: int,
+    cache: bool, cache_dir: str, rebuild: bool, snapshot: bool,
+    profiler: Profiler | None = None,
+) -> None:
+    from genos.adapters.base import BaseAdapter
+    from genos.adapters.cache import ParseCache
+    from genos.adapters.detector import detect_mud_type
+    from genos.compiler.compiler import GenosCompiler, StreamingCompiler
+    from genos.profiling import stage
+    from genos.uir.columnar import ColumnarWorld
+    from genos.uir.compact import compact_uir
+    from genos.uir.snapshot import write_snapshot
+    from genos.uir.validator import validate_uir
+    from genos.uir.writer import UIRStreamWriter, write_uir
+
+    with stage("detect"):
+        adapter = detect_mud_type(source, cache_dir if cache else None)
     if not adapter:
         click.echo(f"Error: Could not detect MUD type at {source}", err=True)
         sys.exit(1)
+    adapter.jobs = jobs
+    if cache:
+        adapter.cache = ParseCache(cache_dir)
+    if profiler is not None:
+        profiler.instrument(adapter)
 
     click.echo(f"Detected: {adapter.__class__.__name__}")
     click.echo("Parsing...")
 
-    uir = adapter.parse()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    uir_path = output_dir / f"uir.{output_format}"
 
-    # Validate
-    validation = validate_uir(uir)
-    if not validation.valid:
-        click.echo("Validation errors:")
-        for e in validation.errors:
-            click.echo(f"  ERROR: {e}")
-    if validation.warnings:
-        click.echo(f"Validation warnings: {len(validation.warnings)}")
+    if stream:
+        if type(adapter).parse_stream is BaseAdapter.parse_stream:
+            click.echo(
+                f"Warning: {adapter.__class__.__name__} does not parse per "
+                "file; --stream still holds the whole world in memory.",
+                err=True,
+            )
+        # Every consumer sees each file's entities once, then drops them
+        with stage("stream"):
+            uir, chunks = adapter.parse_stream()
+            writer = UIRStreamWriter(uir_path, output_format)
+            compiler = StreamingCompiler(
+                uir, output_dir, sql_format, batch_size, incremental=not rebuild,
+            )
+            try:
+                for section, entities in chunks:
+                    writer.feed(section, entities)
+                    compiler.feed(section, entities)
+                with stage("serialize"):
+                    writer.finish(uir)
+            finally:
+                writer.close()
+        click.echo("Validation skipped (--stream)")
+    else:
+        with stage("parse"):
+            uir = compact_uir(adapter.parse())
+
+        # Validate (the columnar view is reused for the seed data)
+        with stage("validate"):
+            columns = ColumnarWorld.from_uir(uir)
+            validation = validate_uir(
+                uir, columns=columns, max_per_code=1, workers=validate_jobs,
+            )
+        if not validation.valid:
+            click.echo("Validation errors:")
+            for e in validation.errors:
+                click.echo(f"  ERROR: {e}")
+        if validation.warning_count:
+            click.echo(f"Validation warnings: {validation.warning_count}")
+            # One example per diagnostic code
+            for diag in validation.diagnostics:
+                click.echo(
+                    f"  {diag.code}: {validation.counts[diag.code]} "
+                    f"(e.g. {diag.message()})"
+                )
+
+        with stage("serialize"):
+            write_uir(uir, uir_path, output_format)
+        if snapshot:
+            with stage("snapshot"):
+                write_snapshot(uir, output_dir / SNAPSHOT_NAME)
+        compiler = GenosCompiler(
+            uir, output_dir, sql_format, batch_size,
+            incremental=not rebuild, columns=columns,
+        )
 
     stats = uir.migration_stats
     click.echo(
@@ -93,58 +312,201 @@ def migrate(source: str, output: str | None, output_format: str) -> None:
 
     if stats.warnings:
         click.echo(f"Parse warnings: {len(stats.warnings)}")
+    if adapter.cache is not None:
+        click.echo(
+            f"Parse cache: {adapter.cache.hits} files reused, "
+            f"{adapter.cache.misses} parsed"
+        )
 
-    # Output directory
-    if output is None:
-        output = str(Path(source).name + "-genos-output")
-    output_dir = Path(output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    click.echo(f"UIR written to: {uir_path}")
+    if snapshot:
+        click.echo(f"Snapshot written to: {output_dir / SNAPSHOT_NAME}")
+
+    # Compile
+    with stage("compile"):
+        _compile_and_report(compiler)
 
-    # Write UIR
-    uir_data = _uir_to_dict(uir)
-    if output_format == "yaml":
-        uir_path = output_dir / "uir.yaml"
-        with open(uir_path, "w") as f:
-            yaml.dump(uir_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    click.echo("\nMigration complete!")
+
+
+@main.command(name="compile")
+@click.argument("snapshot", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    default=None,
+    help="Output directory (default: the snapshot's directory).",
+)
+@click.option(
+    "--sql-format",
+    type=click.Choice(SQL_FORMATS),
+    default="insert",
+    show_default=True,
+    help="Seed data format: INSERT statements or PostgreSQL COPY blocks "
+         "(indexes are then created after the load).",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Rows per INSERT statement in the insert SQL format.",
+)
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Regenerate every artifact, even those whose UIR inputs are unchanged.",
+)
+def compile_snapshot(
+    snapshot: str, output: str | None, sql_format: str, batch_size: int,
+    rebuild: bool,
+) -> None:
+    """Generate GenOS project artifacts from a UIR snapshot (no parsing)."""
+    from genos.compiler.compiler import GenosCompiler
+    from genos.uir.compact import compact_uir
+    from genos.uir.snapshot import load_snapshot
+
+    try:
+        uir = compact_uir(load_snapshot(snapshot))
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    output_dir = Path(output) if output else Path(snapshot).parent
+    stats = uir.migration_stats
+    click.echo(
+        f"Loaded: {stats.total_rooms} rooms, {stats.total_items} items, "
+        f"{stats.total_monsters} mobs, {stats.total_zones} zones"
+    )
+
+    _compile_and_report(GenosCompiler(
+        uir, output_dir, sql_format, batch_size, incremental=not rebuild,
+    ))
+
+
+@main.command()
+@click.option(
+    "--world", "-w", "kinds",
+    type=click.Choice([*WORLD_KINDS, "all"]),
+    multiple=True,
+    help="Synthetic world format to benchmark (repeatable; default circlemud).",
+)
+@click.option(
+    "--rooms",
+    type=click.IntRange(min=1),
+    default=10_000,
+    show_default=True,
+    help="Rooms in each synthetic world (items and mobs are half as many).",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Seed of the synthetic world generator.",
+)
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Benchmark an existing MUD source instead of a synthetic world.",
+)
+@click.option(
+    "--jobs", "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for per-file parsing (0 = all CPUs).",
+)
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Keep generated worlds and artifacts here, replacing those of an "
+         "earlier run (default: a temporary directory that is removed "
+         "afterwards).",
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write the JSON report to this file instead of stdout.",
+)
+def bench(
+    kinds: tuple[str, ...], rooms: int, seed: int, source: str | None,
+    jobs: int, work_dir: str | None, output: str | None,
+) -> None:
+    """Time each migration stage and report throughput as JSON."""
+    import contextlib
+    import json
+    import shutil
+    import tempfile
+
+    from genos.bench import generate_world, run_bench
+    from genos.bench.flags import flag_decoding
+    from genos.bench.records import record_throughput
+    from genos.bench.runner import environment
+    from genos.bench.uir_memory import uir_memory
+    from genos.bench.wld import wld_parsing
+
+    if source and kinds:
+        raise click.UsageError("--source cannot be combined with --world.")
+    if "all" in kinds:
+        kinds = WORLD_KINDS
+    elif not kinds:
+        kinds = ("circlemud",)
+
+    if work_dir:
+        work: ContextManager[str] = contextlib.nullcontext(work_dir)
     else:
-        uir_path = output_dir / "uir.json"
-        with open(uir_path, "w") as f:
-            json.dump(uir_data, f, indent=2, ensure_ascii=False)
+        work = tempfile.TemporaryDirectory(prefix="genos-bench-")
+    with work as base_dir:
+        base = Path(base_dir)
+        runs = []
 
-    click.echo(f"UIR written to: {uir_path}")
+        def run(world_info: dict, root: Path, output_dir: Path) -> None:
+            report = {"world": world_info, **run_bench(root, output_dir, jobs)}
+            if report["adapter"] == "ThreeEyesAdapter":
+                # Decode rate of the binary records alone
+                report["record_decoding"] = record_throughput(root)
+            parsing = wld_parsing(root, report["adapter"])
+            if parsing:
+                report["wld_parsing"] = parsing
+            runs.append(report)
 
-    # Compile
-    compiler = GenosCompiler(uir, output_dir)
-    generated = compiler.compile()
+        if source:
+            shutil.rmtree(base / "output", ignore_errors=True)
+            run({"source": str(source)}, Path(source), base / "output")
+        for kind in dict.fromkeys(kinds):
+            # A reused --work-dir must not mix in an earlier run's files
+            shutil.rmtree(base / kind, ignore_errors=True)
+            world = generate_world(kind, base / kind / "source", rooms, seed)
+            run(world.as_dict(), world.root, base / kind / "output")
 
-    click.echo(f"\nGenerated {len(generated)} files:")
-    for fpath, desc in generated.items():
-        click.echo(f"  {fpath}: {desc}")
+    text = json.dumps({
+        "environment": environment(),
+        "runs": runs,
+        "flag_decoding": flag_decoding(),
+        "uir_memory": uir_memory(),
+    }, indent=2)
+    if output:
+        Path(output).write_text(text + "\n")
+    else:
+        click.echo(text)
 
-    click.echo("\nMigration complete!")
 
+def _compile_and_report(compiler: GenosCompiler) -> None:
+    generated = compiler.compile()
 
-def _uir_to_dict(uir) -> dict:
-    """Convert UIR dataclass tree to a plain dict for serialization."""
-    import dataclasses
-
-    def _convert(obj):
-        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
-            result = {}
-            for f in dataclasses.fields(obj):
-                value = getattr(obj, f.name)
-                result[f.name] = _convert(value)
-            return result
-        elif isinstance(obj, list):
-            return [_convert(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: _convert(v) for k, v in obj.items()}
-        elif isinstance(obj, tuple):
-            return list(obj)
-        else:
-            return obj
-
-    return _convert(uir)
+    click.echo(
+        f"\nGenerated {len(generated)} files "
+        f"({len(compiler.regenerated)} regenerated, "
+        f"{len(compiler.reused)} unchanged):"
+    )
+    reused = set(compiler.reused)
+    for fpath, desc in generated.items():
+        suffix = " (unchanged)" if fpath in reused else ""
+        click.echo(f"  {fpath}: {desc}{suffix}")
 
 
 if __name__ == "__main__":
@@ -1 +1,4 @@
 """GenOS compiler - transforms UIR to target platform artifacts."""
+
+# Seed output formats: one INSERT per row, or COPY ... FROM stdin blocks.
+SQL_FORMATS = ("insert", "copy")
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import shutil
+import tempfile
 from pathlib import Path
+from typing import Any, Callable, Iterable, TextIO
 
+import genos
+from genos.profiling import stage
+from genos.uir.columnar import ColumnarWorld
 from genos.uir.schema import UIR
 
-from .db_generator import generate_ddl, generate_seed_data
+from .db_generator import (
+    SEED_SECTIONS,
+    SeedDataStream,
+    generate_ddl,
+    generate_seed_data,
+)
 from .korean_nlp_generator import (
     generate_korean_commands_lua,
     generate_korean_nlp_lua,
@@ -23,112 +37,272 @@ from .lua_generator import (
     generate_socials_lua,
     generate_stat_tables_lua,
     generate_trigger_lua,
+    generate_trigger_lua_entries,
+    generate_trigger_lua_footer,
+    generate_trigger_lua_header,
 )
 
 logger = logging.getLogger(__name__)
 
+# Records the inputs of every artifact of the last compile, relative to
+# the output directory.
+MANIFEST_NAME = ".genos-manifest.json"
+
+# (path under output_dir, description, UIR sections the content is
+# derived from, optional, writer).  Optional artifacts are only written
+# when one of their sections is non-empty.
+_Artifact = tuple[str, str, tuple[str, ...], bool, Callable[[TextIO], None]]
+
 
 class GenosCompiler:
-    """Compiles UIR into GenOS project artifacts."""
+    """Compiles UIR into GenOS project artifacts.
+
+    Compilation is incremental: each artifact's UIR sections are
+    fingerprinted and recorded in :data:`MANIFEST_NAME`, and an artifact
+    whose fingerprint is unchanged (and whose file was not modified since)
+    is left in place.  After :meth:`compile`, :attr:`regenerated` and
+    :attr:`reused` list the artifact paths in each category.
+    """
 
-    def __init__(self, uir: UIR, output_dir: str | Path) -> None:
+    def __init__(
+        self,
+        uir: UIR,
+        output_dir: str | Path,
+        sql_format: str = "insert",
+        batch_size: int = 1,
+        incremental: bool = True,
+        columns: ColumnarWorld | None = None,
+    ) -> None:
         self.uir = uir
         self.output_dir = Path(output_dir)
+        # Seed data format: "insert" or "copy"; INSERT statements carry
+        # batch_size rows each.
+        self.sql_format = sql_format
+        self.batch_size = batch_size
+        # False regenerates every artifact regardless of the manifest.
+        self.incremental = incremental
+        # Columnar view of uir shared with validation, if already built.
+        self.columns = columns
+        self.regenerated: list[str] = []
+        self.reused: list[str] = []
+        self._section_digests: dict[str, str] = {}
 
     def compile(self) -> dict[str, str]:
         """Generate all artifacts. Returns a dict of filepath → description."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / "sql").mkdir(exist_ok=True)
+        (self.output_dir / "lua").mkdir(exist_ok=True)
 
+        previous = self._load_manifest() if self.incremental else {}
+        manifest: dict[str, dict[str, str]] = {}
         generated: dict[str, str] = {}
+        self.regenerated = []
+        self.reused = []
+        self._section_digests = {}
 
-        # SQL files
-        sql_dir = self.output_dir / "sql"
-        sql_dir.mkdir(exist_ok=True)
-
-        ddl_path = sql_dir / "schema.sql"
-        with open(ddl_path, "w") as f:
-            generate_ddl(self.uir, f)
-        generated[str(ddl_path)] = "Database schema DDL"
-
-        seed_path = sql_dir / "seed_data.sql"
-        with open(seed_path, "w") as f:
-            generate_seed_data(self.uir, f)
-        generated[str(seed_path)] = "Seed data INSERT statements"
-
-        # Lua files
-        lua_dir = self.output_dir / "lua"
-        lua_dir.mkdir(exist_ok=True)
-
-        combat_path = lua_dir / "combat.lua"
-        with open(combat_path, "w") as f:
-            generate_combat_lua(self.uir, f)
-        generated[str(combat_path)] = "Combat system"
-
-        classes_path = lua_dir / "classes.lua"
-        with open(classes_path, "w") as f:
-            generate_class_lua(self.uir, f)
-        generated[str(classes_path)] = "Character classes"
-
-        if self.uir.triggers:
-            triggers_path = lua_dir / "triggers.lua"
-            with open(triggers_path, "w") as f:
-                generate_trigger_lua(self.uir, f)
-            generated[str(triggers_path)] = "DG Script triggers (Lua)"
-
-        # Phase 3: game system Lua files
-        if self.uir.game_configs:
-            config_path = lua_dir / "config.lua"
-            with open(config_path, "w") as f:
-                generate_config_lua(self.uir, f)
-            generated[str(config_path)] = "Game configuration"
-
-        if self.uir.experience_table:
-            exp_path = lua_dir / "exp_tables.lua"
-            with open(exp_path, "w") as f:
-                generate_exp_table_lua(self.uir, f)
-            generated[str(exp_path)] = "Experience tables"
-
-        if self.uir.thac0_table or self.uir.saving_throws or self.uir.attribute_modifiers:
-            stat_path = lua_dir / "stat_tables.lua"
-            with open(stat_path, "w") as f:
-                generate_stat_tables_lua(self.uir, f)
-            generated[str(stat_path)] = "Stat modifier tables"
-
-        # Skills, Races, Socials, Level Titles
-        if self.uir.skills:
-            skills_path = lua_dir / "skills.lua"
-            with open(skills_path, "w") as f:
-                generate_skills_lua(self.uir, f)
-            generated[str(skills_path)] = "Skills data"
-
-        if self.uir.races:
-            races_path = lua_dir / "races.lua"
-            with open(races_path, "w") as f:
-                generate_races_lua(self.uir, f)
-            generated[str(races_path)] = "Races data"
-
-        if self.uir.socials:
-            socials_path = lua_dir / "socials.lua"
-            with open(socials_path, "w") as f:
-                generate_socials_lua(self.uir, f)
-            generated[str(socials_path)] = "Socials data"
-
-        if self.uir.level_titles:
-            level_titles_path = lua_dir / "level_titles.lua"
-            with open(level_titles_path, "w") as f:
-                generate_level_titles_lua(self.uir, f)
-            generated[str(level_titles_path)] = "Level titles"
-
-        # Phase 4: Korean NLP (always generated)
-        nlp_path = lua_dir / "korean_nlp.lua"
-        with open(nlp_path, "w") as f:
-            generate_korean_nlp_lua(f)
-        generated[str(nlp_path)] = "Korean NLP utilities"
-
-        cmd_path = lua_dir / "korean_commands.lua"
-        with open(cmd_path, "w") as f:
-            generate_korean_commands_lua(self.uir, f)
-        generated[str(cmd_path)] = "Korean command interpreter"
-
-        logger.info("Compiled %d artifacts to %s", len(generated), self.output_dir)
+        for rel_path, description, sections, optional, write in self._artifacts():
+            if optional and not any(self._has_section(s) for s in sections):
+                continue
+            path = self.output_dir / rel_path
+            fingerprint = self._fingerprint(rel_path, sections)
+            digest = _file_digest(path)
+            entry = previous.get(rel_path)
+            if entry == {"fingerprint": fingerprint, "digest": digest}:
+                self.reused.append(str(path))
+            else:
+                with stage(rel_path), open(path, "w") as f:
+                    write(f)
+                digest = _file_digest(path)
+                self.regenerated.append(str(path))
+            manifest[rel_path] = {"fingerprint": fingerprint, "digest": digest}
+            generated[str(path)] = description
+
+        with open(self.output_dir / MANIFEST_NAME, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+        logger.info(
+            "Compiled %d artifacts to %s (%d regenerated, %d reused)",
+            len(generated), self.output_dir,
+            len(self.regenerated), len(self.reused),
+        )
         return generated
+
+    def _artifacts(self) -> list[_Artifact]:
+        """All artifacts in generation order."""
+        uir = self.uir
+        if self.sql_format == "copy":
+            seed_description = "Seed data COPY blocks + deferred indexes"
+        else:
+            seed_description = "Seed data INSERT statements"
+        return [
+            ("sql/schema.sql", "Database schema DDL", (), False,
+             lambda f: generate_ddl(uir, f, self.sql_format)),
+            ("sql/seed_data.sql", seed_description, SEED_SECTIONS, False,
+             self._write_seed_data),
+            ("lua/combat.lua", "Combat system",
+             ("combat_system", "character_classes"), False,
+             lambda f: generate_combat_lua(uir, f)),
+            ("lua/classes.lua", "Character classes", ("character_classes",), False,
+             lambda f: generate_class_lua(uir, f)),
+            ("lua/triggers.lua", "DG Script triggers (Lua)", ("triggers",), True,
+             self._write_triggers),
+            # Phase 3: game system Lua files
+            ("lua/config.lua", "Game configuration", ("game_configs",), True,
+             lambda f: generate_config_lua(uir, f)),
+            ("lua/exp_tables.lua", "Experience tables", ("experience_table",), True,
+             lambda f: generate_exp_table_lua(uir, f)),
+            ("lua/stat_tables.lua", "Stat modifier tables",
+             ("thac0_table", "saving_throws", "attribute_modifiers"), True,
+             lambda f: generate_stat_tables_lua(uir, f)),
+            # Skills, Races, Socials, Level Titles
+            ("lua/skills.lua", "Skills data", ("skills",), True,
+             lambda f: generate_skills_lua(uir, f)),
+            ("lua/races.lua", "Races data", ("races",), True,
+             lambda f: generate_races_lua(uir, f)),
+            ("lua/socials.lua", "Socials data", ("socials",), True,
+             lambda f: generate_socials_lua(uir, f)),
+            ("lua/level_titles.lua", "Level titles", ("level_titles",), True,
+             lambda f: generate_level_titles_lua(uir, f)),
+            # Phase 4: Korean NLP (always generated)
+            ("lua/korean_nlp.lua", "Korean NLP utilities", (), False,
+             generate_korean_nlp_lua),
+            ("lua/korean_commands.lua", "Korean command interpreter", ("skills",), False,
+             lambda f: generate_korean_commands_lua(uir, f)),
+        ]
+
+    def _write_seed_data(self, out: TextIO) -> None:
+        generate_seed_data(
+            self.uir, out, self.sql_format, self.batch_size, columns=self.columns,
+        )
+
+    def _write_triggers(self, out: TextIO) -> None:
+        generate_trigger_lua(self.uir, out)
+
+    # ── Fingerprints ────────────────────────────────────────────────
+
+    def _has_section(self, section: str) -> bool:
+        return bool(getattr(self.uir, section))
+
+    def _section_digest(self, section: str) -> str:
+        digest = self._section_digests.get(section)
+        if digest is None:
+            value = getattr(self.uir, section)
+            h = hashlib.sha256()
+            _update_digest(h, value if isinstance(value, list) else [value])
+            digest = self._section_digests[section] = h.hexdigest()
+        return digest
+
+    def _fingerprint(self, rel_path: str, sections: tuple[str, ...]) -> str:
+        h = hashlib.sha256()
+        h.update(f"{_generator_version()}\0{rel_path}\0".encode())
+        if rel_path.startswith("sql/"):
+            h.update(f"{self.sql_format}:{self.batch_size}\0".encode())
+        for section in sections:
+            h.update(f"{section}={self._section_digest(section)}\0".encode())
+        return h.hexdigest()
+
+    def _load_manifest(self) -> dict[str, Any]:
+        try:
+            with open(self.output_dir / MANIFEST_NAME) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+
+class StreamingCompiler(GenosCompiler):
+    """GenosCompiler fed world sections chunk by chunk.
+
+    Used with :meth:`BaseAdapter.parse_stream`: *uir* is the partial UIR
+    it returns, and each ``(section, entities)`` chunk is passed to
+    :meth:`feed` as it is parsed.  Seed rows and trigger scripts are
+    spooled to temporary files and streamed sections are fingerprinted
+    as they arrive, so no world section is ever held in memory as a
+    whole.  :meth:`compile` is called once the chunks are exhausted and
+    produces the same artifacts (and manifest) as :class:`GenosCompiler`
+    would for the fully materialized UIR.
+    """
+
+    def __init__(
+        self,
+        uir: UIR,
+        output_dir: str | Path,
+        sql_format: str = "insert",
+        batch_size: int = 1,
+        incremental: bool = True,
+    ) -> None:
+        super().__init__(uir, output_dir, sql_format, batch_size, incremental)
+        self._seed = SeedDataStream(sql_format, batch_size)
+        self._triggers_spool: TextIO | None = None
+        self._fed: dict[str, Any] = {}
+
+    def feed(self, section: str, entities: list) -> None:
+        """Consume one chunk of a streamed UIR section."""
+        if not entities:
+            return
+        h = self._fed.get(section)
+        if h is None:
+            h = self._fed[section] = hashlib.sha256()
+        _update_digest(h, entities)
+        self._seed.feed(section, entities)
+        if section == "triggers":
+            if self._triggers_spool is None:
+                self._triggers_spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+                generate_trigger_lua_header(self._triggers_spool)
+            generate_trigger_lua_entries(entities, self._triggers_spool)
+
+    def compile(self) -> dict[str, str]:
+        try:
+            return super().compile()
+        finally:
+            self._seed.close()
+            if self._triggers_spool is not None:
+                self._triggers_spool.close()
+
+    def _write_seed_data(self, out: TextIO) -> None:
+        self._seed.finish(self.uir, out)
+
+    def _write_triggers(self, out: TextIO) -> None:
+        spool = self._triggers_spool
+        generate_trigger_lua_footer(spool)
+        spool.seek(0)
+        shutil.copyfileobj(spool, out)
+
+    def _has_section(self, section: str) -> bool:
+        return section in self._fed or super()._has_section(section)
+
+    def _section_digest(self, section: str) -> str:
+        h = self._fed.get(section)
+        if h is None:
+            return super()._section_digest(section)
+        return h.hexdigest()
+
+
+def _update_digest(h: Any, entities: Iterable[Any]) -> None:
+    # Dataclass reprs list every field recursively, so equal reprs mean
+    # equal content; hashing entity by entity keeps memory flat.
+    for entity in entities:
+        h.update(repr(entity).encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+
+
+@functools.lru_cache(maxsize=None)
+def _generator_version() -> str:
+    """Hash of the generator sources; changes regenerate every artifact."""
+    h = hashlib.sha256(genos.__version__.encode())
+    for src in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        h.update(src.name.encode("utf-8"))
+        h.update(src.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _file_digest(path: Path) -> str | None:
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(functools.partial(f.read, 1 << 20), b""):
+                h.update(block)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
@@ -14,9 +14,27 @@ from __future__ import annotations
 
 import json
 import math
-from typing import Any, TextIO
-
-from genos.uir.schema import UIR
+import shutil
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from genos.compiler import SQL_FORMATS
+from genos.uir.columnar import ColumnarWorld
+from genos.uir.schema import (
+    CharacterClass,
+    GameConfig,
+    HelpEntry,
+    Item,
+    Monster,
+    Quest,
+    Race,
+    Room,
+    Shop,
+    Skill,
+    Social,
+    UIR,
+    Zone,
+)
 
 
 # ── DDL ──────────────────────────────────────────────────────────────
@@ -298,41 +316,236 @@ COMMIT;
 """
 
 
-def generate_ddl(uir: UIR, out: TextIO) -> None:
-    """Write PostgreSQL CREATE TABLE statements (20 tables)."""
-    out.write(_DDL)
+# CREATE INDEX statements, split out so the COPY format can create them
+# after the bulk load instead of maintaining them row by row.
+_DDL_INDEXES = [
+    line for line in _DDL.splitlines() if line.startswith("CREATE INDEX ")
+]
+_DDL_TABLES = "".join(
+    line for line in _DDL.splitlines(keepends=True)
+    if not line.startswith("CREATE INDEX ")
+)
+
+
+def generate_ddl(uir: UIR, out: TextIO, sql_format: str = "insert") -> None:
+    """Write PostgreSQL CREATE TABLE statements (20 tables).
+
+    For the ``"copy"`` seed format the indexes are omitted here;
+    :func:`generate_seed_data` creates them after loading the data.
+    """
+    _check_sql_format(sql_format)
+    out.write(_DDL_TABLES if sql_format == "copy" else _DDL)
 
 
 # ── Seed data ────────────────────────────────────────────────────────
 
-def generate_seed_data(uir: UIR, out: TextIO) -> None:
-    """Write INSERT statements for seed data."""
+def generate_seed_data(
+    uir: UIR,
+    out: TextIO,
+    sql_format: str = "insert",
+    batch_size: int = 1,
+    columns: ColumnarWorld | None = None,
+) -> None:
+    """Write seed data as INSERT statements or COPY blocks.
+
+    With ``sql_format="copy"`` every table is loaded by a tab-separated
+    ``COPY ... FROM stdin`` block, and the indexes that :func:`generate_ddl`
+    leaves out in that mode are created once the data is in.  For INSERT,
+    a *batch_size* above 1 groups that many rows per statement.  Pass
+    *columns* to seed the columnar tables from an existing
+    :class:`ColumnarWorld` of *uir* instead of building one.
+    """
+    _check_sql_format(sql_format, batch_size)
+
+    def table(name: str, seeder: _Seeder, section: str | None) -> None:
+        writer = _table_writer(sql_format, out, name, batch_size)
+        if columns is not None and name in _COLUMNAR_TABLES:
+            writer.write(seeder(columns))
+        else:
+            writer.write(seeder(getattr(uir, section) if section else uir))
+        writer.close()
+
+    _write_seed_data(out, sql_format, table)
+
+
+class SeedDataStream:
+    """Incremental seed_data.sql writer for streamed world sections.
+
+    World sections arrive in parse order (rooms, items, mobs, ...) but
+    seed_data.sql lists them in table order, so each table's rows are
+    spooled to an anonymous temporary file as chunks are fed and copied
+    into place by :meth:`finish`.  Memory stays bounded by one chunk and
+    the output is byte-identical to :func:`generate_seed_data`.
+    """
+
+    def __init__(self, sql_format: str = "insert", batch_size: int = 1) -> None:
+        _check_sql_format(sql_format, batch_size)
+        self.sql_format = sql_format
+        self.batch_size = batch_size
+        self._writers: dict[str, _TableWriter] = {}
+
+    def feed(self, section: str, entities: list) -> None:
+        """Render one chunk of a UIR world section."""
+        for name, seeder, table_section in _SEED_TABLES:
+            if table_section != section:
+                continue
+            writer = self._writers.get(name)
+            if writer is None:
+                spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+                writer = _table_writer(
+                    self.sql_format, spool, name, self.batch_size,
+                )
+                self._writers[name] = writer
+            writer.write(seeder(entities))
+
+    def finish(self, uir: UIR, out: TextIO) -> None:
+        """Write the complete seed data; *uir* supplies the other sections."""
+
+        def table(name: str, seeder: _Seeder, section: str | None) -> None:
+            writer = self._writers.pop(name, None)
+            if writer is None:
+                # Not streamed (or never fed): render from the UIR itself
+                writer = _table_writer(
+                    self.sql_format, out, name, self.batch_size,
+                )
+                writer.write(seeder(getattr(uir, section) if section else uir))
+                writer.close()
+                return
+            with writer.out as spool:
+                writer.close()
+                spool.seek(0)
+                shutil.copyfileobj(spool, out)
+
+        _write_seed_data(out, self.sql_format, table)
+
+    def close(self) -> None:
+        """Discard any spools not consumed by :meth:`finish`."""
+        for writer in self._writers.values():
+            writer.out.close()
+        self._writers.clear()
+
+
+def _write_seed_data(
+    out: TextIO,
+    sql_format: str,
+    table: Callable[[str, _Seeder, str | None], None],
+) -> None:
+    """Write the seed file, delegating each table to *table(name, seeder, section)*."""
     out.write("-- GenOS Seed Data (Unified Schema v1.0)\n")
     out.write("-- Auto-generated from UIR\n\n")
     out.write("BEGIN;\n\n")
 
-    _seed_rooms(uir, out)
-    _seed_room_exits(uir, out)
-    _seed_mob_protos(uir, out)
-    _seed_item_protos(uir, out)
-    _seed_zones(uir, out)
-    _seed_skills(uir, out)
-    _seed_classes(uir, out)
-    _seed_races(uir, out)
-    _seed_shops(uir, out)
-    _seed_quests(uir, out)
-    _seed_socials(uir, out)
-    _seed_help_entries(uir, out)
-    _seed_game_tables(uir, out)
-    _seed_game_configs(uir, out)
+    for name, seeder, section in _SEED_TABLES:
+        table(name, seeder, section)
+
+    if sql_format == "copy":
+        out.write("-- Indexes (deferred until after the bulk load)\n")
+        for stmt in _DDL_INDEXES:
+            out.write(f"{stmt}\n")
 
     out.write("\nCOMMIT;\n")
 
 
-# ── Individual seed generators ───────────────────────────────────────
+def _check_sql_format(sql_format: str, batch_size: int = 1) -> None:
+    if sql_format not in SQL_FORMATS:
+        raise ValueError(
+            f"Unknown SQL format {sql_format!r} (expected one of {SQL_FORMATS})"
+        )
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be at least 1, got {batch_size}")
+
+
+# ── Table writers ────────────────────────────────────────────────────
+
+class _TableWriter:
+    """Render one table's rows; a non-empty table ends with a blank line."""
+
+    def __init__(self, out: TextIO, table: str) -> None:
+        self.out = out
+        self.table = table
+        self.columns = ", ".join(_SEED_COLUMNS[table])
+        self.rows = 0
+
+    def write(self, rows: Iterable[tuple]) -> None:
+        for row in rows:
+            self._write_row(row)
+            self.rows += 1
+
+    def close(self) -> None:
+        if self.rows:
+            self.out.write("\n")
+
+    def _write_row(self, row: tuple) -> None:
+        raise NotImplementedError
+
+
+class _InsertWriter(_TableWriter):
+    """One ``INSERT INTO ... VALUES (...);`` statement per row."""
+
+    def _write_row(self, row: tuple) -> None:
+        values = ", ".join(_sql_value(v) for v in row)
+        self.out.write(
+            f"INSERT INTO {self.table} ({self.columns}) VALUES ({values});\n"
+        )
+
+
+class _BatchInsertWriter(_TableWriter):
+    """Multi-row ``INSERT INTO ... VALUES (...),(...);`` of *batch_size* rows."""
+
+    def __init__(self, out: TextIO, table: str, batch_size: int) -> None:
+        super().__init__(out, table)
+        self.batch_size = batch_size
+
+    def _write_row(self, row: tuple) -> None:
+        if self.rows % self.batch_size:
+            self.out.write(",\n")
+        else:
+            if self.rows:
+                self.out.write(";\n")
+            self.out.write(f"INSERT INTO {self.table} ({self.columns}) VALUES\n")
+        values = ", ".join(_sql_value(v) for v in row)
+        self.out.write(f"({values})")
+
+    def close(self) -> None:
+        if self.rows:
+            self.out.write(";\n")
+        super().close()
 
-def _seed_rooms(uir: UIR, out: TextIO) -> None:
-    for r in uir.rooms:
+
+class _CopyWriter(_TableWriter):
+    """A ``COPY ... FROM stdin`` block in PostgreSQL text format."""
+
+    def _write_row(self, row: tuple) -> None:
+        if not self.rows:
+            self.out.write(f"COPY {self.table} ({self.columns}) FROM stdin;\n")
+        self.out.write("\t".join(_copy_value(v) for v in row))
+        self.out.write("\n")
+
+    def close(self) -> None:
+        if self.rows:
+            self.out.write("\\.\n")
+        super().close()
+
+
+def _table_writer(
+    sql_format: str, out: TextIO, table: str, batch_size: int = 1,
+) -> _TableWriter:
+    if sql_format == "copy":
+        return _CopyWriter(out, table)
+    if batch_size > 1:
+        return _BatchInsertWriter(out, table, batch_size)
+    return _InsertWriter(out, table)
+
+
+# ── Individual seed generators ───────────────────────────────────────
+#
+# Each seeder yields one tuple of Python values per row, in the column
+# order listed in _SEED_COLUMNS: int/float for numbers, bool, None for
+# NULL, str for TEXT (and for JSONB/range columns, already serialized),
+# list[str] for TEXT[].  The table writers turn these into SQL.
+
+def _seed_rooms(rooms: list[Room]) -> Iterator[tuple]:
+    for r in rooms:
         flags = _int_flags_to_tags(r.room_flags, _ROOM_FLAG_NAMES)
         extra_json = json.dumps([
             {"keywords": ed.keywords, "description": ed.description}
@@ -340,35 +553,27 @@ def _seed_rooms(uir: UIR, out: TextIO) -> None:
         ], ensure_ascii=False)
         scripts_json = json.dumps(r.trigger_vnums)
         ext = json.dumps(r.extensions, ensure_ascii=False) if r.extensions else '{}'
-        out.write(
-            f"INSERT INTO rooms (vnum, zone_vnum, name, description, sector, "
-            f"flags, extra_descs, scripts, ext) VALUES "
-            f"({r.vnum}, {r.zone_number}, {_sql(r.name)}, {_sql(r.description)}, "
-            f"{r.sector_type}, {_sql_arr(flags)}, "
-            f"{_sql(extra_json)}, {_sql(scripts_json)}, {_sql(ext)});\n"
+        yield (
+            r.vnum, r.zone_number, r.name, r.description,
+            r.sector_type, flags, extra_json, scripts_json, ext,
         )
-    if uir.rooms:
-        out.write("\n")
-
-
-def _seed_room_exits(uir: UIR, out: TextIO) -> None:
-    for r in uir.rooms:
-        for e in r.exits:
-            flags = _exit_flags_to_tags(e.door_flags)
-            out.write(
-                f"INSERT INTO room_exits (from_vnum, direction, to_vnum, "
-                f"description, keywords, key_vnum, flags) VALUES "
-                f"({r.vnum}, {e.direction}, {e.destination}, "
-                f"{_sql(e.description)}, {_sql(e.keyword)}, "
-                f"{e.key_vnum}, {_sql_arr(flags)});\n"
-            )
-    has_exits = any(r.exits for r in uir.rooms)
-    if has_exits:
-        out.write("\n")
-
-
-def _seed_mob_protos(uir: UIR, out: TextIO) -> None:
-    for m in uir.monsters:
+
+
+def _seed_room_exits(rooms: list[Room] | ColumnarWorld) -> Iterator[tuple]:
+    cols = rooms if isinstance(rooms, ColumnarWorld) else ColumnarWorld.from_rooms(rooms)
+    strings = cols.strings.strings
+    tags = {f: _exit_flags_to_tags(f) for f in set(cols.exit_flags)}
+    return zip(
+        cols.exit_from, cols.exit_dir, cols.exit_to,
+        map(strings.__getitem__, cols.exit_desc),
+        map(strings.__getitem__, cols.exit_keyword),
+        cols.exit_key,
+        map(tags.__getitem__, cols.exit_flags),
+    )
+
+
+def _seed_mob_protos(monsters: list[Monster]) -> Iterator[tuple]:
+    for m in monsters:
         act_flags = _int_flags_to_tags(m.action_flags, _MOB_ACT_FLAG_NAMES)
         aff_flags = _int_flags_to_tags(m.affect_flags, _AFF_FLAG_NAMES)
         max_hp = _dice_median(m.hp_dice)
@@ -381,27 +586,21 @@ def _seed_mob_protos(uir: UIR, out: TextIO) -> None:
         skills_json = json.dumps(ext.pop("skills", {}), ensure_ascii=False) if "skills" in ext else '{}'
         scripts_json = json.dumps(m.trigger_vnums)
         ext_json = json.dumps(ext, ensure_ascii=False) if ext else '{}'
-        out.write(
-            f"INSERT INTO mob_protos (vnum, zone_vnum, keywords, short_desc, "
-            f"long_desc, detail_desc, level, max_hp, armor_class, hitroll, damroll, "
-            f"damage_dice, gold, experience, alignment, sex, position, "
-            f"act_flags, aff_flags, stats, skills, scripts, ext) VALUES "
-            f"({m.vnum}, {m.vnum // 100}, {_sql(m.keywords)}, "
-            f"{_sql(m.short_description)}, {_sql(m.long_description)}, "
-            f"{_sql(m.detailed_description)}, {m.level}, {max_hp}, "
-            f"{m.armor_class}, {m.hitroll}, 0, "
-            f"{_sql(str(m.damage_dice))}, {m.gold}, {m.experience}, "
-            f"{m.alignment}, {m.sex}, {m.default_position}, "
-            f"{_sql_arr(act_flags)}, {_sql_arr(aff_flags)}, "
-            f"{_sql(stats_json)}, {_sql(skills_json)}, "
-            f"{_sql(scripts_json)}, {_sql(ext_json)});\n"
+        yield (
+            m.vnum, m.vnum // 100, m.keywords,
+            m.short_description, m.long_description,
+            m.detailed_description, m.level, max_hp,
+            m.armor_class, m.hitroll, 0,
+            str(m.damage_dice), m.gold, m.experience,
+            m.alignment, m.sex, m.default_position,
+            act_flags, aff_flags,
+            stats_json, skills_json,
+            scripts_json, ext_json,
         )
-    if uir.monsters:
-        out.write("\n")
 
 
-def _seed_item_protos(uir: UIR, out: TextIO) -> None:
-    for item in uir.items:
+def _seed_item_protos(items: list[Item]) -> Iterator[tuple]:
+    for item in items:
         item_type = _ITEM_TYPE_NAMES.get(item.item_type, "other")
         wear_slots = _wear_flags_to_slots(item.wear_flags)
         flags = _int_flags_to_tags(item.extra_flags, _ITEM_FLAG_NAMES)
@@ -416,45 +615,36 @@ def _seed_item_protos(uir: UIR, out: TextIO) -> None:
         ], ensure_ascii=False)
         scripts_json = json.dumps(item.trigger_vnums)
         ext_json = '{}'
-        out.write(
-            f"INSERT INTO item_protos (vnum, zone_vnum, keywords, short_desc, "
-            f"long_desc, item_type, weight, cost, min_level, "
-            f"wear_slots, flags, values, affects, extra_descs, scripts, ext) VALUES "
-            f"({item.vnum}, {item.vnum // 100}, {_sql(item.keywords)}, "
-            f"{_sql(item.short_description)}, {_sql(item.long_description)}, "
-            f"{_sql(item_type)}, {item.weight}, {item.cost}, {item.min_level}, "
-            f"{_sql_arr(wear_slots)}, {_sql_arr(flags)}, "
-            f"{_sql(values)}, {_sql(affects_json)}, {_sql(extra_json)}, "
-            f"{_sql(scripts_json)}, {_sql(ext_json)});\n"
+        yield (
+            item.vnum, item.vnum // 100, item.keywords,
+            item.short_description, item.long_description,
+            item_type, item.weight, item.cost, item.min_level,
+            wear_slots, flags,
+            values, affects_json, extra_json,
+            scripts_json, ext_json,
         )
-    if uir.items:
-        out.write("\n")
 
 
-def _seed_zones(uir: UIR, out: TextIO) -> None:
-    for z in uir.zones:
+def _seed_zones(zones: list[Zone]) -> Iterator[tuple]:
+    for z in zones:
         flags = _int_flags_to_tags(z.zone_flags, {})
         resets_json = json.dumps([
             {"command": c.command, "if_flag": c.if_flag,
              "arg1": c.arg1, "arg2": c.arg2, "arg3": c.arg3, "arg4": c.arg4}
             for c in z.reset_commands
         ])
-        lvl_range = "NULL"
+        lvl_range = None
         if z.min_level >= 0 and z.max_level >= 0:
-            lvl_range = f"'[{z.min_level},{z.max_level + 1})'"
-        out.write(
-            f"INSERT INTO zones (vnum, name, builders, lifespan, reset_mode, "
-            f"level_range, flags, resets) VALUES "
-            f"({z.vnum}, {_sql(z.name)}, {_sql(z.builders)}, {z.lifespan}, "
-            f"{z.reset_mode}, {lvl_range}, {_sql_arr(flags)}, "
-            f"{_sql(resets_json)});\n"
+            lvl_range = f"[{z.min_level},{z.max_level + 1})"
+        yield (
+            z.vnum, z.name, z.builders, z.lifespan,
+            z.reset_mode, lvl_range, flags,
+            resets_json,
         )
-    if uir.zones:
-        out.write("\n")
 
 
-def _seed_skills(uir: UIR, out: TextIO) -> None:
-    for sk in uir.skills:
+def _seed_skills(skills: list[Skill]) -> Iterator[tuple]:
+    for sk in skills:
         skill_type = sk.spell_type if sk.spell_type else "spell"
         routines_tags = _int_to_routine_tags(sk.routines)
         target_name = _TARGET_NAMES.get(sk.targets, "ignore")
@@ -469,58 +659,46 @@ def _seed_skills(uir: UIR, out: TextIO) -> None:
         if sk.mana_change:
             ext["mana_change"] = sk.mana_change
         ext_json = json.dumps(ext, ensure_ascii=False) if ext else '{}'
-        out.write(
-            f"INSERT INTO skills (id, name, skill_type, mana_cost, target, "
-            f"violent, min_position, routines, wearoff_msg, class_levels, ext) VALUES "
-            f"({sk.id}, {_sql(sk.name)}, {_sql(skill_type)}, "
-            f"{sk.min_mana}, {_sql(target_name)}, "
-            f"{str(sk.violent).upper()}, {sk.min_position}, "
-            f"{_sql_arr(routines_tags)}, {_sql(sk.wearoff_msg)}, "
-            f"{_sql(class_levels_json)}, {_sql(ext_json)});\n"
+        yield (
+            sk.id, sk.name, skill_type,
+            sk.min_mana, target_name,
+            bool(sk.violent), sk.min_position,
+            routines_tags, sk.wearoff_msg,
+            class_levels_json, ext_json,
         )
-    if uir.skills:
-        out.write("\n")
 
 
-def _seed_classes(uir: UIR, out: TextIO) -> None:
-    for c in uir.character_classes:
-        hp_range = f"'[{c.hp_gain_min},{c.hp_gain_max + 1})'"
-        mana_range = f"'[{c.mana_gain_min},{c.mana_gain_max + 1})'"
-        move_range = f"'[{c.move_gain_min},{c.move_gain_max + 1})'"
+def _seed_classes(classes: list[CharacterClass]) -> Iterator[tuple]:
+    for c in classes:
+        hp_range = f"[{c.hp_gain_min},{c.hp_gain_max + 1})"
+        mana_range = f"[{c.mana_gain_min},{c.mana_gain_max + 1})"
+        move_range = f"[{c.move_gain_min},{c.move_gain_max + 1})"
         ext = dict(c.extensions) if c.extensions else {}
         base_stats = json.dumps(ext.pop("base_stats", {}), ensure_ascii=False) if "base_stats" in ext else '{}'
         ext_json = json.dumps(ext, ensure_ascii=False) if ext else '{}'
-        out.write(
-            f"INSERT INTO classes (id, name, abbrev, hp_gain, mana_gain, "
-            f"move_gain, base_stats, ext) VALUES "
-            f"({c.id}, {_sql(c.name)}, {_sql(c.abbreviation)}, "
-            f"{hp_range}, {mana_range}, {move_range}, "
-            f"{_sql(base_stats)}, {_sql(ext_json)});\n"
+        yield (
+            c.id, c.name, c.abbreviation,
+            hp_range, mana_range, move_range,
+            base_stats, ext_json,
         )
-    if uir.character_classes:
-        out.write("\n")
 
 
-def _seed_races(uir: UIR, out: TextIO) -> None:
-    for race in uir.races:
+def _seed_races(races: list[Race]) -> Iterator[tuple]:
+    for race in races:
         stat_mods = json.dumps(race.stat_modifiers, ensure_ascii=False)
         ext = dict(race.extensions) if race.extensions else {}
         body_parts = ext.pop("body_parts", [])
         size = ext.pop("size", "medium")
         ext_json = json.dumps(ext, ensure_ascii=False) if ext else '{}'
-        out.write(
-            f"INSERT INTO races (id, name, abbrev, stat_mods, body_parts, "
-            f"size, ext) VALUES "
-            f"({race.id}, {_sql(race.name)}, {_sql(race.abbreviation)}, "
-            f"{_sql(stat_mods)}, {_sql_arr(body_parts)}, {_sql(size)}, "
-            f"{_sql(ext_json)});\n"
+        yield (
+            race.id, race.name, race.abbreviation,
+            stat_mods, body_parts, size,
+            ext_json,
         )
-    if uir.races:
-        out.write("\n")
 
 
-def _seed_shops(uir: UIR, out: TextIO) -> None:
-    for s in uir.shops:
+def _seed_shops(shops: list[Shop]) -> Iterator[tuple]:
+    for s in shops:
         buy_types = [_ITEM_TYPE_NAMES.get(t, str(t)) for t in s.accepting_types]
         hours = json.dumps({
             "open1": s.open1, "close1": s.close1,
@@ -540,19 +718,15 @@ def _seed_shops(uir: UIR, out: TextIO) -> None:
                 ("message_sell", s.message_sell),
             ] if v
         }, ensure_ascii=False)
-        out.write(
-            f"INSERT INTO shops (vnum, keeper_vnum, room_vnum, buy_types, "
-            f"buy_profit, sell_profit, hours, inventory, messages) VALUES "
-            f"({s.vnum}, {s.keeper_vnum}, {s.shop_room}, "
-            f"{_sql_arr(buy_types)}, {s.profit_buy}, {s.profit_sell}, "
-            f"{_sql(hours)}, {_sql(inventory)}, {_sql(messages)});\n"
+        yield (
+            s.vnum, s.keeper_vnum, s.shop_room,
+            buy_types, s.profit_buy, s.profit_sell,
+            hours, inventory, messages,
         )
-    if uir.shops:
-        out.write("\n")
 
 
-def _seed_quests(uir: UIR, out: TextIO) -> None:
-    for q in uir.quests:
+def _seed_quests(quests: list[Quest]) -> Iterator[tuple]:
+    for q in quests:
         target = {}
         if q.target_vnum >= 0:
             target["vnum"] = q.target_vnum
@@ -570,26 +744,22 @@ def _seed_quests(uir: UIR, out: TextIO) -> None:
             chain["prev"] = q.prev_quest
         if q.next_quest >= 0:
             chain["next"] = q.next_quest
-        lvl_range = "NULL"
+        lvl_range = None
         if q.min_level > 0 or q.max_level > 0:
             lo = min(q.min_level, q.max_level) if q.max_level > 0 else q.min_level
             hi = max(q.min_level, q.max_level)
-            lvl_range = f"'[{lo},{hi + 1})'"
-        out.write(
-            f"INSERT INTO quests (vnum, name, description, quest_type, "
-            f"level_range, giver_vnum, target, rewards, chain) VALUES "
-            f"({q.vnum}, {_sql(q.name)}, {_sql(q.description)}, "
-            f"{_sql(_QUEST_TYPE_NAMES.get(q.quest_type, 'kill'))}, "
-            f"{lvl_range}, {q.mob_vnum}, "
-            f"{_sql(json.dumps(target))}, {_sql(json.dumps(rewards))}, "
-            f"{_sql(json.dumps(chain))});\n"
+            lvl_range = f"[{lo},{hi + 1})"
+        yield (
+            q.vnum, q.name, q.description,
+            _QUEST_TYPE_NAMES.get(q.quest_type, 'kill'),
+            lvl_range, q.mob_vnum,
+            json.dumps(target), json.dumps(rewards),
+            json.dumps(chain),
         )
-    if uir.quests:
-        out.write("\n")
 
 
-def _seed_socials(uir: UIR, out: TextIO) -> None:
-    for soc in uir.socials:
+def _seed_socials(socials: list[Social]) -> Iterator[tuple]:
+    for soc in socials:
         messages: dict[str, Any] = {}
         if soc.no_arg_to_char or soc.no_arg_to_room:
             messages["no_arg"] = {
@@ -609,63 +779,40 @@ def _seed_socials(uir: UIR, out: TextIO) -> None:
                 "char": soc.self_to_char,
                 "room": soc.self_to_room,
             }
-        out.write(
-            f"INSERT INTO socials (command, min_victim_position, messages) VALUES "
-            f"({_sql(soc.command)}, {soc.min_victim_position}, "
-            f"{_sql(json.dumps(messages, ensure_ascii=False))});\n"
+        yield (
+            soc.command, soc.min_victim_position,
+            json.dumps(messages, ensure_ascii=False),
         )
-    if uir.socials:
-        out.write("\n")
 
 
-def _seed_help_entries(uir: UIR, out: TextIO) -> None:
-    for h in uir.help_entries:
-        out.write(
-            f"INSERT INTO help_entries (keywords, min_level, body) VALUES "
-            f"({_sql_arr(h.keywords)}, {h.min_level}, {_sql(h.text)});\n"
-        )
-    if uir.help_entries:
-        out.write("\n")
+def _seed_help_entries(help_entries: list[HelpEntry]) -> Iterator[tuple]:
+    for h in help_entries:
+        yield (h.keywords, h.min_level, h.text)
 
 
-def _seed_game_tables(uir: UIR, out: TextIO) -> None:
+def _seed_game_tables(uir: UIR) -> Iterator[tuple]:
     """Merge 6 legacy tables into unified game_tables."""
     # Experience table
     for exp in uir.experience_table:
         key = json.dumps({"class_id": exp.class_id, "level": exp.level})
-        out.write(
-            f"INSERT INTO game_tables (table_name, key, value) VALUES "
-            f"('exp_table', {_sql(key)}, '{exp.exp_required}');\n"
-        )
+        yield ("exp_table", key, str(exp.exp_required))
     # THAC0
     for th in uir.thac0_table:
         key = json.dumps({"class_id": th.class_id, "level": th.level})
-        out.write(
-            f"INSERT INTO game_tables (table_name, key, value) VALUES "
-            f"('thac0', {_sql(key)}, '{th.thac0}');\n"
-        )
+        yield ("thac0", key, str(th.thac0))
     # Saving throws
     for st in uir.saving_throws:
         key = json.dumps({"class_id": st.class_id, "type": st.save_type, "level": st.level})
-        out.write(
-            f"INSERT INTO game_tables (table_name, key, value) VALUES "
-            f"('saving_throw', {_sql(key)}, '{st.save_value}');\n"
-        )
+        yield ("saving_throw", key, str(st.save_value))
     # Level titles
     for lt in uir.level_titles:
         key = json.dumps({"class_id": lt.class_id, "level": lt.level, "gender": lt.gender})
-        out.write(
-            f"INSERT INTO game_tables (table_name, key, value) VALUES "
-            f"('level_title', {_sql(key)}, {_sql(json.dumps(lt.title))});\n"
-        )
+        yield ("level_title", key, json.dumps(lt.title))
     # Attribute modifiers
     for am in uir.attribute_modifiers:
         key = json.dumps({"stat": am.stat_name, "score": am.score})
         value = json.dumps(am.modifiers)
-        out.write(
-            f"INSERT INTO game_tables (table_name, key, value) VALUES "
-            f"('stat_bonus', {_sql(key)}, {_sql(value)});\n"
-        )
+        yield ("stat_bonus", key, value)
     # Practice params
     for pp in uir.practice_params:
         key = json.dumps({"class_id": pp.class_id})
@@ -675,27 +822,105 @@ def _seed_game_tables(uir: UIR, out: TextIO) -> None:
             "min": pp.min_per_practice,
             "type": pp.prac_type,
         })
-        out.write(
-            f"INSERT INTO game_tables (table_name, key, value) VALUES "
-            f"('practice', {_sql(key)}, {_sql(value)});\n"
-        )
-    has_any = (uir.experience_table or uir.thac0_table or uir.saving_throws
-               or uir.level_titles or uir.attribute_modifiers or uir.practice_params)
-    if has_any:
-        out.write("\n")
+        yield ("practice", key, value)
 
 
-def _seed_game_configs(uir: UIR, out: TextIO) -> None:
-    for gc in uir.game_configs:
+def _seed_game_configs(game_configs: list[GameConfig]) -> Iterator[tuple]:
+    for gc in game_configs:
         # Convert value to JSONB-compatible format
         value_json = _config_value_to_json(gc.value, gc.value_type)
-        out.write(
-            f"INSERT INTO game_configs (key, value, category, description) VALUES "
-            f"({_sql(gc.key)}, {_sql(value_json)}, "
-            f"{_sql(gc.category)}, {_sql(gc.description)});\n"
-        )
-    if uir.game_configs:
-        out.write("\n")
+        yield (gc.key, value_json, gc.category, gc.description)
+
+
+_Seeder = Callable[[Any], Iterator[tuple]]
+
+# Columns written for each seeded table.
+_SEED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "rooms": (
+        "vnum", "zone_vnum", "name", "description", "sector",
+        "flags", "extra_descs", "scripts", "ext",
+    ),
+    "room_exits": (
+        "from_vnum", "direction", "to_vnum",
+        "description", "keywords", "key_vnum", "flags",
+    ),
+    "mob_protos": (
+        "vnum", "zone_vnum", "keywords", "short_desc",
+        "long_desc", "detail_desc", "level", "max_hp", "armor_class",
+        "hitroll", "damroll", "damage_dice", "gold", "experience",
+        "alignment", "sex", "position",
+        "act_flags", "aff_flags", "stats", "skills", "scripts", "ext",
+    ),
+    "item_protos": (
+        "vnum", "zone_vnum", "keywords", "short_desc",
+        "long_desc", "item_type", "weight", "cost", "min_level",
+        "wear_slots", "flags", "values", "affects", "extra_descs",
+        "scripts", "ext",
+    ),
+    "zones": (
+        "vnum", "name", "builders", "lifespan", "reset_mode",
+        "level_range", "flags", "resets",
+    ),
+    "skills": (
+        "id", "name", "skill_type", "mana_cost", "target",
+        "violent", "min_position", "routines", "wearoff_msg",
+        "class_levels", "ext",
+    ),
+    "classes": (
+        "id", "name", "abbrev", "hp_gain", "mana_gain",
+        "move_gain", "base_stats", "ext",
+    ),
+    "races": (
+        "id", "name", "abbrev", "stat_mods", "body_parts", "size", "ext",
+    ),
+    "shops": (
+        "vnum", "keeper_vnum", "room_vnum", "buy_types",
+        "buy_profit", "sell_profit", "hours", "inventory", "messages",
+    ),
+    "quests": (
+        "vnum", "name", "description", "quest_type",
+        "level_range", "giver_vnum", "target", "rewards", "chain",
+    ),
+    "socials": ("command", "min_victim_position", "messages"),
+    "help_entries": ("keywords", "min_level", "body"),
+    "game_tables": ("table_name", "key", "value"),
+    "game_configs": ("key", "value", "category", "description"),
+}
+
+# (table, seeder, UIR section passed to the seeder) in seed_data.sql
+# order.  A section of None means the seeder reads the whole UIR.
+_SEED_TABLES: tuple[tuple[str, _Seeder, str | None], ...] = (
+    ("rooms", _seed_rooms, "rooms"),
+    ("room_exits", _seed_room_exits, "rooms"),
+    ("mob_protos", _seed_mob_protos, "monsters"),
+    ("item_protos", _seed_item_protos, "items"),
+    ("zones", _seed_zones, "zones"),
+    ("skills", _seed_skills, "skills"),
+    ("classes", _seed_classes, "character_classes"),
+    ("races", _seed_races, "races"),
+    ("shops", _seed_shops, "shops"),
+    ("quests", _seed_quests, "quests"),
+    ("socials", _seed_socials, "socials"),
+    ("help_entries", _seed_help_entries, "help_entries"),
+    ("game_tables", _seed_game_tables, None),
+    ("game_configs", _seed_game_configs, "game_configs"),
+)
+
+# Tables whose seeder also accepts a ColumnarWorld of the whole UIR.
+_COLUMNAR_TABLES = frozenset({"room_exits"})
+
+# UIR sections read by _seed_game_tables (the table without a section).
+_GAME_TABLE_SECTIONS = (
+    "experience_table", "thac0_table", "saving_throws", "level_titles",
+    "attribute_modifiers", "practice_params",
+)
+
+# Every UIR section seed_data.sql is derived from, in seed order.
+SEED_SECTIONS = tuple(dict.fromkeys(
+    name
+    for _, _, section in _SEED_TABLES
+    for name in ((section,) if section else _GAME_TABLE_SECTIONS)
+))
 
 
 # ── Conversion helpers ───────────────────────────────────────────────
@@ -710,14 +935,49 @@ def _sql_arr(tags: list[str]) -> str:
     """Format a Python list as a PostgreSQL TEXT[] literal."""
     if not tags:
         return "'{}'::TEXT[]"
+    # _sql() escapes single quotes for the outer SQL string literal
+    return f"{_sql(_pg_array(tags))}::TEXT[]"
+
+
+def _pg_array(tags: list[str]) -> str:
+    """Format a Python list as PostgreSQL array text, e.g. ``{"a","b"}``."""
     escaped = []
     for t in tags:
         t = t.replace("\\", "\\\\").replace('"', '\\"')
         escaped.append(f'"{t}"')
-    inner = ",".join(escaped)
-    # Escape single quotes for the outer SQL string literal
-    inner_esc = inner.replace("'", "''")
-    return f"'{{{inner_esc}}}'::TEXT[]"
+    return "{" + ",".join(escaped) + "}"
+
+
+def _sql_value(value: Any) -> str:
+    """Render a seeder value as an SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, str):
+        return _sql(value)
+    if isinstance(value, list):
+        return _sql_arr(value)
+    return str(value)
+
+
+# Backslash, the tab delimiter and line breaks must be escaped in COPY text.
+_COPY_ESCAPES = str.maketrans({
+    "\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r",
+})
+
+
+def _copy_value(value: Any) -> str:
+    """Render a seeder value as a COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, list):
+        value = _pg_array(value)
+    elif not isinstance(value, str):
+        return str(value)
+    return value.translate(_COPY_ESCAPES)
 
 
 def _dice_median(dice: Any) -> int:
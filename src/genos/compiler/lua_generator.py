@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import TextIO
 
-from genos.uir.schema import UIR
+from genos.uir.schema import Trigger, UIR
 
 
 def generate_combat_lua(uir: UIR, out: TextIO) -> None:
@@ -74,11 +74,20 @@ end
 
 def generate_trigger_lua(uir: UIR, out: TextIO) -> None:
     """Convert DG Script triggers to Lua (basic pattern matching)."""
+    generate_trigger_lua_header(out)
+    generate_trigger_lua_entries(uir.triggers, out)
+    generate_trigger_lua_footer(out)
+
+
+def generate_trigger_lua_header(out: TextIO) -> None:
     out.write("-- GenOS Trigger Scripts\n")
     out.write("-- Auto-generated from UIR (DG Script → Lua)\n\n")
     out.write("local Triggers = {}\n\n")
 
-    for trigger in uir.triggers:
+
+def generate_trigger_lua_entries(triggers: list[Trigger], out: TextIO) -> None:
+    """Write the Lua table entries for a (possibly partial) trigger list."""
+    for trigger in triggers:
         lua_name = f"trigger_{trigger.vnum}"
         out.write(f"-- Trigger {trigger.vnum}: {trigger.name}\n")
         out.write(f"Triggers[{trigger.vnum}] = {{\n")
@@ -96,6 +105,8 @@ def generate_trigger_lua(uir: UIR, out: TextIO) -> None:
         out.write(f"    end,\n")
         out.write(f"}}\n\n")
 
+
+def generate_trigger_lua_footer(out: TextIO) -> None:
     out.write("return Triggers\n")
 
 
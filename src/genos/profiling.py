@@ -0,0 +1,251 @@
+"""Per-stage timing and memory instrumentation (``migrate --profile``).
+
+A :class:`Profiler` records wall time, CPU time, the tracemalloc peak
+and the bytes read from files for each named stage, plus the parse time
+of every source file.  Stages nest: a stage entered inside another is
+recorded as ``outer/inner``, and entering the same stage again adds to
+its totals.
+
+Instrumented code does not hold a profiler.  It calls the module-level
+:func:`stage` and :func:`parse_file`, which do nothing beyond the plain
+call unless a profiler has been made current with
+:meth:`Profiler.activate`.
+
+Bytes read come from ``/proc/self/io`` (``rchar``) and are ``None`` on
+platforms without it; memory-mapped reads are not counted.  Per-file
+times only cover files parsed in this process, i.e. not those handed
+to worker processes with ``--jobs``.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import inspect
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterable, Iterator
+
+# Profiler of the running command, if any.
+_active: Profiler | None = None
+
+_PROC_IO = "/proc/self/io"
+
+
+def stage(name: str) -> ContextManager[Any]:
+    """Record the ``with`` block as stage *name* of the active profiler."""
+    if _active is None:
+        return nullcontext()
+    return _active.stage(name)
+
+
+def parse_file(func: Callable[..., Any], fpath: Path, *args: Any) -> Any:
+    """Return ``func(fpath, *args)``, timing it when profiling."""
+    if _active is None:
+        return func(fpath, *args)
+    return _active.time_file(func, fpath, *args)
+
+
+def read_bytes() -> int | None:
+    """Bytes this process has read so far (None if unknown)."""
+    try:
+        with open(_PROC_IO, "rb") as f:
+            for line in f:
+                if line.startswith(b"rchar:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _func_name(func: Callable[..., Any]) -> str:
+    """Qualified name of *func*; for a partial, of the first callable it binds."""
+    if isinstance(func, functools.partial):
+        return _func_name(next(
+            (a for a in func.args if callable(a)), func.func,
+        ))
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+@dataclass
+class StageStats:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    # Highest traced Python memory while the stage ran
+    peak_bytes: int = 0
+    read_bytes: int | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "tracemalloc_peak_bytes": self.peak_bytes,
+            "read_bytes": self.read_bytes,
+        }
+
+
+@dataclass(slots=True)
+class FileTiming:
+    path: str
+    parser: str
+    seconds: float
+    bytes: int
+    stage: str
+
+
+class Profiler:
+    """Stage and per-file timings of one command run."""
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageStats] = {}
+        self.files: list[FileTiming] = []
+        self.seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_bytes = 0
+        # Open stages: [name, peak carried over from before the last
+        # tracemalloc.reset_peak()]
+        self._stack: list[list] = []
+
+    # ── Recording ───────────────────────────────────────────────────────
+
+    @contextmanager
+    def activate(self) -> Iterator[Profiler]:
+        """Make this the profiler seen by :func:`stage` and :func:`parse_file`."""
+        global _active
+        started = self.trace_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        previous, _active = _active, self
+        try:
+            with self.stage("") as total:
+                yield self
+        finally:
+            _active = previous
+            if started:
+                tracemalloc.stop()
+            del self.stages[""]
+            self.seconds += total.seconds
+            self.cpu_seconds += total.cpu_seconds
+            self.peak_bytes = max(self.peak_bytes, total.peak_bytes)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        stack = self._stack
+        if stack and stack[-1][0]:
+            name = f"{stack[-1][0]}/{name}"
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            peak = tracemalloc.get_traced_memory()[1]
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        stack.append([name, 0])
+        read0 = read_bytes()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield stats
+        finally:
+            stats.seconds += time.perf_counter() - wall
+            stats.cpu_seconds += time.process_time() - cpu
+            stats.calls += 1
+            read1 = read_bytes()
+            if read0 is not None and read1 is not None:
+                stats.read_bytes = (stats.read_bytes or 0) + read1 - read0
+            _, carried = stack.pop()
+            if tracing:
+                peak = max(carried, tracemalloc.get_traced_memory()[1])
+                stats.peak_bytes = max(stats.peak_bytes, peak)
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+
+    def time_file(self, func: Callable[..., Any], fpath: Path, *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(fpath, *args)
+        finally:
+            seconds = time.perf_counter() - start
+            try:
+                size = os.path.getsize(fpath)
+            except OSError:
+                size = 0
+            self.files.append(FileTiming(
+                str(fpath), _func_name(func),
+                seconds, size, self._stack[-1][0] if self._stack else "",
+            ))
+
+    def iter_stage(self, name: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """Yield from *iterable*, recording the time spent producing items."""
+        it = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def instrument(self, adapter: Any) -> None:
+        """Record each ``_parse_*`` / ``_iter_parsed`` call of *adapter*.
+
+        The methods are wrapped on the instance; ``_iter_parsed`` stages
+        are named after the world sub-directory they parse.
+        """
+        for name in dir(type(adapter)):
+            if name.startswith("_parse_") or name == "_iter_parsed":
+                method = getattr(adapter, name)
+                if callable(method):
+                    setattr(adapter, name, self._wrap(name, method))
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        generator = inspect.isgeneratorfunction(method)
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            label = f"{name}:{args[0]}" if name == "_iter_parsed" and args else name
+            if generator:
+                return self.iter_stage(label, method(*args, **kwargs))
+            with self.stage(label):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    # ── Report ──────────────────────────────────────────────────────────
+
+    def report(self, top: int = 20) -> dict:
+        """The recorded timings, with the *top* slowest files."""
+        slowest = heapq.nlargest(top, self.files, key=lambda f: f.seconds)
+        return {
+            "seconds": round(self.seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "tracemalloc_peak_bytes": self.peak_bytes,
+            "stages": [s.as_dict() for s in self.stages.values()],
+            "files_timed": len(self.files),
+            "file_seconds": round(sum(f.seconds for f in self.files), 6),
+            "slowest_files": [
+                {
+                    "path": f.path, "parser": f.parser,
+                    "seconds": round(f.seconds, 6), "bytes": f.bytes,
+                    "stage": f.stage,
+                }
+                for f in slowest
+            ],
+        }
+
+    def write(self, path: str | Path, top: int = 20, **extra: Any) -> None:
+        """Write :meth:`report` (plus *extra* keys) to *path* as JSON."""
+        with open(path, "w") as f:
+            json.dump({**extra, **self.report(top)}, f, indent=2)
+            f.write("\n")
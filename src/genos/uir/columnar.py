@@ -0,0 +1,263 @@
+"""Columnar (struct-of-arrays) view of the UIR world graph.
+
+Checks over every exit or every zone reset command spend most of their
+time on per-object attribute access.  :class:`ColumnarWorld` stores the
+rooms, exits and reset commands as parallel ``array`` columns instead:
+one row per entity, strings replaced by indices into a shared
+:class:`StringPool`, and the exits/reset commands of room/zone ``i``
+stored in rows ``exit_start[i]:exit_start[i + 1]`` (likewise
+``reset_start``).
+
+Build one with :meth:`ColumnarWorld.from_uir`, or :meth:`~ColumnarWorld.feed`
+it ``(section, entities)`` chunks as they come out of an adapter's
+``parse_stream``.  Membership questions ("which exits lead nowhere?")
+are answered with set operations over whole columns, so the common case
+of a clean world never loops over individual rows in Python.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate, chain, compress, count, islice, repeat
+from operator import attrgetter
+from typing import Iterable
+
+from .schema import UIR, Room, Zone
+
+# array typecodes: signed 64-bit for game integers, unsigned for
+# string pool indices.
+_INT = "q"
+_REF = "I"
+
+_vnum = attrgetter("vnum")
+_zone_number = attrgetter("zone_number")
+_sector_type = attrgetter("sector_type")
+_destination = attrgetter("destination")
+_direction = attrgetter("direction")
+_door_flags = attrgetter("door_flags")
+_key_vnum = attrgetter("key_vnum")
+_description = attrgetter("description")
+_keyword = attrgetter("keyword")
+_command = attrgetter("command")
+_if_flag = attrgetter("if_flag")
+_arg1 = attrgetter("arg1")
+_arg2 = attrgetter("arg2")
+_arg3 = attrgetter("arg3")
+_arg4 = attrgetter("arg4")
+
+
+def _repeat_each(values: Iterable[int], counts: list[int]) -> Iterable[int]:
+    """``values[i]`` repeated ``counts[i]`` times, flattened."""
+    return chain.from_iterable(map(repeat, values, counts))
+
+
+def _offsets(start: int, counts: list[int]) -> Iterable[int]:
+    """End offsets of consecutive runs of *counts* rows after *start*."""
+    return islice(accumulate(counts, initial=start), 1, None)
+
+
+class StringPool:
+    """Interned strings, referenced by index."""
+
+    __slots__ = ("strings", "_index")
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def intern(self, s: str) -> int:
+        idx = self._index.get(s)
+        if idx is None:
+            idx = self._index[s] = len(self.strings)
+            self.strings.append(s)
+        return idx
+
+    def intern_all(self, strings: Iterable[str]) -> Iterable[int]:
+        """Intern every string of *strings*; returns their indices in order."""
+        strings = list(strings)
+        index = self._index
+        new = [s for s in dict.fromkeys(strings) if s not in index]
+        index.update(zip(new, count(len(self.strings))))
+        self.strings += new
+        return map(index.__getitem__, strings)
+
+    def lookup(self, s: str) -> int:
+        """Index of *s*, or -1 when it was never interned."""
+        return self._index.get(s, -1)
+
+    def __getitem__(self, idx: int) -> str:
+        return self.strings[idx]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class ColumnarWorld:
+    """Rooms, exits and zone reset commands as parallel columns."""
+
+    def __init__(self) -> None:
+        self.strings = StringPool()
+
+        # Rooms
+        self.room_vnum = array(_INT)
+        self.room_zone = array(_INT)
+        self.room_sector = array(_INT)
+        self.exit_start = array(_INT, [0])
+
+        # Exits (exit_room is the row of the owning room)
+        self.exit_room = array(_INT)
+        self.exit_from = array(_INT)
+        self.exit_to = array(_INT)
+        self.exit_dir = array(_INT)
+        self.exit_flags = array(_INT)
+        self.exit_key = array(_INT)
+        self.exit_desc = array(_REF)
+        self.exit_keyword = array(_REF)
+
+        # Zones
+        self.zone_vnum = array(_INT)
+        self.reset_start = array(_INT, [0])
+
+        # Reset commands (reset_zone is the row of the owning zone)
+        self.reset_zone = array(_INT)
+        self.reset_cmd = array(_REF)
+        self.reset_if = array(_INT)
+        self.reset_arg1 = array(_INT)
+        self.reset_arg2 = array(_INT)
+        self.reset_arg3 = array(_INT)
+        self.reset_arg4 = array(_INT)
+
+    # ── Building ────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_uir(cls, uir: UIR) -> ColumnarWorld:
+        world = cls()
+        world.add_rooms(uir.rooms)
+        world.add_zones(uir.zones)
+        return world
+
+    @classmethod
+    def from_rooms(cls, rooms: Iterable[Room]) -> ColumnarWorld:
+        world = cls()
+        world.add_rooms(rooms)
+        return world
+
+    def feed(self, section: str, entities: list) -> None:
+        """Append one streamed chunk; sections other than rooms/zones are ignored."""
+        if section == "rooms":
+            self.add_rooms(entities)
+        elif section == "zones":
+            self.add_zones(entities)
+
+    def add_rooms(self, rooms: Iterable[Room]) -> None:
+        # Columns are filled with bulk extends over attrgetter maps, so
+        # the per-row work stays in C.
+        rooms = list(rooms)
+        base = len(self.room_vnum)
+        vnums = list(map(_vnum, rooms))
+        counts = [len(r.exits) for r in rooms]
+        exits = [e for r in rooms for e in r.exits]
+        intern_all = self.strings.intern_all
+
+        self.room_vnum.extend(vnums)
+        self.room_zone.extend(map(_zone_number, rooms))
+        self.room_sector.extend(map(_sector_type, rooms))
+        self.exit_start.extend(_offsets(self.exit_start[-1], counts))
+
+        self.exit_room.extend(_repeat_each(range(base, base + len(rooms)), counts))
+        self.exit_from.extend(_repeat_each(vnums, counts))
+        self.exit_to.extend(map(_destination, exits))
+        self.exit_dir.extend(map(_direction, exits))
+        self.exit_flags.extend(map(_door_flags, exits))
+        self.exit_key.extend(map(_key_vnum, exits))
+        self.exit_desc.extend(intern_all(map(_description, exits)))
+        self.exit_keyword.extend(intern_all(map(_keyword, exits)))
+
+    def add_zones(self, zones: Iterable[Zone]) -> None:
+        zones = list(zones)
+        base = len(self.zone_vnum)
+        counts = [len(z.reset_commands) for z in zones]
+        cmds = [c for z in zones for c in z.reset_commands]
+        intern_all = self.strings.intern_all
+
+        self.zone_vnum.extend(map(_vnum, zones))
+        self.reset_start.extend(_offsets(self.reset_start[-1], counts))
+
+        self.reset_zone.extend(_repeat_each(range(base, base + len(zones)), counts))
+        self.reset_cmd.extend(intern_all(map(_command, cmds)))
+        self.reset_if.extend(map(_if_flag, cmds))
+        self.reset_arg1.extend(map(_arg1, cmds))
+        self.reset_arg2.extend(map(_arg2, cmds))
+        self.reset_arg3.extend(map(_arg3, cmds))
+        self.reset_arg4.extend(map(_arg4, cmds))
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    @property
+    def n_rooms(self) -> int:
+        return len(self.room_vnum)
+
+    @property
+    def n_exits(self) -> int:
+        return len(self.exit_to)
+
+    @property
+    def n_resets(self) -> int:
+        return len(self.reset_cmd)
+
+    def room_exits(self, row: int) -> range:
+        """Exit rows of the room in row *row*."""
+        return range(self.exit_start[row], self.exit_start[row + 1])
+
+    def zone_resets(self, row: int) -> range:
+        """Reset command rows of the zone in row *row*."""
+        return range(self.reset_start[row], self.reset_start[row + 1])
+
+    def dangling_exits(self, room_vnums: set[int] | None = None) -> list[int]:
+        """Rows of exits whose (positive) destination is not a known room.
+
+        *room_vnums* defaults to the rooms in this world.
+        """
+        if room_vnums is None:
+            room_vnums = set(self.room_vnum)
+        return self.unresolved_exits("to", room_vnums)
+
+    def unresolved_exits(
+        self, column: str, known: set[int], rows: range | None = None,
+    ) -> list[int]:
+        """Rows of exits whose (positive) *column* value is not in *known*.
+
+        *rows* limits the search to a contiguous range of exit rows.
+        """
+        values = getattr(self, f"exit_{column}")
+        start = 0
+        if rows is not None:
+            start, values = rows.start, values[rows.start:rows.stop]
+        missing = {v for v in set(values).difference(known) if v > 0}
+        if not missing:
+            return []
+        return list(compress(
+            range(start, start + len(values)), map(missing.__contains__, values),
+        ))
+
+    def unresolved_resets(
+        self, command: str, known: set[int], column: str = "arg1",
+        rows: range | None = None,
+    ) -> list[int]:
+        """Rows of *command* resets whose *column* is not in *known*.
+
+        *rows* limits the search to a contiguous range of reset rows.
+        """
+        cmd = self.strings.lookup(command)
+        if cmd < 0:
+            return []
+        args = getattr(self, f"reset_{column}")
+        cmds = self.reset_cmd
+        if rows is None:
+            rows = range(len(cmds))
+        else:
+            cmds = cmds[rows.start:rows.stop]
+        matching = list(compress(rows, map(cmd.__eq__, cmds)))
+        if not matching or not {args[i] for i in matching}.difference(known):
+            return []
+        return [i for i in matching if args[i] not in known]
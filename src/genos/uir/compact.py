@@ -0,0 +1,115 @@
+"""Shared empty collections for finished UIR worlds.
+
+Most rooms, items and monsters leave several of their list/dict fields
+(``room_flags``, ``trigger_vnums``, ``extensions``, ...) empty, yet each
+instance allocates its own empty list or dict for them.  Adapters fill
+these collections in place while parsing, so the defaults must stay
+mutable; once a UIR is complete, :func:`compact_uir` swaps every empty
+one for the read-only :data:`EMPTY_LIST` / :data:`EMPTY_DICT` singletons.
+
+The sentinels are ``list``/``dict`` subclasses, compare equal to ``[]``
+and ``{}``, and pickle/copy back to the same singletons.  Mutating one
+raises ``TypeError``: assign a new collection to the field instead.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, NoReturn
+
+from .schema import UIR
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"shared empty {type(self).__base__.__name__} is read-only; "
+        "assign a new one to the field instead"
+    )
+
+
+class _EmptyList(list):
+    __slots__ = ()
+
+    def __new__(cls, *args: Any) -> Any:
+        # Rebuilding from contents (e.g. dataclasses.asdict) yields a
+        # regular, mutable list.
+        return list(*args) if args else super().__new__(cls)
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __copy__(self) -> _EmptyList:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _EmptyList:
+        return self
+
+    def __reduce__(self) -> str:
+        return "EMPTY_LIST"
+
+
+class _EmptyDict(dict):
+    __slots__ = ()
+
+    def __new__(cls, *args: Any) -> Any:
+        # Rebuilding from contents (e.g. dataclasses.asdict) yields a
+        # regular, mutable dict.
+        return dict(*args) if args else super().__new__(cls)
+
+    update = setdefault = pop = popitem = clear = _read_only
+    __setitem__ = __delitem__ = __ior__ = _read_only
+
+    def __copy__(self) -> _EmptyDict:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _EmptyDict:
+        return self
+
+    def __reduce__(self) -> str:
+        return "EMPTY_DICT"
+
+
+EMPTY_LIST: list = _EmptyList()
+EMPTY_DICT: dict = _EmptyDict()
+
+_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def compact_uir(uir: UIR) -> UIR:
+    """Replace empty collections of all world entities with the sentinels.
+
+    Covers every entity in the UIR's list sections and the entities
+    nested in them (exits, extra descriptions, reset commands, ...).
+    Returns *uir* for convenience.
+    """
+    for f in dataclasses.fields(uir):
+        value = getattr(uir, f.name)
+        if type(value) is list:
+            for entity in value:
+                compact(entity)
+    return uir
+
+
+def compact(entity: Any) -> None:
+    """Compact one dataclass instance and the dataclasses nested in it."""
+    cls = type(entity)
+    names = _field_names.get(cls)
+    if names is None:
+        if not dataclasses.is_dataclass(cls):
+            return
+        names = _field_names[cls] = tuple(f.name for f in dataclasses.fields(cls))
+    for name in names:
+        value = getattr(entity, name)
+        t = type(value)
+        if t is list:
+            if value:
+                for item in value:
+                    if dataclasses.is_dataclass(type(item)):
+                        compact(item)
+            else:
+                setattr(entity, name, EMPTY_LIST)
+        elif t is dict:
+            if not value:
+                setattr(entity, name, EMPTY_DICT)
+        elif dataclasses.is_dataclass(t):
+            compact(value)
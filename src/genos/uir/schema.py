@@ -2,6 +2,12 @@
 
 Defines the canonical intermediate format for migrating MUD game data
 from any source (CircleMUD, DikuMUD, etc.) to the GenOS platform.
+
+The per-world entity classes (rooms, exits, items, monsters, reset
+commands, extra descriptions) use ``__slots__``: a world holds hundreds
+of thousands of them, and a slotted instance has no per-instance
+``__dict__``.  See :mod:`genos.uir.compact` for sharing their empty
+collections as well.
 """
 
 from __future__ import annotations
@@ -56,7 +62,7 @@ class GameMetadata:
 
 # ── Room / Exit ─────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Exit:
     direction: int  # 0-9: N E S W U D NW NE SE SW
     destination: int  # room vnum (or -1 for none)
@@ -66,13 +72,13 @@ class Exit:
     key_vnum: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtraDescription:
     keywords: str = ""
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     vnum: int
     name: str = ""
@@ -94,7 +100,7 @@ class ItemAffect:
     modifier: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     vnum: int
     keywords: str = ""
@@ -127,7 +133,7 @@ class DiceRoll:
         return f"{self.num}d{self.size}+{self.bonus}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Monster:
     vnum: int
     keywords: str = ""
@@ -181,7 +187,7 @@ class CombatSystem:
 
 # ── Zone ────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ZoneResetCommand:
     command: str  # M, O, G, E, P, D, R, T, V
     if_flag: int = 0
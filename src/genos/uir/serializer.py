@@ -0,0 +1,147 @@
+"""UIR serialization primitives.
+
+:func:`to_plain` turns UIR dataclasses into the dicts/lists that YAML
+and JSON understand.  Instead of walking ``dataclasses.fields`` on every
+node, a converter function is generated once per dataclass and cached;
+fields annotated with a scalar type are copied as-is, everything else
+goes through :func:`to_plain` again.
+
+The ``write_*`` helpers emit one UIR top-level field at a time, and list
+sections in chunks of :data:`CHUNK_SIZE` entities, so only one chunk is
+ever converted to plain data at once.  YAML uses the
+libyaml ``CDumper`` when PyYAML was built with it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import IO, Any, Callable, Iterable
+
+import yaml
+
+# libyaml emitter when available; the pure-Python one otherwise.
+YAML_DUMPER: type = getattr(yaml, "CDumper", yaml.Dumper)
+
+YAML_OPTIONS: dict[str, Any] = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+}
+
+# Entities converted and dumped per call when writing a list section.
+CHUNK_SIZE = 256
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_SCALAR_ANNOTATIONS = frozenset({
+    "str", "int", "float", "bool",
+    "str | None", "int | None", "float | None", "bool | None",
+})
+
+_converters: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
+# ── Plain data conversion ────────────────────────────────────────────────
+
+def to_plain(obj: Any) -> Any:
+    """Convert a UIR dataclass tree to plain dicts/lists for serialization."""
+    t = type(obj)
+    if t in _SCALAR_TYPES:
+        return obj
+    converter = _converters.get(t)
+    if converter is not None:
+        return converter(obj)
+    if t is list or t is tuple:
+        return [to_plain(item) for item in obj]
+    if t is dict:
+        return {k: to_plain(v) for k, v in obj.items()}
+    if dataclasses.is_dataclass(t):
+        return _make_converter(t)(obj)
+    # Subclasses, e.g. the shared empty collections of genos.uir.compact
+    if isinstance(obj, (list, tuple)):
+        return [to_plain(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: to_plain(v) for k, v in obj.items()}
+    return obj
+
+
+def _make_converter(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Generate (and cache) a field-by-field dict builder for *cls*."""
+    items = []
+    for f in dataclasses.fields(cls):
+        if f.type in _SCALAR_ANNOTATIONS:
+            items.append(f"{f.name!r}: o.{f.name}")
+        else:
+            items.append(f"{f.name!r}: to_plain(o.{f.name})")
+    source = f"def convert(o):\n    return {{{', '.join(items)}}}\n"
+    namespace: dict[str, Any] = {"to_plain": to_plain}
+    exec(source, namespace)
+    converter = namespace["convert"]
+    _converters[cls] = converter
+    return converter
+
+
+def _chunks(entities: list) -> Iterable[list]:
+    for start in range(0, len(entities), CHUNK_SIZE):
+        yield entities[start:start + CHUNK_SIZE]
+
+
+# ── YAML ─────────────────────────────────────────────────────────────────
+
+def write_yaml_field(out: IO[str], name: str, value: Any) -> None:
+    """Write one top-level ``name: value`` mapping entry."""
+    if isinstance(value, list) and value:
+        out.write(f"{name}:\n")
+        write_yaml_items(out, value)
+    else:
+        yaml.dump({name: to_plain(value)}, out, Dumper=YAML_DUMPER, **YAML_OPTIONS)
+
+
+def write_yaml_items(out: IO[str], entities: list) -> None:
+    """Write *entities* as block sequence items of a top-level key.
+
+    Sequences under a top-level key are not indented, so consecutive
+    list dumps concatenate to exactly the nested rendering.
+    """
+    for chunk in _chunks(entities):
+        yaml.dump(
+            [to_plain(e) for e in chunk], out, Dumper=YAML_DUMPER, **YAML_OPTIONS,
+        )
+
+
+# ── JSON ─────────────────────────────────────────────────────────────────
+
+def write_json_field(out: IO[str], index: int, name: str) -> None:
+    """Write the separator and key of the *index*-th top-level field."""
+    out.write(",\n" if index else "\n")
+    out.write(f"  {json.dumps(name)}: ")
+
+
+def write_json_value(out: IO[str], value: Any) -> None:
+    """Write a top-level field value as ``json.dump(indent=2)`` would."""
+    if isinstance(value, list) and value:
+        out.write("[\n")
+        write_json_items(out, value, first=True)
+        out.write("\n  ]")
+    else:
+        # Dumped one level deep, the value is already indented for its
+        # place in the document; strip the wrapping "[\n  " and "\n]".
+        out.write(_dumps([to_plain(value)])[4:-2])
+
+
+def write_json_items(out: IO[str], entities: list, first: bool) -> None:
+    """Write *entities* as elements of a top-level JSON array.
+
+    Pass ``first=False`` when elements were already written to *out*.
+    """
+    for chunk in _chunks(entities):
+        if not first:
+            out.write(",\n")
+        first = False
+        # Two levels deep, elements carry the 4-space indent of a
+        # top-level array; strip the wrapping "[\n  [\n" and "\n  ]\n]".
+        out.write(_dumps([[to_plain(e) for e in chunk]])[6:-6])
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, indent=2, ensure_ascii=False)
@@ -0,0 +1,283 @@
+"""Binary UIR snapshots.
+
+A snapshot stores a UIR in a compact binary form that loads far faster
+than ``uir.yaml``/``uir.json`` and rebuilds the ``genos.uir.schema``
+dataclasses directly, so ``genos compile`` can regenerate artifacts
+without re-running an adapter.
+
+Layout (integers are unsigned LEB128 varints unless noted)::
+
+    magic "GENOSUIR" | u16 format version
+    string table:  count, then (byte length, UTF-8 bytes) per string
+    class table:   count, then (name, field count, field names) per class
+    sections:      count, then per UIR field:
+                     name, kind (0 = single value, 1 = list),
+                     single: u32 length + value
+                     list:   record count, then u32 length + value per record
+
+Every string (names included) is written once to the string table and
+referenced by index.  Values are tagged: None, bools, zigzag-varint
+ints, little-endian doubles, string references, lists, tuples, dicts and
+dataclass instances (class index followed by the field values in
+class-table order).  The length prefix of each record lets a reader skip
+entities without decoding them.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import struct
+from pathlib import Path
+from typing import Any, Callable
+
+from . import schema
+from .schema import UIR
+
+MAGIC = b"GENOSUIR"
+FORMAT_VERSION = 1
+
+# Value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _TUPLE, _DICT, _OBJ = range(10)
+
+# Section kinds
+_SINGLE, _RECORDS = 0, 1
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_DOUBLE = struct.Struct("<d")
+
+
+# ── Writer ───────────────────────────────────────────────────────────────
+
+def write_snapshot(uir: UIR, path: str | Path) -> None:
+    """Write *uir* to *path* as a binary snapshot."""
+    enc = _Encoder()
+    body = bytearray()
+    fields = dataclasses.fields(uir)
+    _write_uvarint(body, len(fields))
+    for f in fields:
+        value = getattr(uir, f.name)
+        _write_uvarint(body, enc.intern(f.name))
+        if isinstance(value, list):
+            body.append(_RECORDS)
+            _write_uvarint(body, len(value))
+            for entity in value:
+                enc.record(body, entity)
+        else:
+            body.append(_SINGLE)
+            enc.record(body, value)
+
+    # Class names and field names are interned while the table is
+    # built, so it has to be encoded before the string table.
+    classes = bytearray()
+    _write_uvarint(classes, len(enc.classes))
+    for cls, (_, names) in enc.classes.items():
+        _write_uvarint(classes, enc.intern(cls.__name__))
+        _write_uvarint(classes, len(names))
+        for name in names:
+            _write_uvarint(classes, enc.intern(name))
+
+    strings = bytearray()
+    _write_uvarint(strings, len(enc.strings))
+    for s in enc.strings:
+        raw = s.encode("utf-8", "surrogatepass")
+        _write_uvarint(strings, len(raw))
+        strings += raw
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_U16.pack(FORMAT_VERSION))
+        f.write(strings)
+        f.write(classes)
+        f.write(body)
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        # class -> (index, field names)
+        self.classes: dict[type, tuple[int, tuple[str, ...]]] = {}
+
+    def intern(self, s: str) -> int:
+        idx = self.strings.get(s)
+        if idx is None:
+            idx = self.strings[s] = len(self.strings)
+        return idx
+
+    def record(self, out: bytearray, value: Any) -> None:
+        buf = bytearray()
+        self.value(buf, value)
+        out += _U32.pack(len(buf))
+        out += buf
+
+    def value(self, buf: bytearray, v: Any) -> None:
+        t = type(v)
+        if t is str:
+            buf.append(_STR)
+            _write_uvarint(buf, self.intern(v))
+        elif t is int:
+            buf.append(_INT)
+            _write_uvarint(buf, v << 1 if v >= 0 else (-v << 1) - 1)
+        elif v is None:
+            buf.append(_NONE)
+        elif t is bool:
+            buf.append(_TRUE if v else _FALSE)
+        elif t is list or t is tuple:
+            buf.append(_LIST if t is list else _TUPLE)
+            _write_uvarint(buf, len(v))
+            for item in v:
+                self.value(buf, item)
+        elif t is dict:
+            buf.append(_DICT)
+            _write_uvarint(buf, len(v))
+            for key, item in v.items():
+                self.value(buf, key)
+                self.value(buf, item)
+        elif t is float:
+            buf.append(_FLOAT)
+            buf += _DOUBLE.pack(v)
+        elif dataclasses.is_dataclass(t):
+            entry = self.classes.get(t)
+            if entry is None:
+                names = tuple(f.name for f in dataclasses.fields(t))
+                entry = self.classes[t] = (len(self.classes), names)
+            buf.append(_OBJ)
+            _write_uvarint(buf, entry[0])
+            for name in entry[1]:
+                self.value(buf, getattr(v, name))
+        elif isinstance(v, (list, dict)):
+            # Subclasses, e.g. the shared empty collections of
+            # genos.uir.compact
+            self.value(buf, dict(v) if isinstance(v, dict) else list(v))
+        else:
+            raise TypeError(f"Cannot snapshot value of type {t.__name__}")
+
+
+def _write_uvarint(buf: bytearray, n: int) -> None:
+    while n >= 0x80:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+# ── Loader ───────────────────────────────────────────────────────────────
+
+def load_snapshot(path: str | Path) -> UIR:
+    """Load a UIR written by :func:`write_snapshot`."""
+    data = Path(path).read_bytes()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a GenOS UIR snapshot: {path}")
+    version, = _U16.unpack_from(data, len(MAGIC))
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot format version {version} in {path} "
+            f"(expected {FORMAT_VERSION})"
+        )
+    return _Decoder(data, len(MAGIC) + _U16.size).uir()
+
+
+class _Decoder:
+    def __init__(self, data: bytes, pos: int) -> None:
+        self.data = data
+        self.pos = pos
+        self.strings: list[str] = []
+        self.classes: list[tuple[Callable[[list], Any], int]] = []
+
+    def uir(self) -> UIR:
+        data = self.data
+        for _ in range(self.uvarint()):
+            n = self.uvarint()
+            self.strings.append(
+                data[self.pos:self.pos + n].decode("utf-8", "surrogatepass")
+            )
+            self.pos += n
+
+        for _ in range(self.uvarint()):
+            name = self.strings[self.uvarint()]
+            names = [self.strings[self.uvarint()] for _ in range(self.uvarint())]
+            self.classes.append((_class_factory(name, names), len(names)))
+
+        sections: dict[str, Any] = {}
+        for _ in range(self.uvarint()):
+            name = self.strings[self.uvarint()]
+            kind = data[self.pos]
+            self.pos += 1
+            if kind == _RECORDS:
+                records = []
+                for _ in range(self.uvarint()):
+                    self.pos += _U32.size  # record length; not needed here
+                    records.append(self.value())
+                sections[name] = records
+            else:
+                self.pos += _U32.size
+                sections[name] = self.value()
+
+        known = {f.name for f in dataclasses.fields(UIR)}
+        return UIR(**{k: v for k, v in sections.items() if k in known})
+
+    def uvarint(self) -> int:
+        data = self.data
+        b = data[self.pos]
+        self.pos += 1
+        if b < 0x80:
+            return b
+        n = b & 0x7F
+        shift = 7
+        while True:
+            b = data[self.pos]
+            self.pos += 1
+            n |= (b & 0x7F) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+
+    def value(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            return self.strings[self.uvarint()]
+        if tag == _INT:
+            n = self.uvarint()
+            return (n >> 1) ^ -(n & 1)
+        if tag == _OBJ:
+            factory, n_fields = self.classes[self.uvarint()]
+            value = self.value
+            return factory([value() for _ in range(n_fields)])
+        if tag == _LIST or tag == _TUPLE:
+            value = self.value
+            items = [value() for _ in range(self.uvarint())]
+            return items if tag == _LIST else tuple(items)
+        if tag == _DICT:
+            value = self.value
+            result = {}
+            for _ in range(self.uvarint()):
+                key = value()
+                result[key] = value()
+            return result
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _FLOAT:
+            v, = _DOUBLE.unpack_from(self.data, self.pos)
+            self.pos += _DOUBLE.size
+            return v
+        raise ValueError(f"Corrupt snapshot: unknown value tag {tag}")
+
+
+def _class_factory(name: str, names: list[str]) -> Callable[[list], Any]:
+    """Build a constructor for schema class *name* from ordered field values."""
+    cls = getattr(schema, name, None)
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+        raise ValueError(f"Snapshot references unknown UIR class {name!r}")
+    current = [f.name for f in dataclasses.fields(cls)]
+    if names == current:
+        return lambda values: cls(*values)
+    # Written by an older/newer schema: match fields by name and let
+    # the dataclass defaults fill in the rest.
+    known = set(current)
+    return lambda values: cls(
+        **{k: v for k, v in zip(names, values) if k in known}
+    )
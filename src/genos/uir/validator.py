@@ -1,99 +1,541 @@
-"""UIR validation utilities."""
+"""UIR validation utilities.
+
+:func:`validate_uir` checks every cross-reference of a UIR world in one
+sweep over its sections.  Known vnums come from a :class:`VnumIndex`,
+which callers may build once and reuse; exit and reset-command checks
+run over a :class:`ColumnarWorld`.
+
+Problems are collected as :class:`Diagnostic` records (code, entity,
+field, target) rather than messages: formatting happens only when
+:attr:`ValidationResult.warnings` or :meth:`Diagnostic.message` is
+asked for, and ``max_per_code`` bounds how many records of each code
+are kept on badly broken worlds (all of them are still counted).
+
+Rooms, items, mobs and reset commands can be checked zone by zone in
+worker processes (``workers=N``).  The workers are forked, so they read
+the parent's UIR, columns and index copy-on-write instead of receiving
+pickled copies, and their results are merged back in serial order.
+"""
 
 from __future__ import annotations
 
+import os
+from collections import Counter
 from dataclasses import dataclass, field
+from itertools import groupby, starmap
+from operator import attrgetter, itemgetter
+from typing import Iterable
 
-from .schema import UIR
+from .columnar import ColumnarWorld
+from .schema import UIR, Quest, Shop
 
-# Default command-to-reference-type mapping.
+# Default command-to-reference-type mapping for reset command arg1.
 # Adapters may provide an alternative mapping for their reset commands.
 DEFAULT_CMD_REF_MAP: dict[str, str] = {
     "M": "mob",   # arg1 references a mob vnum
     "O": "item",  # arg1 references an item vnum
 }
 
+# Reset command arguments that reference other entities, per command
+# (CircleMUD/tbaMUD semantics).
+DEFAULT_RESET_REFS: dict[str, tuple[tuple[str, str], ...]] = {
+    "M": (("arg1", "mob"), ("arg3", "room")),    # load mob into room
+    "O": (("arg1", "item"), ("arg3", "room")),   # load object into room
+    "G": (("arg1", "item"),),                    # give object to last mob
+    "E": (("arg1", "item"),),                    # equip last mob
+    "P": (("arg1", "item"), ("arg3", "item")),   # put object in container
+    "D": (("arg1", "room"),),                    # set door state
+    "R": (("arg1", "room"), ("arg2", "item")),   # remove object from room
+    "T": (("arg2", "trigger"),),                 # attach trigger
+}
+
+# Entity type referenced by Quest.target_vnum, per quest type (tbaMUD
+# AQ_OBJ_FIND, AQ_ROOM_FIND, AQ_MOB_FIND, AQ_MOB_KILL, AQ_MOB_SAVE,
+# AQ_OBJ_RETURN, AQ_ROOM_CLEAR).
+DEFAULT_QUEST_TARGETS: dict[int, str] = {
+    0: "item", 1: "room", 2: "mob", 3: "mob", 4: "mob", 5: "item", 6: "room",
+}
+
+_vnum = attrgetter("vnum")
+
+
+# ── Vnum index ───────────────────────────────────────────────────────────
 
 @dataclass
+class VnumIndex:
+    """Sets of the vnums defined in a UIR, per entity type."""
+
+    rooms: set[int] = field(default_factory=set)
+    items: set[int] = field(default_factory=set)
+    mobs: set[int] = field(default_factory=set)
+    triggers: set[int] = field(default_factory=set)
+    zones: set[int] = field(default_factory=set)
+    shops: set[int] = field(default_factory=set)
+    quests: set[int] = field(default_factory=set)
+
+    @classmethod
+    def from_uir(
+        cls, uir: UIR, columns: ColumnarWorld | None = None,
+    ) -> VnumIndex:
+        return cls(
+            rooms=set(columns.room_vnum if columns else map(_vnum, uir.rooms)),
+            items=set(map(_vnum, uir.items)),
+            mobs=set(map(_vnum, uir.monsters)),
+            triggers=set(map(_vnum, uir.triggers)),
+            zones=set(map(_vnum, uir.zones)),
+            shops=set(map(_vnum, uir.shops)),
+            quests=set(map(_vnum, uir.quests)),
+        )
+
+    def of(self, kind: str) -> set[int]:
+        """Vnums of entity type *kind* ("room", "item", "mob", ...)."""
+        return getattr(self, f"{kind}s")
+
+
+# ── Diagnostics ──────────────────────────────────────────────────────────
+
+_LABELS: dict[str, str] = {
+    "uir": "UIR", "room": "Room", "item": "Item", "mob": "Monster",
+    "zone": "Zone", "shop": "Shop", "quest": "Quest",
+}
+
+_MESSAGES: dict[str, str] = {
+    "exit-room": "{label} {vnum}: exit dir {dir} points to non-existent room {target}",
+    "exit-key": "{label} {vnum}: exit dir {dir} key item {target} not found",
+    "missing-trigger": "{label} {vnum}: trigger {target} not found",
+    "reset-ref": "{label} {vnum}: {cmd} cmd references non-existent {kind} {target}",
+    "shop-keeper": "{label} {vnum}: keeper mob {target} not found",
+    "shop-room": "{label} {vnum}: room {target} not found",
+    "shop-item": "{label} {vnum}: sold item {target} not found",
+    "quest-mob": "{label} {vnum}: questmaster mob {target} not found",
+    "quest-target": "{label} {vnum}: target {kind} {target} not found",
+    "quest-reward": "{label} {vnum}: reward item {target} not found",
+    "quest-chain": "{label} {vnum}: {field} {target} not found",
+    "no-rooms": "UIR has no rooms",
+}
+
+
+@dataclass(slots=True)
+class Diagnostic:
+    """One unresolved reference found by :func:`validate_uir`.
+
+    Entity *vnum* of type *entity* refers through *field* to vnum
+    *target* of type *ref*, which does not exist.  *field* is ``D<dir>``
+    for exits and ``<cmd>.<arg>`` for reset commands.
+    """
+
+    code: str
+    entity: str
+    vnum: int
+    field: str
+    ref: str
+    target: int
+
+    def message(self) -> str:
+        return _MESSAGES[self.code].format(
+            label=_LABELS.get(self.entity, self.entity), vnum=self.vnum,
+            field=self.field, kind=self.ref, target=self.target,
+            dir=self.field[1:], cmd=self.field.partition(".")[0],
+        )
+
+
+@dataclass(init=False)
 class ValidationResult:
-    valid: bool = True
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+    valid: bool
+    errors: list[str]
+    diagnostics: list[Diagnostic]
+    # Diagnostics found per code, including those beyond max_per_code.
+    counts: dict[str, int]
+    max_per_code: int | None
+
+    def __init__(
+        self,
+        valid: bool = True,
+        errors: list[str] | None = None,
+        warnings: list[str] | None = None,
+        diagnostics: list[Diagnostic] | None = None,
+        counts: dict[str, int] | None = None,
+        max_per_code: int | None = None,
+    ) -> None:
+        self.valid = valid
+        self.errors = [] if errors is None else errors
+        self.diagnostics = [] if diagnostics is None else diagnostics
+        self.counts = {} if counts is None else counts
+        self.max_per_code = max_per_code
+        # Free-text warnings, plus the messages of the first
+        # ``_formatted`` diagnostics once warnings has been read.
+        self._warnings = [] if warnings is None else warnings
+        self._formatted = 0
 
     def add_error(self, msg: str) -> None:
         self.errors.append(msg)
         self.valid = False
 
     def add_warning(self, msg: str) -> None:
+        """Record a free-text warning that has no diagnostic code."""
         self.warnings.append(msg)
 
+    def add(
+        self, code: str, entity: str, vnum: int, field: str, ref: str,
+        target: int,
+    ) -> None:
+        self.extend([(code, entity, vnum, field, ref, target)])
+
+    def extend(self, entries: list[tuple]) -> None:
+        """Add diagnostics given as tuples of their fields, in order."""
+        counts = self.counts
+        cap = self.max_per_code
+        if cap is None:
+            for code, n in Counter(map(itemgetter(0), entries)).items():
+                counts[code] = counts.get(code, 0) + n
+            self.diagnostics.extend(starmap(Diagnostic, entries))
+            return
+        append = self.diagnostics.append
+        for entry in entries:
+            code = entry[0]
+            n = counts.get(code, 0)
+            counts[code] = n + 1
+            if n < cap:
+                append(Diagnostic(*entry))
+
+    @property
+    def warnings(self) -> list[str]:
+        """Free-text warnings and the messages of the stored diagnostics.
+
+        Diagnostics are formatted on first access; the list is kept, so
+        appending to it works like :meth:`add_warning`.
+        """
+        new = self.diagnostics[self._formatted:]
+        if new:
+            self._warnings.extend(d.message() for d in new)
+            self._formatted = len(self.diagnostics)
+        return self._warnings
+
+    @property
+    def warning_count(self) -> int:
+        free = len(self._warnings) - self._formatted
+        return sum(self.counts.values()) + free
+
+
+# ── Validation ───────────────────────────────────────────────────────────
 
 def validate_uir(
     uir: UIR,
     cmd_ref_map: dict[str, str] | None = None,
+    columns: ColumnarWorld | None = None,
+    index: VnumIndex | None = None,
+    max_per_code: int | None = None,
+    reset_refs: dict[str, tuple[tuple[str, str], ...]] | None = None,
+    quest_targets: dict[int, str] | None = None,
+    workers: int = 1,
 ) -> ValidationResult:
-    """Validate a UIR instance for internal consistency."""
-    result = ValidationResult()
-
-    room_vnums = {r.vnum for r in uir.rooms}
-    item_vnums = {i.vnum for i in uir.items}
-    mob_vnums = {m.vnum for m in uir.monsters}
-    trigger_vnums = {t.vnum for t in uir.triggers}
-
-    # Check room exits point to valid rooms
-    for room in uir.rooms:
-        for exit_ in room.exits:
-            if exit_.destination > 0 and exit_.destination not in room_vnums:
-                result.add_warning(
-                    f"Room {room.vnum}: exit dir {exit_.direction} "
-                    f"points to non-existent room {exit_.destination}"
-                )
-        for tv in room.trigger_vnums:
-            if tv not in trigger_vnums:
-                result.add_warning(
-                    f"Room {room.vnum}: trigger {tv} not found"
-                )
-
-    # Check item triggers
-    for item in uir.items:
-        for tv in item.trigger_vnums:
-            if tv not in trigger_vnums:
-                result.add_warning(
-                    f"Item {item.vnum}: trigger {tv} not found"
-                )
-
-    # Check monster triggers
-    for mob in uir.monsters:
-        for tv in mob.trigger_vnums:
-            if tv not in trigger_vnums:
-                result.add_warning(
-                    f"Monster {mob.vnum}: trigger {tv} not found"
-                )
-
-    # Check zone reset commands reference valid entities
-    ref_map = cmd_ref_map or DEFAULT_CMD_REF_MAP
-    vnum_sets = {"mob": mob_vnums, "item": item_vnums}
-    for zone in uir.zones:
-        for cmd in zone.reset_commands:
-            ref_type = ref_map.get(cmd.command)
-            if ref_type and ref_type in vnum_sets:
-                if cmd.arg1 not in vnum_sets[ref_type]:
-                    result.add_warning(
-                        f"Zone {zone.vnum}: {cmd.command} cmd references "
-                        f"non-existent {ref_type} {cmd.arg1}"
-                    )
-
-    # Check shops reference valid mobs
-    for shop in uir.shops:
-        if shop.keeper_vnum >= 0 and shop.keeper_vnum not in mob_vnums:
-            result.add_warning(
-                f"Shop {shop.vnum}: keeper mob {shop.keeper_vnum} not found"
-            )
+    """Validate a UIR instance for internal consistency.
+
+    Pass *columns* and/or *index* to reuse ones already built from
+    *uir*.  *reset_refs* and *quest_targets* override
+    :data:`DEFAULT_RESET_REFS` and :data:`DEFAULT_QUEST_TARGETS`; the
+    older *cmd_ref_map* checks only arg1 of the commands it names.
+
+    With *workers* > 1 (``0`` = all CPUs) rooms, items, mobs and reset
+    commands are checked zone by zone in that many forked processes; the
+    diagnostics are identical to a serial run.
+    """
+    result = ValidationResult(max_per_code=max_per_code)
+    if columns is None:
+        columns = ColumnarWorld.from_uir(uir)
+    if index is None:
+        index = VnumIndex.from_uir(uir, columns)
+    if reset_refs is None:
+        if cmd_ref_map:
+            reset_refs = {c: (("arg1", r),) for c, r in cmd_ref_map.items()}
+        else:
+            reset_refs = DEFAULT_RESET_REFS
+
+    ctx = _Context(uir, columns, index, reset_refs)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    found = _check_sharded(ctx, workers) if workers > 1 else None
+    if found is None:
+        found = {
+            section: _SECTION_CHECKS[section](ctx, [range(_section_len(ctx, section))])
+            for section in _SECTION_CHECKS
+        }
+    for section in _SECTION_CHECKS:
+        keyed = found[section]
+        keyed.sort(key=itemgetter(0))
+        result.extend(list(map(itemgetter(1), keyed)))
+    _check_shops(uir.shops, index, result)
+    _check_quests(
+        uir.quests, index, quest_targets or DEFAULT_QUEST_TARGETS, result,
+    )
 
     # Basic sanity checks
     if not uir.rooms:
-        result.add_warning("UIR has no rooms")
+        result.add("no-rooms", "uir", 0, "rooms", "room", -1)
     if not uir.source_mud:
         result.add_error("UIR missing source_mud info")
 
     return result
+
+
+@dataclass
+class _Context:
+    """What the section checks read; shared read-only with workers."""
+
+    uir: UIR
+    columns: ColumnarWorld
+    index: VnumIndex
+    reset_refs: dict[str, tuple[tuple[str, str], ...]]
+
+
+# Section checks take the entity rows to check and return ``(key,
+# entry)`` pairs; sorting by key gives the serial diagnostic order.
+
+def _check_rooms(ctx: _Context, shard: list[range]) -> list[tuple]:
+    """Exit destinations and keys, and room triggers, by room row."""
+    columns, index = ctx.columns, ctx.index
+    exit_room, exit_from, exit_dir, exit_start = (
+        columns.exit_room, columns.exit_from, columns.exit_dir,
+        columns.exit_start,
+    )
+    rooms = ctx.uir.rooms
+    triggers = index.triggers
+    found: list[tuple] = []
+    for rows in shard:
+        exits = range(exit_start[rows.start], exit_start[rows.stop])
+        for code, column, kind, known in (
+            ("exit-room", "to", "room", index.rooms),
+            ("exit-key", "key", "item", index.items),
+        ):
+            values = getattr(columns, f"exit_{column}")
+            found += [
+                (exit_room[i], (code, "room", exit_from[i],
+                                _exit_field(exit_dir[i]), kind, values[i]))
+                for i in columns.unresolved_exits(column, known, exits)
+            ]
+        for row in rows:
+            room = rooms[row]
+            if room.trigger_vnums:
+                for tv in room.trigger_vnums:
+                    if tv not in triggers:
+                        found.append((row, (
+                            "missing-trigger", "room", room.vnum,
+                            "trigger_vnums", "trigger", tv,
+                        )))
+    return found
+
+
+_EXIT_FIELDS: dict[int, str] = {}
+
+
+def _exit_field(direction: int) -> str:
+    name = _EXIT_FIELDS.get(direction)
+    if name is None:
+        name = _EXIT_FIELDS[direction] = f"D{direction}"
+    return name
+
+
+def _trigger_check(kind: str, section: str):
+    def check(ctx: _Context, shard: list[range]) -> list[tuple]:
+        entities = getattr(ctx.uir, section)
+        triggers = ctx.index.triggers
+        return [
+            (row, ("missing-trigger", kind, entity.vnum, "trigger_vnums",
+                   "trigger", tv))
+            for rows in shard for row in rows
+            if (entity := entities[row]).trigger_vnums
+            for tv in entity.trigger_vnums if tv not in triggers
+        ]
+    return check
+
+
+def _check_resets(ctx: _Context, shard: list[range]) -> list[tuple]:
+    """Reset command arguments, by command row and argument."""
+    columns, index = ctx.columns, ctx.index
+    strings, zone_vnum, reset_zone, reset_cmd, reset_start = (
+        columns.strings, columns.zone_vnum, columns.reset_zone,
+        columns.reset_cmd, columns.reset_start,
+    )
+    fields: dict[tuple[int, str], str] = {}
+    found: list[tuple] = []
+    for rows in shard:
+        resets = range(reset_start[rows.start], reset_start[rows.stop])
+        for command, refs in ctx.reset_refs.items():
+            for column, kind in refs:
+                args = getattr(columns, f"reset_{column}")
+                for i in columns.unresolved_resets(
+                    command, index.of(kind), column, resets,
+                ):
+                    # Negative arguments are unused ("nothing")
+                    if args[i] < 0:
+                        continue
+                    key = (reset_cmd[i], column)
+                    fld = fields.get(key)
+                    if fld is None:
+                        fld = fields[key] = f"{strings[reset_cmd[i]]}.{column}"
+                    found.append(((i, column), (
+                        "reset-ref", "zone", zone_vnum[reset_zone[i]], fld,
+                        kind, args[i],
+                    )))
+    return found
+
+
+# Sharded sections, in diagnostic order.
+_SECTION_CHECKS = {
+    "rooms": _check_rooms,
+    "items": _trigger_check("item", "items"),
+    "monsters": _trigger_check("mob", "monsters"),
+    "zones": _check_resets,
+}
+
+
+def _section_len(ctx: _Context, section: str) -> int:
+    return len(getattr(ctx.uir, section))
+
+
+# ── Zone shards ──────────────────────────────────────────────────────────
+
+# Worlds with fewer rows to check than this (rooms, items, mobs and
+# zones together) are validated serially: forking the pool costs more
+# than the checks.
+_MIN_SHARDED_ROWS = 20_000
+
+
+def _zone_keys(ctx: _Context, section: str) -> Iterable[int]:
+    """Zone of each row of *section*.
+
+    Rooms carry their zone_number and zones their own vnum; items and
+    mobs are assigned to zone ``vnum // 100``.  Worlds with hashed vnums
+    (LP-MUD) get a zone per entity here; :func:`_merge_shards` bounds
+    the tasks that makes.
+    """
+    if section == "rooms":
+        return ctx.columns.room_zone
+    if section == "zones":
+        return ctx.columns.zone_vnum
+    return (v // 100 for v in map(_vnum, getattr(ctx.uir, section)))
+
+
+def _zone_shards(keys: Iterable[int]) -> list[list[range]]:
+    """Row ranges of each zone, zones in order of first appearance."""
+    shards: dict[int, list[range]] = {}
+    start = 0
+    for zone, run in groupby(keys):
+        stop = start + sum(1 for _ in run)
+        shards.setdefault(zone, []).append(range(start, stop))
+        start = stop
+    return list(shards.values())
+
+
+def _merge_shards(shards: list[list[range]], parts: int) -> list[list[range]]:
+    """Join consecutive *shards* into at most *parts* of similar size."""
+    if len(shards) <= parts:
+        return shards
+    total = sum(len(rows) for shard in shards for rows in shard)
+    merged: list[list[range]] = []
+    current: list[range] = []
+    size = 0
+    for shard in shards:
+        current += shard
+        size += sum(map(len, shard))
+        if size * parts >= total * (len(merged) + 1):
+            merged.append(current)
+            current = []
+    if current:
+        merged.append(current)
+    return merged
+
+
+# Context of the running sharded validation, inherited by forked workers
+# instead of being pickled to each of them.
+_SHARED: _Context | None = None
+
+
+def _check_shard(section: str, shard: list[range]) -> list[tuple]:
+    return _SECTION_CHECKS[section](_SHARED, shard)
+
+
+def _check_sharded(
+    ctx: _Context, workers: int,
+) -> dict[str, list[tuple]] | None:
+    """Run the section checks per zone shard.
+
+    Returns None, for a serial run, without ``fork`` or when the world
+    is smaller than :data:`_MIN_SHARDED_ROWS`.
+    """
+    global _SHARED
+    rows = sum(_section_len(ctx, section) for section in _SECTION_CHECKS)
+    if rows < _MIN_SHARDED_ROWS:
+        return None
+    # Imported here: multiprocessing is slow to import and serial
+    # validation never needs it.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    parts = workers * 4
+    tasks = [
+        (section, shard)
+        for section in _SECTION_CHECKS
+        for shard in _merge_shards(_zone_shards(_zone_keys(ctx, section)), parts)
+    ]
+    found: dict[str, list[tuple]] = {section: [] for section in _SECTION_CHECKS}
+    if not tasks:
+        return found
+    _SHARED = ctx
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            mp_context=multiprocessing.get_context("fork"),
+        ) as pool:
+            outcomes = pool.map(
+                _check_shard, *zip(*tasks),
+                chunksize=max(1, len(tasks) // (workers * 4)),
+            )
+            for (section, _), keyed in zip(tasks, outcomes):
+                found[section] += keyed
+    finally:
+        _SHARED = None
+    return found
+
+
+def _check_shops(
+    shops: list[Shop], index: VnumIndex, result: ValidationResult,
+) -> None:
+    mobs, rooms, items = index.mobs, index.rooms, index.items
+    for shop in shops:
+        vnum = shop.vnum
+        if shop.keeper_vnum >= 0 and shop.keeper_vnum not in mobs:
+            result.add("shop-keeper", "shop", vnum, "keeper_vnum",
+                       "mob", shop.keeper_vnum)
+        if shop.shop_room >= 0 and shop.shop_room not in rooms:
+            result.add("shop-room", "shop", vnum, "shop_room",
+                       "room", shop.shop_room)
+        for iv in shop.selling_items:
+            if iv >= 0 and iv not in items:
+                result.add("shop-item", "shop", vnum, "selling_items",
+                           "item", iv)
+
+
+def _check_quests(
+    quests: list[Quest], index: VnumIndex, targets: dict[int, str],
+    result: ValidationResult,
+) -> None:
+    for quest in quests:
+        vnum = quest.vnum
+        if quest.mob_vnum >= 0 and quest.mob_vnum not in index.mobs:
+            result.add("quest-mob", "quest", vnum, "mob_vnum",
+                       "mob", quest.mob_vnum)
+        kind = targets.get(quest.quest_type)
+        if (kind and quest.target_vnum >= 0
+                and quest.target_vnum not in index.of(kind)):
+            result.add("quest-target", "quest", vnum, "target_vnum",
+                       kind, quest.target_vnum)
+        if quest.reward_obj >= 0 and quest.reward_obj not in index.items:
+            result.add("quest-reward", "quest", vnum, "reward_obj",
+                       "item", quest.reward_obj)
+        for name in ("next_quest", "prev_quest"):
+            qv = getattr(quest, name)
+            if qv >= 0 and qv not in index.quests:
+                result.add("quest-chain", "quest", vnum, name, "quest", qv)
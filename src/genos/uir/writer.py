@@ -0,0 +1,106 @@
+"""UIR → YAML/JSON file writers.
+
+:func:`write_uir` writes a fully materialized UIR field by field (see
+:mod:`genos.uir.serializer`), never holding a plain-data copy of more
+than one chunk of entities.  :class:`UIRStreamWriter` produces the same
+bytes from a streamed parse (see ``BaseAdapter.parse_stream``): each
+chunk is serialized as it arrives and spooled to a temporary file per
+section, and the document is assembled in UIR field order once the
+remaining sections are known.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO
+
+from genos.profiling import stage
+
+from .schema import UIR
+from .serializer import (
+    write_json_field,
+    write_json_items,
+    write_json_value,
+    write_yaml_field,
+    write_yaml_items,
+)
+
+
+def write_uir(uir: UIR, path: str | Path, output_format: str = "yaml") -> None:
+    """Write *uir* to *path* as ``"yaml"`` or ``"json"``."""
+    with open(path, "w") as out:
+        _write_document(out, uir, output_format, {})
+
+
+class UIRStreamWriter:
+    """Write a UIR file from streamed ``(section, entities)`` chunks.
+
+    Feed every chunk through :meth:`feed`, then call :meth:`finish` with
+    the UIR returned by ``parse_stream`` (which supplies all non-streamed
+    fields).  The result is byte-identical to :func:`write_uir` on the
+    equivalent materialized UIR.
+    """
+
+    def __init__(self, path: str | Path, output_format: str = "yaml") -> None:
+        self.path = Path(path)
+        self.output_format = output_format
+        self._spools: dict[str, IO[str]] = {}
+
+    def feed(self, section: str, entities: list) -> None:
+        """Serialize one chunk of a UIR list section."""
+        if not entities:
+            return
+        spool = self._spools.get(section)
+        if spool is None:
+            spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+            self._spools[section] = spool
+        if self.output_format == "yaml":
+            write_yaml_items(spool, entities)
+        else:
+            write_json_items(spool, entities, first=not spool.tell())
+
+    def finish(self, uir: UIR) -> None:
+        """Assemble the document in UIR field order and write it out."""
+        try:
+            with open(self.path, "w") as out:
+                _write_document(out, uir, self.output_format, self._spools)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Discard any spooled chunks."""
+        for spool in self._spools.values():
+            spool.close()
+        self._spools.clear()
+
+
+def _write_document(
+    out: IO[str], uir: UIR, output_format: str, spools: dict[str, IO[str]],
+) -> None:
+    """Write every UIR field, taking spooled sections from *spools*."""
+    if output_format != "yaml":
+        out.write("{")
+    for i, f in enumerate(dataclasses.fields(uir)):
+        with stage(f.name):
+            spool = spools.get(f.name)
+            if output_format == "yaml":
+                if spool is None:
+                    write_yaml_field(out, f.name, getattr(uir, f.name))
+                else:
+                    out.write(f"{f.name}:\n")
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out)
+            else:
+                write_json_field(out, i, f.name)
+                if spool is None:
+                    write_json_value(out, getattr(uir, f.name))
+                else:
+                    out.write("[\n")
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out)
+                    out.write("\n  ]")
+    if output_format != "yaml":
+        out.write("\n}")
@@ -3,6 +3,8 @@
 import pytest
 
 from genos.adapters.lpmud.lpc_parser import (
+    LpcCalls,
+    LpcExpr,
     extract_all_string_pair_calls,
     extract_array,
     extract_clone_items,
@@ -219,6 +221,49 @@ class TestExtractStringPairCalls:
         assert ("기골", 20) in result
 
 
+class TestLpcCalls:
+    def test_argument_values(self):
+        calls = LpcCalls(
+            'setExits(([ "남" : "/방/a", ]));\n'
+            'setID(({ "곰", "동물" }));\n'
+            'setStat("힘", 50);\n'
+            'setAdjExp(2.5);\n'
+            'setLong("a" + "b", x + 1);\n'
+        )
+        assert calls.args("setExits") == [[{"남": "/방/a"}]]
+        assert calls.args("setID") == [[["곰", "동물"]]]
+        assert calls.args("setStat") == [["힘", 50]]
+        assert calls.args("setAdjExp") == [[2.5]]
+        assert calls.args("setLong") == [["ab", LpcExpr("x + 1")]]
+        assert calls.args("setShort") == []
+
+    def test_calls_in_source_order(self):
+        calls = LpcCalls('cloneItem(cloneItem("/a"));\ncloneItem("/b");')
+        assert calls.args("cloneItem") == [
+            [LpcExpr('cloneItem("/a")')], ["/a"], ["/b"],
+        ]
+        assert calls.clone_items() == ["/a", "/b"]
+
+    def test_int_call_skips_non_literal(self):
+        calls = LpcCalls("setMp(x);\nsetMp(3);")
+        assert calls.int_call("setMp") == 3
+
+    def test_whole_method_names(self):
+        calls = LpcCalls('resetShort("x");\nsetShortDesc("y");')
+        assert calls.string_call("setShort") is None
+        assert calls.void_call("setShort") is False
+
+    def test_calls_inside_strings_ignored(self):
+        calls = LpcCalls('setLong("setShort(\\"x\\") 라고 친다");')
+        assert calls.string_call("setLong") == 'setShort("x") 라고 친다'
+        assert calls.void_call("setShort") is False
+
+    def test_mapping_not_a_call(self):
+        calls = LpcCalls('mapping m() { return ([ "a" : 1 ]); }')
+        assert calls.void_call("return") is False
+        assert calls.args("m") == [[]]
+
+
 class TestStripColorCodes:
     def test_fluffos(self):
         text = "%^CYAN%^귀환%^RESET%^이라고 치면"
@@ -0,0 +1,94 @@
+"""Tests for the one-walk LP-MUD world parser."""
+
+import functools
+from dataclasses import asdict
+
+from genos.adapters.cache import func_namespace
+from genos.adapters.lpmud import world_parser
+from genos.adapters.lpmud.adapter import LPMudAdapter
+from genos.adapters.lpmud.room_parser import parse_room_file
+from genos.adapters.lpmud.vnum_generator import VnumGenerator
+from genos.adapters.lpmud.world_parser import parse_detached, parse_world, scan_lib
+
+from tests.worlds import create_minimal_lpmud
+
+
+class TestScanLib:
+    def test_classifies_files_once(self, tmp_path):
+        lib_dir = create_minimal_lpmud(tmp_path) / "lib"
+        files = scan_lib(lib_dir, ["방"])
+
+        assert [f.name for f in files.rooms] == ["room01.c", "room02.c"]
+        # 물체/ sorts before 방/
+        assert [f.name for f in files.monsters] == ["test_weapon.c", "test_mob.c"]
+        assert [f.name for f in files.items] == ["test_weapon.c"]
+
+    def test_missing_room_dir(self, tmp_path):
+        lib_dir = create_minimal_lpmud(tmp_path) / "lib"
+        files = scan_lib(lib_dir, ["없음"])
+        assert files.rooms == []
+        assert len(files.items) == 1
+
+
+class TestParseWorld:
+    def test_vnums_replayed_in_sorted_path_order(self, tmp_path, monkeypatch):
+        lib_dir = create_minimal_lpmud(tmp_path) / "lib"
+        # Every path collides, so VNUMs follow the registration order
+        monkeypatch.setattr(
+            VnumGenerator, "_hash_to_int", staticmethod(lambda text: 1000),
+        )
+        vnum_gen = VnumGenerator()
+        world = parse_world(lib_dir, ["방"], vnum_gen)
+
+        assert vnum_gen.get_path_map() == {
+            1000: "물체/무기/test_weapon",
+            1001: "방/테스트/mob/test_mob",
+            1002: "방/테스트/room01",
+            1003: "방/테스트/room02",
+        }
+        assert [r.vnum for r in world.rooms] == [1002, 1003]
+        assert [m.vnum for m in world.monsters] == [1001]
+        assert [i.vnum for i in world.items] == [1000]
+        assert world.pending_exits == {
+            1002: {"남": "/방/테스트/room02"},
+            1003: {"북": "/방/테스트/room01"},
+        }
+
+    def test_errors_become_warnings(self, tmp_path, monkeypatch):
+        lib_dir = create_minimal_lpmud(tmp_path) / "lib"
+
+        def parse_room(filepath, *args):
+            if filepath.name == "room02.c":
+                raise ValueError("bad room")
+            return parse_room_file(filepath, *args)
+
+        monkeypatch.setattr(world_parser, "parse_room_file", parse_room)
+        world = parse_world(lib_dir, ["방"], VnumGenerator())
+
+        assert [r.name for r in world.rooms] == ["테스트 방"]
+        assert len(world.warnings) == 1
+        assert "room02.c" in world.warnings[0]
+        assert "bad room" in world.warnings[0]
+
+    def test_partial_cache_namespace(self, tmp_path):
+        parser = functools.partial(
+            parse_detached, parse_room_file, lib_dir=tmp_path, encoding="euc-kr",
+        )
+        assert func_namespace(parser) == (
+            "genos.adapters.lpmud.world_parser.parse_detached:"
+            "genos.adapters.lpmud.room_parser.parse_room_file:"
+            f"encoding=euc-kr:lib_dir={tmp_path}"
+        )
+
+
+class TestParallelParse:
+    def test_matches_serial(self, tmp_path):
+        root = create_minimal_lpmud(tmp_path)
+        results = []
+        for jobs in (1, 2):
+            adapter = LPMudAdapter(root)
+            adapter.jobs = jobs
+            results.append(asdict(adapter.parse()))
+
+        assert results[0] == results[1]
+        assert len(results[0]["rooms"]) == 2
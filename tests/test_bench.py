@@ -0,0 +1,147 @@
+"""Tests for the synthetic world generator and ``genos bench``."""
+
+import hashlib
+import json
+import tempfile
+
+import pytest
+from click.testing import CliRunner
+
+from genos.adapters.detector import detect_mud_type
+from genos.bench import STAGES, WORLD_KINDS, generate_world, run_bench
+from genos.bench.flags import flag_decoding
+from genos.bench.uir_memory import uir_memory
+from genos.bench.wld import wld_parsing
+from genos.cli import main
+
+from tests.worlds import WORLD_ADAPTERS
+
+
+def _digest(root) -> dict[str, str]:
+    return {
+        str(p.relative_to(root)): hashlib.sha256(p.read_bytes()).hexdigest()
+        for p in sorted(root.rglob("*")) if p.is_file()
+    }
+
+
+class TestGenerateWorld:
+    @pytest.mark.parametrize("kind", WORLD_KINDS)
+    def test_parses_back(self, tmp_path, kind):
+        world = generate_world(kind, tmp_path, rooms=150, seed=3)
+        assert (world.rooms, world.items, world.mobs, world.zones) == (150, 75, 75, 2)
+        assert world.bytes == sum(p.stat().st_size for p in tmp_path.rglob("*")
+                                  if p.is_file())
+
+        adapter = detect_mud_type(tmp_path)
+        assert adapter.__class__.__name__ == WORLD_ADAPTERS[kind]
+        uir = adapter.parse()
+        assert len(uir.rooms) == world.rooms
+        assert len(uir.items) == world.items
+        assert len(uir.monsters) == world.mobs
+        assert not uir.migration_stats.warnings
+
+    @pytest.mark.parametrize("kind", WORLD_KINDS)
+    def test_deterministic(self, tmp_path, kind):
+        generate_world(kind, tmp_path / "a", rooms=120, seed=7)
+        generate_world(kind, tmp_path / "b", rooms=120, seed=7)
+        generate_world(kind, tmp_path / "c", rooms=120, seed=8)
+        assert _digest(tmp_path / "a") == _digest(tmp_path / "b")
+        assert _digest(tmp_path / "a") != _digest(tmp_path / "c")
+
+    def test_rejects_non_empty_root(self, tmp_path):
+        (tmp_path / "stale.txt").write_text("")
+        with pytest.raises(ValueError, match="not empty"):
+            generate_world("circlemud", tmp_path)
+
+    def test_rejects_unknown_kind(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown world kind"):
+            generate_world("diku", tmp_path)
+
+
+class TestRunBench:
+    def test_stages(self, tmp_path):
+        generate_world("circlemud", tmp_path / "src", rooms=200)
+        report = run_bench(tmp_path / "src", tmp_path / "out")
+        assert report["adapter"] == "CircleMudAdapter"
+        assert report["entities"]["rooms"] == 200
+        assert report["validation_warnings"] == 0
+        assert [s["name"] for s in report["stages"]] == list(STAGES)
+        parse = report["stages"][2]
+        assert parse["entities"] == 200 + 100 + 100 + 2
+        assert parse["entities_per_sec"] > 0
+        assert (tmp_path / "out" / "uir.json").exists()
+
+    def test_cli_writes_json(self, tmp_path, monkeypatch):
+        # --work-dir is used as is, without a temporary directory
+        monkeypatch.setattr(tempfile, "TemporaryDirectory", None)
+        out = tmp_path / "bench.json"
+        result = CliRunner().invoke(main, [
+            "bench", "-w", "simoon", "-w", "lpmud", "--rooms", "50",
+            "--work-dir", str(tmp_path / "work"), "-o", str(out),
+        ])
+        assert result.exit_code == 0, result.output
+        report = json.loads(out.read_text())
+        assert report["environment"]["genos_version"]
+        assert [f["workload"] for f in report["flag_decoding"]] == [
+            "flags[8]", "flags[16]", "asciiflag",
+        ]
+        assert [r["world"]["kind"] for r in report["runs"]] == ["simoon", "lpmud"]
+        assert [u["layout"] for u in report["uir_memory"]] == [
+            "dict-based", "slotted", "slotted+compact",
+        ]
+        assert report["runs"][0]["wld_parsing"]["rooms"] == 50
+        assert "wld_parsing" not in report["runs"][1]
+        assert (tmp_path / "work" / "lpmud" / "source" / "bin" / "driver").exists()
+
+    @pytest.mark.parametrize("kind", ["threeeyes", "lpmud"])
+    def test_cli_reused_work_dir(self, tmp_path, kind):
+        for rooms in (400, 100):
+            out = tmp_path / f"bench-{rooms}.json"
+            result = CliRunner().invoke(main, [
+                "bench", "-w", kind, "--rooms", str(rooms),
+                "--work-dir", str(tmp_path / "work"), "-o", str(out),
+            ])
+            assert result.exit_code == 0, result.output
+            [run] = json.loads(out.read_text())["runs"]
+            assert run["world"]["rooms"] == run["entities"]["rooms"] == rooms
+
+    def test_cli_threeeyes_record_decoding(self, tmp_path):
+        out = tmp_path / "bench.json"
+        result = CliRunner().invoke(main, [
+            "bench", "-w", "threeeyes", "--rooms", "50", "-o", str(out),
+        ])
+        assert result.exit_code == 0, result.output
+        decoding = json.loads(out.read_text())["runs"][0]["record_decoding"]
+        assert [d["layout"] for d in decoding] == ["creature", "object", "room", "exit"]
+        by_layout = {d["layout"]: d for d in decoding}
+        assert by_layout["room"]["records"] == 50
+        assert by_layout["room"]["records_per_sec"] > 0
+
+
+class TestFlagDecoding:
+    def test_workloads(self):
+        results = flag_decoding(samples=300, repeat=1)
+        assert [r["workload"] for r in results] == ["flags[8]", "flags[16]", "asciiflag"]
+        for r in results:
+            assert r["calls"] == 300
+            assert r["bitwise_seconds"] > 0 and r["table_seconds"] > 0
+
+
+class TestWldParsing:
+    def test_circlemud_world(self, tmp_path):
+        world = generate_world("circlemud", tmp_path, rooms=300)
+        result = wld_parsing(tmp_path, "CircleMudAdapter", repeat=1)
+        assert result["rooms"] == world.rooms
+        assert result["rooms_per_sec"] > 0
+        assert 0 < result["transient_bytes"] < result["line_list_bytes"]
+
+    def test_other_adapters(self, tmp_path):
+        assert wld_parsing(tmp_path, "LPMudAdapter") is None
+
+
+class TestUirMemory:
+    def test_layouts(self):
+        plain, slotted, compact = uir_memory(count=500)
+        assert slotted["bytes_per_room"] < plain["bytes_per_room"]
+        assert slotted["bytes_per_reset_command"] < plain["bytes_per_reset_command"]
+        assert compact["bytes_per_room"] < slotted["bytes_per_room"]
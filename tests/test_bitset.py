@@ -0,0 +1,61 @@
+"""Tests for the shared table-driven flag decoders."""
+
+import random
+
+from genos.adapters.bitset import (
+    BYTE_BITS,
+    asciiflag_to_int,
+    asciiflag_to_list,
+    bytes_to_flag_list,
+    int_to_flag_list,
+)
+
+
+def _bits(value: int) -> list[int]:
+    return [bit for bit in range(value.bit_length()) if value >> bit & 1]
+
+
+class TestByteTable:
+    def test_every_byte(self):
+        assert len(BYTE_BITS) == 256
+        for value in range(256):
+            assert list(BYTE_BITS[value]) == _bits(value)
+
+
+class TestBytesToFlagList:
+    def test_f_isset_order(self):
+        # F_ISSET(p, f) => p->flags[f/8] & (1 << (f%8))
+        assert bytes_to_flag_list(b"\x02\x01") == [1, 8]
+        assert bytes_to_flag_list(b"\x00" * 8) == []
+
+    def test_matches_little_endian_int(self):
+        rng = random.Random(0)
+        for size in (1, 4, 8, 16, 20):
+            for _ in range(200):
+                data = bytes(rng.getrandbits(8) if rng.random() < 0.3 else 0
+                             for _ in range(size))
+                assert bytes_to_flag_list(data) == _bits(int.from_bytes(data, "little"))
+
+
+class TestIntToFlagList:
+    def test_values(self):
+        assert int_to_flag_list(0) == []
+        assert int_to_flag_list(-5) == []
+        assert int_to_flag_list(0b1010) == [1, 3]
+        assert int_to_flag_list(1 << 70 | 1) == [0, 70]
+
+
+class TestAsciiflag:
+    def test_letters_and_numbers(self):
+        assert asciiflag_to_int("") == 0
+        assert asciiflag_to_int("0") == 0
+        assert asciiflag_to_int("8") == 8
+        assert asciiflag_to_int("abd") == 0b1011
+        assert asciiflag_to_int("A") == 1 << 26
+        assert asciiflag_to_list("bdq") == [1, 3, 16]
+        assert asciiflag_to_list("65536") == [16]
+
+    def test_cached_list_is_a_copy(self):
+        flags = asciiflag_to_list("ab")
+        flags.append(99)
+        assert asciiflag_to_list("ab") == [0, 1]
@@ -0,0 +1,84 @@
+"""Import-time regression tests for the CLI entry point."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import genos
+from genos.bench import generate_world
+
+# Self time (µs) of all genos modules imported by ``import genos.cli``,
+# best of a few runs.  Loading the UIR schema or the compiler alone
+# takes more than this.
+GENOS_IMPORT_BUDGET_US = 15_000
+
+# Modules only some commands need; none may load with the CLI itself.
+_DEFERRED = (
+    "yaml",
+    "multiprocessing",
+    "genos.uir.schema",
+    "genos.uir.writer",
+    "genos.uir.validator",
+    "genos.compiler.compiler",
+    "genos.compiler.db_generator",
+    "genos.adapters.detector",
+    "genos.adapters.circlemud.adapter",
+    "genos.adapters.simoon.adapter",
+    "genos.adapters.threeeyes.adapter",
+    "genos.adapters.lpmud.adapter",
+    "genos.adapters.threeeyes.constants",
+    "genos.bench.synthetic",
+)
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    src = str(Path(genos.__file__).resolve().parents[1])
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(
+        p for p in (src, os.environ.get("PYTHONPATH")) if p
+    )}
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True,
+        check=True,
+    )
+
+
+def _import_times() -> dict[str, int]:
+    """``{module: self time in µs}`` of ``import genos.cli``."""
+    times = {}
+    for line in _python("-X", "importtime", "-c", "import genos.cli").stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us, _, name = line[len("import time:"):].split("|")
+            if self_us.strip().isdigit():
+                times[name.strip()] = int(self_us)
+    return times
+
+
+def _loaded_modules(code: str) -> set[str]:
+    out = _python("-c", f"{code}\nimport sys; print('\\n'.join(sys.modules))")
+    return set(out.stdout.split())
+
+
+class TestCliStartup:
+    def test_deferred_modules(self):
+        loaded = _import_times()
+        assert "genos.cli" in loaded
+        assert not loaded.keys() & set(_DEFERRED)
+
+    def test_import_budget(self):
+        best = min(
+            sum(us for name, us in _import_times().items()
+                if name.split(".")[0] == "genos")
+            for _ in range(3)
+        )
+        assert best < GENOS_IMPORT_BUDGET_US
+
+    def test_detection_loads_one_adapter(self, tmp_path):
+        generate_world("circlemud", tmp_path, rooms=10)
+        loaded = _loaded_modules(
+            "from genos.adapters.detector import detect_mud_type\n"
+            f"assert detect_mud_type({str(tmp_path)!r})"
+        )
+        assert "genos.adapters.circlemud.adapter" in loaded
+        for other in ("simoon", "threeeyes", "lpmud"):
+            assert not any(m.startswith(f"genos.adapters.{other}.") for m in loaded)
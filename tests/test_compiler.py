@@ -16,108 +16,15 @@ from genos.compiler.lua_generator import (
     generate_skills_lua,
     generate_socials_lua,
 )
-from genos.uir.schema import (
-    CharacterClass,
-    CombatSystem,
-    Exit,
-    Item,
-    LevelTitle,
-    Monster,
-    DiceRoll,
-    Race,
-    Room,
-    Skill,
-    Social,
-    UIR,
-    Zone,
-    ZoneResetCommand,
-)
-
-TBAMUD_ROOT = "/home/genos/workspace/tbamud"
+from genos.uir.schema import ExperienceEntry, Room, ThacOEntry
 
+from tests.worlds import make_test_uir
 
-def _make_test_uir() -> UIR:
-    uir = UIR()
-    uir.rooms = [
-        Room(vnum=0, name="The Void", description="Dark void.",
-             exits=[Exit(direction=4, destination=1)]),
-        Room(vnum=1, name="Limbo", description="Floating."),
-    ]
-    uir.items = [
-        Item(vnum=1, keywords="sword", short_description="a sword",
-             item_type=5, weight=10, cost=500),
-    ]
-    uir.monsters = [
-        Monster(vnum=1, keywords="puff dragon", short_description="Puff",
-                level=34, hp_dice=DiceRoll(6, 6, 340)),
-    ]
-    uir.zones = [
-        Zone(vnum=0, name="Test", bot=0, top=99,
-             reset_commands=[ZoneResetCommand(command="M", arg1=1, arg2=1, arg3=0)]),
-    ]
-    uir.character_classes = [
-        CharacterClass(id=0, name="Magic User", abbreviation="Mu",
-                        extensions={"base_thac0": 20, "thac0_gain": 0.66}),
-        CharacterClass(id=3, name="Warrior", abbreviation="Wa",
-                        hp_gain_min=10, hp_gain_max=15,
-                        extensions={"base_thac0": 20, "thac0_gain": 1.0}),
-    ]
-    uir.combat_system = CombatSystem(
-        type="thac0",
-        parameters={"base_thac0": 20, "ac_range": [-10, 10]},
-        damage_types=[
-            "hit", "sting", "whip", "slash", "bite", "bludgeon",
-            "crush", "pound", "claw", "maul", "thrash", "pierce",
-            "blast", "punch", "stab",
-        ],
-    )
-    uir.skills = [
-        Skill(id=1, name="magic missile", spell_type="spell",
-              max_mana=25, min_mana=10, mana_change=-3, min_position=8,
-              targets=2, violent=True, routines=1,
-              wearoff_msg="", class_levels={0: 1, 3: 10},
-              extensions={"korean_name": "마법화살"}),
-        Skill(id=2, name="cure light", spell_type="spell",
-              max_mana=30, min_mana=15, mana_change=-2, min_position=8,
-              targets=1, violent=False, routines=2,
-              wearoff_msg="You feel less protected.",
-              class_levels={1: 1}),
-    ]
-    uir.races = [
-        Race(id=0, name="Human", abbreviation="Hum",
-             stat_modifiers={"str": 0, "int": 0, "wis": 0},
-             allowed_classes=[0, 1, 2, 3]),
-        Race(id=1, name="Elf", abbreviation="Elf",
-             stat_modifiers={"str": -1, "int": 1, "dex": 1},
-             allowed_classes=[0, 2],
-             extensions={"infravision": True}),
-    ]
-    uir.socials = [
-        Social(command="smile", min_victim_position=0,
-               no_arg_to_char="You smile happily.",
-               no_arg_to_room="$n smiles happily.",
-               found_to_char="You smile at $N.",
-               found_to_room="$n smiles at $N.",
-               found_to_victim="$n smiles at you.",
-               not_found="Smile at whom?",
-               self_to_char="You smile to yourself.",
-               self_to_room="$n smiles at $mself."),
-        Social(command="wave", min_victim_position=0,
-               no_arg_to_char="You wave.",
-               no_arg_to_room="$n waves."),
-    ]
-    uir.level_titles = [
-        LevelTitle(class_id=0, level=1, gender="male", title="Apprentice"),
-        LevelTitle(class_id=0, level=1, gender="female", title="Apprentice"),
-        LevelTitle(class_id=0, level=10, gender="male", title="Conjurer"),
-        LevelTitle(class_id=0, level=10, gender="female", title="Witchess"),
-        LevelTitle(class_id=3, level=1, gender="male", title="Swordpupil"),
-    ]
-    return uir
+TBAMUD_ROOT = "/home/genos/workspace/tbamud"
 
 
 def test_generate_ddl():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_ddl(uir, out)
     sql = out.getvalue()
@@ -137,7 +44,7 @@ def test_generate_ddl():
 
 
 def test_generate_seed_data():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_seed_data(uir, out)
     sql = out.getvalue()
@@ -152,8 +59,72 @@ def test_generate_seed_data():
     assert '"cmd"' not in sql
 
 
+def test_generate_seed_data_copy():
+    uir = make_test_uir()
+    uir.rooms[0].description = 'Tab\there,\nnew line, back\\slash, "quoted"'
+    uir.rooms[0].room_flags = [3]
+    out = io.StringIO()
+    generate_seed_data(uir, out, sql_format="copy")
+    sql = out.getvalue()
+    assert "INSERT INTO" not in sql
+    assert (
+        "COPY rooms (vnum, zone_vnum, name, description, sector, flags, "
+        "extra_descs, scripts, ext) FROM stdin;\n"
+    ) in sql
+    row = sql.split("FROM stdin;\n", 1)[1].split("\n", 1)[0]
+    fields = row.split("\t")
+    assert fields[0] == "0"
+    assert fields[3] == 'Tab\\there,\\nnew line, back\\\\slash, "quoted"'
+    assert fields[5] == '{"indoors"}'
+    assert sql.count("\\.\n") == sql.count(" FROM stdin;\n")
+    # Indexes are created once the data is loaded
+    assert sql.index("CREATE INDEX IF NOT EXISTS idx_rooms_zone") > sql.rindex("\\.\n")
+    assert sql.rstrip().endswith("COMMIT;")
+
+
+def test_generate_ddl_copy_defers_indexes():
+    uir = make_test_uir()
+    out = io.StringIO()
+    generate_ddl(uir, out, sql_format="copy")
+    sql = out.getvalue()
+    assert "CREATE TABLE IF NOT EXISTS rooms" in sql
+    assert "CREATE INDEX" not in sql
+
+
+def test_generate_seed_data_batched():
+    uir = make_test_uir()
+    uir.rooms += [Room(vnum=v, name=f"Room {v}") for v in range(2, 7)]
+    uir.experience_table = [
+        ExperienceEntry(class_id=0, level=lvl, exp_required=lvl * 100)
+        for lvl in range(1, 3)
+    ]
+    uir.thac0_table = [ThacOEntry(class_id=0, level=1, thac0=20)]
+    out = io.StringIO()
+    generate_seed_data(uir, out, batch_size=3)
+    sql = out.getvalue()
+    # 7 rooms in batches of 3 -> 3 statements, last one holds a single row
+    room_stmts = sql.count("INSERT INTO rooms (")
+    assert room_stmts == 3
+    assert "(6, 0, 'Room 6', '', 0, '{}'::TEXT[], '[]', '[]', '{}');\n" in sql
+    # game_tables rows from different legacy tables share batches
+    # (2 exp + 1 thac0 + 5 level titles = 8 rows)
+    assert sql.count("INSERT INTO game_tables (") == 3
+    assert "('exp_table', '{\"class_id\": 0, \"level\": 2}', '200'),\n('thac0'" in sql
+    # Per-row output is unchanged with the default batch size
+    single = io.StringIO()
+    generate_seed_data(uir, single)
+    assert single.getvalue().count("INSERT INTO rooms (") == 7
+
+
+def test_generate_seed_data_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        generate_seed_data(make_test_uir(), io.StringIO(), sql_format="csv")
+    with pytest.raises(ValueError):
+        generate_seed_data(make_test_uir(), io.StringIO(), batch_size=0)
+
+
 def test_generate_combat_lua():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_combat_lua(uir, out)
     lua = out.getvalue()
@@ -164,7 +135,7 @@ def test_generate_combat_lua():
 
 
 def test_generate_class_lua():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_class_lua(uir, out)
     lua = out.getvalue()
@@ -174,7 +145,7 @@ def test_generate_class_lua():
 
 
 def test_generate_skills_lua():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_skills_lua(uir, out)
     lua = out.getvalue()
@@ -194,7 +165,7 @@ def test_generate_skills_lua():
 
 
 def test_generate_races_lua():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_races_lua(uir, out)
     lua = out.getvalue()
@@ -210,7 +181,7 @@ def test_generate_races_lua():
 
 
 def test_generate_socials_lua():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_socials_lua(uir, out)
     lua = out.getvalue()
@@ -227,7 +198,7 @@ def test_generate_socials_lua():
 
 
 def test_generate_level_titles_lua():
-    uir = _make_test_uir()
+    uir = make_test_uir()
     out = io.StringIO()
     generate_level_titles_lua(uir, out)
     lua = out.getvalue()
@@ -243,7 +214,7 @@ def test_generate_level_titles_lua():
 
 
 def test_compiler_writes_files(tmp_path):
-    uir = _make_test_uir()
+    uir = make_test_uir()
     compiler = GenosCompiler(uir, tmp_path)
     generated = compiler.compile()
 
@@ -261,6 +232,51 @@ def test_compiler_writes_files(tmp_path):
     assert (lua_dir / "level_titles.lua").exists()
 
 
+def _names(paths):
+    return sorted(os.path.basename(p) for p in paths)
+
+
+def test_compiler_reuses_unchanged_artifacts(tmp_path):
+    generated = GenosCompiler(make_test_uir(), tmp_path).compile()
+
+    compiler = GenosCompiler(make_test_uir(), tmp_path)
+    assert compiler.compile() == generated
+    assert compiler.regenerated == []
+    assert sorted(compiler.reused) == sorted(generated)
+
+
+def test_compiler_regenerates_dependent_artifacts(tmp_path):
+    GenosCompiler(make_test_uir(), tmp_path).compile()
+
+    uir = make_test_uir()
+    uir.skills[0].name = "fireball"
+    compiler = GenosCompiler(uir, tmp_path)
+    compiler.compile()
+    assert _names(compiler.regenerated) == [
+        "korean_commands.lua", "seed_data.sql", "skills.lua",
+    ]
+    assert "fireball" in (tmp_path / "lua" / "skills.lua").read_text()
+
+
+def test_compiler_regenerates_modified_or_forced(tmp_path):
+    GenosCompiler(make_test_uir(), tmp_path).compile()
+    (tmp_path / "lua" / "races.lua").write_text("-- edited\n")
+
+    compiler = GenosCompiler(make_test_uir(), tmp_path)
+    compiler.compile()
+    assert _names(compiler.regenerated) == ["races.lua"]
+
+    compiler = GenosCompiler(make_test_uir(), tmp_path, sql_format="copy")
+    compiler.compile()
+    assert _names(compiler.regenerated) == ["schema.sql", "seed_data.sql"]
+
+    compiler = GenosCompiler(
+        make_test_uir(), tmp_path, sql_format="copy", incremental=False,
+    )
+    generated = compiler.compile()
+    assert sorted(compiler.regenerated) == sorted(generated)
+
+
 @pytest.mark.skipif(
     not os.path.exists(TBAMUD_ROOT),
     reason="tbaMUD source not available",
@@ -0,0 +1,144 @@
+"""Tests for fingerprint-based MUD type detection."""
+
+import json
+import os
+
+import pytest
+
+from genos.adapters import detector, fingerprint, threeeyes
+from genos.adapters.base import BaseAdapter
+from genos.adapters.detector import (
+    DETECTION_CACHE_NAME,
+    detect_mud_type,
+    register_adapter,
+)
+from genos.adapters.fingerprint import DetectionContext, dir_marker, file_marker
+from genos.adapters.threeeyes.constants import SIZEOF_CREATURE
+from genos.bench import WORLD_KINDS, generate_world
+
+from tests.worlds import WORLD_ADAPTERS
+
+
+@pytest.fixture
+def scandirs(monkeypatch):
+    """Directories listed with os.scandir during the test."""
+    listed = []
+    real = os.scandir
+
+    def scandir(path):
+        listed.append(str(path))
+        return real(path)
+
+    monkeypatch.setattr(fingerprint.os, "scandir", scandir)
+    return listed
+
+
+class TestDetectionContext:
+    def test_markers(self, tmp_path):
+        (tmp_path / "rooms" / "r01").mkdir(parents=True)
+        (tmp_path / "objmon").mkdir()
+        (tmp_path / "objmon" / "m00").write_bytes(b"\0" * 10)
+        (tmp_path / "objmon" / "m01").write_bytes(b"\0" * 8)
+        context = DetectionContext(tmp_path)
+
+        assert context.matches(dir_marker("rooms/r[0-9][0-9]"))
+        assert not context.matches(file_marker("rooms/r[0-9][0-9]", record_size=4))
+        assert context.matches(file_marker("objmon/m[0-9][0-9]", record_size=4))
+        assert not context.matches(file_marker("objmon/m[0-9][0-9]", record_size=3))
+        assert context.matches(dir_marker("missing", "objmon"))
+        assert not context.matches(dir_marker("objmon/m00/x"))
+        assert context.listing("nowhere") == {}
+
+    def test_lists_each_directory_once(self, tmp_path, scandirs):
+        generate_world("circlemud", tmp_path, rooms=10)
+        assert detect_mud_type(tmp_path).__class__.__name__ == "CircleMudAdapter"
+        assert len(scandirs) == len(set(scandirs))
+        # Nothing below lib/world/ is listed
+        assert all(p.count(os.sep) <= str(tmp_path / "lib/world").count(os.sep)
+                   for p in scandirs)
+
+
+class TestDetectMudType:
+    @pytest.mark.parametrize("kind", WORLD_KINDS)
+    def test_generated_worlds(self, tmp_path, kind):
+        generate_world(kind, tmp_path, rooms=10)
+        assert detect_mud_type(tmp_path).__class__.__name__ == WORLD_ADAPTERS[kind]
+
+    def test_threeeyes_needs_whole_monster_records(self, tmp_path):
+        generate_world("threeeyes", tmp_path, rooms=10)
+        for mfile in (tmp_path / "objmon").glob("m[0-9][0-9]"):
+            with open(mfile, "ab") as f:
+                f.write(b"\0")
+        adapter = detect_mud_type(tmp_path)
+        assert adapter is None or adapter.__class__.__name__ != "ThreeEyesAdapter"
+
+    def test_threeeyes_marker_record_size(self):
+        assert threeeyes.MARKERS[2].record_size == SIZEOF_CREATURE
+
+    def test_nothing_detected(self, tmp_path):
+        assert detect_mud_type(tmp_path) is None
+        assert detect_mud_type(tmp_path / "missing") is None
+
+    def test_cache(self, tmp_path, scandirs):
+        src, cache_dir = tmp_path / "src", tmp_path / "cache"
+        generate_world("circlemud", src, rooms=10)
+        assert detect_mud_type(src, cache_dir).__class__.__name__ == "CircleMudAdapter"
+        cached = json.loads((cache_dir / DETECTION_CACHE_NAME).read_text())
+        assert cached[str(src.resolve())][0] == "CircleMudAdapter"
+
+        scandirs.clear()
+        assert detect_mud_type(src, cache_dir).__class__.__name__ == "CircleMudAdapter"
+        # Only the cached adapter's markers were checked
+        assert scandirs == [str(src), str(src / "lib"), str(src / "lib/world")]
+
+        # A new top-level entry changes the root mtime: full detection again
+        (src / "HANGUL.TXT").write_text("")
+        assert detect_mud_type(src, cache_dir).__class__.__name__ == "SimoonAdapter"
+
+
+class TestRegisteredAdapters:
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch):
+        monkeypatch.setattr(detector, "_ADAPTER_REGISTRY", [])
+
+    def test_detect_without_context(self, tmp_path):
+        @register_adapter
+        class CustomAdapter(BaseAdapter):
+            def detect(self):
+                return (self.source_path / "custom.cfg").exists()
+
+            def analyze(self):
+                ...
+
+            def parse(self):
+                ...
+
+        assert detect_mud_type(tmp_path) is None
+        (tmp_path / "custom.cfg").write_text("")
+        assert isinstance(detect_mud_type(tmp_path), CustomAdapter)
+
+    def test_markers_only(self, tmp_path):
+        @register_adapter
+        class MarkedAdapter(BaseAdapter):
+            markers = (file_marker("marked.cfg"),)
+
+            def analyze(self):
+                ...
+
+            def parse(self):
+                ...
+
+        assert detect_mud_type(tmp_path) is None
+        (tmp_path / "marked.cfg").write_text("")
+        assert isinstance(detect_mud_type(tmp_path), MarkedAdapter)
+
+    def test_requires_markers_or_detect(self):
+        class BareAdapter(BaseAdapter):
+            def analyze(self):
+                ...
+
+            def parse(self):
+                ...
+
+        with pytest.raises(TypeError, match="markers or override detect"):
+            register_adapter(BareAdapter)
@@ -0,0 +1,107 @@
+"""Tests for process-pool parsing (--jobs) in the text adapters."""
+
+from dataclasses import asdict
+from pathlib import Path
+
+from genos.adapters.circlemud.adapter import CircleMudAdapter
+from genos.adapters.parallel import map_files, resolve_jobs
+from genos.adapters.simoon.adapter import SimoonAdapter
+
+
+def _room_block(vnum: int) -> str:
+    return f"""\
+#{vnum}
+Room {vnum}~
+   Description of room {vnum}.
+~
+{vnum // 100} 8 0 0 0 1
+D0
+~
+~
+0 0 {vnum + 1}
+S
+"""
+
+
+def _write_world(root: Path, encoding: str = "utf-8") -> None:
+    """Write a small world: 6 .wld files (one broken) and a .mob file."""
+    wld_dir = root / "lib" / "world" / "wld"
+    mob_dir = root / "lib" / "world" / "mob"
+    wld_dir.mkdir(parents=True)
+    mob_dir.mkdir(parents=True)
+
+    names = []
+    for zone in range(6):
+        name = f"{zone}.wld"
+        names.append(name)
+        body = "".join(_room_block(zone * 100 + n) for n in range(5))
+        if zone == 3:
+            # Non-numeric zone field -> ValueError inside the parser
+            body = body.replace("3 8 0 0 0 1", "x 8 0 0 0 1", 1)
+        (wld_dir / name).write_text(body + "$~\n", encoding=encoding)
+    (wld_dir / "index").write_text("\n".join(names) + "\n$\n", encoding=encoding)
+
+    (mob_dir / "0.mob").write_text(
+        "#1\npuff~\nPuff~\nPuff is here.\n~\nA dragon.\n~\n"
+        "0 0 0 E\n34 0 -10 6d6+340 3d4+0\n0 0\n8 8 2\nE\n$~\n",
+        encoding=encoding,
+    )
+    (mob_dir / "index").write_text("0.mob\n$\n", encoding=encoding)
+
+
+def _parse(adapter_cls, root: Path, jobs: int):
+    adapter = adapter_cls(root)
+    adapter.jobs = jobs
+    return adapter.parse()
+
+
+class TestMapFiles:
+    def test_resolve_jobs(self):
+        assert resolve_jobs(3) == 3
+        assert resolve_jobs(0) >= 1
+
+    def test_errors_reported_in_order(self, tmp_path):
+        files = [tmp_path / "a", tmp_path / "missing", tmp_path / "b"]
+        files[0].write_text("aa")
+        files[2].write_text("bbb")
+        results = map_files(_file_len, files, jobs=2)
+        assert [r[0] for r in results] == files
+        assert results[0][1:] == (2, None)
+        assert results[1][1] is None and results[1][2]
+        assert results[2][1:] == (3, None)
+
+
+def _file_len(fpath: Path) -> int:
+    return len(fpath.read_bytes())
+
+
+class TestParallelAdapters:
+    def test_circlemud_matches_serial(self, tmp_path):
+        _write_world(tmp_path)
+        serial = _parse(CircleMudAdapter, tmp_path, jobs=1)
+        parallel = _parse(CircleMudAdapter, tmp_path, jobs=3)
+
+        assert asdict(parallel) == asdict(serial)
+        assert [r.vnum for r in parallel.rooms] == [
+            z * 100 + n for z in (0, 1, 2, 4, 5) for n in range(5)
+        ]
+        warnings = parallel.migration_stats.warnings
+        assert len(warnings) == 1
+        assert "3.wld" in warnings[0]
+
+    def test_simoon_matches_serial(self, tmp_path):
+        _write_world(tmp_path, encoding="euc-kr")
+        (tmp_path / "HANGUL.TXT").write_text("")
+        serial = _parse(SimoonAdapter, tmp_path, jobs=1)
+        parallel = _parse(SimoonAdapter, tmp_path, jobs=2)
+
+        assert asdict(parallel) == asdict(serial)
+        assert len(parallel.migration_stats.warnings) == 1
+
+    def test_analyze_counts_with_jobs(self, tmp_path):
+        _write_world(tmp_path)
+        adapter = CircleMudAdapter(tmp_path)
+        adapter.jobs = 2
+        report = adapter.analyze()
+        assert report.room_count == 30
+        assert report.mob_count == 1
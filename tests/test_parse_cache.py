@@ -0,0 +1,180 @@
+"""Tests for the on-disk parse cache (migrate --cache)."""
+
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from genos.adapters import cache as cache_module
+from genos.adapters.cache import ParseCache
+from genos.adapters.circlemud.adapter import CircleMudAdapter
+from genos.adapters.lpmud.adapter import LPMudAdapter
+from genos.adapters.threeeyes.constants import RECORDS_PER_FILE, SIZEOF_OBJECT
+from genos.adapters.threeeyes.obj_parser import parse_all_objects
+from genos.cli import main
+
+from tests.worlds import create_minimal_lpmud, write_circlemud_world
+
+_calls: list[str] = []
+
+
+def _count_lines(fpath: Path) -> int:
+    _calls.append(fpath.name)
+    return len(fpath.read_text().splitlines())
+
+
+def _fail(fpath: Path) -> int:
+    raise ValueError("bad file")
+
+
+def _write_files(tmp_path: Path) -> list[Path]:
+    files = []
+    for i in range(3):
+        fpath = tmp_path / f"{i}.txt"
+        fpath.write_text("line\n" * (i + 1))
+        files.append(fpath)
+    return files
+
+
+class TestParseCache:
+    def setup_method(self):
+        _calls.clear()
+
+    def test_second_run_reuses_entries(self, tmp_path):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        first = list(cache.iter_files(_count_lines, files))
+        second = list(cache.iter_files(_count_lines, files))
+
+        assert first == second == [(f, i + 1, None) for i, f in enumerate(files)]
+        assert _calls == ["0.txt", "1.txt", "2.txt"]
+        assert (cache.hits, cache.misses) == (3, 3)
+
+    def test_changed_file_reparsed(self, tmp_path):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        list(cache.iter_files(_count_lines, files))
+        files[1].write_text("line\n" * 10)
+        _calls.clear()
+
+        results = [n for _, n, _ in cache.iter_files(_count_lines, files)]
+        assert results == [1, 10, 3]
+        assert _calls == ["1.txt"]
+
+    def test_touched_file_matches_by_hash(self, tmp_path):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        list(cache.iter_files(_count_lines, files))
+        st = files[0].stat()
+        os.utime(files[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        _calls.clear()
+
+        assert cache.call(_count_lines, files[0]) == 1
+        assert _calls == []
+
+    def test_touched_files_hashed_once(self, tmp_path, monkeypatch):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        list(cache.iter_files(_count_lines, files))
+        for fpath in files:
+            st = fpath.stat()
+            os.utime(fpath, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        hashed = []
+        digest = cache_module._file_digest
+        monkeypatch.setattr(cache_module, "_file_digest",
+                            lambda fpath: hashed.append(fpath) or digest(fpath))
+        _calls.clear()
+
+        assert [v for _, v, _ in cache.iter_files(_count_lines, files)] == [1, 2, 3]
+        assert _calls == [] and hashed == files
+
+    def test_version_change_invalidates(self, tmp_path, monkeypatch):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        list(cache.iter_files(_count_lines, files))
+        monkeypatch.setattr(cache_module, "cache_version", lambda: "changed")
+        _calls.clear()
+
+        list(cache.iter_files(_count_lines, files))
+        assert _calls == ["0.txt", "1.txt", "2.txt"]
+
+    def test_errors_not_cached(self, tmp_path):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        for _ in range(2):
+            outcomes = list(cache.iter_files(_fail, files))
+            assert all(error == "bad file" for _, _, error in outcomes)
+        assert cache.hits == 0
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        cache.call(_count_lines, files[0])
+        for entry in (tmp_path / "cache").iterdir():
+            entry.write_bytes(b"garbage")
+        _calls.clear()
+
+        assert cache.call(_count_lines, files[0]) == 1
+        assert _calls == ["0.txt"]
+
+    def test_entry_replaced_after_check(self, tmp_path):
+        files = _write_files(tmp_path)
+        cache = ParseCache(tmp_path / "cache")
+        list(cache.iter_files(_count_lines, files))
+        namespace = cache_module.func_namespace(_count_lines)
+        fresh = cache._fresh_entry(namespace, files[0])
+        cache.store(namespace, files[0], 99)
+
+        assert cache._load_fresh(namespace, files[0], *fresh) == (False, None)
+
+
+class TestAdapterCache:
+    def test_circlemud_cached_parse_identical(self, tmp_path):
+        write_circlemud_world(tmp_path / "src")
+        expected = asdict(CircleMudAdapter(tmp_path / "src").parse())
+
+        for _ in range(2):
+            adapter = CircleMudAdapter(tmp_path / "src")
+            adapter.cache = ParseCache(tmp_path / "cache")
+            assert asdict(adapter.parse()) == expected
+        assert adapter.cache.misses == 0
+        assert adapter.cache.hits == 15
+
+    def test_lpmud_cached_parse_identical(self, tmp_path):
+        root = create_minimal_lpmud(tmp_path)
+        expected = asdict(LPMudAdapter(root).parse())
+
+        for _ in range(2):
+            adapter = LPMudAdapter(root)
+            adapter.cache = ParseCache(tmp_path / "cache")
+            assert asdict(adapter.parse()) == expected
+        assert adapter.cache.misses == 0
+        assert adapter.cache.hits > 0
+
+    def test_threeeyes_cached_objects(self, tmp_path):
+        objmon = tmp_path / "objmon"
+        objmon.mkdir()
+        for i in range(2):
+            rec = bytearray(SIZEOF_OBJECT * RECORDS_PER_FILE)
+            name = f"검{i}".encode("euc-kr")
+            rec[0:len(name)] = name
+            (objmon / f"o{i:02d}").write_bytes(bytes(rec))
+
+        cache = ParseCache(tmp_path / "cache")
+        first = parse_all_objects(objmon, cache)
+        second = parse_all_objects(objmon, cache)
+        assert [i.vnum for i in first] == [0, 100]
+        assert [asdict(i) for i in second] == [asdict(i) for i in first]
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_migrate_cache_option(self, tmp_path):
+        write_circlemud_world(tmp_path / "src")
+        runner = CliRunner()
+        for _ in range(2):
+            result = runner.invoke(main, [
+                "migrate", str(tmp_path / "src"), "-o", str(tmp_path / "out"),
+                "--cache", "--cache-dir", str(tmp_path / "cache"),
+            ])
+            assert result.exit_code == 0, result.output
+        assert "Parse cache: 15 files reused, 0 parsed" in result.output
@@ -0,0 +1,136 @@
+"""Tests for stage profiling and ``genos migrate --profile``."""
+
+import json
+import pstats
+
+from click.testing import CliRunner
+
+from genos import profiling
+from genos.bench import generate_world
+from genos.cli import main
+from genos.profiling import Profiler, parse_file, stage
+
+
+class TestProfiler:
+    def test_nested_stages_accumulate(self):
+        profiler = Profiler(trace_memory=False)
+        with profiler.activate():
+            for _ in range(2):
+                with stage("parse"), stage("wld"):
+                    pass
+            with stage("compile"):
+                pass
+        assert list(profiler.stages) == ["parse", "parse/wld", "compile"]
+        assert profiler.stages["parse/wld"].calls == 2
+        assert profiler.seconds >= profiler.stages["parse"].seconds
+        assert profiling._active is None
+
+    def test_memory_peak(self):
+        profiler = Profiler()
+        with profiler.activate():
+            with stage("alloc"):
+                block = bytearray(1 << 20)
+                del block
+            with stage("idle"):
+                pass
+        assert profiler.stages["alloc"].peak_bytes >= 1 << 20
+        assert profiler.stages["idle"].peak_bytes < 1 << 20
+        assert profiler.peak_bytes >= 1 << 20
+
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / "a.wld"
+        path.write_text("abc")
+        # Inactive: a plain call
+        assert parse_file(len, "xy") == 2
+
+        profiler = Profiler(trace_memory=False)
+        with profiler.activate(), stage("parse"):
+            assert parse_file(lambda p, n: p.read_text() * n, path, 2) == "abcabc"
+        [timing] = profiler.files
+        assert (timing.path, timing.bytes, timing.stage) == (str(path), 3, "parse")
+
+        report = profiler.report(top=0)
+        assert report["files_timed"] == 1
+        assert report["slowest_files"] == []
+
+    def test_instrument(self):
+        class Adapter:
+            def _parse_help(self):
+                return ["help"]
+
+            def _iter_parsed(self, subdir):
+                yield from (1, 2)
+
+        adapter = Adapter()
+        profiler = Profiler(trace_memory=False)
+        profiler.instrument(adapter)
+        with profiler.activate():
+            assert adapter._parse_help() == ["help"]
+            assert list(adapter._iter_parsed("wld")) == [1, 2]
+        assert profiler.stages["_iter_parsed:wld"].calls == 3
+        assert profiler.stages["_parse_help"].calls == 1
+
+
+class TestMigrateProfile:
+    def test_profile_json(self, tmp_path):
+        generate_world("circlemud", tmp_path / "src", rooms=150)
+        out = tmp_path / "out"
+        result = CliRunner().invoke(main, [
+            "migrate", str(tmp_path / "src"), "-o", str(out),
+            "--profile", "--profile-top", "3", "--cprofile",
+        ])
+        assert result.exit_code == 0, result.output
+        assert "Profile written to" in result.output
+
+        report = json.loads((out / "profile.json").read_text())
+        assert report["command"] == "migrate"
+        names = [s["name"] for s in report["stages"]]
+        for name in ("detect", "parse", "validate", "serialize", "compile",
+                     "parse/_iter_parsed:wld", "serialize/rooms",
+                     "compile/sql/seed_data.sql"):
+            assert name in names
+        assert report["files_timed"] >= 8
+        slowest = report["slowest_files"]
+        assert len(slowest) == 3
+        assert slowest[0]["seconds"] >= slowest[-1]["seconds"]
+        assert slowest[0]["stage"].startswith("parse/_iter_parsed:")
+
+        assert pstats.Stats(str(out / "profile.pstats")).total_calls > 0
+
+    def test_threeeyes_room_files_timed(self, tmp_path):
+        generate_world("threeeyes", tmp_path / "src", rooms=150)
+        out = tmp_path / "out"
+        result = CliRunner().invoke(main, [
+            "migrate", str(tmp_path / "src"), "-o", str(out),
+            "--profile", "--profile-top", "1000",
+        ])
+        assert result.exit_code == 0, result.output
+        report = json.loads((out / "profile.json").read_text())
+        rooms_dir = tmp_path / "src" / "rooms"
+        timed = [f for f in report["slowest_files"]
+                 if f["path"].startswith(str(rooms_dir))]
+        # Each room file, not each rooms/r{nn} directory
+        assert len(timed) == 150
+        assert all(f["parser"].endswith(".parse_room_file") for f in timed)
+
+    def test_profile_stream(self, tmp_path):
+        generate_world("circlemud", tmp_path / "src", rooms=150)
+        out = tmp_path / "out"
+        result = CliRunner().invoke(main, [
+            "migrate", str(tmp_path / "src"), "-o", str(out),
+            "--stream", "--profile",
+        ])
+        assert result.exit_code == 0, result.output
+        names = [s["name"] for s in json.loads(
+            (out / "profile.json").read_text())["stages"]]
+        assert "stream/_iter_parsed:wld" in names
+        assert not (out / "profile.pstats").exists()
+
+    def test_no_profile(self, tmp_path):
+        generate_world("circlemud", tmp_path / "src", rooms=150)
+        out = tmp_path / "out"
+        result = CliRunner().invoke(main, [
+            "migrate", str(tmp_path / "src"), "-o", str(out),
+        ])
+        assert result.exit_code == 0, result.output
+        assert not (out / "profile.json").exists()
@@ -0,0 +1,190 @@
+"""Tests for the shared CircleMUD record reader.
+
+Parse throughput is measured by ``genos bench`` (``wld_parsing``).
+The buffer reader used for memory-mapped files must parse exactly like
+the text reader; see TestBufferRecordReader.
+"""
+
+import tracemalloc
+
+from genos.adapters.circlemud import records
+from genos.adapters.circlemud.records import (
+    BufferRecordReader,
+    RecordReader,
+    open_records,
+)
+from genos.adapters.circlemud.wld_parser import parse_wld_records, parse_wld_text
+from genos.adapters.simoon.wld_parser import (
+    parse_wld_file as simoon_parse_wld_file,
+)
+
+_DESC = (
+    "   You are standing in a long stone corridor that stretches to the\n"
+    "north and south.  Torches flicker in iron brackets along the damp\n"
+    "walls, throwing long shadows across the flagstones.\n"
+)
+
+
+def _synthetic_wld(n: int) -> str:
+    out = []
+    for v in range(n):
+        out.append(
+            f"#{v}\nThe Stone Corridor~\n{_DESC}~\n"
+            f"{v // 100} d 0 0 0 0\n"
+            f"D0\nThe corridor continues into darkness.\n~\n~\n0 -1 {v + 1}\n"
+            f"D3\nA heavy oak door.\n~\ndoor oak~\n1 -1 {v + 50}\n"
+            "E\ntorches brackets~\nThe torches burn with a smoky flame.\n~\n"
+            "S\n"
+        )
+    out.append("$~\n")
+    return "".join(out)
+
+
+class TestLines:
+    def test_line_semantics_match_split(self):
+        for text in ("a\nb  \n", "a\nb", "", "\n\n"):
+            reader = RecordReader(text)
+            lines = []
+            while (line := reader.line()) is not None:
+                lines.append(line)
+            assert lines == [s.rstrip() for s in text.split("\n")]
+            assert reader.eof
+
+    def test_peek_and_skip(self):
+        reader = RecordReader("S  \nT 5\n")
+        assert reader.peek() == "S"
+        assert reader.peek() == "S"
+        reader.skip()
+        assert reader.fields() == ["T", "5"]
+        assert not reader.eof
+        reader.skip()
+        assert reader.eof
+        assert reader.fields() == []
+        assert reader.line() is None
+
+
+class TestTilde:
+    def test_multiline(self):
+        reader = RecordReader("  line one\nline two\n~\nnext\n")
+        assert reader.tilde() == "line one\nline two"
+        assert reader.line() == "next"
+
+    def test_tilde_ends_line_only(self):
+        # A "~" inside a line does not terminate the string.
+        reader = RecordReader("a~b\nc ~  \nnext")
+        assert reader.tilde() == "a~b\nc"
+        assert reader.line() == "next"
+
+    def test_empty_and_eof(self):
+        reader = RecordReader("~\n~")
+        assert reader.tilde() == ""
+        assert reader.tilde() == ""
+        assert reader.eof
+
+    def test_unterminated(self):
+        reader = RecordReader("no terminator\nat all\n")
+        assert reader.tilde() == "no terminator\nat all"
+        assert reader.eof
+        assert reader.tilde() == ""
+
+
+class TestRecords:
+    def test_vnums(self):
+        text = "junk\n#1\nbody\n#x\n#2\n#$\n#3\n"
+        reader = RecordReader(text)
+        assert list(reader.records()) == [1, 2]
+
+    def test_positioned_after_header(self):
+        reader = RecordReader("#10\nName~\n#11\n")
+        vnums = reader.records()
+        assert next(vnums) == 10
+        assert reader.tilde() == "Name"
+        assert next(vnums) == 11
+
+    def test_tilde_header(self):
+        reader = RecordReader("CircleMUD v3.0 Shop File~\n#5~\nbody\n$~\n")
+        assert list(reader.records(tilde_header=True)) == [5]
+
+    def test_dollar_ends_scan(self):
+        reader = RecordReader("#1\n#$~\n#2\n")
+        assert list(reader.records()) == [1]
+        assert list(RecordReader("#1\n$~\n#2\n").records()) == [1, 2]
+
+
+def test_transient_memory():
+    # Allocations beyond the parsed rooms stay well below the line list
+    # the parsers used to build.
+    sample = _synthetic_wld(2000)
+    tracemalloc.start()
+    rooms = parse_wld_text(sample)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(rooms) == 2000
+    assert rooms[-1].extra_descriptions[0].keywords == "torches brackets"
+    del rooms
+    tracemalloc.start()
+    lines = sample.split("\n")
+    line_list = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lines
+    assert peak - current < line_list // 10
+
+
+# ── Memory-mapped byte buffers ───────────────────────────────────────────
+
+_KOREAN_WLD = (
+    "#3001\n작은 방~\n   어두운 방이다.\n둘째 줄\n~\n"
+    "30 0 0\nD0\n북쪽 복도.\n~\n문~\n1 -1 3002\n"
+    "E\n횃불~\n타오르는 횃불.~　\nS\n$~\n"
+)
+
+
+def _buffer_matches_text(text: str, encoding: str, newline: str = "\n"):
+    raw = text.replace("\n", newline).encode(encoding)
+    expected = parse_wld_records(RecordReader(text), "x")
+    assert parse_wld_records(BufferRecordReader(raw, encoding), "x") == expected
+    return expected
+
+
+class TestBufferRecordReader:
+    def test_matches_text_reader(self):
+        for encoding in ("utf-8", "euc-kr"):
+            for newline in ("\n", "\r\n"):
+                rooms = _buffer_matches_text(_KOREAN_WLD, encoding, newline)
+                assert rooms[0].name == "작은 방"
+                assert rooms[0].description == "어두운 방이다.\n둘째 줄"
+                assert rooms[0].exits[0].keyword == "문"
+                assert rooms[0].extra_descriptions[0].description == "타오르는 횃불."
+
+    def test_invalid_bytes_replaced(self):
+        reader = BufferRecordReader(b"bad \xb0~\nnext\n", "euc-kr")
+        assert reader.tilde() == "bad �"
+        assert reader.line() == "next"
+
+    def test_numeric_lines(self):
+        reader = BufferRecordReader(b"30 d 0\n", "euc-kr")
+        assert reader.fields() == ["30", "d", "0"]
+        assert reader.fields() == []
+        assert reader.eof
+
+
+class TestOpenRecords:
+    def test_mmap_and_text_agree(self, tmp_path, monkeypatch):
+        path = tmp_path / "30.wld"
+        path.write_bytes(_KOREAN_WLD.encode("euc-kr"))
+        expected = parse_wld_text(_KOREAN_WLD)
+        assert simoon_parse_wld_file(path) == expected
+
+        monkeypatch.setattr(records, "MMAP_MIN_SIZE", 0)
+        with open_records(path, "euc-kr") as reader:
+            assert isinstance(reader, BufferRecordReader)
+        assert simoon_parse_wld_file(path) == expected
+
+    def test_lone_cr_read_as_text(self, tmp_path, monkeypatch):
+        path = tmp_path / "1.wld"
+        path.write_bytes(b"#1\rRoom~\r")
+        monkeypatch.setattr(records, "MMAP_MIN_SIZE", 0)
+        with open_records(path) as reader:
+            assert not isinstance(reader, BufferRecordReader)
+            assert next(reader.records()) == 1
+            assert reader.tilde() == "Room"
@@ -0,0 +1,151 @@
+"""Tests for streaming migration (migrate --stream)."""
+
+from dataclasses import asdict
+
+import pytest
+from click.testing import CliRunner
+
+from genos.adapters.base import STREAM_SECTIONS, BaseAdapter
+from genos.adapters.circlemud.adapter import CircleMudAdapter
+from genos.adapters.lpmud.adapter import LPMudAdapter
+from genos.adapters.threeeyes.adapter import ThreeEyesAdapter
+from genos.bench import generate_world
+from genos.cli import main
+
+from tests.worlds import tree_outputs, write_circlemud_world
+
+
+class TestParseStream:
+    def test_chunks_per_file(self, tmp_path):
+        write_circlemud_world(tmp_path)
+        uir, chunks = CircleMudAdapter(tmp_path).parse_stream()
+        chunks = list(chunks)
+
+        assert [s for s, _ in chunks] == (
+            ["rooms"] * 3 + ["items"] * 3 + ["monsters"] * 3
+            + ["zones"] * 3 + ["triggers"] * 3
+        )
+        assert all(s in STREAM_SECTIONS for s, _ in chunks)
+        assert [len(e) for s, e in chunks if s == "rooms"] == [4, 4, 4]
+        # Stats are complete once the stream is exhausted
+        assert uir.migration_stats.total_rooms == 12
+        assert uir.migration_stats.total_triggers == 6
+        assert uir.rooms == []
+        assert len(uir.character_classes) == 4
+
+    def test_parse_matches_stream(self, tmp_path):
+        write_circlemud_world(tmp_path)
+        adapter = CircleMudAdapter(tmp_path)
+        uir, chunks = adapter.parse_stream()
+        for section, entities in chunks:
+            getattr(uir, section).extend(entities)
+        assert asdict(uir) == asdict(adapter.parse())
+
+
+    def test_threeeyes_chunks(self, tmp_path):
+        world = generate_world("threeeyes", tmp_path, rooms=1200)
+        adapter = ThreeEyesAdapter(tmp_path)
+        uir, chunks = adapter.parse_stream()
+        sizes = [(s, len(e)) for s, e in chunks]
+
+        # One chunk per rooms/r{nn} directory and per objmon file
+        room_dirs = sorted((tmp_path / "rooms").iterdir())
+        objmon = [p.name for p in sorted((tmp_path / "objmon").iterdir())]
+        assert len(room_dirs) > 1
+        assert [n for s, n in sizes if s == "rooms"] == [
+            len(list(d.iterdir())) for d in room_dirs
+        ]
+        assert [s for s, _ in sizes if s != "rooms"] == [
+            "items" if name.startswith("o") else "monsters"
+            for name in sorted(objmon, key=lambda n: n[0] == "m")
+        ]
+        assert uir.migration_stats.total_rooms == world.rooms
+        assert uir.rooms == [] and len(uir.character_classes) == 8
+        full = adapter.parse()
+        assert uir.migration_stats.total_zones == len({r.zone_number for r in full.rooms})
+        assert asdict(full) == asdict(_collect(adapter.parse_stream()))
+
+    def test_lpmud_chunks(self, tmp_path):
+        generate_world("lpmud", tmp_path, rooms=150)
+        adapter = LPMudAdapter(tmp_path)
+        uir, chunks = adapter.parse_stream()
+        chunks = list(chunks)
+
+        # One entity per source file, zones once every room is known
+        assert [s for s, _ in chunks] == (
+            ["rooms"] * 150 + ["monsters"] * 75 + ["items"] * 75 + ["zones"]
+        )
+        assert all(len(e) == 1 for s, e in chunks if s != "zones")
+        assert uir.migration_stats.total_zones == len(chunks[-1][1]) == 2
+        assert any(z.reset_commands for z in chunks[-1][1])
+        assert asdict(adapter.parse()) == asdict(_collect(adapter.parse_stream()))
+
+
+def _collect(stream):
+    uir, chunks = stream
+    for section, entities in chunks:
+        getattr(uir, section).extend(entities)
+    return uir
+
+
+class TestStreamMigrate:
+    @pytest.mark.parametrize("fmt,sql_options", [
+        ("yaml", []),
+        ("json", []),
+        ("yaml", ["--sql-format", "copy"]),
+        ("json", ["--batch-size", "5"]),
+    ])
+    def test_outputs_identical(self, tmp_path, fmt, sql_options):
+        src = tmp_path / "src"
+        write_circlemud_world(src)
+        runner = CliRunner()
+        for name, extra in (("full", []), ("stream", ["--stream"])):
+            result = runner.invoke(main, [
+                "migrate", str(src), "-o", str(tmp_path / name), "-f", fmt,
+                *sql_options, *extra,
+            ])
+            assert result.exit_code == 0, result.output
+
+        full = tree_outputs(tmp_path / "full")
+        streamed = tree_outputs(tmp_path / "stream")
+        assert f"uir.{fmt}" in full
+        assert "lua/triggers.lua" in full
+        assert streamed == full
+
+    @pytest.mark.parametrize("kind", ["threeeyes", "lpmud"])
+    def test_outputs_identical_generated(self, tmp_path, kind):
+        generate_world(kind, tmp_path / "src", rooms=150)
+        runner = CliRunner()
+        for name, extra in (("full", []), ("stream", ["--stream"])):
+            result = runner.invoke(main, [
+                "migrate", str(tmp_path / "src"), "-o", str(tmp_path / name),
+                *extra,
+            ])
+            assert result.exit_code == 0, result.output
+            assert "Warning" not in result.output
+        assert tree_outputs(tmp_path / "stream") == tree_outputs(tmp_path / "full")
+
+    def test_fallback_adapter_warns(self, tmp_path, monkeypatch):
+        src = tmp_path / "src"
+        write_circlemud_world(src)
+        uir = CircleMudAdapter(src).parse()
+        monkeypatch.setattr(CircleMudAdapter, "parse", lambda self: uir)
+        monkeypatch.setattr(
+            CircleMudAdapter, "parse_stream", BaseAdapter.parse_stream,
+        )
+        result = CliRunner().invoke(main, [
+            "migrate", str(src), "-o", str(tmp_path / "out"), "--stream",
+        ])
+        assert result.exit_code == 0, result.output
+        assert "CircleMudAdapter does not parse per file" in result.output
+
+    def test_stream_reuses_full_artifacts(self, tmp_path):
+        src = tmp_path / "src"
+        write_circlemud_world(src)
+        runner = CliRunner()
+        for extra in ([], ["--stream"]):
+            result = runner.invoke(main, [
+                "migrate", str(src), "-o", str(tmp_path / "out"), *extra,
+            ])
+            assert result.exit_code == 0, result.output
+        assert "Generated 7 files (0 regenerated, 7 unchanged)" in result.output
@@ -6,12 +6,19 @@ Integration tests use the actual 3eyes data directory.
 
 from __future__ import annotations
 
+import random
 import struct
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
 
 from genos.adapters.threeeyes.binary_utils import (
+    CREATURE,
+    EXIT,
+    OBJECT,
+    ROOM,
+    RecordLayout,
     flags_to_bit_positions,
     read_byte,
     read_cstring,
@@ -20,6 +27,8 @@ from genos.adapters.threeeyes.binary_utils import (
     read_short,
     read_ubyte,
 )
+from genos.adapters.cache import ParseCache
+from genos.adapters.threeeyes import bulk
 from genos.adapters.threeeyes.constants import (
     SIZEOF_CREATURE,
     SIZEOF_EXIT,
@@ -29,9 +38,10 @@ from genos.adapters.threeeyes.constants import (
 )
 from genos.adapters.threeeyes.obj_parser import parse_obj_file
 from genos.adapters.threeeyes.mob_parser import parse_mob_file
-from genos.adapters.threeeyes.room_parser import parse_room_file
+from genos.adapters.threeeyes.room_parser import parse_all_rooms, parse_room_file
 from genos.adapters.threeeyes.help_parser import parse_help_file
 from genos.adapters.threeeyes.talk_parser import (
+    index_talk_files,
     parse_talk_file,
     parse_ddesc_file,
     parse_talk_filename,
@@ -107,6 +117,40 @@ class TestBinaryUtils:
         assert 17 in positions
 
 
+class TestRecordLayout:
+    def test_sizes(self):
+        assert CREATURE.size == CREATURE.struct.size == SIZEOF_CREATURE
+        assert OBJECT.size == OBJECT.struct.size == SIZEOF_OBJECT
+        assert ROOM.size == ROOM.struct.size == SIZEOF_ROOM
+        assert EXIT.size == EXIT.struct.size == SIZEOF_EXIT
+
+    def test_size_mismatch(self):
+        with pytest.raises(ValueError, match="expected 8"):
+            RecordLayout("Bad", (("a", "h"), ("b", "i")), 8)
+
+    def test_decode_at_offset(self):
+        data = bytearray(4 + SIZEOF_EXIT)
+        data[4:9] = b"north"
+        struct.pack_into("<h", data, 24, 1234)
+        data[26] = 0x05
+        struct.pack_into("<b", data, 44, -3)
+        rec = EXIT.decode(memoryview(data), 4)
+        assert rec.name.rstrip(b"\x00") == b"north"
+        assert rec.room == 1234
+        assert rec.flags == b"\x05\x00\x00\x00"
+        assert rec.key == -3
+
+    def test_array_fields(self):
+        data = bytearray(SIZEOF_ROOM)
+        for i in range(10):
+            struct.pack_into("<h", data, 190 + i * 2, i - 1)
+        data[460], data[461] = 5, 200
+        rec = ROOM.decode(bytes(data))
+        assert rec.random == (-1, 0, 1, 2, 3, 4, 5, 6, 7, 8)
+        assert (rec.lolevel, rec.hilevel) == (5, 200)
+        assert len(CREATURE.decode(bytes(SIZEOF_CREATURE)).key) == 3
+
+
 # ── Object parser unit tests ────────────────────────────────────────
 
 
@@ -223,6 +267,57 @@ class TestMobParser:
         assert mob.damage_dice.bonus == 2
 
 
+# ── numpy bulk decode ───────────────────────────────────────────────
+
+
+def _random_records(size: int, count: int, seed: int) -> bytes:
+    """*count* records of random bytes, with a third of them empty."""
+    rng = random.Random(seed)
+    data = bytearray()
+    for i in range(count):
+        rec = bytearray(rng.getrandbits(8) for _ in range(size))
+        if i % 3 == 0:
+            rec[:80] = bytes(80)
+        data += rec
+    return bytes(data)
+
+
+class TestBulkDecode:
+    def test_dtype_offsets(self):
+        spec = bulk.dtype_fields(CREATURE)
+        fields = dict(zip(spec["names"], zip(spec["formats"], spec["offsets"])))
+        assert spec["itemsize"] == SIZEOF_CREATURE
+        assert fields["name"] == ("S80", 44)
+        assert fields["key"] == (("S20", (3,)), 299)
+        assert fields["proficiency"] == (("<i4", (5,)), 360)
+        assert fields["rom_num"] == ("<i2", 458)
+        spec = bulk.dtype_fields(OBJECT)
+        fields = dict(zip(spec["names"], zip(spec["formats"], spec["offsets"])))
+        assert fields["value"] == ("<i4", 300)
+        assert fields["wearflag"] == ("u1", 319)
+
+    @pytest.mark.parametrize("kind", ["mob", "obj"])
+    def test_matches_struct_path(self, tmp_path, monkeypatch, kind):
+        pytest.importorskip("numpy")
+        if kind == "mob":
+            parse, size = parse_mob_file, SIZEOF_CREATURE
+            data = bytearray(_random_records(size, 30, seed=1))
+            for i in range(0, 30, 2):
+                data[i * size + 3] = 1  # CREATURE_MONSTER
+        else:
+            parse, size = parse_obj_file, SIZEOF_OBJECT
+            data = _random_records(size, 30, seed=2)
+        fpath = tmp_path / f"{kind[0]}07"
+        fpath.write_bytes(bytes(data))
+
+        monkeypatch.setattr(bulk, "HAVE_NUMPY", True)
+        fast = [asdict(e) for e in parse(fpath, 7)]
+        monkeypatch.setattr(bulk, "HAVE_NUMPY", False)
+        slow = [asdict(e) for e in parse(fpath, 7)]
+        assert fast == slow
+        assert fast
+
+
 # ── Room parser unit tests ──────────────────────────────────────────
 
 
@@ -250,10 +345,8 @@ class TestRoomParser:
             struct.pack_into("<h", ext_data, 20, ext.get("room", 0))
             buf += ext_data
 
-        # Monster count = 0
-        buf += struct.pack("<i", 0)
-        # Object count = 0
-        buf += struct.pack("<i", 0)
+        # Monsters and objects (default: none of either)
+        buf += kwargs.get("contents", struct.pack("<ii", 0, 0))
 
         # Descriptions (short, long, obj)
         for desc_key in ("short_desc", "long_desc", "obj_desc"):
@@ -294,6 +387,57 @@ class TestRoomParser:
         assert room.exits[0].destination == 101
 
 
+    def test_skips_embedded_creatures_and_objects(self, tmp_path):
+        def obj(*contents: bytes) -> bytes:
+            return bytes(SIZEOF_OBJECT) + struct.pack("<i", len(contents)) + b"".join(contents)
+
+        creature = bytes(SIZEOF_CREATURE) + struct.pack("<i", 1) + obj(obj(), obj())
+        contents = (
+            struct.pack("<i", 1) + creature
+            + struct.pack("<i", 2) + obj(obj()) + obj()
+        )
+        data = self._make_room_file(
+            rom_num=7, contents=contents, short_desc="짧은", long_desc="긴 설명",
+        )
+        fpath = tmp_path / "r00007"
+        fpath.write_bytes(data)
+        room = parse_room_file(fpath)
+        assert room.description == "긴 설명"
+        assert room.extensions["short_desc"] == "짧은"
+
+    def test_truncated_contents(self, tmp_path):
+        # Three objects announced, none stored: descriptions are lost
+        data = self._make_room_file(
+            rom_num=8, contents=struct.pack("<ii", 0, 3), long_desc="설명",
+        )
+        fpath = tmp_path / "r00008"
+        fpath.write_bytes(data)
+        room = parse_room_file(fpath)
+        assert room.vnum == 8
+        assert room.description == ""
+
+    def test_parse_all_rooms_per_zone_dir(self, tmp_path):
+        rooms_dir = tmp_path / "rooms"
+        for vnum in (101, 1, 2, 102):
+            zone_dir = rooms_dir / f"r{vnum // 100:02d}"
+            zone_dir.mkdir(parents=True, exist_ok=True)
+            (zone_dir / f"r{vnum:05d}").write_bytes(
+                self._make_room_file(rom_num=vnum, long_desc=f"방 {vnum}"),
+            )
+        # Unreadable entry named like a room file, and a duplicate vnum
+        (rooms_dir / "r01" / "r00103").mkdir()
+        (rooms_dir / "r01" / "r00104").write_bytes(self._make_room_file(rom_num=2))
+
+        results = [
+            [asdict(r) for r in parse_all_rooms(rooms_dir, jobs=jobs)]
+            for jobs in (1, 2)
+        ]
+        results.append([
+            asdict(r) for r in parse_all_rooms(rooms_dir, ParseCache(tmp_path / "cache"))
+        ])
+        assert [r["vnum"] for r in results[0]] == [1, 2, 101, 102]
+        assert results[0] == results[1] == results[2]
+
 # ── Help parser unit tests ──────────────────────────────────────────
 
 
@@ -337,6 +481,46 @@ class TestTalkParser:
         assert name == "검은_알"
         assert level == 10
 
+    def test_index_talk_files(self, tmp_path):
+        (tmp_path / "길라잡이-25").write_bytes(b"")
+        (tmp_path / "noname").write_bytes(b"")
+        (tmp_path / "sub-1").mkdir()
+        assert index_talk_files(tmp_path) == {
+            ("길라잡이", 25): [tmp_path / "길라잡이-25"],
+            ("noname", 0): [tmp_path / "noname"],
+        }
+        assert index_talk_files(tmp_path / "missing") == {}
+
+    def test_merge_reads_matched_files_only(self, tmp_path, monkeypatch):
+        from genos.adapters.threeeyes import adapter as adapter_module
+        from genos.adapters.threeeyes.adapter import ThreeEyesAdapter
+        from genos.uir.schema import Monster
+
+        talk_dir = tmp_path / "objmon" / "talk"
+        ddesc_dir = tmp_path / "objmon" / "ddesc"
+        talk_dir.mkdir(parents=True)
+        ddesc_dir.mkdir()
+        (talk_dir / "길라잡이-25").write_bytes("존\n안녕\n".encode("euc-kr"))
+        (talk_dir / "유령-3").write_bytes("누구\n몰라\n".encode("euc-kr"))
+        (ddesc_dir / "검은_알_10").write_bytes("까만 알이다.".encode("euc-kr"))
+        (ddesc_dir / "없는몹_1").write_bytes("아무도 없다.".encode("euc-kr"))
+
+        read = []
+        for name in ("parse_talk_file", "parse_ddesc_file"):
+            parse = getattr(adapter_module, name)
+            monkeypatch.setattr(
+                adapter_module, name,
+                lambda path, parse=parse: read.append(path.name) or parse(path),
+            )
+
+        guide = Monster(vnum=1, short_description="길라잡이", level=25)
+        egg = Monster(vnum=2, short_description="검은 알", level=10)
+        ThreeEyesAdapter(tmp_path)._merge_talk_files([guide, egg])
+
+        assert guide.extensions["talk_responses"] == {"존": "안녕"}
+        assert egg.detailed_description == "까만 알이다."
+        assert sorted(read) == sorted(["길라잡이-25", "검은_알_10"])
+
 
 # ── Integration tests (require actual 3eyes data) ──────────────────
 
@@ -0,0 +1,85 @@
+"""Tests for the columnar UIR store."""
+
+import io
+
+from genos.compiler.db_generator import generate_seed_data
+from genos.uir.columnar import ColumnarWorld, StringPool
+from genos.uir.validator import validate_uir
+
+from tests.worlds import columnar_world
+
+
+class TestStringPool:
+    def test_intern_reuses_indices(self):
+        pool = StringPool()
+        assert pool.intern("a") == 0
+        assert pool.intern("b") == 1
+        assert pool.intern("a") == 0
+        assert list(pool.intern_all(["b", "c", "a", "c"])) == [1, 2, 0, 2]
+        assert pool[2] == "c"
+        assert len(pool) == 3
+        assert pool.lookup("d") == -1
+
+
+class TestColumnarWorld:
+    def test_columns(self):
+        cols = ColumnarWorld.from_uir(columnar_world())
+        assert list(cols.room_vnum) == [10, 11, 12]
+        assert list(cols.room_sector) == [2, 0, 0]
+        assert cols.n_exits == 4
+        assert list(cols.exit_room) == [0, 0, 2, 2]
+        assert list(cols.exit_from) == [10, 10, 12, 12]
+        assert list(cols.exit_to) == [11, 99, -1, 98]
+        assert cols.strings[cols.exit_keyword[0]] == "door"
+        assert cols.room_exits(1) == range(2, 2)
+        assert cols.room_exits(2) == range(2, 4)
+        assert cols.zone_resets(1) == range(2, 2)
+        assert [cols.strings[c] for c in cols.reset_cmd] == ["M", "O", "M", "D"]
+        assert list(cols.reset_zone) == [0, 0, 2, 2]
+
+    def test_feed_matches_from_uir(self):
+        uir = columnar_world()
+        cols = ColumnarWorld()
+        cols.feed("rooms", uir.rooms[:1])
+        cols.feed("items", uir.items)
+        cols.feed("rooms", uir.rooms[1:])
+        cols.feed("zones", uir.zones)
+        full = ColumnarWorld.from_uir(uir)
+        assert cols.exit_start == full.exit_start
+        assert cols.exit_room == full.exit_room
+        assert cols.reset_start == full.reset_start
+
+    def test_dangling_exits(self):
+        cols = ColumnarWorld.from_uir(columnar_world())
+        assert cols.dangling_exits() == [1, 3]
+        assert cols.dangling_exits({10, 11, 98, 99}) == []
+
+    def test_unresolved_resets(self):
+        cols = ColumnarWorld.from_uir(columnar_world())
+        assert cols.unresolved_resets("M", {1}) == [2]
+        assert cols.unresolved_resets("M", {1, 2}) == []
+        assert cols.unresolved_resets("X", set()) == []
+
+
+def test_validate_uir_warnings():
+    result = validate_uir(columnar_world())
+    assert result.warnings == [
+        "Room 10: exit dir 1 points to non-existent room 99",
+        "Room 10: trigger 7 not found",
+        "Room 12: exit dir 3 points to non-existent room 98",
+        "Zone 0: O cmd references non-existent item 5",
+        "Zone 2: M cmd references non-existent mob 2",
+    ]
+
+
+def test_seed_data_from_columns():
+    uir = columnar_world()
+    plain, columnar = io.StringIO(), io.StringIO()
+    generate_seed_data(uir, plain)
+    generate_seed_data(uir, columnar, columns=ColumnarWorld.from_uir(uir))
+    assert columnar.getvalue() == plain.getvalue()
+    assert (
+        "INSERT INTO room_exits (from_vnum, direction, to_vnum, description, "
+        "keywords, key_vnum, flags) VALUES (10, 0, 11, '', 'door', -1, "
+        "'{\"door\",\"closed\"}'::TEXT[]);"
+    ) in plain.getvalue()
@@ -0,0 +1,63 @@
+"""Tests for slotted UIR entities and compaction.
+
+Bytes per room and per reset command of each layout are measured by
+``genos bench`` (``uir_memory``).
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from genos.uir.compact import EMPTY_DICT, EMPTY_LIST, compact_uir
+from genos.uir.schema import UIR, Exit, ExtraDescription, Room, ZoneResetCommand
+from genos.uir.serializer import to_plain
+
+
+class TestSlots:
+    def test_no_instance_dict(self):
+        for obj in (Room(vnum=1), Exit(0, 1), ZoneResetCommand("M"),
+                    ExtraDescription()):
+            assert not hasattr(obj, "__dict__")
+
+    def test_dataclass_api_unchanged(self):
+        room = Room(vnum=1, exits=[Exit(direction=0, destination=2)])
+        assert dataclasses.asdict(room)["exits"][0]["destination"] == 2
+        assert dataclasses.replace(room, vnum=2).vnum == 2
+        assert pickle.loads(pickle.dumps(room)) == room
+        assert copy.deepcopy(room) == room
+
+
+class TestCompact:
+    def test_empty_collections_shared(self):
+        uir = UIR(rooms=[Room(vnum=1), Room(vnum=2, room_flags=[3])])
+        compact_uir(uir)
+        a, b = uir.rooms
+        assert a.room_flags is EMPTY_LIST and a.extensions is EMPTY_DICT
+        assert b.room_flags == [3] and b.trigger_vnums is EMPTY_LIST
+        assert a == Room(vnum=1)
+        assert to_plain(a) == dataclasses.asdict(Room(vnum=1))
+
+    def test_sentinels_read_only(self):
+        room = Room(vnum=1)
+        compact_uir(UIR(rooms=[room]))
+        with pytest.raises(TypeError):
+            room.exits.append(Exit(0, 2))
+        with pytest.raises(TypeError):
+            room.extensions["x"] = 1
+        room.exits = [Exit(0, 2)]
+        assert EMPTY_LIST == []
+
+    def test_sentinels_survive_pickle_and_copy(self):
+        room = Room(vnum=1)
+        compact_uir(UIR(rooms=[room]))
+        assert pickle.loads(pickle.dumps(room)).exits is EMPTY_LIST
+        assert copy.deepcopy(room).extensions is EMPTY_DICT
+
+    def test_asdict_of_compacted_is_mutable(self):
+        room = Room(vnum=1)
+        compact_uir(UIR(rooms=[room]))
+        data = dataclasses.asdict(room)
+        data["exits"].append({})
+        data["extensions"]["x"] = 1
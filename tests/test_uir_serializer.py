@@ -0,0 +1,66 @@
+"""Tests for the UIR serializer and file writers."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+import yaml
+
+from genos.uir import serializer
+from genos.uir.schema import UIR, Room, Shop
+from genos.uir.serializer import to_plain
+from genos.uir.writer import UIRStreamWriter, write_uir
+
+from tests.worlds import make_test_uir
+
+
+def _uir() -> UIR:
+    uir = make_test_uir()
+    uir.rooms.append(Room(
+        vnum=9, name="따옴표 \"q\" \\ \t", description="line\n" * 3,
+        extensions={"nested": {"list": [1, None, True]}, "tuple": (1, 2)},
+    ))
+    uir.shops = [Shop(vnum=1, profit_buy=1.5)]
+    return uir
+
+
+class TestToPlain:
+    def test_matches_asdict(self):
+        uir = make_test_uir()
+        assert to_plain(uir) == asdict(uir)
+
+    def test_tuples_become_lists(self):
+        plain = to_plain(_uir())
+        assert plain["rooms"][-1]["extensions"]["tuple"] == [1, 2]
+
+
+class TestWriteUir:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 256])
+    def test_json_matches_json_dump(self, tmp_path, monkeypatch, chunk_size):
+        monkeypatch.setattr(serializer, "CHUNK_SIZE", chunk_size)
+        uir = _uir()
+        write_uir(uir, tmp_path / "uir.json", "json")
+        expected = json.dumps(to_plain(uir), indent=2, ensure_ascii=False)
+        assert (tmp_path / "uir.json").read_text() == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 256])
+    def test_yaml_loads_back(self, tmp_path, monkeypatch, chunk_size):
+        monkeypatch.setattr(serializer, "CHUNK_SIZE", chunk_size)
+        uir = _uir()
+        write_uir(uir, tmp_path / "uir.yaml", "yaml")
+        loaded = yaml.safe_load((tmp_path / "uir.yaml").read_text())
+        assert loaded == to_plain(uir)
+
+    @pytest.mark.parametrize("fmt", ["yaml", "json"])
+    def test_stream_writer_matches(self, tmp_path, fmt):
+        uir = _uir()
+        write_uir(uir, tmp_path / f"full.{fmt}", fmt)
+
+        writer = UIRStreamWriter(tmp_path / f"stream.{fmt}", fmt)
+        rooms, uir.rooms = uir.rooms, []
+        writer.feed("rooms", rooms[:1])
+        writer.feed("rooms", rooms[1:])
+        writer.finish(uir)
+        assert (tmp_path / f"stream.{fmt}").read_bytes() == (
+            tmp_path / f"full.{fmt}"
+        ).read_bytes()
@@ -0,0 +1,188 @@
+"""Tests for the UIR validator."""
+
+import pytest
+
+from genos.uir import validator
+from genos.uir.schema import (
+    UIR,
+    Exit,
+    Quest,
+    Room,
+    Shop,
+    Zone,
+    ZoneResetCommand,
+)
+from genos.uir.validator import (
+    Diagnostic,
+    ValidationResult,
+    VnumIndex,
+    _merge_shards,
+    _zone_shards,
+    validate_uir,
+)
+
+from tests.worlds import columnar_world
+
+
+def _broken_world():
+    uir = columnar_world()
+    uir.rooms[1].exits = [Exit(direction=5, destination=10, key_vnum=77)]
+    uir.zones.append(Zone(vnum=3, reset_commands=[
+        ZoneResetCommand(command="M", arg1=1, arg3=4000),
+        ZoneResetCommand(command="P", arg1=6, arg3=8),
+        ZoneResetCommand(command="T", arg1=0, arg2=1, arg3=-1),
+        ZoneResetCommand(command="T", arg1=0, arg2=2),
+        ZoneResetCommand(command="D", arg1=12, arg2=0),
+    ]))
+    uir.shops = [Shop(vnum=20, keeper_vnum=1, shop_room=500,
+                      selling_items=[5, -1])]
+    uir.quests = [
+        Quest(vnum=30, quest_type=1, target_vnum=999, mob_vnum=1,
+              reward_obj=5, next_quest=31, prev_quest=32),
+        Quest(vnum=31, quest_type=3, target_vnum=1, mob_vnum=8),
+    ]
+    return uir
+
+
+class TestVnumIndex:
+    def test_from_uir(self):
+        index = VnumIndex.from_uir(_broken_world())
+        assert index.rooms == {10, 11, 12}
+        assert index.zones == {0, 1, 2, 3}
+        assert index.quests == {30, 31}
+        assert index.of("trigger") == {1}
+        assert index.of("mob") == {1}
+
+
+class TestValidate:
+    def test_all_checks(self):
+        result = validate_uir(_broken_world())
+        assert result.warnings == [
+            "Room 10: exit dir 1 points to non-existent room 99",
+            "Room 10: trigger 7 not found",
+            "Room 11: exit dir 5 key item 77 not found",
+            "Room 12: exit dir 3 points to non-existent room 98",
+            "Zone 0: O cmd references non-existent item 5",
+            "Zone 2: M cmd references non-existent mob 2",
+            "Zone 3: M cmd references non-existent room 4000",
+            "Zone 3: P cmd references non-existent item 6",
+            "Zone 3: P cmd references non-existent item 8",
+            "Zone 3: T cmd references non-existent trigger 2",
+            "Shop 20: room 500 not found",
+            "Shop 20: sold item 5 not found",
+            "Quest 30: target room 999 not found",
+            "Quest 30: reward item 5 not found",
+            "Quest 30: prev_quest 32 not found",
+            "Quest 31: questmaster mob 8 not found",
+        ]
+        assert result.valid
+
+    def test_structured_diagnostics(self):
+        result = validate_uir(_broken_world())
+        assert result.diagnostics[0] == Diagnostic(
+            "exit-room", "room", 10, "D1", "room", 99,
+        )
+        resets = [d for d in result.diagnostics if d.code == "reset-ref"]
+        assert resets[2] == Diagnostic(
+            "reset-ref", "zone", 3, "M.arg3", "room", 4000,
+        )
+        assert result.counts["reset-ref"] == 6
+        assert result.warning_count == len(result.diagnostics)
+
+    def test_max_per_code(self):
+        result = validate_uir(_broken_world(), max_per_code=1)
+        assert result.counts["reset-ref"] == 6
+        assert [d.code for d in result.diagnostics].count("reset-ref") == 1
+        assert result.warning_count == sum(result.counts.values()) > len(
+            result.diagnostics
+        )
+
+    def test_cmd_ref_map_checks_arg1_only(self):
+        result = validate_uir(_broken_world(), cmd_ref_map={"M": "mob"})
+        assert [d.field for d in result.diagnostics if d.code == "reset-ref"] == [
+            "M.arg1",
+        ]
+
+    def test_reused_index(self):
+        uir = _broken_world()
+        index = VnumIndex.from_uir(uir)
+        index.mobs.update({2, 8})
+        index.rooms.add(4000)
+        result = validate_uir(uir, index=index)
+        assert "quest-mob" not in result.counts
+        assert result.counts["reset-ref"] == 4
+
+    def test_empty_world(self):
+        result = validate_uir(UIR())
+        assert result.warnings == ["UIR has no rooms"]
+        assert result.errors == ["UIR missing source_mud info"]
+        assert not result.valid
+
+    def test_free_text_warnings(self):
+        result = validate_uir(UIR())
+        result.add_warning("zone 3 has no name")
+        result.warnings.append("zone 4 has no name")
+        assert result.warnings == [
+            "UIR has no rooms", "zone 3 has no name", "zone 4 has no name",
+        ]
+        assert result.warning_count == 3
+
+        result = ValidationResult(warnings=["legacy"])
+        result.add("no-rooms", "uir", 0, "rooms", "room", -1)
+        assert result.warnings == ["legacy", "UIR has no rooms"]
+        assert result.warning_count == 2 and result.valid
+
+    def test_room_vnum_zero_exits_ignored(self):
+        uir = columnar_world()
+        uir.rooms = [Room(vnum=1, exits=[Exit(direction=0, destination=0)])]
+        assert "exit-room" not in validate_uir(uir).counts
+
+
+class TestShardedValidate:
+    @pytest.fixture(autouse=True)
+    def _shard_small_worlds(self, monkeypatch):
+        monkeypatch.setattr(validator, "_MIN_SHARDED_ROWS", 0)
+
+    def test_matches_serial(self):
+        uir = _broken_world()
+        # Zone 0 split into two runs of rooms
+        uir.rooms[1].zone_number = 1
+        uir.rooms[2].zone_number = 0
+        serial = validate_uir(uir)
+        sharded = validate_uir(uir, workers=2)
+        assert sharded.diagnostics == serial.diagnostics
+        assert sharded.counts == serial.counts
+
+    def test_max_per_code(self):
+        uir = _broken_world()
+        assert (validate_uir(uir, workers=2, max_per_code=1).diagnostics
+                == validate_uir(uir, max_per_code=1).diagnostics)
+
+    def test_empty_world(self):
+        assert validate_uir(UIR(), workers=2).warnings == ["UIR has no rooms"]
+
+    def test_zone_shards(self):
+        assert _zone_shards([0, 0, 1, 0, 2, 2]) == [
+            [range(0, 2), range(3, 4)], [range(2, 3)], [range(4, 6)],
+        ]
+
+    def test_merge_shards(self):
+        # Hashed vnums: one zone, hence one shard, per row
+        shards = _zone_shards([v // 100 for v in range(0, 15000, 100)])
+        assert len(shards) == 150
+        merged = _merge_shards(shards, 8)
+        assert len(merged) == 8
+        assert [r for shard in merged for r in shard] == [
+            r for shard in shards for r in shard
+        ]
+        assert {sum(map(len, shard)) for shard in merged} <= {18, 19, 20}
+        assert _merge_shards(shards[:3], 8) == shards[:3]
+
+    def test_small_world_is_serial(self, monkeypatch):
+        uir = _broken_world()
+        monkeypatch.setattr(validator, "_MIN_SHARDED_ROWS", len(uir.rooms) * 100)
+        ctx = validator._Context(
+            uir, validator.ColumnarWorld.from_uir(uir), VnumIndex.from_uir(uir),
+            validator.DEFAULT_RESET_REFS,
+        )
+        assert validator._check_sharded(ctx, 4) is None
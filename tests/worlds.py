@@ -0,0 +1,391 @@
+"""Test worlds shared by several test modules."""
+
+from pathlib import Path
+
+from genos.uir.schema import (
+    CharacterClass,
+    CombatSystem,
+    DiceRoll,
+    Exit,
+    Item,
+    LevelTitle,
+    Monster,
+    Race,
+    Room,
+    Skill,
+    Social,
+    SourceMudInfo,
+    Trigger,
+    UIR,
+    Zone,
+    ZoneResetCommand,
+)
+
+# Adapter class detected for each synthetic world kind.
+WORLD_ADAPTERS = {
+    "circlemud": "CircleMudAdapter",
+    "simoon": "SimoonAdapter",
+    "threeeyes": "ThreeEyesAdapter",
+    "lpmud": "LPMudAdapter",
+}
+
+
+# ── UIR ───────────────────────────────────────────────────────────────
+
+def make_test_uir() -> UIR:
+    """Small CircleMUD-style world with every game-data section filled."""
+    uir = UIR()
+    uir.rooms = [
+        Room(vnum=0, name="The Void", description="Dark void.",
+             exits=[Exit(direction=4, destination=1)]),
+        Room(vnum=1, name="Limbo", description="Floating."),
+    ]
+    uir.items = [
+        Item(vnum=1, keywords="sword", short_description="a sword",
+             item_type=5, weight=10, cost=500),
+    ]
+    uir.monsters = [
+        Monster(vnum=1, keywords="puff dragon", short_description="Puff",
+                level=34, hp_dice=DiceRoll(6, 6, 340)),
+    ]
+    uir.zones = [
+        Zone(vnum=0, name="Test", bot=0, top=99,
+             reset_commands=[ZoneResetCommand(command="M", arg1=1, arg2=1, arg3=0)]),
+    ]
+    uir.character_classes = [
+        CharacterClass(id=0, name="Magic User", abbreviation="Mu",
+                        extensions={"base_thac0": 20, "thac0_gain": 0.66}),
+        CharacterClass(id=3, name="Warrior", abbreviation="Wa",
+                        hp_gain_min=10, hp_gain_max=15,
+                        extensions={"base_thac0": 20, "thac0_gain": 1.0}),
+    ]
+    uir.combat_system = CombatSystem(
+        type="thac0",
+        parameters={"base_thac0": 20, "ac_range": [-10, 10]},
+        damage_types=[
+            "hit", "sting", "whip", "slash", "bite", "bludgeon",
+            "crush", "pound", "claw", "maul", "thrash", "pierce",
+            "blast", "punch", "stab",
+        ],
+    )
+    uir.skills = [
+        Skill(id=1, name="magic missile", spell_type="spell",
+              max_mana=25, min_mana=10, mana_change=-3, min_position=8,
+              targets=2, violent=True, routines=1,
+              wearoff_msg="", class_levels={0: 1, 3: 10},
+              extensions={"korean_name": "마법화살"}),
+        Skill(id=2, name="cure light", spell_type="spell",
+              max_mana=30, min_mana=15, mana_change=-2, min_position=8,
+              targets=1, violent=False, routines=2,
+              wearoff_msg="You feel less protected.",
+              class_levels={1: 1}),
+    ]
+    uir.races = [
+        Race(id=0, name="Human", abbreviation="Hum",
+             stat_modifiers={"str": 0, "int": 0, "wis": 0},
+             allowed_classes=[0, 1, 2, 3]),
+        Race(id=1, name="Elf", abbreviation="Elf",
+             stat_modifiers={"str": -1, "int": 1, "dex": 1},
+             allowed_classes=[0, 2],
+             extensions={"infravision": True}),
+    ]
+    uir.socials = [
+        Social(command="smile", min_victim_position=0,
+               no_arg_to_char="You smile happily.",
+               no_arg_to_room="$n smiles happily.",
+               found_to_char="You smile at $N.",
+               found_to_room="$n smiles at $N.",
+               found_to_victim="$n smiles at you.",
+               not_found="Smile at whom?",
+               self_to_char="You smile to yourself.",
+               self_to_room="$n smiles at $mself."),
+        Social(command="wave", min_victim_position=0,
+               no_arg_to_char="You wave.",
+               no_arg_to_room="$n waves."),
+    ]
+    uir.level_titles = [
+        LevelTitle(class_id=0, level=1, gender="male", title="Apprentice"),
+        LevelTitle(class_id=0, level=1, gender="female", title="Apprentice"),
+        LevelTitle(class_id=0, level=10, gender="male", title="Conjurer"),
+        LevelTitle(class_id=0, level=10, gender="female", title="Witchess"),
+        LevelTitle(class_id=3, level=1, gender="male", title="Swordpupil"),
+    ]
+    return uir
+
+
+def columnar_world() -> UIR:
+    """:func:`make_test_uir` with rooms and zones whose references dangle."""
+    uir = make_test_uir()
+    uir.source_mud = SourceMudInfo("test", "1", "circlemud", "/tmp")
+    uir.rooms = [
+        Room(vnum=10, zone_number=0, sector_type=2, exits=[
+            Exit(direction=0, destination=11, keyword="door", door_flags=3),
+            Exit(direction=1, destination=99),
+        ], trigger_vnums=[7]),
+        Room(vnum=11, zone_number=0),
+        Room(vnum=12, zone_number=1, exits=[
+            Exit(direction=2, destination=-1),
+            Exit(direction=3, destination=98, description="a hole"),
+        ]),
+    ]
+    uir.zones = [
+        Zone(vnum=0, reset_commands=[
+            ZoneResetCommand(command="M", arg1=1),
+            ZoneResetCommand(command="O", arg1=5),
+        ]),
+        Zone(vnum=1),
+        Zone(vnum=2, reset_commands=[
+            ZoneResetCommand(command="M", arg1=2),
+            ZoneResetCommand(command="D", arg1=12),
+        ]),
+    ]
+    uir.triggers = [Trigger(vnum=1)]
+    return uir
+
+
+# ── CircleMUD ─────────────────────────────────────────────────────────
+
+_WLD = """\
+#{vnum}
+방 {vnum}~
+   Room {vnum} with a 'quote' and a \\backslash.
+~
+{zone} 8 0 0 0 1
+D0
+~
+door~
+1 10 {next}
+E
+sign~
+A "sign".
+~
+S
+"""
+
+_OBJ = """\
+#{vnum}
+wings~
+a pair of wings~
+A pair of wings is sitting here.~
+~
+9 0 0 0 0 ae 0 0 0 0 0 0 0
+6 0 0 0
+1 1 0 0 0
+"""
+
+_MOB = """\
+#{vnum}
+puff~
+Puff~
+Puff is here.
+~
+A dragon.
+~
+0 0 0 E
+34 0 -10 6d6+340 3d4+0
+0 0
+8 8 2
+E
+"""
+
+_ZON = """\
+#{zone}
+Rumble~
+Zone {zone}~
+{bot} {top} 30 2 d 0 0 0 -1 -1
+M 0 {bot} 1 {bot} 	(Puff)
+O 0 {bot} 99 {bot} 	(wings)
+S
+$~
+"""
+
+_TRG = """\
+#{vnum}
+Greet {vnum}~
+0 g 100
+~
+if %actor.is_pc%
+  say Hello, %actor.name%!
+end
+~
+"""
+
+
+def _write_index(data_dir: Path, names: list[str]) -> None:
+    (data_dir / "index").write_text("\n".join(names) + "\n$\n")
+
+
+def write_circlemud_world(root: Path) -> None:
+    """Write a three-zone CircleMUD world under *root*."""
+    world = root / "lib" / "world"
+    for sub in ("wld", "obj", "mob", "zon", "trg"):
+        (world / sub).mkdir(parents=True)
+
+    for zone in range(3):
+        bot = zone * 100
+        vnums = range(bot, bot + 4)
+        (world / "wld" / f"{zone}.wld").write_text(
+            "".join(_WLD.format(vnum=v, zone=zone, next=v + 1) for v in vnums)
+            + "$~\n"
+        )
+        (world / "obj" / f"{zone}.obj").write_text(
+            "".join(_OBJ.format(vnum=v) for v in vnums) + "$~\n"
+        )
+        (world / "mob" / f"{zone}.mob").write_text(
+            "".join(_MOB.format(vnum=v) for v in vnums) + "$~\n"
+        )
+        (world / "zon" / f"{zone}.zon").write_text(
+            _ZON.format(zone=zone, bot=bot, top=bot + 99)
+        )
+        (world / "trg" / f"{zone}.trg").write_text(
+            "".join(_TRG.format(vnum=v) for v in vnums[:2]) + "$~\n"
+        )
+    for sub in ("wld", "obj", "mob", "zon", "trg"):
+        _write_index(world / sub, [f"{z}.{sub}" for z in range(3)])
+
+
+def tree_outputs(root: Path) -> dict[str, bytes]:
+    """Contents of the files under *root*, by relative path."""
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*")) if p.is_file()
+    }
+
+
+# ── LP-MUD ────────────────────────────────────────────────────────────
+
+def create_minimal_lpmud(tmp_path: Path) -> Path:
+    """Create a minimal LP-MUD directory structure for testing."""
+    root = tmp_path / "lpmud"
+    root.mkdir()
+
+    # bin/ with driver
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "driver").touch()
+    (bin_dir / "fluffos-han-test").touch()
+
+    # lib/
+    lib_dir = root / "lib"
+    lib_dir.mkdir()
+
+    # lib/구조/
+    (lib_dir / "구조").mkdir()
+    (lib_dir / "구조" / "room.c").write_text("// base room")
+
+    # lib/삽입파일/
+    header_dir = lib_dir / "삽입파일"
+    header_dir.mkdir()
+
+    # 직업.h
+    job_h = '''\
+#ifndef __JOBH__
+#define __JOBH__
+static mapping *JobData = ({
+([ "직업명" : "투사", "선행능력" : ({ 0, 0, 0, 0, 0, 0 }),
+   "주요능력" : ({ 1,1,0,0,0,0 }), "기본유닛" : 6, "증가유닛" : 2,
+   "증가멈춤" : 10, "직결직업" : ({ "전사" }),
+   "관계직업" : ({ }), "선행직업" : ({ }) ]),
+});
+#endif
+'''
+    (header_dir / "직업.h").write_bytes(job_h.encode("euc-kr"))
+
+    # 기술.h
+    skill_h = '''\
+#ifndef __SKILLH__
+#define __SKILLH__
+static mapping *SkillData = ({
+([ "기술명" : "패리L1", "최대" : 20, "단위" : 2, "직업" : "투사", "레벨" : 8 ]),
+});
+#endif
+'''
+    (header_dir / "기술.h").write_bytes(skill_h.encode("euc-kr"))
+
+    # lib/방/ with room files
+    room_dir = lib_dir / "방" / "테스트"
+    room_dir.mkdir(parents=True)
+
+    room1 = '''\
+#include <구조.h>
+inherit LIB_ROOM;
+void create() {
+  room::create();
+  setShort("테스트 방");
+  setLong("테스트 방 설명입니다.");
+  setExits(([ "남" : "/방/테스트/room02" ]));
+  setOutSide();
+  reset();
+}
+'''
+    (room_dir / "room01.c").write_bytes(room1.encode("euc-kr"))
+
+    room2 = '''\
+#include <구조.h>
+inherit LIB_ROOM;
+void create() {
+  room::create();
+  setShort("테스트 방 2");
+  setLong("두번째 테스트 방입니다.");
+  setExits(([ "북" : "/방/테스트/room01" ]));
+  setRoomAttr(1);
+  reset();
+}
+'''
+    (room_dir / "room02.c").write_bytes(room2.encode("euc-kr"))
+
+    # lib/방/테스트/mob/ with monster
+    mob_dir = room_dir / "mob"
+    mob_dir.mkdir()
+    mob1 = '''\
+#include <구조.h>
+inherit LIB_MONSTER;
+void create() {
+  ::create();
+  setName("테스트몹");
+  setID(({ "몹" }));
+  setShort("테스트 몬스터가 있다.");
+  setGender("남자");
+  randomStat(10);
+  setExp(100);
+}
+'''
+    (mob_dir / "test_mob.c").write_bytes(mob1.encode("euc-kr"))
+
+    # lib/물체/ with item
+    item_dir = lib_dir / "물체" / "무기"
+    item_dir.mkdir(parents=True)
+    weapon1 = '''\
+#include <구조.h>
+inherit LIB_WEAPON;
+void create() {
+  ::create();
+  setName("테스트검");
+  setID(({ "검" }));
+  setShort("테스트 검이 있다.");
+  setMass(10);
+  setValue(500);
+  setSpWeapon(5);
+  setType("왼손");
+  setLimitLevel(10);
+}
+'''
+    (item_dir / "test_weapon.c").write_bytes(weapon1.encode("euc-kr"))
+
+    # lib/도움말/
+    help_dir = lib_dir / "도움말"
+    help_dir.mkdir()
+    (help_dir / "테스트.help").write_bytes("테스트 도움말입니다.".encode("euc-kr"))
+
+    # lib/명령어/플레이어/
+    cmd_dir = lib_dir / "명령어" / "플레이어"
+    cmd_dir.mkdir(parents=True)
+    cmd1 = '''\
+#include <구조.h>
+inherit LIB_DAEMON;
+string *getCMD() { return ({ "때", "때려" }); }
+mixed CMD(string str) { return 1; }
+'''
+    (cmd_dir / "때려.c").write_bytes(cmd1.encode("euc-kr"))
+
+    return root